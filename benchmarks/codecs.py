@@ -0,0 +1,82 @@
+"""Compares the JSON codecs usable by Connection on CDP traffic.
+
+Usage: python -m benchmarks.codecs [--traffic recorded-frames.txt] [--rounds N]
+"""
+import argparse
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from cripy.codec import CODECS, Codec
+from .traffic import load_traffic, outbound_commands
+
+
+def available_codecs() -> List[Codec]:
+    codecs = []
+    for codec_clazz in CODECS.values():
+        try:
+            codecs.append(codec_clazz())
+        except ImportError:
+            print(f"skipping {codec_clazz.name}, it is not installed")
+    return codecs
+
+
+def time_it(fn: Callable[[], None], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def bench_decode(codec: Codec, frames: List[bytes], rounds: int) -> float:
+    loads = codec.loads
+
+    def run() -> None:
+        for frame in frames:
+            loads(frame)
+
+    return time_it(run, rounds)
+
+
+def bench_encode(codec: Codec, cmds: List[Dict], rounds: int) -> float:
+    dumps = codec.dumps
+
+    def run() -> None:
+        for cmd in cmds:
+            dumps(cmd)
+
+    return time_it(run, rounds)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--traffic", help="file of recorded frames, one per line")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    traffic = load_traffic(args.traffic)
+    cmds = outbound_commands()
+    codecs = available_codecs()
+
+    for kind, str_frames in traffic.items():
+        # frames as they arrive off a byte stream transport
+        frames = [frame.encode("utf-8") for frame in str_frames]
+        size = sum(len(frame) for frame in frames)
+        print(f"decode {kind}: {len(frames)} frames, {size / 1e6:.2f} MB")
+        for codec in codecs:
+            took = bench_decode(codec, frames, args.rounds)
+            print(
+                f"  {codec.name:>8}: {took * 1e3:9.2f} ms {size / took / 1e6:9.1f} MB/s"
+            )
+
+    print(f"encode {len(cmds)} outbound commands")
+    for codec in codecs:
+        took = bench_encode(codec, cmds, args.rounds)
+        print(
+            f"  {codec.name:>8}: {took * 1e3:9.2f} ms {len(cmds) / took:12.0f} cmds/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compares emitting the events of recorded CDP traffic using pyee2's EventEmitterS,
+which Connection and CDPSession used to extend, and cripy's EventDispatcher.
+
+The listeners registered mimic a typical crawler: a few exact listeners for some of
+the events, while the rest of the events have no listeners.
+
+Usage: python -m benchmarks.dispatch [--traffic recorded-frames.txt] [--rounds N]
+"""
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Any, Callable, List, Tuple
+
+import ujson
+from pyee2 import EventEmitterS
+
+from cripy.dispatch import EventDispatcher
+from .traffic import load_traffic
+
+LISTENED = [
+    "Network.requestWillBeSent",
+    "Network.loadingFinished",
+    "Page.loadEventFired",
+]
+
+
+def recorded_events(path: str) -> List[Tuple[str, Any]]:
+    events = []
+    for frames in load_traffic(path).values():
+        for frame in frames:
+            msg = ujson.loads(frame)
+            if "method" in msg:
+                events.append((msg["method"], msg.get("params", {})))
+    return events
+
+
+def time_it(fn: Callable[[], None], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def bench(emitter: Any, events: List[Tuple[str, Any]], rounds: int) -> float:
+    emit = emitter.emit
+    has_listeners = emitter.has_listeners
+
+    def run() -> None:
+        # the receive loop checks for listeners before decoding an event
+        for method, params in events:
+            if has_listeners(method):
+                emit(method, params)
+
+    return time_it(run, rounds)
+
+
+def listener(params: Any) -> None:
+    pass
+
+
+def wildcard_listener(event: str, params: Any) -> None:
+    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--traffic", help="file of recorded frames, one per line")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="times the recording is replayed"
+    )
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    events = recorded_events(args.traffic) * args.repeat
+    print(f"emitting {len(events)} events")
+    emitters = [
+        ("pyee2", EventEmitterS(loop=loop)),
+        ("dispatcher", EventDispatcher(loop=loop)),
+    ]
+    for _, emitter in emitters:
+        for event in LISTENED:
+            emitter.on(event, listener)
+    for name, emitter in emitters:
+        took = bench(emitter, events, args.rounds)
+        print(f"{name:>16}: {took * 1e3:9.2f} ms {len(events) / took:12.0f} events/s")
+
+    dispatcher = EventDispatcher(loop=loop)
+    dispatcher.on("Network.*", wildcard_listener)
+    took = bench(dispatcher, events, args.rounds)
+    print(
+        f"{'Network.*':>16}: {took * 1e3:9.2f} ms {len(events) / took:12.0f} events/s"
+    )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Measures the receive loop, routing and callback handling of Connection
+against an in-process browser over an InMemoryTransport, so no I/O is involved.
+
+Usage: python -m benchmarks.routing [--commands N] [--events N] [--rounds N]
+"""
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Callable, List
+
+import ujson
+
+from cripy.connection import Connection
+from cripy.errors import TransportClosedError
+from cripy.transports import InMemoryTransport
+
+SESSION_ID = "session-1"
+# keeps the browser alive while the benchmark runs
+BROWSER: List = []
+
+
+async def serve(transport: InMemoryTransport) -> None:
+    """Answers every command, attaching to any target as SESSION_ID"""
+    while 1:
+        try:
+            msg = ujson.loads(await transport.recv())
+        except TransportClosedError:
+            return
+        if msg["method"] == "Target.attachToTarget":
+            await transport.send(
+                ujson.dumps(
+                    {
+                        "method": "Target.attachedToTarget",
+                        "params": {
+                            "sessionId": SESSION_ID,
+                            "targetInfo": {"targetId": "page-1", "type": "page"},
+                        },
+                    }
+                )
+            )
+            result = {"sessionId": SESSION_ID}
+        else:
+            result = {}
+        response = {"id": msg["id"], "result": result}
+        if "sessionId" in msg:
+            response["sessionId"] = msg["sessionId"]
+        await transport.send(ujson.dumps(response))
+
+
+def event_frames(count: int) -> List[str]:
+    return [
+        ujson.dumps(
+            {
+                "method": "Network.dataReceived",
+                "params": {"requestId": str(i), "timestamp": i, "dataLength": 1024},
+                "sessionId": SESSION_ID,
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def report(name: str, took: float, count: int, unit: str) -> None:
+    print(f"{name:>16}: {took * 1e3:9.2f} ms {count / took:12.0f} {unit}/s")
+
+
+async def best_of(rounds: int, fn: Callable) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        await fn()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+async def run(args: argparse.Namespace) -> None:
+    ours, theirs = InMemoryTransport.pair()
+    BROWSER.append(asyncio.get_event_loop().create_task(serve(theirs)))
+    conn = Connection(flatten_sessions=True)
+    await conn.connect(transport=ours)
+    session = await conn.create_session("page-1")
+
+    async def round_trips() -> None:
+        send = session.send
+        await asyncio.gather(*[send("Runtime.evaluate") for _ in range(args.commands)])
+
+    report(
+        "round trips",
+        await best_of(args.rounds, round_trips),
+        args.commands,
+        "commands",
+    )
+
+    frames = event_frames(args.events)
+    received = [0]
+
+    def on_data(event) -> None:
+        received[0] += 1
+
+    async def routed_events() -> None:
+        done = asyncio.Event()
+        received[0] = 0
+
+        def on_last(event) -> None:
+            done.set()
+
+        session.on("Network.dataReceived", on_data)
+        session.once("Page.loadEventFired", on_last)
+        send = theirs.send
+        for frame in frames:
+            await send(frame)
+        await send(
+            ujson.dumps(
+                {
+                    "method": "Page.loadEventFired",
+                    "params": {"timestamp": 1},
+                    "sessionId": SESSION_ID,
+                }
+            )
+        )
+        await done.wait()
+        session.remove_listener("Network.dataReceived", on_data)
+
+    report(
+        "routed events",
+        await best_of(args.rounds, routed_events),
+        args.events,
+        "events",
+    )
+
+    async def skipped_events() -> None:
+        send = theirs.send
+        for frame in frames:
+            await send(frame)
+        await conn.send("Browser.getVersion")
+
+    report(
+        "skipped events",
+        await best_of(args.rounds, skipped_events),
+        args.events,
+        "events",
+    )
+    await conn.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.get_event_loop().run_until_complete(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
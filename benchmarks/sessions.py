@@ -0,0 +1,139 @@
+"""Compares the throughput of flat and nested (Target.sendMessageToTarget) sessions
+against an in-process browser over an InMemoryTransport, so no I/O is involved.
+
+Usage: python -m benchmarks.sessions [--commands N] [--events N] [--rounds N]
+"""
+import argparse
+import asyncio
+from typing import Dict, List
+
+import ujson
+
+from cripy.connection import Connection
+from cripy.errors import TransportClosedError
+from cripy.transports import InMemoryTransport
+from .routing import best_of, report
+
+SESSION_ID = "session-1"
+# keeps the browsers alive while the benchmark runs
+BROWSERS: List = []
+
+
+def event_frame(i: int, flat: bool) -> str:
+    event = {
+        "method": "Network.dataReceived",
+        "params": {"requestId": str(i), "timestamp": i, "dataLength": 1024},
+    }
+    if flat:
+        event["sessionId"] = SESSION_ID
+        return ujson.dumps(event)
+    return ujson.dumps(
+        {
+            "method": "Target.receivedMessageFromTarget",
+            "params": {"sessionId": SESSION_ID, "message": ujson.dumps(event)},
+        }
+    )
+
+
+async def serve(transport: InMemoryTransport) -> None:
+    """Answers every command, of flat and nested sessions, attaching to any target
+    as SESSION_ID"""
+    while 1:
+        try:
+            msg = ujson.loads(await transport.recv())
+        except TransportClosedError:
+            return
+        method = msg["method"]
+        result: Dict = {}
+        if method == "Target.attachToTarget":
+            if msg["params"].get("flatten"):
+                await transport.send(
+                    ujson.dumps(
+                        {
+                            "method": "Target.attachedToTarget",
+                            "params": {
+                                "sessionId": SESSION_ID,
+                                "targetInfo": {"targetId": "page-1", "type": "page"},
+                            },
+                        }
+                    )
+                )
+            result = {"sessionId": SESSION_ID}
+        elif method == "Target.sendMessageToTarget":
+            inner = ujson.loads(msg["params"]["message"])
+            await transport.send(
+                ujson.dumps(
+                    {
+                        "method": "Target.receivedMessageFromTarget",
+                        "params": {
+                            "sessionId": SESSION_ID,
+                            "message": ujson.dumps({"id": inner["id"], "result": {}}),
+                        },
+                    }
+                )
+            )
+        response = {"id": msg["id"], "result": result}
+        if "sessionId" in msg:
+            response["sessionId"] = msg["sessionId"]
+        await transport.send(ujson.dumps(response))
+
+
+async def run_mode(args: argparse.Namespace, flat: bool) -> None:
+    ours, theirs = InMemoryTransport.pair()
+    BROWSERS.append(asyncio.get_event_loop().create_task(serve(theirs)))
+    conn = Connection(flatten_sessions=flat)
+    await conn.connect(transport=ours)
+    session = await conn.create_session("page-1")
+    mode = "flat" if flat else "nested"
+
+    async def round_trips() -> None:
+        send = session.send
+        await asyncio.gather(*[send("Runtime.evaluate") for _ in range(args.commands)])
+
+    report(
+        f"{mode} commands",
+        await best_of(args.rounds, round_trips),
+        args.commands,
+        "commands",
+    )
+
+    frames = [event_frame(i, flat) for i in range(args.events)]
+    last = event_frame(-1, flat).replace("Network.dataReceived", "Page.loadEventFired")
+
+    def on_data(event) -> None:
+        pass
+
+    async def routed_events() -> None:
+        done = asyncio.Event()
+        session.once("Page.loadEventFired", lambda event: done.set())
+        send = theirs.send
+        for frame in frames:
+            await send(frame)
+        await send(last)
+        await done.wait()
+
+    session.on("Network.dataReceived", on_data)
+    report(
+        f"{mode} events",
+        await best_of(args.rounds, routed_events),
+        args.events,
+        "events",
+    )
+    await conn.dispose()
+
+
+async def run(args: argparse.Namespace) -> None:
+    await run_mode(args, True)
+    await run_mode(args, False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=3)
+    asyncio.get_event_loop().run_until_complete(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
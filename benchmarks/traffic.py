@@ -0,0 +1,158 @@
+"""Representative CDP traffic used by the benchmarks.
+
+Real traffic can be supplied as a file of recorded frames, one raw JSON frame per
+line, e.g. collected by listening for Connection.AllMessages and writing out the
+encoded messages. Otherwise a synthetic recording is generated that mimics what a
+page load with the Network, Page and DOM domains enabled looks like.
+"""
+import base64
+import os
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import ujson
+
+__all__ = ["load_traffic", "outbound_commands", "synthetic_traffic"]
+
+
+def _dom_node(rng: random.Random, depth: int, node_id: List[int]) -> Dict:
+    node_id[0] += 1
+    node = {
+        "nodeId": node_id[0],
+        "backendNodeId": node_id[0],
+        "nodeType": 1,
+        "nodeName": rng.choice(["DIV", "SPAN", "A", "P", "LI", "IMG"]),
+        "localName": "div",
+        "nodeValue": "",
+        "childNodeCount": 0,
+        "attributes": ["class", f"c{rng.randint(0, 1000)}", "id", f"n{node_id[0]}"],
+    }
+    if depth > 0:
+        children = [_dom_node(rng, depth - 1, node_id) for _ in range(4)]
+        node["childNodeCount"] = len(children)
+        node["children"] = children
+    return node
+
+
+def _network_burst(rng: random.Random, count: int) -> List[Dict]:
+    msgs = []
+    for i in range(count):
+        request_id = f"1000.{i}"
+        url = f"https://example.com/static/{rng.getrandbits(64):x}.js"
+        msgs.append(
+            {
+                "method": "Network.requestWillBeSent",
+                "params": {
+                    "requestId": request_id,
+                    "loaderId": "LOADER",
+                    "documentURL": "https://example.com/",
+                    "request": {
+                        "url": url,
+                        "method": "GET",
+                        "headers": {"User-Agent": "Mozilla/5.0", "Accept": "*/*"},
+                        "mixedContentType": "none",
+                        "initialPriority": "High",
+                        "referrerPolicy": "no-referrer-when-downgrade",
+                    },
+                    "timestamp": 1000.0 + i,
+                    "wallTime": 1560000000.0 + i,
+                    "initiator": {"type": "parser", "url": "https://example.com/"},
+                    "type": "Script",
+                    "frameId": "FRAME",
+                    "hasUserGesture": False,
+                },
+            }
+        )
+        for chunk in range(3):
+            msgs.append(
+                {
+                    "method": "Network.dataReceived",
+                    "params": {
+                        "requestId": request_id,
+                        "timestamp": 1000.0 + i + chunk / 10,
+                        "dataLength": 65536,
+                        "encodedDataLength": 16384,
+                    },
+                }
+            )
+        msgs.append(
+            {
+                "method": "Network.loadingFinished",
+                "params": {
+                    "requestId": request_id,
+                    "timestamp": 1001.0 + i,
+                    "encodedDataLength": 49152,
+                    "shouldReportCorbBlocking": False,
+                },
+            }
+        )
+    return msgs
+
+
+def synthetic_traffic(seed: int = 1) -> Dict[str, List[str]]:
+    """Generates the synthetic recording of CDP traffic
+
+    :param seed: The seed used for the random content
+    :return: A dictionary of traffic kind to the list of raw frames of that kind
+    """
+    rng = random.Random(seed)
+    document = {"id": 1, "result": {"root": _dom_node(rng, 6, [0])}}
+    screenshot = {
+        "id": 2,
+        "result": {"data": base64.b64encode(os.urandom(3 * 1024 * 1024)).decode()},
+    }
+    network = _network_burst(rng, 500)
+    return {
+        "DOM.getDocument": [ujson.dumps(document)],
+        "Network.* burst": [ujson.dumps(msg) for msg in network],
+        "Page.captureScreenshot": [ujson.dumps(screenshot)],
+    }
+
+
+def load_traffic(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """Loads the recorded traffic found at path or generates the synthetic recording
+    if no path was supplied
+
+    :param path: Optional path to a file containing one raw frame per line
+    :return: A dictionary of traffic kind to the list of raw frames of that kind
+    """
+    if path is None:
+        return synthetic_traffic()
+    with Path(path).open("r") as iin:
+        return {Path(path).name: [line.rstrip("\n") for line in iin if line.strip()]}
+
+
+def outbound_commands(count: int = 5000) -> List[Dict]:
+    """Returns a list of commands typical of a high rate automation client
+
+    :param count: The number of commands to return
+    :return: The list of commands
+    """
+    cmds = []
+    for i in range(count):
+        if i % 3 == 0:
+            cmds.append(
+                {
+                    "id": i,
+                    "method": "Input.dispatchMouseEvent",
+                    "params": {"type": "mouseMoved", "x": i % 800, "y": i % 600},
+                }
+            )
+        elif i % 3 == 1:
+            cmds.append(
+                {
+                    "id": i,
+                    "method": "Page.screencastFrameAck",
+                    "params": {"sessionId": i},
+                }
+            )
+        else:
+            cmds.append(
+                {
+                    "id": i,
+                    "method": "Fetch.continueRequest",
+                    "params": {"requestId": f"interception-job-{i}.0"},
+                }
+            )
+    return cmds
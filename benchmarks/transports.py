@@ -0,0 +1,109 @@
+"""Compares the round trip throughput of Connection over the websocket and
+pipe transports, each talking to an in-process peer that answers every command.
+
+Usage: python -m benchmarks.transports [--commands N] [--concurrency N] [--rounds N]
+"""
+import argparse
+import asyncio
+import socket
+from time import perf_counter
+from typing import Awaitable, Callable, List
+
+import ujson
+import websockets
+
+from cripy.connection import Connection
+from cripy.transports import PIPE_DELIMITER, PipeTransport, Transport
+
+# keeps the peers alive while the benchmark runs
+PEERS: List = []
+RESULT = {"product": "HeadlessChrome/80.0.3987.0", "protocolVersion": "1.3"}
+
+
+def reply(frame: bytes) -> str:
+    return ujson.dumps({"id": ujson.loads(frame)["id"], "result": RESULT})
+
+
+async def ws_peer() -> Callable[[], Awaitable[Transport]]:
+    async def handler(ws, path=None) -> None:
+        async for frame in ws:
+            await ws.send(reply(frame))
+
+    server = await websockets.serve(handler, "127.0.0.1", 0)
+    PEERS.append(server)
+    port = server.sockets[0].getsockname()[1]
+
+    def make() -> Awaitable[Transport]:
+        from cripy.transports import WebSocketTransport
+
+        return WebSocketTransport.connect(f"ws://127.0.0.1:{port}")
+
+    return make
+
+
+async def pipe_peer() -> Callable[[], Awaitable[Transport]]:
+    ours, theirs = socket.socketpair()
+    reader, writer = await asyncio.open_connection(sock=theirs, limit=2 ** 31 - 1)
+
+    async def serve() -> None:
+        while 1:
+            try:
+                frame = await reader.readuntil(PIPE_DELIMITER)
+            except asyncio.IncompleteReadError:
+                return
+            writer.write(reply(frame[:-1]).encode("utf-8") + PIPE_DELIMITER)
+
+    PEERS.append(asyncio.get_event_loop().create_task(serve()))
+    return lambda: PipeTransport.from_socket(ours)
+
+
+async def bench(
+    make: Callable[[], Awaitable[Transport]],
+    commands: int,
+    concurrency: int,
+    rounds: int,
+) -> float:
+    conn = Connection()
+    await conn.connect(transport=await make())
+    per_worker = commands // concurrency
+
+    async def worker() -> None:
+        send = conn.send
+        for _ in range(per_worker):
+            await send("Browser.getVersion")
+
+    best = float("inf")
+    for _ in range(rounds):
+        start = perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        best = min(best, perf_counter() - start)
+    await conn.dispose()
+    return best
+
+
+async def run(args: argparse.Namespace) -> None:
+    peers = {"websocket": ws_peer, "pipe": pipe_peer}
+    for name in args.transports:
+        make = await peers[name]()
+        took = await bench(make, args.commands, args.concurrency, args.rounds)
+        print(
+            f"{name:>10}: {took * 1e3:9.2f} ms {args.commands / took:12.0f} round trips/s"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--transports",
+        nargs="+",
+        default=["websocket", "pipe"],
+        choices=["websocket", "pipe"],
+    )
+    asyncio.get_event_loop().run_until_complete(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
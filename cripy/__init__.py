@@ -1,33 +1,92 @@
 from typing import Union
 
+from .batching import EventBatcher, EventCoalescer, sum_fields
+from .binary import decode_base64, decode_base64_to_sink
 from .cdp import CDP, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_URL, connect
 from .cdp_session import CDPSession
 from .client import Client, ClientDynamic
-from .connection import Connection
-from .errors import ClientError, NetworkError, ProtocolError
+from .codec import Codec, JSONCodec, OrjsonCodec, UJSONCodec
+from .connection import Connection, dispose_all
+from .errors import (
+    ClientError,
+    CommandTimeoutError,
+    ConnectionLostError,
+    EventTimeoutError,
+    NetworkError,
+    ProtocolError,
+    TransportClosedError,
+)
 from .events import ConnectionEvents, SessionEvents
+from .group import ConnectionGroup
+from .priority import DEFAULT_BULK_METHODS, Priority
+from .proxy import CDPProxy
+from .reconnect import ReconnectPolicy
+from .runner import CrawlRunner, JobResult, WorkerStats
+from .stream import EventStream, Overflow
 from .target_session import TargetSession, TargetSessionDynamic
+from .threaded import ThreadedClient
+from .timing import TimedEvent
+from .transports import (
+    InMemoryTransport,
+    PipeTransport,
+    Transport,
+    UnixSocketTransport,
+    WebSocketTransport,
+    launch_with_pipe,
+)
 
 ConnectionType = Union[Client, Connection, ClientDynamic]
 SessionType = Union[TargetSession, CDPSession, TargetSessionDynamic]
 
 __all__ = [
     "CDP",
+    "CDPProxy",
     "CDPSession",
     "Client",
     "ClientDynamic",
     "ClientError",
+    "Codec",
+    "CommandTimeoutError",
     "connect",
     "Connection",
     "ConnectionEvents",
+    "ConnectionGroup",
+    "ConnectionLostError",
     "ConnectionType",
+    "CrawlRunner",
+    "DEFAULT_BULK_METHODS",
     "DEFAULT_HOST",
     "DEFAULT_PORT",
     "DEFAULT_URL",
+    "decode_base64",
+    "decode_base64_to_sink",
+    "dispose_all",
+    "EventBatcher",
+    "EventCoalescer",
+    "EventStream",
+    "EventTimeoutError",
+    "InMemoryTransport",
+    "JobResult",
+    "JSONCodec",
+    "launch_with_pipe",
     "NetworkError",
+    "OrjsonCodec",
+    "Overflow",
+    "PipeTransport",
+    "Priority",
     "ProtocolError",
+    "ReconnectPolicy",
     "SessionEvents",
     "SessionType",
+    "sum_fields",
     "TargetSession",
     "TargetSessionDynamic",
+    "ThreadedClient",
+    "TimedEvent",
+    "Transport",
+    "TransportClosedError",
+    "UJSONCodec",
+    "UnixSocketTransport",
+    "WebSocketTransport",
+    "WorkerStats",
 ]
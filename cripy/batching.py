@@ -0,0 +1,340 @@
+import logging
+from asyncio import AbstractEventLoop, Handle, TimerHandle, ensure_future
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+from .errors import ClientError
+
+__all__ = ["BatchHandler", "EventBatcher", "EventCoalescer", "sum_fields"]
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[List[Any]], Any]
+CoalesceKey = Union[str, Callable[[Any], Hashable]]
+CoalesceMerge = Callable[[Any, Any], Any]
+
+# marks a key without a pending event, None is a valid key
+_MISSING: Any = object()
+
+
+class EventBatcher:
+    """Collects the events, emitted by a connection or session, with the supplied name
+    and delivers them to the handler as a list, so that the cost of calling a
+    Python handler is paid per batch rather than per event.
+
+    Without a window a batch holds the events received in one receive burst: the
+    frames the receive loop handles before it yields to the event loop. The batch is
+    delivered in the next iteration of the event loop, before any code awaiting a
+    command whose response was received after the first event of the batch resumes.
+    So events received before a response are always delivered before the code
+    awaiting that response resumes.
+
+    With a window a batch holds the events received within window seconds of its
+    first event, so code awaiting a response may resume before the events received
+    ahead of that response are delivered. Call flush to deliver them early.
+
+    For wildcard events ("Domain.*" or "*") the batch holds (event, params) tuples.
+    """
+
+    __slots__ = [
+        "_batch",
+        "_batches",
+        "_emitter",
+        "_event",
+        "_events",
+        "_flush_handle",
+        "_handler",
+        "_loop",
+        "_max_size",
+        "_window",
+    ]
+
+    def __init__(
+        self,
+        emitter: Any,
+        event: str,
+        handler: BatchHandler,
+        window: Optional[float] = None,
+        max_size: Optional[int] = None,
+        loop: Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """Create a new EventBatcher
+
+        :param emitter: The connection or session emitting the events
+        :param event: The name of the event, or a wildcard
+        :param handler: The function called with each batch of events, if it returns
+        an awaitable the awaitable is scheduled using asyncio.ensure_future
+        :param window: Optional number of seconds the events of a batch are collected
+        for after its first event. Defaults to delivering a batch per receive burst
+        :param max_size: Optional maximum number of events in a batch, a full batch
+        is delivered immediately. Defaults to no limit
+        :param loop: Optional event loop the batches are delivered on.
+        Defaults to the loop of the emitter
+        """
+        if max_size is not None and max_size < 1:
+            raise ClientError(
+                f"The max_size of an EventBatcher must be >= 1, got {max_size}"
+            )
+        self._emitter: Any = emitter
+        self._event: str = event
+        self._handler: BatchHandler = handler
+        self._window: Optional[float] = window
+        self._max_size: Optional[int] = max_size
+        self._loop: AbstractEventLoop = loop if loop is not None else emitter.loop
+        self._batch: List[Any] = []
+        self._flush_handle: Optional[Union[Handle, TimerHandle]] = None
+        self._batches: int = 0
+        self._events: int = 0
+        emitter.on(event, self._on_event)
+
+    @property
+    def event(self) -> str:
+        """Returns the name of the batched events"""
+        return self._event
+
+    @property
+    def batches(self) -> int:
+        """Returns the number of batches delivered to the handler"""
+        return self._batches
+
+    @property
+    def events(self) -> int:
+        """Returns the number of events delivered to the handler"""
+        return self._events
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of events waiting to be delivered"""
+        return len(self._batch)
+
+    def flush(self) -> None:
+        """Delivers the events collected so far, if any"""
+        handle = self._flush_handle
+        if handle is not None:
+            self._flush_handle = None
+            handle.cancel()
+        batch = self._batch
+        if not batch:
+            return
+        self._batch = []
+        self._batches += 1
+        self._events += len(batch)
+        try:
+            result = self._handler(batch)
+            if result is not None and isawaitable(result):
+                ensure_future(result, loop=self._loop)
+        except Exception as e:
+            if self._emitter.listener_count("error"):
+                self._emitter.emit("error", e)
+            else:
+                logger.exception(f"The batch handler of {self._event} raised")
+
+    def close(self) -> None:
+        """Removes the listener of the batcher, after delivering the pending events"""
+        self._emitter.remove_listener(self._event, self._on_event)
+        self.flush()
+
+    def _on_event(self, *args: Any) -> None:
+        """Adds the event to the current batch, scheduling its delivery if it
+        is the first event of the batch
+
+        :param args: The event or, for wildcards, the name of the event and the event
+        """
+        batch = self._batch
+        batch.append(args[0] if len(args) == 1 else args)
+        if len(batch) == 1:
+            if self._window is None:
+                self._flush_handle = self._loop.call_soon(self.flush)
+            else:
+                self._flush_handle = self._loop.call_later(self._window, self.flush)
+        if self._max_size is not None and len(batch) >= self._max_size:
+            self.flush()
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(event={self._event}, window={self._window}, batches={self._batches})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class EventCoalescer:
+    """Keeps only the newest, or merged, event per key of the events, emitted by a
+    connection or session, with the supplied name and calls the handler once per key
+    with it, so that handlers of high frequency progress events only see the
+    latest state rather than every intermediate event.
+
+    Events are collected per receive burst or, with a window, for window seconds
+    after the first event, the same as EventBatcher. The handler is called with the
+    event of each key in the order the keys were first seen.
+
+    For wildcard events ("Domain.*" or "*") the events are coalesced per event name and
+    key, the key and merge functions are called with the events and the handler is
+    called with (event, params) tuples.
+    """
+
+    __slots__ = [
+        "_coalesced",
+        "_delivered",
+        "_emitter",
+        "_event",
+        "_flush_handle",
+        "_handler",
+        "_key",
+        "_loop",
+        "_merge",
+        "_pending",
+        "_window",
+    ]
+
+    def __init__(
+        self,
+        emitter: Any,
+        event: str,
+        handler: Callable[[Any], Any],
+        key: Optional[CoalesceKey] = None,
+        merge: Optional[CoalesceMerge] = None,
+        window: Optional[float] = None,
+        loop: Optional[AbstractEventLoop] = None,
+    ) -> None:
+        """Create a new EventCoalescer
+
+        :param emitter: The connection or session emitting the events
+        :param event: The name of the event, or a wildcard
+        :param handler: The function called with the event of each key, if it returns
+        an awaitable the awaitable is scheduled using asyncio.ensure_future
+        :param key: Optional name of the field of the events, e.g. requestId, or function
+        returning the key of an event. Defaults to every event sharing one key
+        :param merge: Optional function called with the pending event of a key and
+        a newer event of that key that returns the event kept, e.g. sum_fields.
+        Defaults to keeping the newer event
+        :param window: Optional number of seconds the events are collected for after
+        the first event. Defaults to delivering the events once per receive burst
+        :param loop: Optional event loop the events are delivered on.
+        Defaults to the loop of the emitter
+        """
+        self._emitter: Any = emitter
+        self._event: str = event
+        self._handler: Callable[[Any], Any] = handler
+        self._key: Optional[CoalesceKey] = key
+        self._merge: Optional[CoalesceMerge] = merge
+        self._window: Optional[float] = window
+        self._loop: AbstractEventLoop = loop if loop is not None else emitter.loop
+        self._pending: Dict[Hashable, Any] = {}
+        self._flush_handle: Optional[Union[Handle, TimerHandle]] = None
+        self._coalesced: int = 0
+        self._delivered: int = 0
+        emitter.on(event, self._on_event)
+
+    @property
+    def event(self) -> str:
+        """Returns the name of the coalesced events"""
+        return self._event
+
+    @property
+    def coalesced(self) -> int:
+        """Returns the number of events folded into the pending event of their key"""
+        return self._coalesced
+
+    @property
+    def delivered(self) -> int:
+        """Returns the number of events the handler was called with"""
+        return self._delivered
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of keys with an event waiting to be delivered"""
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Delivers the pending event of every key, if any"""
+        handle = self._flush_handle
+        if handle is not None:
+            self._flush_handle = None
+            handle.cancel()
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = {}
+        self._delivered += len(pending)
+        handler = self._handler
+        for event in pending.values():
+            try:
+                result = handler(event)
+                if result is not None and isawaitable(result):
+                    ensure_future(result, loop=self._loop)
+            except Exception as e:
+                if self._emitter.listener_count("error"):
+                    self._emitter.emit("error", e)
+                else:
+                    logger.exception(f"The coalesced handler of {self._event} raised")
+
+    def close(self) -> None:
+        """Removes the listener of the coalescer, after delivering the pending events"""
+        self._emitter.remove_listener(self._event, self._on_event)
+        self.flush()
+
+    def _on_event(self, *args: Any) -> None:
+        """Makes the event the pending event of its key, or merges it into the
+        pending event, scheduling the delivery if no event was pending
+
+        :param args: The event or, for wildcards, the name of the event and the event
+        """
+        if len(args) > 1:
+            name, params = args[0], args[1]
+        else:
+            name, params = None, args[0] if args else None
+        key = self._key
+        if key is None:
+            event_key = None
+        elif isinstance(key, str):
+            event_key = params.get(key) if isinstance(params, dict) else None
+        else:
+            event_key = key(params)
+        merge = self._merge
+        if name is None:
+            event = params
+        else:
+            # the events of a wildcard are coalesced per event name
+            event_key = (name, event_key)
+            event = (name, params)
+        pending = self._pending
+        current = pending.get(event_key, _MISSING)
+        if current is not _MISSING:
+            self._coalesced += 1
+            if merge is not None:
+                if name is None:
+                    event = merge(current, event)
+                else:
+                    event = (name, merge(current[1], params))
+            pending[event_key] = event
+            return
+        pending[event_key] = event
+        if len(pending) == 1:
+            if self._window is None:
+                self._flush_handle = self._loop.call_soon(self.flush)
+            else:
+                self._flush_handle = self._loop.call_later(self._window, self.flush)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(event={self._event}, key={self._key}, coalesced={self._coalesced})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def sum_fields(*fields: str) -> CoalesceMerge:
+    """Returns a merge function, for EventCoalescer, keeping the newer event
+    with the supplied numeric fields summed across the merged events,
+    e.g. sum_fields("dataLength", "encodedDataLength") for Network.dataReceived
+
+    :param fields: The names of the fields summed
+    :return: The merge function
+    """
+
+    def merge(current: Dict, event: Dict) -> Dict:
+        merged = dict(event)
+        for field in fields:
+            merged[field] = current.get(field, 0) + event.get(field, 0)
+        return merged
+
+    return merge
@@ -0,0 +1,87 @@
+from binascii import a2b_base64
+from typing import Any, Awaitable, Dict, Optional, Union
+
+__all__ = [
+    "BASE64_CHUNK_SIZE",
+    "binary_result",
+    "decode_base64",
+    "decode_base64_to_sink",
+]
+
+Base64 = Union[str, bytes, bytearray, memoryview]
+
+# The number of base64 characters decoded at a time when writing to a sink.
+# Must be a multiple of 4 so that every chunk decodes on its own
+BASE64_CHUNK_SIZE: int = 4 * 2 ** 16
+
+
+def decode_base64(data: Base64) -> bytes:
+    """Decodes the supplied base64 data, as found in the results of the commands
+    returning binary data (screenshots, PDFs, response bodies, streams).
+
+    The str found in a decoded result is decoded directly, without first
+    being encoded to bytes.
+
+    :param data: The base64 encoded data
+    :return: The decoded data
+    """
+    return a2b_base64(data)
+
+
+def decode_base64_to_sink(
+    data: Base64, sink: Any, chunk_size: int = BASE64_CHUNK_SIZE
+) -> int:
+    """Decodes the supplied base64 data chunk by chunk writing each decoded
+    chunk to the sink, so that the decoded data is never held in memory at once.
+
+    :param data: The base64 encoded data
+    :param sink: A file-like object opened for writing bytes
+    :param chunk_size: The number of base64 characters decoded at a time,
+    rounded down to a multiple of 4
+    :return: The number of bytes written to the sink
+    """
+    chunk_size = max(4, chunk_size - chunk_size % 4)
+    write = sink.write
+    written = 0
+    for start in range(0, len(data), chunk_size):
+        decoded = a2b_base64(data[start : start + chunk_size])
+        write(decoded)
+        written += len(decoded)
+    return written
+
+
+async def binary_result(
+    result: Awaitable[Dict],
+    field: str,
+    sink: Optional[Any] = None,
+    flag: Optional[str] = None,
+) -> Dict:
+    """Replaces the base64 encoded data found in the result of a command with
+    the decoded bytes or, if a sink was supplied, writes the decoded data to the sink
+    and replaces it with the number of bytes written. The encoded data is dropped
+    from the result once decoded so it is not kept alive along with the decoded data.
+
+    :param result: The pending result of the command
+    :param field: The name of the field holding the base64 encoded data
+    :param sink: Optional file-like object opened for writing bytes
+    :param flag: Optional name of the field indicating if the data is base64 encoded.
+    If it is false the data is text, which is encoded as UTF-8
+    :return: The result of the command
+    """
+    results = await result
+    data = results.pop(field, None)
+    if data is None:
+        return results
+    if flag is not None and not results.get(flag):
+        data = data.encode("utf-8")
+        if sink is None:
+            results[field] = data
+        else:
+            sink.write(data)
+            results[field] = len(data)
+        return results
+    if sink is None:
+        results[field] = a2b_base64(data)
+    else:
+        results[field] = decode_base64_to_sink(data, sink)
+    return results
@@ -4,13 +4,14 @@ from asyncio import AbstractEventLoop
 from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
-import ujson
 from aiohttp import AsyncResolver, ClientSession, TCPConnector
 
 from .client import Client, ClientDynamic
+from .codec import Codec, get_codec
 from .connection import Connection
 from .errors import ClientError
 from .protogen.generate import dynamically_generate_domains
+from .reconnect import ReconnectPolicy
 
 __all__ = [
     "DEFAULT_HOST",
@@ -37,17 +38,21 @@ WS_TEST: Pattern = re.compile(r"^wss?:", re.IGNORECASE)
 HTTP_TEST: Pattern = re.compile(r"^https?:", re.IGNORECASE)
 
 
-def make_http_session(loop: Optional[AbstractEventLoop] = None) -> ClientSession:
+def make_http_session(
+    loop: Optional[AbstractEventLoop] = None, codec: Optional[Union[str, Codec]] = None
+) -> ClientSession:
     """Creates and returns a new aiohttp.ClientSession that uses AsyncResolver
 
     :param loop: Optional asyncio event loop to use. Defaults to asyncio.get_event_loop()
+    :param codec: Optional JSON codec, or the name of one, used to serialize JSON.
+    Defaults to ujson
     :return: An instance of aiohttp.ClientSession
     """
     if loop is None:
         loop = asyncio.get_event_loop()
     return ClientSession(
         connector=TCPConnector(resolver=AsyncResolver(loop=loop), loop=loop),
-        json_serialize=ujson.dumps,
+        json_serialize=get_codec(codec).dumps_str,
         loop=loop,
     )
 
@@ -67,8 +72,14 @@ async def connect(
     url: Optional[str] = DEFAULT_URL,
     protocol: Optional[ProtocolDef] = None,
     remote: bool = False,
-    flatten_sessions: bool = False,
+    flatten_sessions: Optional[bool] = None,
     loop: Optional[AbstractEventLoop] = None,
+    codec: Optional[Union[str, Codec]] = None,
+    command_timeout: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
+    reconnect_policy: Optional[ReconnectPolicy] = None,
+    decode_threshold: Optional[int] = None,
+    record_timing: bool = False,
 ) -> Union[Client, ClientDynamic]:
     """Convince function for creating an instance of the ChromeRemoteInterface and connecting it
     to the remote instance.
@@ -81,8 +92,24 @@ async def connect(
     version should be used. It has no effect if the protocol option is set. Defaults to false
     :param flatten_sessions: a boolean indicating whether to enables the "flat" access to the session
     via specifying sessionId attribute in the commands when targets are connected to via either TargetSession
-    or CDPSession
+    or CDPSession. Defaults to probing the browser and using flat sessions if it supports them
     :param loop: The event loop instance to use. Defaults to asyncio.get_event_loop
+    :param codec: Optional JSON codec, or the name of one (ujson, json, orjson), used to encode
+    and decode messages. Defaults to ujson
+    :param command_timeout: Optional number of seconds commands have to receive a response,
+    unless a timeout is supplied to send. Defaults to no timeout
+    :param max_in_flight: Optional maximum number of commands sent using the client,
+    excluding those of its sessions, that can be awaiting their response at once.
+    Defaults to no limit
+    :param reconnect_policy: Optional policy enabling reconnecting, with exponential
+    backoff, when the websocket drops. Defaults to closing the connection when
+    the websocket drops
+    :param decode_threshold: Optional size, in characters or bytes, of the frames at or
+    above which they are decoded in a worker thread rather than on the event loop.
+    Defaults to decoding every frame on the event loop
+    :param record_timing: Record when every frame was received and its size, which are
+    then set on the futures of the commands and events are emitted as TimedEvents.
+    Defaults to not recording timing
     :return: Client instance connected to the browser
     """
     if loop is None:
@@ -104,12 +131,32 @@ async def connect(
         proto_def = await fetch_and_gen_proto_classes(ws_url, loop=loop)
     else:
         proto_def = None
+    client: Union[Client, ClientDynamic]
     if proto_def is not None:
         client = ClientDynamic(
-            ws_url, flatten_sessions=flatten_sessions, proto_def=proto_def, loop=loop
+            ws_url,
+            flatten_sessions=flatten_sessions,
+            proto_def=proto_def,
+            loop=loop,
+            codec=codec,
+            command_timeout=command_timeout,
+            max_in_flight=max_in_flight,
+            reconnect_policy=reconnect_policy,
+            decode_threshold=decode_threshold,
+            record_timing=record_timing,
         )
     else:
-        client = Client(ws_url, flatten_sessions=flatten_sessions, loop=loop)
+        client = Client(
+            ws_url,
+            flatten_sessions=flatten_sessions,
+            loop=loop,
+            codec=codec,
+            command_timeout=command_timeout,
+            max_in_flight=max_in_flight,
+            reconnect_policy=reconnect_policy,
+            decode_threshold=decode_threshold,
+            record_timing=record_timing,
+        )
     await client.connect()
     return client
 
@@ -292,8 +339,14 @@ class CDP:
         target: Optional[TargetArgT] = None,
         protocol: Optional[ProtocolDef] = None,
         remote: bool = False,
-        flatten_sessions: bool = False,
+        flatten_sessions: Optional[bool] = None,
         loop: Optional[AbstractEventLoop] = None,
+        codec: Optional[Union[str, Codec]] = None,
+        command_timeout: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        decode_threshold: Optional[int] = None,
+        record_timing: bool = False,
     ) -> Union[Client, ClientDynamic]:
         """Returns a cripy.Client instance connected to the desired target.
 
@@ -322,8 +375,24 @@ class CDP:
         version should be used. It has no effect if the protocol option is set. Defaults to false
         :param flatten_sessions: a boolean indicating whether to enables the "flat" access to the session
         via specifying sessionId attribute in the commands when targets are connected to via either TargetSession
-        or CDPSession
+        or CDPSession. Defaults to probing the browser and using flat sessions if it supports them
         :param loop: The event loop instance to use. Defaults to asyncio.get_event_loop
+        :param codec: Optional JSON codec, or the name of one (ujson, json, orjson), used to
+        encode and decode messages. Defaults to ujson
+        :param command_timeout: Optional number of seconds commands have to receive a response,
+        unless a timeout is supplied to send. Defaults to no timeout
+        :param max_in_flight: Optional maximum number of commands sent using the client,
+        excluding those of its sessions, that can be awaiting their response at once.
+        Defaults to no limit
+        :param reconnect_policy: Optional policy enabling reconnecting, with exponential
+        backoff, when the websocket drops. Defaults to closing the connection when
+        the websocket drops
+        :param decode_threshold: Optional size, in characters or bytes, of the frames at or
+        above which they are decoded in a worker thread rather than on the event loop.
+        Defaults to decoding every frame on the event loop
+        :param record_timing: Record when every frame was received and its size, which are
+        then set on the futures of the commands and events are emitted as TimedEvents.
+        Defaults to not recording timing
         :return: A cripy.Client instance connected to the desired target
         """
         if loop is None:
@@ -337,15 +406,32 @@ class CDP:
             proto_def = await fetch_and_gen_proto_classes(ws_url, loop=loop)
         else:
             proto_def = None
+        client: Union[Client, ClientDynamic]
         if proto_def is not None:
             client = ClientDynamic(
                 ws_url,
                 flatten_sessions=flatten_sessions,
                 proto_def=proto_def,
                 loop=loop,
+                codec=codec,
+                command_timeout=command_timeout,
+                max_in_flight=max_in_flight,
+                reconnect_policy=reconnect_policy,
+                decode_threshold=decode_threshold,
+                record_timing=record_timing,
             )
         else:
-            client = Client(ws_url, flatten_sessions=flatten_sessions, loop=loop)
+            client = Client(
+                ws_url,
+                flatten_sessions=flatten_sessions,
+                loop=loop,
+                codec=codec,
+                command_timeout=command_timeout,
+                max_in_flight=max_in_flight,
+                reconnect_policy=reconnect_policy,
+                decode_threshold=decode_threshold,
+                record_timing=record_timing,
+            )
         await client.connect()
         return client
 
@@ -355,8 +441,14 @@ class CDP:
         port: Optional[Union[int, str]] = DEFAULT_PORT,
         secure: Optional[bool] = False,
         target: Optional[TargetArgT] = None,
-        flatten_sessions: bool = False,
+        flatten_sessions: Optional[bool] = None,
         loop: Optional[AbstractEventLoop] = None,
+        codec: Optional[Union[str, Codec]] = None,
+        command_timeout: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        decode_threshold: Optional[int] = None,
+        record_timing: bool = False,
     ) -> Connection:
         """Returns a cripy.Connection instance connected to the desired target.
 
@@ -381,8 +473,24 @@ class CDP:
         :param target: Determines which target this client should attach to
         :param flatten_sessions: a boolean indicating whether to enables the "flat" access to the session
         via specifying sessionId attribute in the commands when targets are connected to via either TargetSession
-        or CDPSession
+        or CDPSession. Defaults to probing the browser and using flat sessions if it supports them
         :param loop: The event loop instance to use. Defaults to asyncio.get_event_loop
+        :param codec: Optional JSON codec, or the name of one (ujson, json, orjson), used to
+        encode and decode messages. Defaults to ujson
+        :param command_timeout: Optional number of seconds commands have to receive a response,
+        unless a timeout is supplied to send. Defaults to no timeout
+        :param max_in_flight: Optional maximum number of commands sent using the client,
+        excluding those of its sessions, that can be awaiting their response at once.
+        Defaults to no limit
+        :param reconnect_policy: Optional policy enabling reconnecting, with exponential
+        backoff, when the websocket drops. Defaults to closing the connection when
+        the websocket drops
+        :param decode_threshold: Optional size, in characters or bytes, of the frames at or
+        above which they are decoded in a worker thread rather than on the event loop.
+        Defaults to decoding every frame on the event loop
+        :param record_timing: Record when every frame was received and its size, which are
+        then set on the futures of the commands and events are emitted as TimedEvents.
+        Defaults to not recording timing
         :return: A cripy.Connection instance connected to the desired target
         """
         if loop is None:
@@ -391,7 +499,15 @@ class CDP:
             host=host, port=port, secure=secure, target=target, loop=loop
         )
         conn: Connection = Connection(
-            ws_url, flatten_sessions=flatten_sessions, loop=loop
+            ws_url,
+            flatten_sessions=flatten_sessions,
+            loop=loop,
+            codec=codec,
+            command_timeout=command_timeout,
+            max_in_flight=max_in_flight,
+            reconnect_policy=reconnect_policy,
+            decode_threshold=decode_threshold,
+            record_timing=record_timing,
         )
         await conn.connect()
         return conn
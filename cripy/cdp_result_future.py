@@ -1,12 +1,66 @@
 from asyncio import AbstractEventLoop, Future
-from typing import Optional
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .timers import Timer  # noqa: F401
+    from .window import CommandWindow  # noqa: F401
 
 __all__ = ["CDPResultFuture"]
 
 
 class CDPResultFuture(Future):
-    """A subclass of asyncio.Future to make linting happy about adding method to it"""
+    """A subclass of asyncio.Future to make linting happy about adding method to it.
+
+    If the future is cancelled, e.g. the task awaiting it was cancelled, it removes
+    itself from the callback table it was registered in, and frees its place in the
+    command window if one is used, right away rather than once the response for it
+    is received.
+
+    When the connection records timing, sent_at and received_at are the time.monotonic
+    timestamps of when the command was sent and its response was received and size is
+    the size in bytes of the frame carrying the response.
+
+    timer is the timer of the commands timeout, if it has one, which is cancelled
+    once the response is received or the future is cancelled.
+    """
 
-    def __init__(self, method: str, loop: Optional[AbstractEventLoop] = None) -> None:
+    timer: Optional["Timer"] = None
+
+    sent_at: Optional[float] = None
+    received_at: Optional[float] = None
+    size: Optional[int] = None
+
+    def __init__(
+        self,
+        method: str,
+        loop: Optional[AbstractEventLoop] = None,
+        callback_id: Optional[int] = None,
+        callbacks: Optional[Dict[int, "CDPResultFuture"]] = None,
+        window: Optional["CommandWindow"] = None,
+    ) -> None:
         super().__init__(loop=loop)
         self.method: str = method
+        self.callback_id: Optional[int] = callback_id
+        self._pending: Optional[Dict[int, CDPResultFuture]] = callbacks
+        self._window: Optional["CommandWindow"] = window
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Returns the number of seconds between sending the command and receiving
+        its response, if the connection records timing"""
+        if self.sent_at is None or self.received_at is None:
+            return None
+        return self.received_at - self.sent_at
+
+    def cancel(self, *args: Any, **kwargs: Any) -> bool:
+        cancelled = super().cancel(*args, **kwargs)
+        if cancelled and self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if cancelled and self._pending is not None:
+            self._pending.pop(self.callback_id, None)
+            self._pending = None
+            if self._window is not None:
+                self._window.done(self.callback_id)
+                self._window = None
+        return cancelled
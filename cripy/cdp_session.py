@@ -1,26 +1,68 @@
-from asyncio import AbstractEventLoop, get_event_loop
-from typing import ClassVar, Dict, Optional, TYPE_CHECKING, Type, Union
-
-from ujson import dumps, loads
-from pyee2 import EventEmitterS
+import logging
+from asyncio import AbstractEventLoop, Future, get_event_loop
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from .cdp_result_future import CDPResultFuture
-from .errors import NetworkError, create_protocol_error
+from .codec import Codec
+from .dispatch import EventDispatcher
+from .errors import (
+    CommandTimeoutError,
+    ConnectionLostError,
+    NetworkError,
+    create_protocol_error,
+)
 from .events import SessionEvents
+from .frames import peek_error, peek_id, peek_method
+from .priority import resolve_priority
+from .reconnect import record_state
+from .timers import Timers
+from .timing import TimedEvent
+from .waiters import EventPredicate, EventWaiter
+from .window import CommandWindow
 
 if TYPE_CHECKING:  # pragma: no cover
     from cripy import ConnectionType, SessionType  # noqa: F401
 
+logger = logging.getLogger(__name__)
+
 
-class CDPSession(EventEmitterS):
+class CDPSession(EventDispatcher):
     __slots__ = [
+        "_bulk_methods",
         "_lastId",
+        "_record_timing",
         "_connection",
+        "_discarded_responses",
         "_target_type",
         "_session_id",
         "_flat_session",
         "_callbacks",
+        "_codec",
+        "_notification_errors",
+        "_notifications",
+        "_command_timeout",
+        "_session_max_in_flight",
         "_sessions",
+        "_skipped_events",
+        "_state",
+        "_suspended",
+        "_target_id",
+        "_timers",
+        "_wait_timers",
+        "_window",
     ]
 
     Events: ClassVar[Type[SessionEvents]] = SessionEvents
@@ -31,6 +73,8 @@ class CDPSession(EventEmitterS):
         target_type: str,
         session_id: str,
         flat_session: bool = False,
+        max_in_flight: Optional[int] = None,
+        target_id: Optional[str] = None,
     ) -> None:
         """Make new session
 
@@ -39,6 +83,11 @@ class CDPSession(EventEmitterS):
         :param session_id: The id of the session being connected to
         :param flat_session: Should any sessions created from this session
         using flat session mode
+        :param max_in_flight: Optional maximum number of commands sent using the session
+        that can be awaiting their response at once. Defaults to the session_max_in_flight
+        of the connection
+        :param target_id: Optional id of the target, required for the session to be
+        re-attached when the connection reconnects
         """
         _loop: AbstractEventLoop = (
             connection.loop if connection.loop is not None else get_event_loop()
@@ -48,20 +97,143 @@ class CDPSession(EventEmitterS):
         self._connection: Union["ConnectionType", "SessionType"] = connection
         self._target_type: str = target_type
         self._session_id: str = session_id
+        self._target_id: Optional[str] = target_id
+        self._suspended: bool = False
         self._flat_session: bool = flat_session
         self._callbacks: Dict[int, CDPResultFuture] = {}
+        self._notifications: Dict[int, str] = {}
+        self._notification_errors: int = 0
         self._sessions: Dict[str, SessionType] = {}
+        self._codec: Codec = connection.codec
+        self._bulk_methods: FrozenSet[str] = connection.bulk_methods
+        self._record_timing: bool = connection.record_timing
+        self._skipped_events: int = 0
+        self._discarded_responses: int = 0
+        self._command_timeout: Optional[float] = connection.command_timeout
+        self._timers: Timers = connection._timers
+        self._wait_timers: Timers = connection._wait_timers
+        self._state: Optional[Dict[str, Dict]] = (
+            {} if connection._state is not None else None
+        )
+        self._session_max_in_flight: Optional[int] = connection.session_max_in_flight
+        if max_in_flight is None:
+            max_in_flight = self._session_max_in_flight
+        self._window: Optional[CommandWindow] = None
+        if max_in_flight is not None:
+            self.max_in_flight = max_in_flight
 
     @property
     def loop(self) -> AbstractEventLoop:
         """Returns the instance of event loop"""
         return self._loop
 
+    @property
+    def codec(self) -> Codec:
+        """Returns the JSON codec used by the session"""
+        return self._codec
+
+    @property
+    def bulk_methods(self) -> FrozenSet[str]:
+        """Returns the methods of the commands sent with bulk priority by default"""
+        return self._bulk_methods
+
     @property
     def flat_session(self) -> bool:
         """Returns T/F indicating if flat session mode is enabled"""
         return self._flat_session
 
+    @property
+    def record_timing(self) -> bool:
+        """Returns T/F indicating if the receive time and size of the frames are recorded"""
+        return self._record_timing
+
+    @record_timing.setter
+    def record_timing(self, value: bool) -> None:
+        """Sets whether the receive time and size of the frames are recorded,
+        for this session and its sessions. See Connection.record_timing
+
+        :param value: T/F indicating if timing is recorded
+        """
+        self._record_timing = value
+        for session in self._sessions.values():
+            session.record_timing = value
+
+    @property
+    def _flat_connection(self) -> "ConnectionType":
+        """Returns the connection of a flat session, which is always the connection
+        the session was created by"""
+        return cast("ConnectionType", self._connection)
+
+    @property
+    def command_timeout(self) -> Optional[float]:
+        """Returns the default number of seconds commands have to receive a response"""
+        return self._command_timeout
+
+    @command_timeout.setter
+    def command_timeout(self, value: Optional[float]) -> None:
+        """Sets the default number of seconds commands have to receive a response.
+        Only affects commands sent after it was set.
+
+        :param value: The number of seconds or None for no timeout
+        """
+        self._command_timeout = value
+
+    @property
+    def max_in_flight(self) -> Optional[int]:
+        """Returns the maximum number of commands that can be awaiting their
+        response at once"""
+        return self._window.limit if self._window is not None else None
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int) -> None:
+        """Sets the maximum number of commands that can be awaiting their
+        response at once
+
+        :param value: The maximum number of commands
+        """
+        if self._window is not None:
+            self._window.limit = value
+        elif self._flat_session:
+            connection = self._flat_connection
+            self._window = connection._new_window(value, connection._enqueue)
+        else:
+            self._window = self._connection._new_window(value, self._send_to_target)
+
+    @property
+    def session_max_in_flight(self) -> Optional[int]:
+        """Returns the maximum number of commands per session that can be awaiting
+        their response at once, used for the sessions created by this session"""
+        return self._session_max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of commands that are awaiting their response"""
+        if self._window is not None:
+            return self._window.in_flight
+        return len(self._callbacks)
+
+    @property
+    def queued_commands(self) -> int:
+        """Returns the number of commands waiting for room in the in flight window"""
+        return self._window.parked if self._window is not None else 0
+
+    @property
+    def notification_errors(self) -> int:
+        """Returns the number of commands sent using send_nowait that failed"""
+        return self._notification_errors
+
+    @property
+    def skipped_events(self) -> int:
+        """Returns the number of events that were dropped without being
+        decoded because nobody was listening for them"""
+        return self._skipped_events
+
+    @property
+    def discarded_responses(self) -> int:
+        """Returns the number of responses that were discarded because the command
+        they are for was cancelled or timed out before they were received"""
+        return self._discarded_responses
+
     @property
     def session_id(self) -> str:
         """Returns the id of the session"""
@@ -72,38 +244,230 @@ class CDPSession(EventEmitterS):
         """Returns the type of the target"""
         return self._target_type
 
-    def send(self, method: str, params: Optional[Dict] = None) -> CDPResultFuture:
+    @property
+    def target_id(self) -> Optional[str]:
+        """Returns the id of the target, if known"""
+        return self._target_id
+
+    def send(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        priority: Optional[int] = None,
+    ) -> CDPResultFuture:
         """Send message to the connected session.
 
         :param method: Protocol method name
         :param params: Optional method parameters
-        :return: A future that resolves once a response has been received
+        :param timeout: Optional number of seconds the command has to receive a response
+        before failing with CommandTimeoutError. Defaults to the sessions command_timeout
+        :param priority: Optional priority (Priority.CONTROL or Priority.BULK) of the command.
+        Defaults to bulk if the method is one of the bulk_methods otherwise control
+        :return: A future that resolves once a response has been received. If the in
+        flight window is full the command is written once there is room, awaiting the future
+        awaits that too
         """
         if not self._connection:  # pragma: no cover
             raise NetworkError(
                 f"Protocol Error ({method}): Session closed. Most likely the "
                 f"target {self._target_type} has been closed."
             )
+        if self._suspended:
+            raise ConnectionLostError(
+                f"{method}: Connection lost, the session is being re-attached"
+            )
         if params is None:
             params = {}
+        window = self._window
+        priority = resolve_priority(method, priority, self._bulk_methods)
         if self._flat_session:
-            _id = self._connection._raw_send(
-                {"method": method, "params": params, "sessionId": self.session_id}
+            _id = self._flat_connection._raw_send(
+                {"method": method, "params": params, "sessionId": self.session_id},
+                priority,
+                window,
             )
-            callback = CDPResultFuture(method, self._loop)
-            self._callbacks[_id] = callback
-            return callback
-        self._lastId += 1
-        _id = self._lastId
-        msg = dumps({"id": _id, "method": method, "params": params})
-        callback = CDPResultFuture(method, self._loop)
+        else:
+            self._lastId += 1
+            _id = self._lastId
+            msg = {"id": _id, "method": method, "params": params}
+            if window is None:
+                self._send_to_target(msg, priority)
+            else:
+                window.submit(msg, priority)
+        if self._state is not None:
+            record_state(self._state, method, params)
+        callback = CDPResultFuture(method, self._loop, _id, self._callbacks, window)
+        if self._record_timing:
+            callback.sent_at = monotonic()
         self._callbacks[_id] = callback
-        self._connection.send(
+        if timeout is None:
+            timeout = self._command_timeout
+        if timeout is not None:
+            callback.timer = self._timers.call_later(
+                timeout, self._expire_command, _id, timeout
+            )
+        return callback
+
+    def send_nowait(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        priority: Optional[int] = None,
+    ) -> None:
+        """Send message to the connected session without waiting for its response.
+
+        No future is created for the command and its response is discarded, without
+        being decoded, if it was successful. If the command failed the failure is counted
+        (notification_errors) and the ProtocolError is emitted as
+        SessionEvents.NotificationError, or logged at the debug level if nobody
+        is listening for it. The command does not enter the in flight window, but
+        it does not overtake the commands waiting for room in the window either.
+
+        :param method: Protocol method name
+        :param params: Optional method parameters
+        :param priority: Optional priority (Priority.CONTROL or Priority.BULK) of the command.
+        Defaults to bulk if the method is one of the bulk_methods otherwise control
+        """
+        if not self._connection:  # pragma: no cover
+            raise NetworkError(
+                f"Protocol Error ({method}): Session closed. Most likely the "
+                f"target {self._target_type} has been closed."
+            )
+        if self._suspended:
+            raise ConnectionLostError(
+                f"{method}: Connection lost, the session is being re-attached"
+            )
+        if params is None:
+            params = {}
+        if self._state is not None:
+            record_state(self._state, method, params)
+        priority = resolve_priority(method, priority, self._bulk_methods)
+        window = self._window
+        if self._flat_session:
+            _id = self._flat_connection._raw_send(
+                {"method": method, "params": params, "sessionId": self.session_id},
+                priority,
+                window,
+                nowait=True,
+            )
+        else:
+            self._lastId += 1
+            _id = self._lastId
+            msg = {"id": _id, "method": method, "params": params}
+            if window is None:
+                self._send_to_target(msg, priority)
+            else:
+                window.submit_nowait(msg, priority)
+        self._notifications[_id] = method
+
+    def _send_to_target(self, msg: Dict, priority: int) -> None:
+        """Sends the message to the target of this non-flat session by
+        wrapping it in Target.sendMessageToTarget. The wrapping command is sent
+        using send_nowait as its response carries nothing, the response of the
+        wrapped command is received as Target.receivedMessageFromTarget
+
+        :param msg: The message to be sent, its id must already be set
+        :param priority: The priority of the message
+        """
+        self._connection.send_nowait(
             "Target.sendMessageToTarget",
-            {"sessionId": self._session_id, "message": msg},
+            {"sessionId": self._session_id, "message": self._codec.dumps_str(msg)},
+            priority,
         )
+
+    def _take_callback(self, callback_id: int) -> Optional[CDPResultFuture]:
+        """Removes the future of the command identified by the supplied id from
+        the pending commands, freeing its place in the in flight window
+
+        :param callback_id: The id of the command
+        :return: The future of the command if it was pending
+        """
+        callback = self._callbacks.pop(callback_id, None)
+        if callback is not None:
+            if callback.timer is not None:
+                callback.timer.cancel()
+                callback.timer = None
+            if self._window is not None:
+                self._window.done(callback_id)
+            if self._record_timing:
+                callback.received_at, callback.size = self._frame_timing()
         return callback
 
+    def pause_reading(self) -> int:
+        """Stops the connection of the session dispatching the events it receives.
+        See Connection.pause_reading
+
+        :return: The epoch of the pause, to be supplied to resume_reading
+        """
+        if not self._connection:
+            raise NetworkError(f"CDPSession for {self._target_type} already closed.")
+        return self._connection.pause_reading()
+
+    def resume_reading(self, epoch: Optional[int] = None) -> None:
+        """Undoes a call to pause_reading, does nothing once the session
+        is closed. See Connection.resume_reading
+
+        :param epoch: Optional epoch returned by pause_reading
+        """
+        if self._connection:
+            self._connection.resume_reading(epoch)
+
+    def _new_window(
+        self, limit: int, write: Callable[[Dict, int], Any]
+    ) -> CommandWindow:
+        """Creates an in flight window for a session created by this session.
+        See Connection._new_window
+
+        :param limit: The maximum number of commands in flight at once
+        :param write: The function used to write a command that entered the window
+        :return: The window
+        """
+        return self._connection._new_window(limit, write)
+
+    def _frame_timing(self) -> Tuple[float, int]:
+        """Returns the receive time and size of the frame, received by the connection,
+        being handled when timing is recorded
+
+        :return: The time.monotonic timestamp of when the frame was received and its size
+        """
+        return self._connection._frame_timing()
+
+    async def wait_for_room(self) -> None:
+        """Waits until a command sent using the session right after would be
+        written right away rather than wait for room in the in flight window.
+        Returns immediately if the session has no in flight window
+        """
+        if self._window is not None:
+            await self._window.wait_for_room()
+
+    def wait_for(
+        self,
+        event: str,
+        predicate: Optional[EventPredicate] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Waits for the first event, with the supplied name, emitted by this session
+        that is accepted by the predicate.
+
+        The listener used to wait is removed once the returned future is done,
+        including when it is cancelled, e.g. by asyncio.wait_for.
+
+        :param event: The name of the event, e.g. Page.loadEventFired
+        :param predicate: Optional function called with each event that returns
+        T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event before
+        failing with EventTimeoutError. Defaults to no timeout
+        :return: A future that resolves with the event. If the session closes
+        first it fails with NetworkError
+        """
+        future = self._loop.create_future()
+        if not self._connection:
+            future.set_exception(NetworkError(f"{event}: Session closed"))
+            return future
+        EventWaiter(self, event, future, predicate, timeout, self._wait_timers)
+        return future
+
     async def detach(self) -> None:
         """Detach session from target. Once detached, session won't emit any events and
         can't be used to send messages.
@@ -127,7 +491,7 @@ class CDPSession(EventEmitterS):
             connection, target_type, session_id, flat_session=self._flat_session
         )
         if self._flat_session:
-            self._connection.add_session(session)
+            self._flat_connection.add_session(session)
         else:
             self._sessions[session_id] = session
         return session
@@ -140,13 +504,23 @@ class CDPSession(EventEmitterS):
         :param maybe_str_or_dict: The message received
         """
         if isinstance(maybe_str_or_dict, str):
-            obj = loads(maybe_str_or_dict)
+            method = peek_method(maybe_str_or_dict)
+            if method is None:
+                _id = peek_id(maybe_str_or_dict)
+                if _id is not None and self._discard_response(_id, maybe_str_or_dict):
+                    return
+            elif not method.startswith("Target.") and not self.has_listeners(method):
+                self._skipped_events += 1
+                return
+            obj = self._codec.loads(maybe_str_or_dict)
         else:
             obj = maybe_str_or_dict
         _id = obj.get("id")
-        if _id and _id in self._callbacks:
-            callback = self._callbacks.pop(_id)
-            if "error" in obj:
+        if _id is not None:
+            callback = self._take_callback(_id)
+            if callback is None:
+                self._on_uncalled_response(_id, obj)
+            elif "error" in obj:
                 # Checking state of the future object.
                 # It can be canceled.
                 if callback and not callback.done():
@@ -170,9 +544,106 @@ class CDPSession(EventEmitterS):
                 if session is not None:
                     session.on_closed()
                     del self._sessions[session_id]
-            return
+                return
+        if self._record_timing:
+            params = TimedEvent(params, *self._frame_timing())
         self.emit(method, params)
 
+    def _discard_response(self, _id: int, message: Union[str, bytes]) -> bool:
+        """Discards the raw response message with the supplied id if nobody is
+        waiting for it, that is the command it is for is no longer pending because it
+        was cancelled or timed out or it was sent using send_nowait and succeeded
+
+        :param _id: The id of the response
+        :param message: The raw JSON message
+        :return: T/F indicating if the message was discarded
+        """
+        if _id in self._callbacks:
+            return False
+        notifications = self._notifications
+        if _id in notifications:
+            if peek_error(message):
+                return False
+            del notifications[_id]
+            return True
+        self._discarded_responses += 1
+        return True
+
+    def _on_uncalled_response(self, _id: int, msg: Dict) -> None:
+        """Handles a decoded response no future is waiting for, it is either
+        the response of a command sent using send_nowait or a late response
+
+        :param _id: The id of the response
+        :param msg: The response
+        """
+        method = self._notifications.pop(_id, None)
+        if method is None:
+            self._discarded_responses += 1
+            return
+        if "error" not in msg:
+            return
+        self._notification_errors += 1
+        error = create_protocol_error(method, msg)
+        if self.has_listeners(SessionEvents.NotificationError):
+            self.emit(SessionEvents.NotificationError, error)
+        else:
+            logger.debug(str(error))
+
+    def _expire_command(self, callback_id: int, timeout: float) -> None:
+        """Fails the command identified by the supplied id with CommandTimeoutError
+        if it has not received its response yet
+
+        :param callback_id: The id of the command
+        :param timeout: The timeout of the command
+        """
+        callback = self._take_callback(callback_id)
+        if callback is not None and not callback.done():
+            callback.set_exception(
+                CommandTimeoutError(
+                    f"{callback.method}: No response received within {timeout} seconds"
+                )
+            )
+
+    def on_connection_lost(self) -> None:
+        """Suspends this session because the connection was lost. Its pending commands
+        are failed with ConnectionLostError, as are commands sent until it is re-attached.
+        Sessions created from this session in non-flat mode are closed"""
+        for cb in self._callbacks.values():
+            if not cb.done():
+                cb.set_exception(ConnectionLostError(f"{cb.method}: Connection lost"))
+        self._callbacks.clear()
+        self._notifications.clear()
+        if self._window is not None:
+            self._window.clear()
+        for session in self._sessions.values():
+            session.on_closed()
+        self._sessions.clear()
+        self._suspended = True
+
+    def _record_state(self, enabled: bool) -> None:
+        """Starts or stops recording the commands replayed once re-attached,
+        for this session and its sessions
+
+        :param enabled: T/F indicating if the commands are recorded
+        """
+        if enabled == (self._state is not None):
+            return
+        self._state = {} if enabled else None
+        for session in self._sessions.values():
+            session._record_state(enabled)
+
+    def on_reattached(self, session_id: str) -> None:
+        """Resumes this session once it was re-attached to its target
+        after the connection reconnected, replaying the recorded commands
+
+        :param session_id: The id of the new session with the target
+        """
+        self._session_id = session_id
+        self._suspended = False
+        if self._state is not None:
+            for method, params in list(self._state.items()):
+                self.send_nowait(method, params)
+
     def on_closed(self) -> None:
         """Close this session"""
         for cb in self._callbacks.values():
@@ -183,6 +654,9 @@ class CDPSession(EventEmitterS):
                     )
                 )
         self._callbacks.clear()
+        self._notifications.clear()
+        if self._window is not None:
+            self._window.clear()
         for session in self._sessions.values():
             session.on_closed()
         self._sessions.clear()
@@ -1,6 +1,7 @@
 from asyncio import AbstractEventLoop
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Union, cast
 
+from .codec import Codec
 from .connection import Connection
 from .protocol import (
     Accessibility,
@@ -48,6 +49,7 @@ from .protocol import (
     WebAudio,
 )
 
+from .reconnect import ReconnectPolicy
 from .target_session import TargetSession, TargetSessionDynamic
 
 __all__ = ["Client", "ClientDynamic"]
@@ -103,17 +105,49 @@ class Client(Connection):
     def __init__(
         self,
         ws_url: Optional[str] = None,
-        flatten_sessions: bool = False,
+        flatten_sessions: Optional[bool] = None,
         loop: Optional[AbstractEventLoop] = None,
+        codec: Optional[Union[str, Codec]] = None,
+        command_timeout: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        decode_threshold: Optional[int] = None,
+        record_timing: bool = False,
     ) -> None:
         """Construct a new instance of the ChromeRemoteInterface Client.
 
         :param ws_url: The WS endpoint of the remote instance
         :param flatten_sessions: Enables "flat" access to the session via specifying sessionId
-        attribute in the commands
+        attribute in the commands. Defaults to probing the browser when connecting
         :param loop:  Optional event loop to use. Defaults to asyncio.get_event_loop
+        :param codec: Optional JSON codec, or the name of one, used to encode and decode
+        messages. Defaults to ujson
+        :param command_timeout: Optional number of seconds commands have to receive a response,
+        unless a timeout is supplied to send. Defaults to no timeout
+        :param max_in_flight: Optional maximum number of commands sent using the client,
+        excluding those of its sessions, that can be awaiting their response at once.
+        Defaults to no limit
+        :param reconnect_policy: Optional policy enabling reconnecting, with exponential
+        backoff, when the websocket drops. Defaults to closing the connection when
+        the websocket drops
+        :param decode_threshold: Optional size, in characters or bytes, of the frames at or
+        above which they are decoded in a worker thread rather than on the event loop.
+        Defaults to decoding every frame on the event loop
+        :param record_timing: Record when every frame was received and its size, which are
+        then set on the futures of the commands and events are emitted as TimedEvents.
+        Defaults to not recording timing
         """
-        super().__init__(ws_url, flatten_sessions, loop)
+        super().__init__(
+            ws_url,
+            flatten_sessions,
+            loop,
+            codec,
+            command_timeout=command_timeout,
+            max_in_flight=max_in_flight,
+            reconnect_policy=reconnect_policy,
+            decode_threshold=decode_threshold,
+            record_timing=record_timing,
+        )
         self.Accessibility: Accessibility = Accessibility(self)
         self.Animation: Animation = Animation(self)
         self.ApplicationCache: ApplicationCache = ApplicationCache(self)
@@ -165,7 +199,7 @@ class Client(Connection):
         :param session_id: The id of the session
         :return: The TargetSession instance associated with the supplied id if it exists
         """
-        return self._sessions.get(session_id)
+        return cast(Optional["TargetSession"], self._sessions.get(session_id))
 
     async def create_session(self, target_id: str) -> "TargetSession":
         """Attach to the target specified by the supplied target id and creates new CDPSession for
@@ -180,22 +214,29 @@ class Client(Connection):
         resp = await self.send("Target.attachToTarget", params)
         session_id = resp.get("sessionId")
         if self._flatten_sessions:
-            session: TargetSession = self._sessions.get(session_id)
+            session = cast(TargetSession, self._sessions.get(session_id))
             if session:
                 return session
-        session = self._new_session(resp.get("type", "unknown"), session_id)
+        session = self._new_session(resp.get("type", "unknown"), session_id, target_id)
         self._sessions[session_id] = session
         return session
 
-    def _new_session(self, target_type: str, session_id: str) -> "TargetSession":
+    def _new_session(
+        self, target_type: str, session_id: str, target_id: Optional[str] = None
+    ) -> "TargetSession":
         """Create a new session for the supplied target
 
         :param target_type: The type of the target
         :param session_id: The session id for the target
+        :param target_id: The id of the target, if known
         :return: A TargetSession connected to the target
         """
         return TargetSession(
-            self, target_type, session_id, flat_session=self._flatten_sessions
+            self,
+            target_type,
+            session_id,
+            flat_session=self._flatten_sessions,
+            target_id=target_id,
         )
 
 
@@ -203,20 +244,52 @@ class ClientDynamic(Connection):
     def __init__(
         self,
         ws_url: Optional[str] = None,
-        flatten_sessions: bool = False,
+        flatten_sessions: Optional[bool] = None,
         proto_def: Dict = None,
         loop: Optional[AbstractEventLoop] = None,
+        codec: Optional[Union[str, Codec]] = None,
+        command_timeout: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        decode_threshold: Optional[int] = None,
+        record_timing: bool = False,
     ) -> None:
         """Construct a new instance of ClientDynamic.
 
         :param ws_url: The WS endpoint of the remote instance
         :param flatten_sessions: Enables "flat" access to the session via specifying sessionId
-        attribute in the commands
+        attribute in the commands. Defaults to probing the browser when connecting
         :param proto_def: Optional protocol domain classes to be used rather than
         the pre-generated ones
         :param loop:  Optional event loop to use. Defaults to asyncio.get_event_loop
+        :param codec: Optional JSON codec, or the name of one, used to encode and decode
+        messages. Defaults to ujson
+        :param command_timeout: Optional number of seconds commands have to receive a response,
+        unless a timeout is supplied to send. Defaults to no timeout
+        :param max_in_flight: Optional maximum number of commands sent using the client,
+        excluding those of its sessions, that can be awaiting their response at once.
+        Defaults to no limit
+        :param reconnect_policy: Optional policy enabling reconnecting, with exponential
+        backoff, when the websocket drops. Defaults to closing the connection when
+        the websocket drops
+        :param decode_threshold: Optional size, in characters or bytes, of the frames at or
+        above which they are decoded in a worker thread rather than on the event loop.
+        Defaults to decoding every frame on the event loop
+        :param record_timing: Record when every frame was received and its size, which are
+        then set on the futures of the commands and events are emitted as TimedEvents.
+        Defaults to not recording timing
         """
-        super().__init__(ws_url, flatten_sessions, loop)
+        super().__init__(
+            ws_url,
+            flatten_sessions,
+            loop,
+            codec,
+            command_timeout=command_timeout,
+            max_in_flight=max_in_flight,
+            reconnect_policy=reconnect_policy,
+            decode_threshold=decode_threshold,
+            record_timing=record_timing,
+        )
         self._proto_def: Dict = proto_def
         for domain, clazz in proto_def.items():
             setattr(self, domain, clazz(self))
@@ -228,7 +301,7 @@ class ClientDynamic(Connection):
         :param session_id: The id of the session
         :return: The TargetSession instance associated with the supplied id if it exists
         """
-        return self._sessions.get(session_id)
+        return cast(Optional["TargetSessionDynamic"], self._sessions.get(session_id))
 
     async def create_session(self, target_id: str) -> "TargetSessionDynamic":
         """Attach to the target specified by the supplied target id and creates new CDPSession for
@@ -243,18 +316,21 @@ class ClientDynamic(Connection):
         resp = await self.send("Target.attachToTarget", params)
         session_id = resp.get("sessionId")
         if self._flatten_sessions:
-            session: TargetSessionDynamic = self._sessions.get(session_id)
+            session = cast(TargetSessionDynamic, self._sessions.get(session_id))
             if session:
                 return session
-        session = self._new_session(resp.get("type", "unknown"), session_id)
+        session = self._new_session(resp.get("type", "unknown"), session_id, target_id)
         self._sessions[session_id] = session
         return session
 
-    def _new_session(self, target_type: str, session_id: str) -> "TargetSessionDynamic":
+    def _new_session(
+        self, target_type: str, session_id: str, target_id: Optional[str] = None
+    ) -> "TargetSessionDynamic":
         """Create a new session for the supplied target
 
         :param target_type: The type of the target
         :param session_id: The session id for the target
+        :param target_id: The id of the target, if known
         :return: A TargetSession connected to the target
         """
         return TargetSessionDynamic(
@@ -263,4 +339,5 @@ class ClientDynamic(Connection):
             session_id,
             flat_session=self._flatten_sessions,
             proto_def=self._proto_def,
+            target_id=target_id,
         )
@@ -0,0 +1,167 @@
+import json
+from typing import Any, ClassVar, Dict, Optional, Type, Union
+
+import ujson
+
+from .errors import ClientError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__all__ = [
+    "Codec",
+    "DEFAULT_CODEC",
+    "JSONCodec",
+    "OrjsonCodec",
+    "UJSONCodec",
+    "get_codec",
+]
+
+Encoded = Union[str, bytes]
+Decodable = Union[str, bytes, bytearray, memoryview]
+
+
+class Codec:
+    """Base class of the JSON codecs used to encode the messages sent to and
+    decode the messages received from the remote browser.
+
+    A codec's dumps may return either str or bytes and its loads must accept
+    both str and bytes, that way a transport that works on raw bytes never has to
+    round trip through str. Transports that can only send text (websockets) should
+    use dumps_str.
+    """
+
+    __slots__ = []
+
+    name: ClassVar[str] = "codec"
+
+    def dumps(self, obj: Any) -> Encoded:
+        """Encodes the supplied object
+
+        :param obj: The object to be encoded
+        :return: The encoded object as either str or bytes
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    def dumps_str(self, obj: Any) -> str:
+        """Encodes the supplied object to a str
+
+        :param obj: The object to be encoded
+        :return: The encoded object
+        """
+        encoded = self.dumps(obj)
+        if isinstance(encoded, bytes):
+            return encoded.decode("utf-8")
+        return encoded
+
+    def loads(self, data: Decodable) -> Any:
+        """Decodes the supplied JSON str or bytes
+
+        :param data: The JSON to be decoded
+        :return: The decoded JSON
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class UJSONCodec(Codec):
+    """Codec using ujson, the default codec"""
+
+    __slots__ = []
+
+    name: ClassVar[str] = "ujson"
+
+    def dumps(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+    def dumps_str(self, obj: Any) -> str:
+        return ujson.dumps(obj)
+
+    def loads(self, data: Decodable) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return ujson.loads(data)
+
+
+class JSONCodec(Codec):
+    """Codec using the standard library's json module"""
+
+    __slots__ = ["_encoder"]
+
+    name: ClassVar[str] = "json"
+
+    def __init__(self) -> None:
+        self._encoder: json.JSONEncoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":")
+        )
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj)
+
+    def dumps_str(self, obj: Any) -> str:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Decodable) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """Codec using orjson. Encodes to bytes and decodes str, bytes, bytearray
+    and memoryview without copying them first.
+
+    Requires the optional orjson dependency
+    """
+
+    __slots__ = []
+
+    name: ClassVar[str] = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("The orjson codec requires orjson to be installed")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_str(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, data: Decodable) -> Any:
+        return orjson.loads(data)
+
+
+CODECS: Dict[str, Type[Codec]] = {
+    UJSONCodec.name: UJSONCodec,
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+DEFAULT_CODEC: Codec = UJSONCodec()
+
+
+def get_codec(codec: Optional[Union[str, Codec]] = None) -> Codec:
+    """Returns the codec to be used for the supplied codec value.
+
+    :param codec: Either a codec instance, the name of a known codec
+    (ujson, json, orjson) or None for the default codec
+    :return: The codec instance
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if isinstance(codec, Codec):
+        return codec
+    codec_clazz = CODECS.get(codec)
+    if codec_clazz is None:
+        raise ClientError(
+            f"Unknown codec {codec}, expected one of {', '.join(CODECS.keys())}"
+        )
+    return codec_clazz()
@@ -1,42 +1,143 @@
 import logging
-from asyncio import AbstractEventLoop, Event, Task, get_event_loop, sleep
+import re
+from asyncio import (
+    AbstractEventLoop,
+    Event,
+    FIRST_COMPLETED,
+    Future,
+    Task,
+    ensure_future,
+    gather,
+    get_event_loop,
+    sleep,
+    wait,
+)
+from collections import deque
+from concurrent.futures import Executor
 from inspect import isawaitable
-from typing import Any, Callable, ClassVar, Dict, Optional, TYPE_CHECKING, Type, Union
+from time import monotonic, perf_counter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    TYPE_CHECKING,
+    Tuple,
+    Type,
+    Union,
+)
 
-from async_timeout import timeout
-from pyee2 import EventEmitterS
-from ujson import dumps, loads
-from websockets import ConnectionClosed, WebSocketClientProtocol, connect
+from async_timeout import timeout as async_timeout
 
 from .cdp_result_future import CDPResultFuture
 from .cdp_session import CDPSession
-from .errors import NetworkError, create_protocol_error
+from .codec import Codec, get_codec
+from .dispatch import EventDispatcher
+from .errors import (
+    CommandTimeoutError,
+    ConnectionLostError,
+    NetworkError,
+    ProtocolError,
+    create_protocol_error,
+)
 from .events import ConnectionEvents
+from .frames import (
+    mentions_session_id,
+    peek_error,
+    peek_id,
+    peek_method,
+    peek_session_id,
+)
+from .priority import Priority, make_bulk_methods, resolve_priority
+from .reconnect import ReconnectPolicy, record_state
+from .timers import Timers
+from .timing import TimedEvent, wire_size
+from .transports import (
+    TRANSPORT_CLOSED_ERRORS,
+    Transport,
+    TransportFactory,
+    WebSocketTransport,
+)
+from .waiters import EventPredicate, EventWaiter
+from .window import CommandWindow
 
 if TYPE_CHECKING:  # pragma: no cover
     from cripy import ConnectionType, SessionType  # noqa: F401
 
-__all__ = ["Connection"]
+__all__ = ["Connection", "dispose_all"]
 
 logger = logging.getLogger(__name__)
 
+# The first major version of Chrome whose Target.attachToTarget accepts flatten
+FLAT_SESSIONS_MIN_VERSION: int = 74
+# The number of seconds the browser has to answer the flat sessions probe
+FLAT_SESSIONS_PROBE_TIMEOUT: float = 10.0
+CHROME_VERSION: Pattern = re.compile(r"Chrome/(\d+)")
+# The number of event frames held while reading is paused before the connection
+# stops receiving frames from the browser altogether
+MAX_HELD_EVENTS: int = 1024
 
-class Connection(EventEmitterS):
+# Called with each event message, returns True if the event was consumed
+EventHook = Callable[[Dict], Any]
+
+
+class Connection(EventDispatcher):
     """Chrome DevTools Protocol Connection Class.
 
-    This class provides the websocket communication for using the CDP.
+    This class provides the communication, over a websocket or any other transport,
+    for using the CDP.
     """
 
     __slots__ = [
+        "_bulk_methods",
+        "_bulk_queue",
         "_callbacks",
         "_closeCallback",
+        "_close_timeout",
         "_closed",
+        "_codec",
+        "_event_hook",
+        "_command_timeout",
         "_connected",
+        "_decode_executor",
+        "_decode_threshold",
+        "_decode_time",
+        "_discarded_responses",
+        "_frame_received_at",
+        "_frame",
         "_flatten_sessions",
+        "_held_events",
         "_lastId",
+        "_max_control_streak",
+        "_max_parked",
+        "_notification_errors",
+        "_notifications",
+        "_offloaded_decodes",
+        "_read_epoch",
+        "_read_pauses",
+        "_reading",
+        "_reconnect_policy",
+        "_record_timing",
+        "_reconnecting",
         "_recv_task",
+        "_send_queue",
+        "_send_ready",
+        "_session_max_in_flight",
         "_sessions",
-        "_ws",
+        "_skipped_events",
+        "_state",
+        "_timers",
+        "_transport",
+        "_transport_factory",
+        "_window",
+        "_writer_task",
+        "_wait_timers",
         "_ws_url",
     ]
 
@@ -45,30 +146,130 @@ class Connection(EventEmitterS):
     def __init__(
         self,
         ws_url: Optional[str] = None,
-        flatten_sessions: bool = False,
+        flatten_sessions: Optional[bool] = None,
         loop: Optional[AbstractEventLoop] = None,
+        codec: Optional[Union[str, Codec]] = None,
+        command_timeout: Optional[float] = None,
+        max_in_flight: Optional[int] = None,
+        session_max_in_flight: Optional[int] = None,
+        bulk_methods: Optional[Iterable[str]] = None,
+        max_control_streak: int = 16,
+        max_parked: Optional[int] = None,
+        reconnect_policy: Optional[ReconnectPolicy] = None,
+        close_timeout: float = 15.0,
+        transport_factory: Optional[TransportFactory] = None,
+        decode_threshold: Optional[int] = None,
+        decode_executor: Optional[Executor] = None,
+        record_timing: bool = False,
     ) -> None:
         """Construct a new instance of the CDP Client.
 
         :param ws_url: The WS endpoint of the remote instance.
         If a ws url is not supplied it is expected to be supplied via connect.
         :param flatten_sessions: Enables "flat" access to the session via specifying sessionId
-        attribute in the commands
+        attribute in the commands. Defaults to probing the browser when connecting and
+        using flat sessions unless the browser does not support them
         :param loop:  Optional event loop to use. Defaults to asyncio.get_event_loop
+        :param codec: Optional JSON codec, or the name of one, used to encode and decode
+        messages. Defaults to ujson
+        :param command_timeout: Optional number of seconds commands sent using this connection
+        and its sessions have to receive a response, unless a timeout is supplied to send.
+        Defaults to no timeout
+        :param max_in_flight: Optional maximum number of commands sent using the connection,
+        excluding those of its sessions, that can be awaiting their response at once.
+        Commands sent while the limit is reached are written once there is room.
+        Defaults to no limit
+        :param session_max_in_flight: Optional maximum number of commands, per session,
+        that can be awaiting their response at once for the sessions created by
+        the connection. Defaults to no limit
+        :param bulk_methods: Optional methods of the commands sent with bulk priority,
+        unless a priority is supplied to send. Defaults to DEFAULT_BULK_METHODS
+        :param max_control_streak: The maximum number of control priority commands
+        written in a row while bulk priority commands are waiting to be written
+        :param max_parked: Optional maximum number of commands, per in flight window of
+        the connection and its sessions, waiting for room in the window. Sending a command
+        that would wait once reached raises ClientError, use wait_for_room to be pushed
+        back on instead. Defaults to no limit
+        :param reconnect_policy: Optional policy enabling reconnecting, with exponential
+        backoff, when the websocket drops. Once reconnected the sessions are re-attached
+        to their targets, if they still exist, and the *.enable, Target.setAutoAttach and
+        Target.setDiscoverTargets commands sent using the connection and its sessions
+        are replayed. Defaults to closing the connection when the websocket drops
+        :param close_timeout: The number of seconds closing the connection, including
+        the closing handshake and stopping the receive loop, may take before the
+        transport is aborted
+        :param transport_factory: Optional coroutine function returning the transport
+        used to communicate with the remote browser when connecting and reconnecting.
+        Defaults to a websocket connected to ws_url
+        :param decode_threshold: Optional size, in characters or bytes, of the frames at or
+        above which the frame is decoded in the decode executor rather than on the event loop.
+        The receive loop waits for the decode so messages are still handled in order.
+        Defaults to decoding every frame on the event loop
+        :param decode_executor: Optional executor large frames are decoded in.
+        Defaults to the event loop's default executor
+        :param record_timing: Record when every frame was received and its size. The send
+        and receive times and the size of the response are then set on the futures of the
+        commands and events are emitted as TimedEvents. Defaults to not recording timing
         """
         if loop is None:
             loop = get_event_loop()
         super().__init__(loop=loop)
         self._connected: bool = False
         self._closed: bool = False
-        self._flatten_sessions: bool = flatten_sessions
+        self._flatten_sessions: Optional[bool] = flatten_sessions
         self._ws_url: str = ws_url
         self._lastId: int = 0
         self._callbacks: Dict[int, CDPResultFuture] = {}
+        self._notifications: Dict[int, str] = {}
+        self._notification_errors: int = 0
         self._sessions: Dict[str, "SessionType"] = {}
-        self._ws: Optional[WebSocketClientProtocol] = None
+        self._transport: Optional[Transport] = None
+        self._transport_factory: Optional[TransportFactory] = transport_factory
         self._recv_task: Optional[Task] = None
+        self._send_queue: Deque[Tuple[Union[str, bytes], int]] = deque()
+        self._bulk_queue: Deque[Tuple[Union[str, bytes], int]] = deque()
+        self._bulk_methods: FrozenSet[str] = make_bulk_methods(bulk_methods)
+        self._max_control_streak: int = max_control_streak
+        self._max_parked: Optional[int] = max_parked
+        self._reconnect_policy: Optional[ReconnectPolicy] = reconnect_policy
+        self._close_timeout: float = close_timeout
+        self._decode_threshold: Optional[int] = decode_threshold
+        self._decode_executor: Optional[Executor] = decode_executor
+        self._decode_time: float = 0.0
+        self._offloaded_decodes: int = 0
+        self._record_timing: bool = record_timing
+        self._frame_received_at: float = 0.0
+        # the frame being handled, its size is only computed when it is used
+        self._frame: Union[str, bytes] = b""
+        self._read_pauses: int = 0
+        self._read_epoch: int = 0
+        self._reading: Optional[Event] = None
+        # the event frames received while reading was paused, with their timing
+        self._held_events: Deque[
+            Tuple[Union[str, bytes, Dict], float, Union[str, bytes]]
+        ] = deque()
+        self._reconnecting: bool = False
+        self._state: Optional[Dict[str, Dict]] = (
+            {} if reconnect_policy is not None else None
+        )
+        self._send_ready: Optional[Event] = None
+        self._writer_task: Optional[Task] = None
         self._closeCallback: Optional[Callable[[], Any]] = None
+        self._event_hook: Optional[EventHook] = None
+        self._codec: Codec = get_codec(codec)
+        self._skipped_events: int = 0
+        self._discarded_responses: int = 0
+        self._command_timeout: Optional[float] = command_timeout
+        self._timers: Timers = Timers(loop)
+        # the timeouts of wait_for, kept apart from those of the commands as they
+        # must survive reconnecting, the waiters clean up after themselves
+        self._wait_timers: Timers = Timers(loop)
+        self._window: Optional[CommandWindow] = (
+            self._new_window(max_in_flight, self._enqueue)
+            if max_in_flight is not None
+            else None
+        )
+        self._session_max_in_flight: Optional[int] = session_max_in_flight
 
     @staticmethod
     def from_session(session: "SessionType") -> "ConnectionType":
@@ -78,7 +279,7 @@ class Connection(EventEmitterS):
         :return: The underlying connection
         """
         if session.flat_session:
-            return session._connection
+            return session._flat_connection
         conn = session._connection
         while not isinstance(conn, Connection):
             conn = conn._connection
@@ -89,11 +290,246 @@ class Connection(EventEmitterS):
         """Returns the event loop the connection is using"""
         return self._loop
 
+    @property
+    def codec(self) -> Codec:
+        """Returns the JSON codec the connection is using"""
+        return self._codec
+
     @property
     def ws_url(self) -> str:
         """Get connected WebSocket url"""
         return self._ws_url
 
+    @property
+    def flatten_sessions(self) -> Optional[bool]:
+        """Returns T/F indicating if flat sessions are used or None if
+        the browser has yet to be probed for their support"""
+        return self._flatten_sessions
+
+    @property
+    def bulk_methods(self) -> FrozenSet[str]:
+        """Returns the methods of the commands sent with bulk priority by default"""
+        return self._bulk_methods
+
+    @property
+    def command_timeout(self) -> Optional[float]:
+        """Returns the default number of seconds commands have to receive a response"""
+        return self._command_timeout
+
+    @command_timeout.setter
+    def command_timeout(self, value: Optional[float]) -> None:
+        """Sets the default number of seconds commands have to receive a response.
+        Only affects commands sent after it was set.
+
+        :param value: The number of seconds or None for no timeout
+        """
+        self._command_timeout = value
+
+    @property
+    def max_in_flight(self) -> Optional[int]:
+        """Returns the maximum number of commands, excluding those of the sessions,
+        that can be awaiting their response at once"""
+        return self._window.limit if self._window is not None else None
+
+    @max_in_flight.setter
+    def max_in_flight(self, value: int) -> None:
+        """Sets the maximum number of commands, excluding those of the sessions,
+        that can be awaiting their response at once
+
+        :param value: The maximum number of commands
+        """
+        if self._window is None:
+            self._window = self._new_window(value, self._enqueue)
+        else:
+            self._window.limit = value
+
+    @property
+    def max_parked(self) -> Optional[int]:
+        """Returns the maximum number of commands per in flight window that can
+        wait for room in the window"""
+        return self._max_parked
+
+    @property
+    def session_max_in_flight(self) -> Optional[int]:
+        """Returns the maximum number of commands per session that can be awaiting
+        their response at once, used for sessions created by the connection"""
+        return self._session_max_in_flight
+
+    @session_max_in_flight.setter
+    def session_max_in_flight(self, value: Optional[int]) -> None:
+        """Sets the maximum number of commands per session that can be awaiting
+        their response at once. Only affects sessions created after it was set
+
+        :param value: The maximum number of commands or None for no limit
+        """
+        self._session_max_in_flight = value
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of commands, excluding those of the sessions,
+        that are awaiting their response"""
+        if self._window is not None:
+            return self._window.in_flight
+        return len(self._callbacks)
+
+    @property
+    def queued_commands(self) -> int:
+        """Returns the number of commands, excluding those of the sessions,
+        waiting for room in the in flight window"""
+        return self._window.parked if self._window is not None else 0
+
+    @property
+    def skipped_events(self) -> int:
+        """Returns the number of events that were dropped without being
+        decoded because nobody was listening for them"""
+        return self._skipped_events
+
+    @property
+    def record_timing(self) -> bool:
+        """Returns T/F indicating if the receive time and size of the frames are recorded"""
+        return self._record_timing
+
+    @record_timing.setter
+    def record_timing(self, value: bool) -> None:
+        """Sets whether the receive time and size of the frames are recorded,
+        for the connection and its sessions
+
+        :param value: T/F indicating if timing is recorded
+        """
+        self._record_timing = value
+        for session in self._sessions.values():
+            session.record_timing = value
+
+    @property
+    def reading_paused(self) -> bool:
+        """Returns T/F indicating if receiving frames from the browser is paused"""
+        return self._read_pauses > 0
+
+    def pause_reading(self) -> int:
+        """Stops dispatching the events received from the browser until resume_reading
+        was called as many times as this method was.
+
+        The responses of commands are still received while paused, so awaiting a command
+        while reading is paused does not deadlock. Event frames are held, in the order
+        they were received, and dispatched once reading resumes. Once MAX_HELD_EVENTS
+        are held the connection stops receiving frames altogether, so that the browser
+        is pushed back on once the buffers of the socket fill up, responses included.
+        The responses of non flat sessions arrive as events and are held as well.
+
+        Closing the transport is still noticed while paused. Every pause is undone,
+        and the held events dropped, once the connection closes or reconnects
+
+        :return: The epoch of the pause, to be supplied to resume_reading
+        """
+        self._read_pauses += 1
+        if self._reading is None:
+            self._reading = Event()
+        self._reading.clear()
+        return self._read_epoch
+
+    def resume_reading(self, epoch: Optional[int] = None) -> None:
+        """Undoes a call to pause_reading, receiving frames from the browser
+        resumes once every pause was undone
+
+        :param epoch: Optional epoch returned by pause_reading, if the pauses were
+        undone by closing or reconnecting since, the call is ignored
+        """
+        if not self._read_pauses:
+            return
+        if epoch is not None and epoch != self._read_epoch:
+            return
+        self._read_pauses -= 1
+        if not self._read_pauses:
+            self._reading.set()
+            if self._held_events:
+                self._loop.call_soon(self._release_held_events)
+
+    @property
+    def decode_threshold(self) -> Optional[int]:
+        """Returns the size of the frames at or above which they are decoded
+        in the decode executor"""
+        return self._decode_threshold
+
+    @decode_threshold.setter
+    def decode_threshold(self, value: Optional[int]) -> None:
+        """Sets the size of the frames at or above which they are decoded
+        in the decode executor
+
+        :param value: The size or None to decode every frame on the event loop
+        """
+        self._decode_threshold = value
+
+    @property
+    def decode_time(self) -> float:
+        """Returns the number of seconds the event loop spent decoding frames"""
+        return self._decode_time
+
+    @property
+    def offloaded_decodes(self) -> int:
+        """Returns the number of frames decoded in the decode executor"""
+        return self._offloaded_decodes
+
+    @property
+    def discarded_responses(self) -> int:
+        """Returns the number of responses that were discarded because the command
+        they are for was cancelled or timed out before they were received"""
+        return self._discarded_responses
+
+    @property
+    def notification_errors(self) -> int:
+        """Returns the number of commands sent using send_nowait that failed"""
+        return self._notification_errors
+
+    @property
+    def reconnect_policy(self) -> Optional[ReconnectPolicy]:
+        """Returns the policy used to reconnect when the websocket drops, if any"""
+        return self._reconnect_policy
+
+    @reconnect_policy.setter
+    def reconnect_policy(self, value: Optional[ReconnectPolicy]) -> None:
+        """Sets the policy used to reconnect when the websocket drops, None disables
+        reconnecting. Only the commands sent once reconnecting was enabled are replayed
+
+        :param value: The reconnect policy
+        """
+        self._reconnect_policy = value
+        self._record_state(value is not None)
+
+    def _record_state(self, enabled: bool) -> None:
+        """Starts or stops recording the commands replayed once reconnected,
+        for the connection and its sessions
+
+        :param enabled: T/F indicating if the commands are recorded
+        """
+        if enabled == (self._state is not None):
+            return
+        self._state = {} if enabled else None
+        for session in self._sessions.values():
+            session._record_state(enabled)
+
+    @property
+    def reconnecting(self) -> bool:
+        """Returns T/F indicating if the connection is reconnecting"""
+        return self._reconnecting
+
+    @property
+    def transport(self) -> Optional[Transport]:
+        """Returns the transport used to communicate with the remote browser"""
+        return self._transport
+
+    @property
+    def close_timeout(self) -> float:
+        """Returns the number of seconds closing the connection may take"""
+        return self._close_timeout
+
+    @close_timeout.setter
+    def close_timeout(self, value: float) -> None:
+        """Sets the number of seconds closing the connection may take
+
+        :param value: The number of seconds
+        """
+        self._close_timeout = value
+
     @property
     def closed(self) -> bool:
         """Returns T/F indicating if the connection is closed"""
@@ -110,6 +546,18 @@ class Connection(EventEmitterS):
         """Set closed callback."""
         self._closeCallback = callback
 
+    def set_event_hook(self, hook: Optional[EventHook]) -> None:
+        """Sets the function called with every event message, as decoded, received
+        over flat sessions, e.g. by a CDPProxy forwarding the events to its clients.
+
+        Events are never dropped undecoded while a hook is set. If the hook returns
+        True the event is not emitted by the connection or its session, the sessions
+        are still tracked using the Target domain events
+
+        :param hook: The hook or None to remove it
+        """
+        self._event_hook = hook
+
     def session(self, session_id: str) -> Optional[CDPSession]:
         """Returns the session instance associated with the supplied
         session id.
@@ -119,46 +567,189 @@ class Connection(EventEmitterS):
         """
         return self._sessions.get(session_id)
 
-    def send(self, method: str, params: Optional[Dict] = None) -> CDPResultFuture:
+    def send(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        priority: Optional[int] = None,
+    ) -> CDPResultFuture:
         """Send a command to the remote chrome instance.
 
         :param str method: The method to be used
         :param dict params: The optional parameters (arguments) for the command
-        :return: A future that resolves once the commands response is received
+        :param timeout: Optional number of seconds the command has to receive a response
+        before failing with CommandTimeoutError. Defaults to the connections command_timeout
+        :param priority: Optional priority (Priority.CONTROL or Priority.BULK) of the command.
+        Defaults to bulk if the method is one of the bulk_methods otherwise control
+        :return: A future that resolves once the commands response is received. If the in
+        flight window is full the command is written once there is room, awaiting the future
+        awaits that too
         """
         if self._lastId and not self._connected:
-            raise NetworkError("Connection is closed")
+            self._raise_not_connected(method)
         if params is None:
             params = {}
-        _id = self._raw_send({"method": method, "params": params})
-        callback = CDPResultFuture(method, loop=self._loop)
+        _id = self._raw_send(
+            {"method": method, "params": params},
+            resolve_priority(method, priority, self._bulk_methods),
+            self._window,
+        )
+        if self._state is not None:
+            record_state(self._state, method, params)
+        callback = CDPResultFuture(
+            method, self._loop, _id, self._callbacks, self._window
+        )
+        if self._record_timing:
+            callback.sent_at = monotonic()
         self._callbacks[_id] = callback
+        if timeout is None:
+            timeout = self._command_timeout
+        if timeout is not None:
+            callback.timer = self._timers.call_later(
+                timeout, self._expire_command, _id, timeout
+            )
         return callback
 
+    def send_nowait(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        priority: Optional[int] = None,
+    ) -> None:
+        """Send a command to the remote chrome instance without waiting for its response.
+
+        No future is created for the command and its response is discarded, without
+        being decoded, if it was successful. If the command failed the failure is counted
+        (notification_errors) and the ProtocolError is emitted as
+        ConnectionEvents.NotificationError, or logged at the debug level if nobody
+        is listening for it. The command does not enter the in flight window, but
+        it does not overtake the commands waiting for room in the window either.
+
+        :param method: The method to be used
+        :param params: The optional parameters (arguments) for the command
+        :param priority: Optional priority (Priority.CONTROL or Priority.BULK) of the command.
+        Defaults to bulk if the method is one of the bulk_methods otherwise control
+        """
+        if self._lastId and not self._connected:
+            self._raise_not_connected(method)
+        if params is None:
+            params = {}
+        if self._state is not None:
+            record_state(self._state, method, params)
+        _id = self._raw_send(
+            {"method": method, "params": params},
+            resolve_priority(method, priority, self._bulk_methods),
+            self._window,
+            nowait=True,
+        )
+        self._notifications[_id] = method
+
+    async def wait_for_room(self) -> None:
+        """Waits until a command sent using the connection right after would be
+        written right away rather than wait for room in the in flight window.
+        Returns immediately if the connection has no in flight window
+        """
+        if self._window is not None:
+            await self._window.wait_for_room()
+
+    def wait_for(
+        self,
+        event: str,
+        predicate: Optional[EventPredicate] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Waits for the first event, with the supplied name, emitted by this connection
+        that is accepted by the predicate.
+
+        The listener used to wait is removed once the returned future is done,
+        including when it is cancelled, e.g. by asyncio.wait_for.
+
+        :param event: The name of the event, e.g. Page.loadEventFired
+        :param predicate: Optional function called with each event that returns
+        T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event before
+        failing with EventTimeoutError. Defaults to no timeout
+        :return: A future that resolves with the event. If the connection closes
+        first it fails with NetworkError
+        """
+        future = self._loop.create_future()
+        if self._closed:
+            future.set_exception(NetworkError(f"{event}: Connection closed"))
+            return future
+        EventWaiter(self, event, future, predicate, timeout, self._wait_timers)
+        return future
+
     async def connect(
-        self, ws_url: Optional[str] = None, flatten_sessions: Optional[bool] = None
+        self,
+        ws_url: Optional[str] = None,
+        flatten_sessions: Optional[bool] = None,
+        transport: Optional[Transport] = None,
     ) -> None:
         """Connect to the remote websocket endpoint
 
         :param ws_url: The websocket URL to connect to
-        :param flatten_sessions: Should flat session mode be used
+        :param flatten_sessions: Should flat session mode be used. Defaults to the mode
+        supplied when the connection was created, probing the browser if none was
+        :param transport: Optional already connected transport to be used rather than
+        the one created by the transport factory, e.g. a PipeTransport
         """
         if ws_url is not None:
             self._ws_url = ws_url
         if flatten_sessions is not None:
             self._flatten_sessions = flatten_sessions
-        self._ws = await connect(
-            self._ws_url,
-            ping_interval=None,  # chrome no ping pong and websockets closes down on no pong :'(
-            ping_timeout=None,
-            max_size=None,
-            compression=None,
-            max_queue=2 ** 7,
-            loop=self._loop,
-        )
+        if self._flatten_sessions is None:
+            # events are held until the mode is known, so they are dispatched using it
+            epoch = self.pause_reading()
+            try:
+                await self._open(transport)
+                self._flatten_sessions = await self._supports_flat_sessions()
+            finally:
+                self.resume_reading(epoch)
+        else:
+            await self._open(transport)
+
+    async def _supports_flat_sessions(self) -> bool:
+        """Probes the browser for flat session support using its version.
+        Browsers that do not report a Chrome version, e.g. other implementations
+        of the protocol, are assumed to support them. If probing fails flat
+        sessions are not used
+
+        :return: T/F indicating if the browser supports flat sessions
+        """
+        try:
+            version = await self.send(
+                "Browser.getVersion", timeout=FLAT_SESSIONS_PROBE_TIMEOUT
+            )
+        except (CommandTimeoutError, ProtocolError) as e:
+            logger.warning(
+                f"Probing for flat session support failed, not using flat sessions: {e}"
+            )
+            return False
+        match = CHROME_VERSION.search(version.get("product", ""))
+        if match is None:
+            return True
+        return int(match.group(1)) >= FLAT_SESSIONS_MIN_VERSION
+
+    async def _open(self, transport: Optional[Transport] = None) -> None:
+        """Opens the transport, unless one is supplied, and starts the writer
+        and receive loops
+
+        :param transport: Optional already connected transport
+        """
+        if transport is None:
+            if self._transport_factory is not None:
+                transport = await self._transport_factory()
+            else:
+                transport = await WebSocketTransport.connect(self._ws_url, self._loop)
+        self._transport = transport
         self._closed = False
+        self._send_ready = Event()
+        if self._send_queue or self._bulk_queue:
+            self._send_ready.set()
+        self._writer_task = self._loop.create_task(self._write_loop())
         # ensure that _recv_loop gets going
-        ready_event = Event(loop=self._loop)
+        ready_event = Event()
         self._recv_task = self._loop.create_task(self._recv_loop())
         self.once(ConnectionEvents.Ready, lambda: ready_event.set())
         await ready_event.wait()
@@ -179,14 +770,22 @@ class Connection(EventEmitterS):
             session = self._sessions.get(session_id)
             if session:
                 return session
-        session = self._new_session(resp.get("type", "unknown"), session_id)
+        session = self._new_session(resp.get("type", "unknown"), session_id, target_id)
         self._sessions[session_id] = session
         return session
 
-    async def dispose(self) -> None:
-        """Close all open connections"""
+    async def dispose(
+        self, hard: bool = False, timeout: Optional[float] = None
+    ) -> None:
+        """Close all open connections
+
+        :param hard: Abort the transport immediately rather than performing
+        the closing handshake
+        :param timeout: Optional number of seconds closing may take before the
+        transport is aborted. Defaults to the connections close_timeout
+        """
         self._connected = False
-        await self._on_close()
+        await self._on_close(hard, timeout)
 
     async def _recv_loop(self) -> None:
         """Loop that listens for messages from the remote chrome instance and handles them.
@@ -195,24 +794,99 @@ class Connection(EventEmitterS):
         """
         self._connected = True
         self.emit(ConnectionEvents.Ready)
-        self_ws_recv = self._ws.recv
+        recv = self._transport.recv
         self_on_message = self._on_message
         logger_info = logger.info
         connected = self.__connected
+        held = self._held_events
 
         while 1:
             try:
-                resp = await self_ws_recv()
+                if self._read_pauses and len(held) >= MAX_HELD_EVENTS:
+                    await self._wait_resumed()
+                resp = await recv()
                 if resp:
-                    self_on_message(resp)
-            except (ConnectionClosed, ConnectionResetError):
+                    if self._record_timing:
+                        self._frame_received_at = monotonic()
+                        self._frame = resp
+                    threshold = self._decode_threshold
+                    if (self._read_pauses or held) and self._hold_event(resp):
+                        pass
+                    elif threshold is not None and len(resp) >= threshold:
+                        await self._on_large_message(resp)
+                    else:
+                        self_on_message(resp)
+            except TRANSPORT_CLOSED_ERRORS:
                 logger_info("connection closed")
                 break
             if not connected():
                 break
 
         if self._connected:
-            await self.dispose()  # pragma: no cover
+            if self._reconnect_policy is not None:
+                await self._reconnect()
+            else:
+                # this task must not wait on itself while closing
+                self._recv_task = None
+                await self.dispose()  # pragma: no cover
+
+    async def _wait_resumed(self) -> None:
+        """Waits until reading was resumed or the transport was closed, so that
+        the receive loop notices closure while it is paused"""
+        resumed = ensure_future(self._reading.wait(), loop=self._loop)
+        closed = ensure_future(self._transport.wait_closed(), loop=self._loop)
+        try:
+            await wait([resumed, closed], return_when=FIRST_COMPLETED)
+        finally:
+            resumed.cancel()
+            closed.cancel()
+
+    def _reset_read_pauses(self) -> None:
+        """Undoes every pause of reading, the pauses made before are ignored
+        when they are resumed, and drops the held events"""
+        self._read_pauses = 0
+        self._read_epoch += 1
+        self._held_events.clear()
+        if self._reading is not None:
+            self._reading.set()
+
+    def _hold_event(self, frame: Union[str, bytes]) -> bool:
+        """Holds the frame, received while reading is paused or events are still held,
+        if it is an event. Frames not laid out the way Chrome does are decoded to tell
+        events and responses apart, such a response is handled right away
+
+        :param frame: The raw JSON frame
+        :return: T/F indicating if the frame was held or handled
+        """
+        if peek_id(frame) is not None:
+            return False
+        held: Union[str, bytes, Dict] = frame
+        if peek_method(frame) is None:
+            msg = self._codec.loads(frame)
+            if "method" not in msg:
+                self._on_decoded_message(msg)
+                return True
+            held = msg
+        self._held_events.append((held, self._frame_received_at, frame))
+        return True
+
+    def _release_held_events(self) -> None:
+        """Dispatches the events held while reading was paused, in the order they
+        were received, until they are all dispatched or reading is paused again.
+        Held frames are decoded on the event loop whatever their size
+        """
+        held = self._held_events
+        received_at, current = self._frame_received_at, self._frame
+        try:
+            while held and not self._read_pauses and self._connected:
+                frame, self._frame_received_at, self._frame = held.popleft()
+                if isinstance(frame, dict):
+                    self._on_decoded_message(frame)
+                else:
+                    self._on_message(frame)
+        finally:
+            # the receive loop may be awaiting the decode of a large frame
+            self._frame_received_at, self._frame = received_at, current
 
     def __connected(self) -> bool:
         """Helper method for _recv_loop
@@ -220,30 +894,185 @@ class Connection(EventEmitterS):
         """
         return self._connected
 
-    async def _send_async(self, msg: str, callback_id: int) -> None:
-        """Actually send the msg to remote instance.
+    async def _write_loop(self) -> None:
+        """Loop that writes the queued messages to the remote chrome instance.
 
-        :param msg: The msg to send
-        :param callback_id: The id identifying the callback associated with the msg
+        Every message sent over the connection is appended to the send queue of its
+        priority and the writer is woken up. Once awake, the writer sends everything
+        that is queued before waiting again, so a burst of commands costs a single
+        wake up rather than a task per command.
+
+        Control priority messages are always sent first, including those queued
+        while the writer is sending, except that once max_control_streak control
+        messages were sent in a row a waiting bulk message is sent.
+
+        If the transport is closed while writing, the futures of the message being
+        sent and of any message still queued are failed.
         """
-        while not self._connected:
-            await sleep(0)  # pragma: no cover
+        control = self._send_queue
+        bulk = self._bulk_queue
+        ready = self._send_ready
+        send = self._transport.send
+        text_only = self._transport.text_only
+        control_popleft = control.popleft
+        bulk_popleft = bulk.popleft
+        max_streak = self._max_control_streak
 
-        try:
-            await self._ws.send(msg)
-        except ConnectionClosed:
-            logger.error("connection unexpectedly closed")
-            callback = self._callbacks.get(callback_id, None)
-            if callback and not callback.done():
-                callback.set_result(None)
-                await self.dispose()
+        while 1:
+            await ready.wait()
+            ready.clear()
+            streak = 0
+            while control or bulk:
+                if control and (not bulk or streak < max_streak):
+                    msg, callback_id = control_popleft()
+                    streak += 1
+                else:
+                    msg, callback_id = bulk_popleft()
+                    streak = 0
+                if text_only and msg.__class__ is bytes:
+                    msg = msg.decode("utf-8")
+                try:
+                    await send(msg)
+                except TRANSPORT_CLOSED_ERRORS:
+                    logger.error("connection unexpectedly closed")
+                    self._fail_unsent(callback_id)
+                    return
+
+    async def _reconnect(self) -> None:
+        """Reconnects to the remote browser after the websocket dropped.
+
+        The pending commands of the connection and its sessions are failed with
+        ConnectionLostError and commands sent while reconnecting fail with it too.
+        The sessions are kept, but their own sessions of non-flat mode are closed.
+        Reconnect attempts are made as described by the reconnect policy, once one
+        succeeds the sessions are restored. If every attempt fails the connection is closed.
+        """
+        self._connected = False
+        self._reconnecting = True
+        self.emit(ConnectionEvents.Reconnecting)
+        for cb in self._callbacks.values():
+            if not cb.done():
+                cb.set_exception(ConnectionLostError(f"{cb.method}: Connection lost"))
+        self._callbacks.clear()
+        self._notifications.clear()
+        self._send_queue.clear()
+        self._bulk_queue.clear()
+        self._timers.clear()
+        self._reset_read_pauses()
+        if self._window is not None:
+            self._window.clear()
+        for session in self._sessions.values():
+            session.on_connection_lost()
+        if self._writer_task is not None and not self._writer_task.done():
+            self._writer_task.cancel()
+        self._writer_task = None
+
+        for delay in self._reconnect_policy.delays():
+            await sleep(delay)
+            if self._closed:
+                return
+            try:
+                await self._open()
+                break
+            except Exception as e:
+                logger.warning(f"reconnect attempt failed: {e}")
+        else:
+            self._reconnecting = False
+            logger.error("unable to reconnect, closing the connection")
+            # reconnecting happens in the receive task which must not wait on itself
+            self._recv_task = None
+            await self.dispose()
+            return
+
+        self._reconnecting = False
+        await self._restore_sessions()
+        for method, params in list(self._state.items()):
+            self.send_nowait(method, params)
+        self.emit(ConnectionEvents.Reconnected)
 
-    async def _on_close(self) -> None:
-        """Closes the websocket connection and cleans up internals.
+    async def _restore_sessions(self) -> None:
+        """Re-attaches the suspended sessions to their targets, the sessions whose target
+        no longer exists, or whose target is unknown, are closed"""
+        suspended: List["SessionType"] = list(self._sessions.values())
+        self._sessions.clear()
+        for session in suspended:
+            target_id = session.target_id
+            if target_id is None:
+                session.on_closed()
+                continue
+            params: Dict[str, Union[str, bool]] = {"targetId": target_id}
+            if self._flatten_sessions:
+                params["flatten"] = self._flatten_sessions
+            try:
+                resp = await self.send("Target.attachToTarget", params)
+            except (NetworkError, ProtocolError):
+                session.on_closed()
+                continue
+            session_id = resp.get("sessionId")
+            self._sessions[session_id] = session
+            session.on_reattached(session_id)
+
+    def _raise_not_connected(self, method: str) -> None:
+        """Raises the error for a command sent while the connection is not connected
+
+        :param method: The method of the command
+        """
+        if self._reconnecting:
+            raise ConnectionLostError(f"{method}: Connection lost, reconnecting")
+        raise NetworkError("Connection is closed")
+
+    def _expire_command(self, callback_id: int, timeout: float) -> None:
+        """Fails the command identified by the supplied id with CommandTimeoutError
+        if it has not received its response yet
+
+        :param callback_id: The id of the command
+        :param timeout: The timeout of the command
+        """
+        callback = self._take_callback(callback_id)
+        if callback is not None and not callback.done():
+            callback.set_exception(
+                CommandTimeoutError(
+                    f"{callback.method}: No response received within {timeout} seconds"
+                )
+            )
+
+    def _fail_unsent(self, callback_id: int) -> None:
+        """Fails the future of the message that could not be written and the futures
+        of every message still waiting in the send queue.
+
+        :param callback_id: The id of the message whose write failed
+        """
+        callbacks = self._callbacks
+        ids = [callback_id]
+        ids.extend(_id for _, _id in self._send_queue)
+        ids.extend(_id for _, _id in self._bulk_queue)
+        self._send_queue.clear()
+        self._bulk_queue.clear()
+        if self._window is not None:
+            self._window.clear()
+        for _id in ids:
+            callback = callbacks.pop(_id, None)
+            if callback is not None and not callback.done():
+                callback.set_exception(
+                    ConnectionLostError(f"{callback.method}: Connection closed.")
+                )
+
+    async def _on_close(
+        self, hard: bool = False, timeout: Optional[float] = None
+    ) -> None:
+        """Closes the transport and cleans up internals.
 
         All pending protocol method callbacks are canceled and the receive loop is stopped.
         Calls the on close callback if it was supplied and the "connection-closed" method
-        is emitted
+        is emitted.
+
+        Closing the transport, stopping the receive loop and the close callback share
+        a single deadline, once it elapses the transport is aborted.
+
+        :param hard: Abort the transport immediately rather than performing
+        the closing handshake
+        :param timeout: Optional number of seconds closing may take.
+        Defaults to the connections close_timeout
         """
         if self._closed:  # pragma: no cover
             return
@@ -253,52 +1082,135 @@ class Connection(EventEmitterS):
             if not cb.done():  # pragma: no cover
                 cb.set_exception(NetworkError(f"{cb.method}: Target closed."))
         self._callbacks.clear()
+        self._notifications.clear()
+        self._send_queue.clear()
+        self._bulk_queue.clear()
+        self._timers.clear()
+        self._reset_read_pauses()
+        if self._window is not None:
+            self._window.clear()
 
         for session in self._sessions.values():
             session.on_closed()
         self._sessions.clear()
 
+        if self._writer_task is not None and not self._writer_task.done():
+            self._writer_task.cancel()
+        self._writer_task = None
+
+        if timeout is None:
+            timeout = self._close_timeout
+        deadline = self._loop.time() + timeout
+
         # close connection
-        if self._ws and not self._ws.closed:
-            try:
-                async with timeout(15, loop=self._loop):
-                    await self._ws.close()
-            except Exception:  # pragma: no cover
-                pass
+        transport = self._transport
+        if transport is not None and not transport.closed:
+            if hard:
+                transport.abort()
+            else:
+                try:
+                    async with async_timeout(timeout):
+                        await transport.close()
+                except Exception:  # pragma: no cover
+                    transport.abort()
 
-        if self._recv_task is not None and not self._recv_task.done():
-            self._recv_task.cancel()
-            try:
-                async with timeout(15, loop=self._loop):
-                    await self._recv_task
-            except Exception:  # pragma: no cover
-                pass
+        recv_task = self._recv_task
+        self._recv_task = None
+        if recv_task is not None and not recv_task.done():
+            recv_task.cancel()
+            await wait([recv_task], timeout=max(0.0, deadline - self._loop.time()))
 
         if self._closeCallback:
             ret = self._closeCallback()
             if isawaitable(ret):
                 try:
-                    await ret
+                    async with async_timeout(max(0.0, deadline - self._loop.time())):
+                        await ret
                 except Exception:
                     pass
             self._closeCallback = None
 
         self.emit(ConnectionEvents.Disconnected)
 
-    def _raw_send(self, msg: Dict) -> int:
-        """Sends a message to the remote browser returning
+    def _raw_send(
+        self,
+        msg: Dict,
+        priority: int = Priority.CONTROL,
+        window: Optional[CommandWindow] = None,
+        nowait: bool = False,
+    ) -> int:
+        """Queues a message to be sent to the remote browser returning
         the id of the message
 
         :param msg: The message to be sent
+        :param priority: The priority of the message
+        :param window: Optional in flight window the message must enter before
+        being sent or, if nowait, must not overtake the commands parked in
+        :param nowait: T/F indicating if the message is sent using send_nowait
         :return: The id of the message sent
         """
         self._lastId += 1
         _id = self._lastId
         msg["id"] = _id
-        self._loop.create_task(self._send_async(dumps(msg), _id))
+        if window is None:
+            self._enqueue(msg, priority)
+        elif nowait:
+            window.submit_nowait(msg, priority)
+        else:
+            window.submit(msg, priority)
         return _id
 
-    def _on_message(self, message: str) -> None:
+    def _new_window(
+        self, limit: int, write: Callable[[Dict, int], Any]
+    ) -> CommandWindow:
+        """Creates an in flight window, of the connection or one of its sessions,
+        using the max_parked and max_control_streak of the connection
+
+        :param limit: The maximum number of commands in flight at once
+        :param write: The function used to write a command that entered the window
+        :return: The window
+        """
+        return CommandWindow(limit, write, self._max_parked, self._max_control_streak)
+
+    def _enqueue(self, msg: Dict, priority: int = Priority.CONTROL) -> None:
+        """Encodes the message and adds it to the send queue of its priority
+
+        :param msg: The message to be sent, its id must already be set
+        :param priority: The priority of the message
+        """
+        queue = self._bulk_queue if priority == Priority.BULK else self._send_queue
+        queue.append((self._codec.dumps(msg), msg["id"]))
+        if self._send_ready is not None:
+            self._send_ready.set()
+
+    def _take_callback(self, callback_id: int) -> Optional[CDPResultFuture]:
+        """Removes the future of the command identified by the supplied id from
+        the pending commands, freeing its place in the in flight window
+
+        :param callback_id: The id of the command
+        :return: The future of the command if it was pending
+        """
+        callback = self._callbacks.pop(callback_id, None)
+        if callback is not None:
+            if callback.timer is not None:
+                callback.timer.cancel()
+                callback.timer = None
+            if self._window is not None:
+                self._window.done(callback_id)
+            if self._record_timing:
+                callback.received_at = self._frame_received_at
+                callback.size = wire_size(self._frame)
+        return callback
+
+    def _frame_timing(self) -> Tuple[float, int]:
+        """Returns the receive time and size of the frame being handled,
+        when timing is recorded
+
+        :return: The time.monotonic timestamp of when the frame was received and its size
+        """
+        return self._frame_received_at, wire_size(self._frame)
+
+    def _on_message(self, message: Union[str, bytes]) -> None:
         """Handles a message received from the remote browser instance.
 
         If the message contains a callback id, the future associated with the id has
@@ -306,19 +1218,67 @@ class Connection(EventEmitterS):
         Otherwise the if the method is for a target the message is forwarded to the CDPSession
         and if it is not for a target it is emitted.
 
-        :param message: The JSON message string.
+        :param message: The JSON message string or bytes.
+        """
+        if self._drop_raw_message(message):
+            return
+        start = perf_counter()
+        msg = self._codec.loads(message)
+        self._decode_time += perf_counter() - start
+        self._on_decoded_message(msg)
+
+    async def _on_large_message(self, message: Union[str, bytes]) -> None:
+        """Handles a large message received from the remote browser instance
+        by decoding it in the decode executor, so the event loop is not blocked
+        while it is decoded.
+
+        :param message: The JSON message string or bytes.
+        """
+        if self._drop_raw_message(message):
+            return
+        msg = await self._loop.run_in_executor(
+            self._decode_executor, self._codec.loads, message
+        )
+        self._offloaded_decodes += 1
+        self._on_decoded_message(msg)
+
+    def _drop_raw_message(self, message: Union[str, bytes]) -> bool:
+        """Determines if the raw message can be dropped without being decoded
+        because it is an event nobody listens for or a response nobody waits for
+
+        :param message: The JSON message string or bytes.
+        :return: T/F indicating if the message was dropped
+        """
+        if self.has_listeners(ConnectionEvents.AllMessages):
+            return False
+        method = peek_method(message)
+        if method is not None:
+            if self._event_hook is None and self._can_skip_event(method, message):
+                self._skipped_events += 1
+                return True
+            return False
+        return self._discard_late_response(message)
+
+    def _on_decoded_message(self, msg: Dict) -> None:
+        """Handles a decoded message received from the remote browser instance.
+
+        :param msg: The decoded message
         """
-        msg = loads(message)
         self._log_msg(msg)
         if not self._flatten_sessions:
             return self._on_message_non_flat(msg)
         _id = msg.get("id")
         params = msg.get("params", {})
         method = msg.get("method", "")
+        hook = self._event_hook
+        consumed = hook is not None and _id is None and hook(msg) is True
         if method == "Target.attachedToTarget":
             session_id = params.get("sessionId")
+            target_info = params.get("targetInfo", {})
             self._sessions[session_id] = self._new_session(
-                params.get("targetInfo", {}).get("type", "unknown"), session_id
+                target_info.get("type", "unknown"),
+                session_id,
+                target_info.get("targetId"),
             )
         elif method == "Target.detachedFromTarget":
             session_id = params.get("sessionId", None)
@@ -326,6 +1286,8 @@ class Connection(EventEmitterS):
             if session:
                 session.on_closed()
                 del self._sessions[session_id]
+        if consumed:
+            return
 
         session_id = msg.get("sessionId", None)
         if session_id:
@@ -333,14 +1295,18 @@ class Connection(EventEmitterS):
             if session:
                 session.on_message(msg)
             return
-        if _id and _id in self._callbacks:
-            callback = self._callbacks.pop(_id)
-            if not callback.done():
+        if _id is not None:
+            callback = self._take_callback(_id)
+            if callback is None:
+                self._on_uncalled_response(_id, msg)
+            elif not callback.done():
                 if "error" in msg:
                     callback.set_exception(create_protocol_error(callback.method, msg))
                 else:
                     callback.set_result(msg.get("result"))
             return
+        if self._record_timing:
+            params = TimedEvent(params, *self._frame_timing())
         self.emit(method, params)
 
     def _on_message_non_flat(self, msg: Dict) -> None:
@@ -355,9 +1321,11 @@ class Connection(EventEmitterS):
         :param msg: The JSON message string.
         """
         _id = msg.get("id")
-        if _id and _id in self._callbacks:
-            callback = self._callbacks.pop(_id)
-            if callback and not callback.done():
+        if _id is not None:
+            callback = self._take_callback(_id)
+            if callback is None:
+                self._on_uncalled_response(_id, msg)
+            elif not callback.done():
                 if "error" in msg:
                     callback.set_exception(create_protocol_error(callback.method, msg))
                 else:
@@ -377,17 +1345,111 @@ class Connection(EventEmitterS):
                 session.on_closed()
                 del self._sessions[session_id]
             return
+        if self._record_timing:
+            params = TimedEvent(params, *self._frame_timing())
         self.emit(method, params)
 
-    def _new_session(self, target_type: str, session_id: str) -> CDPSession:
+    def _can_skip_event(self, method: str, message: Union[str, bytes]) -> bool:
+        """Determines if the raw event message can be dropped without being decoded.
+
+        An event can be dropped when the emitter it would be emitted on, either this
+        connection or the flat session identified by the sessionId of the message,
+        has no listeners for it. Target domain events are never dropped as they
+        are used to track the sessions, nor are events whose sessionId is not
+        the last key, as Chrome puts it, since where they go is not known undecoded.
+
+        :param method: The method of the event
+        :param message: The raw JSON message
+        :return: T/F indicating if the event can be dropped
+        """
+        if method.startswith("Target."):
+            return False
+        if self._flatten_sessions:
+            session_id = peek_session_id(message)
+            if session_id is not None:
+                session = self._sessions.get(session_id)
+                if session is None:
+                    return False
+                return not session.has_listeners(method)
+            if mentions_session_id(message):
+                return False
+        return not self.has_listeners(method)
+
+    def _discard_late_response(self, message: Union[str, bytes]) -> bool:
+        """Discards the raw response message, without decoding it, if the command
+        it is for is no longer pending because it was cancelled or timed out or
+        if it is the successful response of a command sent using send_nowait.
+
+        :param message: The raw JSON message
+        :return: T/F indicating if the message was discarded
+        """
+        _id = peek_id(message)
+        if _id is None:
+            return False
+        if self._flatten_sessions:
+            session_id = peek_session_id(message)
+            if session_id is not None:
+                session = self._sessions.get(session_id)
+                if session is None:
+                    return False
+                return session._discard_response(_id, message)
+        return self._discard_response(_id, message)
+
+    def _discard_response(self, _id: int, message: Union[str, bytes]) -> bool:
+        """Discards the raw response message with the supplied id if nobody is
+        waiting for it
+
+        :param _id: The id of the response
+        :param message: The raw JSON message
+        :return: T/F indicating if the message was discarded
+        """
+        if _id in self._callbacks:
+            return False
+        notifications = self._notifications
+        if _id in notifications:
+            if peek_error(message):
+                return False
+            del notifications[_id]
+            return True
+        self._discarded_responses += 1
+        return True
+
+    def _on_uncalled_response(self, _id: int, msg: Dict) -> None:
+        """Handles a decoded response no future is waiting for, it is either
+        the response of a command sent using send_nowait or a late response
+
+        :param _id: The id of the response
+        :param msg: The response
+        """
+        method = self._notifications.pop(_id, None)
+        if method is None:
+            self._discarded_responses += 1
+            return
+        if "error" not in msg:
+            return
+        self._notification_errors += 1
+        error = create_protocol_error(method, msg)
+        if self.has_listeners(ConnectionEvents.NotificationError):
+            self.emit(ConnectionEvents.NotificationError, error)
+        else:
+            logger.debug(str(error))
+
+    def _new_session(
+        self, target_type: str, session_id: str, target_id: Optional[str] = None
+    ) -> CDPSession:
         """Creates a new session connected to the target
 
         :param target_type: The type of the session
         :param session_id: The id of the session
+        :param target_id: The id of the target, if known
         :return: A CDPSession connected to the target
         """
         return CDPSession(
-            self, target_type, session_id, flat_session=self._flatten_sessions
+            self,
+            target_type,
+            session_id,
+            flat_session=self._flatten_sessions,
+            target_id=target_id,
         )
 
     def _log_msg(self, msg: Dict) -> None:
@@ -403,3 +1465,51 @@ class Connection(EventEmitterS):
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+async def dispose_all(
+    clients: Iterable[Union[Connection, CDPSession]],
+    timeout: float = 15.0,
+    hard: bool = False,
+) -> None:
+    """Disposes of the supplied connections and sessions concurrently with
+    a single shared deadline.
+
+    Sessions are detached from their targets, unless hard is true in which case they
+    are only closed, and connections are disposed of. Sessions that could not be
+    detached before the deadline are closed.
+
+    :param clients: The connections and sessions to be disposed of
+    :param timeout: The number of seconds disposing of everything may take, once
+    elapsed the remaining transports are aborted
+    :param hard: Abort the transports immediately rather than performing
+    the closing handshakes
+    """
+    closing = []
+    for client in clients:
+        if isinstance(client, Connection):
+            closing.append(client.dispose(hard, timeout))
+        elif hard:
+            if client._connection is not None:
+                client.on_closed()
+        else:
+            closing.append(_detach(client, timeout))
+    if closing:
+        await gather(*closing, return_exceptions=True)
+
+
+async def _detach(session: CDPSession, timeout: float) -> None:
+    """Detaches the session from its target within timeout seconds, closing
+    the session if that fails
+
+    :param session: The session to be detached
+    :param timeout: The number of seconds detaching may take
+    """
+    if session._connection is None:
+        return
+    try:
+        async with async_timeout(timeout):
+            await session.detach()
+    except Exception:
+        if session._connection is not None:
+            session.on_closed()
@@ -0,0 +1,326 @@
+from asyncio import AbstractEventLoop, Future, ensure_future, get_event_loop
+from collections import OrderedDict
+from functools import partial
+from inspect import isawaitable
+from sys import intern
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from .batching import (
+    BatchHandler,
+    CoalesceKey,
+    CoalesceMerge,
+    EventBatcher,
+    EventCoalescer,
+)
+
+__all__ = ["ALL_EVENTS", "EventDispatcher", "RESERVED_DOMAINS"]
+
+# The name that registers a listener for every event of the browser
+ALL_EVENTS: str = "*"
+# The domains of the events emitted by cripy itself (ConnectionEvents and
+# SessionEvents), which are not matched by ALL_EVENTS
+RESERVED_DOMAINS: FrozenSet[str] = frozenset(["Connection", "Session"])
+
+Listener = Callable[..., Any]
+Handlers = Tuple[Listener, ...]
+
+
+class EventDispatcher:
+    """A drop in replacement for pyee2's EventEmitterS that keeps a compiled
+    dispatch table mapping each emitted event name to the tuple of its handlers.
+
+    Emitting an event is a single dictionary lookup followed by calling the handlers,
+    the table entry of an event is compiled the first time it is emitted and is
+    dropped when a listener the entry depends on is added or removed.
+
+    Besides exact event names listeners can be registered for every event of a
+    domain, using "Domain.*", or for every event of the browser, using "*". Wildcard
+    listeners are called with the name of the event followed by the arguments it
+    was emitted with. Events emitted by cripy itself, ConnectionEvents and SessionEvents,
+    are only matched by their own domain wildcard ("Connection.*" and "Session.*").
+    """
+
+    __slots__ = ["_error_listeners", "_listeners", "_loop", "_table"]
+
+    def __init__(self, loop: Optional[AbstractEventLoop] = None) -> None:
+        """Create a new EventDispatcher
+
+        :param loop: Optional event loop awaitables returned by listeners are
+        scheduled on. Defaults to asyncio.get_event_loop
+        """
+        self._loop: AbstractEventLoop = loop if loop is not None else get_event_loop()
+        self._listeners: Dict[str, Dict[Listener, Listener]] = {}
+        self._table: Dict[str, Handlers] = {}
+        self._error_listeners: bool = False
+
+    def emit(self, event: str, *args: Any, **kwargs: Any) -> bool:
+        """Emit an event, calling its handlers with the supplied args and kwargs.
+
+        If a handler returns an awaitable it is scheduled using asyncio.ensure_future.
+        Exceptions raised by handlers are emitted as the error event, if it has listeners
+
+        :param event: The event to emit
+        :param args: Arguments to pass to the handlers of the event
+        :param kwargs: Keyword arguments to pass to the handlers of the event
+        :return: T/F indicating if the event had any handlers
+        """
+        handlers = self._table.get(event)
+        if handlers is None:
+            handlers = self._compile(event)
+        if not handlers:
+            return False
+        if self._error_listeners:
+            for handler in handlers:
+                try:
+                    result = handler(*args, **kwargs)
+                    if result is not None and isawaitable(result):
+                        self._handle_awaitable(result)
+                except Exception as e:
+                    self.emit("error", e)
+            return True
+        for handler in handlers:
+            try:
+                result = handler(*args, **kwargs)
+                if result is not None and isawaitable(result):
+                    ensure_future(result, loop=self._loop)
+            except Exception:
+                pass
+        return True
+
+    def raising_emit(self, event: str, *args: Any, **kwargs: Any) -> bool:
+        """Emit an event, calling its handlers with the supplied args and kwargs.
+
+        Unlike emit, exceptions raised by the handlers are not caught and the
+        error event is always emitted for the awaitables, returned by the handlers,
+        that raise
+
+        :param event: The event to emit
+        :param args: Arguments to pass to the handlers of the event
+        :param kwargs: Keyword arguments to pass to the handlers of the event
+        :return: T/F indicating if the event had any handlers
+        """
+        handlers = self._table.get(event)
+        if handlers is None:
+            handlers = self._compile(event)
+        if not handlers:
+            return False
+        for handler in handlers:
+            result = handler(*args, **kwargs)
+            if result is not None and isawaitable(result):
+                self._handle_awaitable(result)
+        return True
+
+    def on(self, event: str, listener: Optional[Listener] = None) -> Listener:
+        """Register a listener for an event, every event of a domain ("Domain.*")
+        or every event of the browser ("*").
+
+        Can be used as a decorator.
+
+        :param event: The event to register the listener for
+        :param listener: The listener to be called when the event is emitted
+        :return: The listener or listener wrapper when used as a decorator
+        """
+        if listener is None:
+            return partial(self.on, event)
+        self._add_listener(event, listener, listener)
+        return listener
+
+    def once(self, event: str, listener: Optional[Listener] = None) -> Listener:
+        """Register a listener that is removed the first time it is called.
+
+        Can be used as a decorator.
+
+        :param event: The event to register the listener for
+        :param listener: The listener to be called when the event is emitted
+        :return: The listener or listener wrapper when used as a decorator
+        """
+        if listener is None:
+            return partial(self.once, event)
+
+        def once_wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.remove_listener(event, listener)
+            return listener(*args, **kwargs)
+
+        self._add_listener(event, listener, once_wrapper)
+        return listener
+
+    def on_batch(
+        self,
+        event: str,
+        handler: BatchHandler,
+        window: Optional[float] = None,
+        max_size: Optional[int] = None,
+    ) -> EventBatcher:
+        """Register a handler that is called with lists of events rather than
+        once per event. See EventBatcher for when batches are delivered
+
+        :param event: The event, or wildcard, to register the handler for
+        :param handler: The function called with each batch of events
+        :param window: Optional number of seconds the events of a batch are collected
+        for after its first event. Defaults to delivering a batch per receive burst
+        :param max_size: Optional maximum number of events in a batch.
+        Defaults to no limit
+        :return: The batcher, whose close method removes the handler
+        """
+        return EventBatcher(self, event, handler, window, max_size, self._loop)
+
+    def on_coalesced(
+        self,
+        event: str,
+        handler: Callable[[Any], Any],
+        key: Optional[CoalesceKey] = None,
+        merge: Optional[CoalesceMerge] = None,
+        window: Optional[float] = None,
+    ) -> EventCoalescer:
+        """Register a handler that is called only with the newest, or merged,
+        event per key. See EventCoalescer
+
+        :param event: The event, or wildcard, to register the handler for
+        :param handler: The function called with the event of each key
+        :param key: Optional name of the field of the events, e.g. requestId, or function
+        returning the key of an event. Defaults to every event sharing one key
+        :param merge: Optional function called with the pending event of a key and
+        a newer event of that key that returns the event kept. Defaults to the newer event
+        :param window: Optional number of seconds the events are collected for after
+        the first event. Defaults to delivering the events once per receive burst
+        :return: The coalescer, whose close method removes the handler
+        """
+        return EventCoalescer(self, event, handler, key, merge, window, self._loop)
+
+    def remove_listener(self, event: str, listener: Listener) -> None:
+        """Remove a listener registered for an event
+
+        :param event: The event the listener was registered for
+        :param listener: The registered listener to be removed
+        """
+        listeners = self._listeners.get(event)
+        if listeners is None or listeners.pop(listener, None) is None:
+            return
+        if not listeners:
+            del self._listeners[event]
+        self._invalidate(event)
+
+    def remove_all_listeners(self, event: Optional[str] = None) -> None:
+        """Removes every listener registered for the event or,
+        if no event was supplied, every registered listener
+
+        :param event: Optional event to remove the listeners of
+        """
+        if event is None:
+            self._listeners.clear()
+            self._table.clear()
+            self._error_listeners = False
+            return
+        if self._listeners.pop(event, None) is not None:
+            self._invalidate(event)
+
+    def listeners(self, event: str) -> List[Listener]:
+        """Returns the listeners registered for the event, wildcard listeners
+        are only returned for their wildcard
+
+        :param event: The event, or wildcard, to retrieve the listeners of
+        :return: The listeners registered for the event
+        """
+        return list(self._listeners.get(event, ()))
+
+    def event_names(self) -> List[str]:
+        """Returns the names of the events, and wildcards, that have listeners
+
+        :return: The names of the events
+        """
+        return list(self._listeners)
+
+    def listener_count(self, event: str) -> int:
+        """Returns the number of listeners registered for the event, wildcard
+        listeners are only counted for their wildcard
+
+        :param event: The event, or wildcard
+        :return: The number of listeners
+        """
+        return len(self._listeners.get(event, ()))
+
+    def has_listeners(self, event: str) -> bool:
+        """Returns T/F indicating if emitting the event would call any handlers,
+        including the wildcard listeners matching it
+
+        :param event: The event
+        :return: T/F indicating if the event has handlers
+        """
+        handlers = self._table.get(event)
+        if handlers is None:
+            handlers = self._compile(event)
+        return len(handlers) > 0
+
+    def _compile(self, event: str) -> Handlers:
+        """Creates, and stores in the dispatch table, the handlers of the event
+
+        :param event: The event
+        :return: The handlers of the event
+        """
+        listeners = self._listeners
+        exact = listeners.get(event)
+        handlers: List[Listener] = list(exact.values()) if exact is not None else []
+        domain, dot, _ = event.partition(".")
+        if dot:
+            wildcards = [listeners.get(f"{domain}.*")]
+            if domain not in RESERVED_DOMAINS:
+                wildcards.append(listeners.get(ALL_EVENTS))
+            for wildcard in wildcards:
+                if wildcard is not None:
+                    handlers.extend(
+                        partial(listener, event) for listener in wildcard.values()
+                    )
+        compiled = tuple(handlers)
+        self._table[intern(event)] = compiled
+        return compiled
+
+    def _invalidate(self, event: str) -> None:
+        """Drops the dispatch table entries that depend on the listeners of the event
+
+        :param event: The event, or wildcard, whose listeners changed
+        """
+        if event == "error":
+            self._error_listeners = "error" in self._listeners
+        table = self._table
+        if event == ALL_EVENTS:
+            table.clear()
+        elif event.endswith(".*"):
+            prefix = event[:-1]
+            for name in [name for name in table if name.startswith(prefix)]:
+                del table[name]
+        else:
+            table.pop(event, None)
+
+    def _add_listener(self, event: str, listener: Listener, wrapped: Listener) -> None:
+        """Registers the, possibly wrapped, listener for the event
+
+        :param event: The event, or wildcard
+        :param listener: The listener, used to remove it
+        :param wrapped: The listener or its wrapper, called when the event is emitted
+        """
+        listeners = self._listeners.get(event)
+        if listeners is None:
+            listeners = self._listeners[intern(event)] = OrderedDict()
+        listeners[listener] = wrapped
+        self._invalidate(event)
+
+    def _handle_awaitable(self, awaitable: Awaitable[Any]) -> None:
+        """Schedules the awaitable returned by a handler, emitting the error event
+        if it raises
+
+        :param awaitable: The awaitable
+        """
+        future = ensure_future(awaitable, loop=self._loop)
+        future.add_done_callback(self._maybe_emit_error)
+
+    def _maybe_emit_error(self, future: Future) -> None:
+        """Emits the exception raised by the future of an awaitable returned
+        by a handler as the error event
+
+        :param future: The future
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.emit("error", error)
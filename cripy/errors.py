@@ -1,6 +1,15 @@
-from typing import Dict
+from asyncio import TimeoutError
+from typing import Dict, Optional
 
-__all__ = ["ClientError", "NetworkError", "ProtocolError"]
+__all__ = [
+    "ClientError",
+    "CommandTimeoutError",
+    "ConnectionLostError",
+    "EventTimeoutError",
+    "NetworkError",
+    "ProtocolError",
+    "TransportClosedError",
+]
 
 
 class NetworkError(Exception):
@@ -14,9 +23,41 @@ class ClientError(Exception):
 class ProtocolError(Exception):
     """Exception used to indicate that a CDP command has received an error"""
 
+    def __init__(self, message: str, error: Optional[Dict] = None) -> None:
+        """Create a new ProtocolError
+
+        :param message: The message of the exception
+        :param error: Optional error object of the response, with its code and message
+        """
+        super().__init__(message)
+        self.error: Optional[Dict] = error
+
+
+class CommandTimeoutError(NetworkError, TimeoutError):
+    """Exception used to indicate that a CDP command did not receive a response
+    before its timeout elapsed"""
+
+
+class EventTimeoutError(NetworkError, TimeoutError):
+    """Exception used to indicate that an awaited CDP event was not received
+    before its timeout elapsed"""
+
+
+class ConnectionLostError(NetworkError):
+    """Exception used to indicate that a CDP command failed because the connection
+    to the remote browser was lost before it received a response. The command
+    may be retried once the connection is restored"""
+
+
+class TransportClosedError(NetworkError):
+    """Exception used to indicate that the transport used to communicate with the
+    remote browser was closed"""
+
 
 def create_protocol_error(method: str, msg: Dict) -> ProtocolError:
     error = msg["error"]
     data = error.get("data")
     data_m = f" {data}" if data is not None else ""
-    return ProtocolError(f"Protocol Error ({method}): {error.get('message')}{data_m}")
+    return ProtocolError(
+        f"Protocol Error ({method}): {error.get('message')}{data_m}", error
+    )
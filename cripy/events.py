@@ -7,7 +7,11 @@ class ConnectionEvents:
     Disconnected: ClassVar[str] = "Connection.Disconnected"
     Ready: ClassVar[str] = "Connection.Ready"
     AllMessages: ClassVar[str] = "Connection.AllMessages"
+    NotificationError: ClassVar[str] = "Connection.NotificationError"
+    Reconnecting: ClassVar[str] = "Connection.Reconnecting"
+    Reconnected: ClassVar[str] = "Connection.Reconnected"
 
 
 class SessionEvents:
     Disconnected: ClassVar[str] = "Session.Disconnected"
+    NotificationError: ClassVar[str] = "Session.NotificationError"
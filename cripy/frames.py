@@ -0,0 +1,139 @@
+import re
+from typing import FrozenSet, Optional, Pattern, Union
+
+__all__ = [
+    "mentions_session_id",
+    "peek_error",
+    "peek_id",
+    "peek_method",
+    "peek_session_id",
+]
+
+Frame = Union[str, bytes]
+
+# Chrome serializes events as {"method":"...","params":{...}} and responses
+# as {"id":N,"result":{...}} with the sessionId of flat sessions being the
+# last key, so all three can be read without decoding the whole frame
+ID_PREFIX: str = '{"id":'
+ID_PREFIX_B: bytes = b'{"id":'
+ID_START: int = len(ID_PREFIX)
+# ids are ints well below 2**53 so never have more than 16 digits
+ID_MAX_DIGITS: int = 16
+# digits as str characters and as the ints found when iterating bytes
+DIGITS: FrozenSet = frozenset("0123456789") | frozenset(b"0123456789")
+RESULT_KEY: str = ',"result":'
+RESULT_KEY_B: bytes = b',"result":'
+METHOD_PREFIX: str = '{"method":"'
+METHOD_PREFIX_B: bytes = b'{"method":"'
+METHOD_START: int = len(METHOD_PREFIX)
+SESSION_ID_TAIL: Pattern = re.compile(r',"sessionId":"([^"]+)"}\s*$')
+SESSION_ID_TAIL_B: Pattern = re.compile(rb',"sessionId":"([^"]+)"}\s*$')
+# how far from the end of the frame the sessionId key is looked for
+TAIL_WINDOW: int = 128
+SESSION_ID_KEY: str = '"sessionId":'
+SESSION_ID_KEY_B: bytes = b'"sessionId":'
+
+
+def _id_end(frame: Frame) -> int:
+    """Returns the index one past the last digit of the id of the supplied raw frame
+
+    :param frame: The raw JSON frame
+    :return: The index or 0 if the frame is not a response or its layout
+    is not the one used by Chrome
+    """
+    if isinstance(frame, str):
+        if not frame.startswith(ID_PREFIX):
+            return 0
+    elif not frame.startswith(ID_PREFIX_B):
+        return 0
+    digits = frame[ID_START : ID_START + ID_MAX_DIGITS + 1]
+    end = 0
+    for end, char in enumerate(digits):
+        if char not in DIGITS:
+            break
+    else:
+        return 0
+    if end == 0:
+        return 0
+    return ID_START + end
+
+
+def peek_id(frame: Frame) -> Optional[int]:
+    """Returns the id of the supplied raw frame if it is a response
+    without decoding the frame.
+
+    :param frame: The raw JSON frame
+    :return: The id of the response or None if the frame is not a response
+    or its layout is not the one used by Chrome
+    """
+    end = _id_end(frame)
+    if end == 0:
+        return None
+    return int(frame[ID_START:end])
+
+
+def peek_error(frame: Frame) -> bool:
+    """Returns T/F indicating if the supplied raw frame is an error response
+    without decoding the frame.
+
+    :param frame: The raw JSON frame
+    :return: T/F indicating if the frame is an error response. Frames whose layout
+    is not the one used by Chrome are considered errors so that they get decoded
+    """
+    end = _id_end(frame)
+    if end == 0:
+        return True
+    if isinstance(frame, str):
+        return not frame.startswith(RESULT_KEY, end)
+    return not frame.startswith(RESULT_KEY_B, end)
+
+
+def peek_method(frame: Frame) -> Optional[str]:
+    """Returns the method of the supplied raw frame if it is an event
+    without decoding the frame.
+
+    :param frame: The raw JSON frame
+    :return: The method of the event or None if the frame is not an event
+    or its layout is not the one used by Chrome
+    """
+    if isinstance(frame, str):
+        if not frame.startswith(METHOD_PREFIX):
+            return None
+        end = frame.find('"', METHOD_START)
+        if end == -1:
+            return None
+        return frame[METHOD_START:end]
+    if not frame.startswith(METHOD_PREFIX_B):
+        return None
+    end = frame.find(b'"', METHOD_START)
+    if end == -1:
+        return None
+    return frame[METHOD_START:end].decode("utf-8")
+
+
+def peek_session_id(frame: Frame) -> Optional[str]:
+    """Returns the top level sessionId of the supplied raw frame without
+    decoding the frame.
+
+    :param frame: The raw JSON frame
+    :return: The sessionId of the frame or None if it does not have one
+    """
+    start = max(0, len(frame) - TAIL_WINDOW)
+    if isinstance(frame, str):
+        match = SESSION_ID_TAIL.search(frame, start)
+        return match.group(1) if match is not None else None
+    match_b = SESSION_ID_TAIL_B.search(frame, start)
+    return match_b.group(1).decode("utf-8") if match_b is not None else None
+
+
+def mentions_session_id(frame: Frame) -> bool:
+    """Returns T/F indicating if the sessionId key appears anywhere in the supplied
+    raw frame, for telling frames without a sessionId apart from frames whose
+    sessionId peek_session_id could not find
+
+    :param frame: The raw JSON frame
+    :return: T/F indicating if the frame mentions a sessionId
+    """
+    if isinstance(frame, str):
+        return SESSION_ID_KEY in frame
+    return SESSION_ID_KEY_B in frame
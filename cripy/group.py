@@ -0,0 +1,244 @@
+from asyncio import AbstractEventLoop, Future, gather, get_event_loop
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cdp_result_future import CDPResultFuture
+from .cdp_session import CDPSession
+from .connection import Connection, dispose_all
+from .errors import ClientError, NetworkError
+from .waiters import EventPredicate
+
+__all__ = ["ConnectionGroup"]
+
+
+class ConnectionGroup:
+    """A group of connections, each with its own websocket, to the same browser
+    exposed as a single connection.
+
+    Sessions are created on the least loaded connection, so that the commands,
+    responses and events of many targets are spread across several sockets and
+    receive loops. Commands sent using the group and the listeners registered with
+    it are sent using and registered with the groups first connection, which
+    receives the browser level events.
+    """
+
+    __slots__ = ["_connection_kwargs", "_connections", "_loop", "_size", "_ws_url"]
+
+    def __init__(
+        self,
+        ws_url: Optional[str] = None,
+        size: int = 2,
+        loop: Optional[AbstractEventLoop] = None,
+        **connection_kwargs: Any,
+    ) -> None:
+        """Create a new ConnectionGroup
+
+        :param ws_url: The WS endpoint of the browser.
+        If a ws url is not supplied it is expected to be supplied via connect.
+        :param size: The number of connections opened to the browser
+        :param loop: Optional event loop to use. Defaults to asyncio.get_event_loop
+        :param connection_kwargs: Additional keyword arguments for each Connection,
+        e.g. transport_factory or command_timeout
+        """
+        if size < 1:
+            raise ClientError(f"The size of a ConnectionGroup must be >= 1, got {size}")
+        if loop is None:
+            loop = get_event_loop()
+        self._ws_url: Optional[str] = ws_url
+        self._size: int = size
+        self._loop: AbstractEventLoop = loop
+        self._connection_kwargs: Dict[str, Any] = connection_kwargs
+        self._connections: List[Connection] = []
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        """Returns the event loop the group is using"""
+        return self._loop
+
+    @property
+    def size(self) -> int:
+        """Returns the number of connections opened to the browser"""
+        return self._size
+
+    @property
+    def connections(self) -> List[Connection]:
+        """Returns the connections of the group"""
+        return list(self._connections)
+
+    @property
+    def primary(self) -> Connection:
+        """Returns the connection commands sent using the group and the
+        listeners registered with it use"""
+        if not self._connections:
+            raise NetworkError("The ConnectionGroup is not connected")
+        return self._connections[0]
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of commands, including those of the sessions,
+        awaiting their response across all connections"""
+        return sum(self.load(connection)[0] for connection in self._connections)
+
+    async def connect(self, ws_url: Optional[str] = None) -> None:
+        """Opens every connection of the group
+
+        :param ws_url: The websocket URL to connect to
+        """
+        if ws_url is not None:
+            self._ws_url = ws_url
+        connections = [
+            Connection(self._ws_url, loop=self._loop, **self._connection_kwargs)
+            for _ in range(self._size)
+        ]
+        results = await gather(
+            *[connection.connect() for connection in connections],
+            return_exceptions=True,
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await dispose_all(connections, hard=True)
+            raise errors[0]
+        self._connections = connections
+
+    async def create_session(self, target_id: str) -> CDPSession:
+        """Attaches to the target specified by the supplied target id, using the
+        least loaded connection, and creates a new CDPSession for direct communication to it
+
+        :param target_id: The id of the target connecting to
+        :return: A new session connected to the target
+        """
+        return await self.least_loaded().create_session(target_id)
+
+    def least_loaded(self) -> Connection:
+        """Returns the connection with the fewest commands awaiting their response,
+        ties are broken by the number of sessions of the connections
+
+        :return: The least loaded connection
+        """
+        if not self._connections:
+            raise NetworkError("The ConnectionGroup is not connected")
+        return min(self._connections, key=self.load)
+
+    @staticmethod
+    def load(connection: Connection) -> Tuple[int, int]:
+        """Returns the load of the supplied connection
+
+        :param connection: The connection
+        :return: The number of commands, including those of the sessions, awaiting their
+        response or waiting for room in an in flight window and the number of sessions
+        """
+        sessions = connection._sessions.values()
+        commands = connection.in_flight + connection.queued_commands
+        for session in sessions:
+            commands += session.in_flight + session.queued_commands
+        return commands, len(sessions)
+
+    def session(self, session_id: str) -> Optional[CDPSession]:
+        """Returns the session instance, of any of the connections, associated
+        with the supplied session id.
+
+        :param session_id: The id of the session to be retrieved
+        :return: The session instance associated with the id if it exists
+        """
+        for connection in self._connections:
+            session = connection.session(session_id)
+            if session is not None:
+                return session
+        return None
+
+    def send(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        priority: Optional[int] = None,
+    ) -> CDPResultFuture:
+        """Send a command to the browser using the primary connection.
+        See Connection.send
+
+        :param method: The method to be used
+        :param params: The optional parameters (arguments) for the command
+        :param timeout: Optional number of seconds the command has to receive a response
+        :param priority: Optional priority (Priority.CONTROL or Priority.BULK) of the command
+        :return: A future that resolves once the commands response is received
+        """
+        return self.primary.send(method, params, timeout, priority)
+
+    def send_nowait(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        priority: Optional[int] = None,
+    ) -> None:
+        """Send a command to the browser using the primary connection without
+        waiting for its response. See Connection.send_nowait
+
+        :param method: The method to be used
+        :param params: The optional parameters (arguments) for the command
+        :param priority: Optional priority (Priority.CONTROL or Priority.BULK) of the command
+        """
+        self.primary.send_nowait(method, params, priority)
+
+    def on(
+        self, event: str, listener: Optional[Callable[..., Any]] = None
+    ) -> Callable[..., Any]:
+        """Register a listener for an event of the primary connection
+
+        :param event: The event to register the listener for
+        :param listener: The listener to be called when the event is emitted
+        :return: The listener or listener wrapper when used as a decorator
+        """
+        return self.primary.on(event, listener)
+
+    def once(
+        self, event: str, listener: Optional[Callable[..., Any]] = None
+    ) -> Callable[..., Any]:
+        """Register a one time listener for an event of the primary connection
+
+        :param event: The event to register the listener for
+        :param listener: The listener to be called when the event is emitted
+        :return: The listener or listener wrapper when used as a decorator
+        """
+        return self.primary.once(event, listener)
+
+    def wait_for(
+        self,
+        event: str,
+        predicate: Optional[EventPredicate] = None,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """Waits for the first event of the primary connection accepted by the predicate.
+        See Connection.wait_for
+
+        :param event: The name of the event
+        :param predicate: Optional function called with each event that returns
+        T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event
+        :return: A future that resolves with the event
+        """
+        return self.primary.wait_for(event, predicate, timeout)
+
+    def remove_listener(self, event: str, listener: Callable[..., Any]) -> None:
+        """Remove a listener registered for an event of the primary connection
+
+        :param event: The event that has the supplied listener registered
+        :param listener: The registered listener to be removed
+        """
+        self.primary.remove_listener(event, listener)
+
+    async def dispose(self, hard: bool = False, timeout: float = 15.0) -> None:
+        """Closes every connection of the group with a single shared deadline
+
+        :param hard: Abort the transports immediately rather than performing
+        the closing handshakes
+        :param timeout: The number of seconds closing may take before the
+        remaining transports are aborted
+        """
+        connections = self._connections
+        self._connections = []
+        await dispose_all(connections, timeout, hard)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(wsurl={self._ws_url}, size={self._size}, connected={len(self._connections)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,63 @@
+from typing import ClassVar, FrozenSet, Iterable, Optional
+
+__all__ = ["DEFAULT_BULK_METHODS", "Priority", "make_bulk_methods", "resolve_priority"]
+
+
+class Priority:
+    """The priorities of outbound commands.
+
+    Control commands are always written before bulk commands, except that
+    after a streak of control commands a waiting bulk command is written so
+    that bulk commands are never starved.
+    """
+
+    CONTROL: ClassVar[int] = 0
+    BULK: ClassVar[int] = 1
+
+
+# Commands that move large payloads, or take the browser a long time to answer,
+# and are sent with bulk priority unless told otherwise
+DEFAULT_BULK_METHODS: FrozenSet[str] = frozenset(
+    [
+        "Audits.getEncodedResponse",
+        "DOM.getDocument",
+        "DOM.getFlattenedDocument",
+        "DOMSnapshot.captureSnapshot",
+        "Fetch.getResponseBody",
+        "HeapProfiler.takeHeapSnapshot",
+        "IO.read",
+        "Network.getResponseBody",
+        "Network.getResponseBodyForInterception",
+        "Page.captureScreenshot",
+        "Page.captureSnapshot",
+        "Page.getResourceContent",
+        "Page.printToPDF",
+    ]
+)
+
+
+def resolve_priority(
+    method: str, priority: Optional[int], bulk_methods: FrozenSet[str]
+) -> int:
+    """Returns the priority a command is to be sent with
+
+    :param method: The method of the command
+    :param priority: The priority explicitly requested for the command, if any
+    :param bulk_methods: The methods sent with bulk priority by default
+    :return: The priority of the command
+    """
+    if priority is not None:
+        return priority
+    return Priority.BULK if method in bulk_methods else Priority.CONTROL
+
+
+def make_bulk_methods(methods: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """Returns the supplied methods as a frozenset or the default
+    bulk methods if methods is None
+
+    :param methods: Optional methods to be sent with bulk priority
+    :return: The methods sent with bulk priority by default
+    """
+    if methods is None:
+        return DEFAULT_BULK_METHODS
+    return frozenset(methods)
@@ -25,25 +25,33 @@ class Accessibility:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables the accessibility domain.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Accessibility#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Accessibility.disable", {})
         return self.client.send("Accessibility.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables the accessibility domain which causes `AXNodeId`s to remain consistent between method calls.
         This turns on accessibility for the page, which can impact performance until accessibility is disabled.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Accessibility#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Accessibility.enable", {})
         return self.client.send("Accessibility.enable", {})
 
     def getPartialAXTree(
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -26,24 +28,32 @@ class Animation:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables animation domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Animation.disable", {})
         return self.client.send("Animation.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables animation domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Animation.enable", {})
         return self.client.send("Animation.enable", {})
 
     def getCurrentTime(self, id: str) -> Awaitable[Dict]:
@@ -67,15 +77,23 @@ class Animation:
         """
         return self.client.send("Animation.getPlaybackRate", {})
 
-    def releaseAnimations(self, animations: List[str]) -> Awaitable[Dict]:
+    def releaseAnimations(
+        self, animations: List[str], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Releases a set of animations to no longer be manipulated.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#method-releaseAnimations`
 
         :param animations: List of animation ids to seek.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Animation.releaseAnimations", {"animations": animations}
+            )
         return self.client.send(
             "Animation.releaseAnimations", {"animations": animations}
         )
@@ -94,8 +112,11 @@ class Animation:
         )
 
     def seekAnimations(
-        self, animations: List[str], currentTime: Union[int, float]
-    ) -> Awaitable[Dict]:
+        self,
+        animations: List[str],
+        currentTime: Union[int, float],
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Seek a set of animations to a particular time within each animation.
 
@@ -103,14 +124,23 @@ class Animation:
 
         :param animations: List of animation ids to seek.
         :param currentTime: Set the current time of each animation.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Animation.seekAnimations",
+                {"animations": animations, "currentTime": currentTime},
+            )
         return self.client.send(
             "Animation.seekAnimations",
             {"animations": animations, "currentTime": currentTime},
         )
 
-    def setPaused(self, animations: List[str], paused: bool) -> Awaitable[Dict]:
+    def setPaused(
+        self, animations: List[str], paused: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets the paused state of a set of animations.
 
@@ -118,28 +148,46 @@ class Animation:
 
         :param animations: Animations to set the pause state of.
         :param paused: Paused state to set to.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Animation.setPaused", {"animations": animations, "paused": paused}
+            )
         return self.client.send(
             "Animation.setPaused", {"animations": animations, "paused": paused}
         )
 
-    def setPlaybackRate(self, playbackRate: Union[int, float]) -> Awaitable[Dict]:
+    def setPlaybackRate(
+        self, playbackRate: Union[int, float], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets the playback rate of the document timeline.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#method-setPlaybackRate`
 
         :param playbackRate: Playback rate for animations on page
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Animation.setPlaybackRate", {"playbackRate": playbackRate}
+            )
         return self.client.send(
             "Animation.setPlaybackRate", {"playbackRate": playbackRate}
         )
 
     def setTiming(
-        self, animationId: str, duration: Union[int, float], delay: Union[int, float]
-    ) -> Awaitable[Dict]:
+        self,
+        animationId: str,
+        duration: Union[int, float],
+        delay: Union[int, float],
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets the timing of an animation node.
 
@@ -148,15 +196,26 @@ class Animation:
         :param animationId: Animation id.
         :param duration: Duration of the animation.
         :param delay: Delay of the animation.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Animation.setTiming",
+                {"animationId": animationId, "duration": duration, "delay": delay},
+            )
         return self.client.send(
             "Animation.setTiming",
             {"animationId": animationId, "duration": duration, "delay": delay},
         )
 
+    @event_accessor("Animation.animationCanceled")
     def animationCanceled(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Event for when an animation has been cancelled.
@@ -164,26 +223,27 @@ class Animation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#event-animationCanceled`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Animation.animationCanceled"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Animation.animationCreated")
     def animationCreated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Event for each animation that has been created.
@@ -191,26 +251,27 @@ class Animation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#event-animationCreated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Animation.animationCreated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Animation.animationStarted")
     def animationStarted(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Event for animation that has been started.
@@ -218,20 +279,17 @@ class Animation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Animation#event-animationStarted`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Animation.animationStarted"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
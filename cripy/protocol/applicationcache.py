@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -23,14 +25,18 @@ class ApplicationCache:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables application cache domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/ApplicationCache#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("ApplicationCache.enable", {})
         return self.client.send("ApplicationCache.enable", {})
 
     def getApplicationCacheForFrame(self, frameId: str) -> Awaitable[Dict]:
@@ -70,52 +76,54 @@ class ApplicationCache:
             "ApplicationCache.getManifestForFrame", {"frameId": frameId}
         )
 
+    @event_accessor("ApplicationCache.applicationCacheStatusUpdated")
     def applicationCacheStatusUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ApplicationCache#event-applicationCacheStatusUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "ApplicationCache.applicationCacheStatusUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("ApplicationCache.networkStateUpdated")
     def networkStateUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ApplicationCache#event-networkStateUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "ApplicationCache.networkStateUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
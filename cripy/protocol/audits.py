@@ -1,5 +1,7 @@
 """This is an auto-generated file. Modify at your own risk"""
-from typing import Awaitable, Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Awaitable, Any, BinaryIO, Dict, List, Optional, Union, TYPE_CHECKING
+
+from cripy.binary import binary_result
 
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
@@ -33,6 +35,8 @@ class Audits:
         encoding: str,
         quality: Optional[Union[int, float]] = None,
         sizeOnly: Optional[bool] = None,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
     ) -> Awaitable[Dict]:
         """
         Returns the response body and size if it were re-encoded with the specified settings. Only
@@ -44,6 +48,9 @@ class Audits:
         :param encoding: The encoding to use.
         :param quality: The quality of the encoding (0-1). (defaults to 1)
         :param sizeOnly: Whether to only return the size information (defaults to false).
+        :param as_bytes: If true body is decoded from base64 and returned as bytes
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        body is written to in chunks, body is then the number of bytes written
         :return: The results of the command
         """
         msg = {"requestId": requestId, "encoding": encoding}
@@ -51,4 +58,8 @@ class Audits:
             msg["quality"] = quality
         if sizeOnly is not None:
             msg["sizeOnly"] = sizeOnly
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send("Audits.getEncodedResponse", msg), "body", sink
+            )
         return self.client.send("Audits.getEncodedResponse", msg)
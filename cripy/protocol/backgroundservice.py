@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -24,31 +26,49 @@ class BackgroundService:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def startObserving(self, service: str) -> Awaitable[Dict]:
+    def startObserving(
+        self, service: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables event updates for the service.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/BackgroundService#method-startObserving`
 
         :param service: The service
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "BackgroundService.startObserving", {"service": service}
+            )
         return self.client.send(
             "BackgroundService.startObserving", {"service": service}
         )
 
-    def stopObserving(self, service: str) -> Awaitable[Dict]:
+    def stopObserving(
+        self, service: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Disables event updates for the service.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/BackgroundService#method-stopObserving`
 
         :param service: The service
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "BackgroundService.stopObserving", {"service": service}
+            )
         return self.client.send("BackgroundService.stopObserving", {"service": service})
 
-    def setRecording(self, shouldRecord: bool, service: str) -> Awaitable[Dict]:
+    def setRecording(
+        self, shouldRecord: bool, service: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Set the recording state for the service.
 
@@ -56,26 +76,45 @@ class BackgroundService:
 
         :param shouldRecord: The shouldRecord
         :param service: The service
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "BackgroundService.setRecording",
+                {"shouldRecord": shouldRecord, "service": service},
+            )
         return self.client.send(
             "BackgroundService.setRecording",
             {"shouldRecord": shouldRecord, "service": service},
         )
 
-    def clearEvents(self, service: str) -> Awaitable[Dict]:
+    def clearEvents(
+        self, service: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears all stored data for the service.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/BackgroundService#method-clearEvents`
 
         :param service: The service
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "BackgroundService.clearEvents", {"service": service}
+            )
         return self.client.send("BackgroundService.clearEvents", {"service": service})
 
+    @event_accessor("BackgroundService.recordingStateChanged")
     def recordingStateChanged(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called when the recording state for the service has been updated.
@@ -83,26 +122,27 @@ class BackgroundService:
         See `https://chromedevtools.github.io/devtools-protocol/tot/BackgroundService#event-recordingStateChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "BackgroundService.recordingStateChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("BackgroundService.backgroundServiceEventReceived")
     def backgroundServiceEventReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called with all existing backgroundServiceEvents when enabled, and all new
@@ -111,20 +151,17 @@ class BackgroundService:
         See `https://chromedevtools.github.io/devtools-protocol/tot/BackgroundService#event-backgroundServiceEventReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "BackgroundService.backgroundServiceEventReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
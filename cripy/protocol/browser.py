@@ -28,7 +28,8 @@ class Browser:
         origin: str,
         permissions: List[str],
         browserContextId: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Grant specific permissions to the given origin and reject all others.
 
@@ -39,16 +40,20 @@ class Browser:
         :param origin: The origin
         :param permissions: The permissions
         :param browserContextId: BrowserContext to override permissions. When omitted, default browser context is used.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"origin": origin, "permissions": permissions}
         if browserContextId is not None:
             msg["browserContextId"] = browserContextId
+        if nowait:
+            return self.client.send_nowait("Browser.grantPermissions", msg)
         return self.client.send("Browser.grantPermissions", msg)
 
     def resetPermissions(
-        self, browserContextId: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, browserContextId: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Reset all permission management for all origins.
 
@@ -57,24 +62,32 @@ class Browser:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Browser#method-resetPermissions`
 
         :param browserContextId: BrowserContext to reset permissions. When omitted, default browser context is used.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if browserContextId is not None:
             msg["browserContextId"] = browserContextId
+        if nowait:
+            return self.client.send_nowait("Browser.resetPermissions", msg)
         return self.client.send("Browser.resetPermissions", msg)
 
-    def close(self) -> Awaitable[Dict]:
+    def close(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Close browser gracefully.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Browser#method-close`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Browser.close", {})
         return self.client.send("Browser.close", {})
 
-    def crash(self) -> Awaitable[Dict]:
+    def crash(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Crashes browser on the main thread.
 
@@ -82,11 +95,15 @@ class Browser:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Browser#method-crash`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Browser.crash", {})
         return self.client.send("Browser.crash", {})
 
-    def crashGpuProcess(self) -> Awaitable[Dict]:
+    def crashGpuProcess(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Crashes GPU process.
 
@@ -94,8 +111,12 @@ class Browser:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Browser#method-crashGpuProcess`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Browser.crashGpuProcess", {})
         return self.client.send("Browser.crashGpuProcess", {})
 
     def getVersion(self) -> Awaitable[Dict]:
@@ -190,7 +211,9 @@ class Browser:
             msg["targetId"] = targetId
         return self.client.send("Browser.getWindowForTarget", msg)
 
-    def setWindowBounds(self, windowId: int, bounds: Dict[str, Any]) -> Awaitable[Dict]:
+    def setWindowBounds(
+        self, windowId: int, bounds: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Set position and/or size of the browser window.
 
@@ -201,15 +224,24 @@ class Browser:
         :param windowId: Browser window id.
         :param bounds: New window bounds. The 'minimized', 'maximized' and 'fullscreen' states cannot be combined
          with 'left', 'top', 'width' or 'height'. Leaves unspecified fields unchanged.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Browser.setWindowBounds", {"windowId": windowId, "bounds": bounds}
+            )
         return self.client.send(
             "Browser.setWindowBounds", {"windowId": windowId, "bounds": bounds}
         )
 
     def setDockTile(
-        self, badgeLabel: Optional[str] = None, image: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self,
+        badgeLabel: Optional[str] = None,
+        image: Optional[str] = None,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Set dock tile details, platform-specific.
 
@@ -219,6 +251,8 @@ class Browser:
 
         :param badgeLabel: The badgeLabel
         :param image: Png encoded image.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -226,4 +260,6 @@ class Browser:
             msg["badgeLabel"] = badgeLabel
         if image is not None:
             msg["image"] = image
+        if nowait:
+            return self.client.send_nowait("Browser.setDockTile", msg)
         return self.client.send("Browser.setDockTile", msg)
@@ -23,18 +23,28 @@ class CacheStorage:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def deleteCache(self, cacheId: str) -> Awaitable[Dict]:
+    def deleteCache(
+        self, cacheId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deletes a cache.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/CacheStorage#method-deleteCache`
 
         :param cacheId: Id of cache for deletion.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "CacheStorage.deleteCache", {"cacheId": cacheId}
+            )
         return self.client.send("CacheStorage.deleteCache", {"cacheId": cacheId})
 
-    def deleteEntry(self, cacheId: str, request: str) -> Awaitable[Dict]:
+    def deleteEntry(
+        self, cacheId: str, request: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deletes a cache entry.
 
@@ -42,8 +52,14 @@ class CacheStorage:
 
         :param cacheId: Id of cache where the entry will be deleted.
         :param request: URL spec of the request.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "CacheStorage.deleteEntry", {"cacheId": cacheId, "request": request}
+            )
         return self.client.send(
             "CacheStorage.deleteEntry", {"cacheId": cacheId, "request": request}
         )
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -25,7 +27,9 @@ class Cast:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def enable(self, presentationUrl: Optional[str] = None) -> Awaitable[Dict]:
+    def enable(
+        self, presentationUrl: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Starts observing for sinks that can be used for tab mirroring, and if set,
         sinks compatible with |presentationUrl| as well. When sinks are found, a
@@ -36,24 +40,34 @@ class Cast:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#method-enable`
 
         :param presentationUrl: The presentationUrl
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if presentationUrl is not None:
             msg["presentationUrl"] = presentationUrl
+        if nowait:
+            return self.client.send_nowait("Cast.enable", msg)
         return self.client.send("Cast.enable", msg)
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Stops observing for sinks and issues.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Cast.disable", {})
         return self.client.send("Cast.disable", {})
 
-    def setSinkToUse(self, sinkName: str) -> Awaitable[Dict]:
+    def setSinkToUse(
+        self, sinkName: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets a sink to be used when the web page requests the browser to choose a
         sink via Presentation API, Remote Playback API, or Cast SDK.
@@ -61,34 +75,56 @@ class Cast:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#method-setSinkToUse`
 
         :param sinkName: The sinkName
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Cast.setSinkToUse", {"sinkName": sinkName})
         return self.client.send("Cast.setSinkToUse", {"sinkName": sinkName})
 
-    def startTabMirroring(self, sinkName: str) -> Awaitable[Dict]:
+    def startTabMirroring(
+        self, sinkName: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Starts mirroring the tab to the sink.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#method-startTabMirroring`
 
         :param sinkName: The sinkName
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Cast.startTabMirroring", {"sinkName": sinkName}
+            )
         return self.client.send("Cast.startTabMirroring", {"sinkName": sinkName})
 
-    def stopCasting(self, sinkName: str) -> Awaitable[Dict]:
+    def stopCasting(
+        self, sinkName: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Stops the active Cast session on the sink.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#method-stopCasting`
 
         :param sinkName: The sinkName
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Cast.stopCasting", {"sinkName": sinkName})
         return self.client.send("Cast.stopCasting", {"sinkName": sinkName})
 
+    @event_accessor("Cast.sinksUpdated")
     def sinksUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         This is fired whenever the list of available sinks changes. A sink is a
@@ -97,26 +133,27 @@ class Cast:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#event-sinksUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Cast.sinksUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Cast.issueUpdated")
     def issueUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         This is fired whenever the outstanding issue/error message changes.
@@ -125,20 +162,17 @@ class Cast:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Cast#event-issueUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Cast.issueUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
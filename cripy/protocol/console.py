@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -27,39 +29,55 @@ class Console:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def clearMessages(self) -> Awaitable[Dict]:
+    def clearMessages(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Does nothing.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Console#method-clearMessages`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Console.clearMessages", {})
         return self.client.send("Console.clearMessages", {})
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables console domain, prevents further console messages from being reported to the client.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Console#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Console.disable", {})
         return self.client.send("Console.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables console domain, sends the messages collected so far to the client by means of the
         `messageAdded` notification.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Console#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Console.enable", {})
         return self.client.send("Console.enable", {})
 
+    @event_accessor("Console.messageAdded")
     def messageAdded(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when new console message is added.
@@ -67,20 +85,17 @@ class Console:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Console#event-messageAdded`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Console.messageAdded"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
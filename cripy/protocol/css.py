@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -73,30 +75,38 @@ class CSS:
         """
         return self.client.send("CSS.createStyleSheet", {"frameId": frameId})
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables the CSS agent for the given page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("CSS.disable", {})
         return self.client.send("CSS.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables the CSS agent for the given page. Clients should not assume that the CSS agent has been
         enabled until the result of this command is received.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("CSS.enable", {})
         return self.client.send("CSS.enable", {})
 
     def forcePseudoState(
-        self, nodeId: int, forcedPseudoClasses: List[str]
-    ) -> Awaitable[Dict]:
+        self, nodeId: int, forcedPseudoClasses: List[str], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Ensures that the given node will have specified pseudo-classes whenever its style is computed by
         the browser.
@@ -105,8 +115,15 @@ class CSS:
 
         :param nodeId: The element id for which to force the pseudo state.
         :param forcedPseudoClasses: Element pseudo classes to force when computing the element's style.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "CSS.forcePseudoState",
+                {"nodeId": nodeId, "forcedPseudoClasses": forcedPseudoClasses},
+            )
         return self.client.send(
             "CSS.forcePseudoState",
             {"nodeId": nodeId, "forcedPseudoClasses": forcedPseudoClasses},
@@ -189,8 +206,8 @@ class CSS:
         return self.client.send("CSS.getStyleSheetText", {"styleSheetId": styleSheetId})
 
     def setEffectivePropertyValueForNode(
-        self, nodeId: int, propertyName: str, value: str
-    ) -> Awaitable[Dict]:
+        self, nodeId: int, propertyName: str, value: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Find a rule with the given active property for the given node and set the new value for this
         property
@@ -200,8 +217,15 @@ class CSS:
         :param nodeId: The element id for which to set property.
         :param propertyName: The propertyName
         :param value: The value
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "CSS.setEffectivePropertyValueForNode",
+                {"nodeId": nodeId, "propertyName": propertyName, "value": value},
+            )
         return self.client.send(
             "CSS.setEffectivePropertyValueForNode",
             {"nodeId": nodeId, "propertyName": propertyName, "value": value},
@@ -286,14 +310,18 @@ class CSS:
         """
         return self.client.send("CSS.setStyleTexts", {"edits": edits})
 
-    def startRuleUsageTracking(self) -> Awaitable[Dict]:
+    def startRuleUsageTracking(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables the selector recording.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#method-startRuleUsageTracking`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("CSS.startRuleUsageTracking", {})
         return self.client.send("CSS.startRuleUsageTracking", {})
 
     def stopRuleUsageTracking(self) -> Awaitable[Dict]:
@@ -318,8 +346,12 @@ class CSS:
         """
         return self.client.send("CSS.takeCoverageDelta", {})
 
+    @event_accessor("CSS.fontsUpdated")
     def fontsUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fires whenever a web font is updated.  A non-empty font parameter indicates a successfully loaded
@@ -328,26 +360,27 @@ class CSS:
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#event-fontsUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "CSS.fontsUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("CSS.mediaQueryResultChanged")
     def mediaQueryResultChanged(
-        self, listener: Optional[Callable[[Any], Any]] = None
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fires whenever a MediaQuery result changes (for example, after a browser window has been
@@ -356,26 +389,27 @@ class CSS:
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#event-mediaQueryResultChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "CSS.mediaQueryResultChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("CSS.styleSheetAdded")
     def styleSheetAdded(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired whenever an active document stylesheet is added.
@@ -383,26 +417,27 @@ class CSS:
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#event-styleSheetAdded`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "CSS.styleSheetAdded"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("CSS.styleSheetChanged")
     def styleSheetChanged(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired whenever a stylesheet is changed as a result of the client operation.
@@ -410,26 +445,27 @@ class CSS:
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#event-styleSheetChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "CSS.styleSheetChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("CSS.styleSheetRemoved")
     def styleSheetRemoved(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired whenever an active document stylesheet is removed.
@@ -437,20 +473,17 @@ class CSS:
         See `https://chromedevtools.github.io/devtools-protocol/tot/CSS#event-styleSheetRemoved`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "CSS.styleSheetRemoved"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -28,8 +30,11 @@ class Debugger:
         self.client: Union["ConnectionType", "SessionType"] = client
 
     def continueToLocation(
-        self, location: Dict[str, Any], targetCallFrames: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self,
+        location: Dict[str, Any],
+        targetCallFrames: Optional[str] = None,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Continues execution until specific location is reached.
 
@@ -37,21 +42,29 @@ class Debugger:
 
         :param location: Location to continue to.
         :param targetCallFrames: The targetCallFrames
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"location": location}
         if targetCallFrames is not None:
             msg["targetCallFrames"] = targetCallFrames
+        if nowait:
+            return self.client.send_nowait("Debugger.continueToLocation", msg)
         return self.client.send("Debugger.continueToLocation", msg)
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables debugger for given page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Debugger.disable", {})
         return self.client.send("Debugger.disable", {})
 
     def enable(
@@ -171,38 +184,58 @@ class Debugger:
             "Debugger.getStackTrace", {"stackTraceId": stackTraceId}
         )
 
-    def pause(self) -> Awaitable[Dict]:
+    def pause(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Stops on the next JavaScript statement.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-pause`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Debugger.pause", {})
         return self.client.send("Debugger.pause", {})
 
-    def pauseOnAsyncCall(self, parentStackTraceId: Dict[str, Any]) -> Awaitable[Dict]:
+    def pauseOnAsyncCall(
+        self, parentStackTraceId: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Status: Experimental
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-pauseOnAsyncCall`
 
         :param parentStackTraceId: Debugger will pause when async call with given stack trace is started.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.pauseOnAsyncCall", {"parentStackTraceId": parentStackTraceId}
+            )
         return self.client.send(
             "Debugger.pauseOnAsyncCall", {"parentStackTraceId": parentStackTraceId}
         )
 
-    def removeBreakpoint(self, breakpointId: str) -> Awaitable[Dict]:
+    def removeBreakpoint(
+        self, breakpointId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes JavaScript breakpoint.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-removeBreakpoint`
 
         :param breakpointId: The breakpointId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.removeBreakpoint", {"breakpointId": breakpointId}
+            )
         return self.client.send(
             "Debugger.removeBreakpoint", {"breakpointId": breakpointId}
         )
@@ -218,14 +251,18 @@ class Debugger:
         """
         return self.client.send("Debugger.restartFrame", {"callFrameId": callFrameId})
 
-    def resume(self) -> Awaitable[Dict]:
+    def resume(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Resumes JavaScript execution.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-resume`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Debugger.resume", {})
         return self.client.send("Debugger.resume", {})
 
     def searchInContent(
@@ -253,7 +290,9 @@ class Debugger:
             msg["isRegex"] = isRegex
         return self.client.send("Debugger.searchInContent", msg)
 
-    def setAsyncCallStackDepth(self, maxDepth: int) -> Awaitable[Dict]:
+    def setAsyncCallStackDepth(
+        self, maxDepth: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables or disables async call stacks tracking.
 
@@ -261,13 +300,21 @@ class Debugger:
 
         :param maxDepth: Maximum depth of async call stacks. Setting to `0` will effectively disable collecting async
          call stacks (default).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setAsyncCallStackDepth", {"maxDepth": maxDepth}
+            )
         return self.client.send(
             "Debugger.setAsyncCallStackDepth", {"maxDepth": maxDepth}
         )
 
-    def setBlackboxPatterns(self, patterns: List[str]) -> Awaitable[Dict]:
+    def setBlackboxPatterns(
+        self, patterns: List[str], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Replace previous blackbox patterns with passed ones. Forces backend to skip stepping/pausing in
         scripts with url matching one of the patterns. VM will try to leave blackboxed script by
@@ -278,13 +325,19 @@ class Debugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-setBlackboxPatterns`
 
         :param patterns: Array of regexps that will be used to check script url for blackbox state.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setBlackboxPatterns", {"patterns": patterns}
+            )
         return self.client.send("Debugger.setBlackboxPatterns", {"patterns": patterns})
 
     def setBlackboxedRanges(
-        self, scriptId: str, positions: List[Dict[str, Any]]
-    ) -> Awaitable[Dict]:
+        self, scriptId: str, positions: List[Dict[str, Any]], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Makes backend skip steps in the script in blackboxed ranges. VM will try leave blacklisted
         scripts by performing 'step in' several times, finally resorting to 'step out' if unsuccessful.
@@ -297,8 +350,15 @@ class Debugger:
 
         :param scriptId: Id of the script.
         :param positions: The positions
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setBlackboxedRanges",
+                {"scriptId": scriptId, "positions": positions},
+            )
         return self.client.send(
             "Debugger.setBlackboxedRanges",
             {"scriptId": scriptId, "positions": positions},
@@ -384,18 +444,28 @@ class Debugger:
             msg["condition"] = condition
         return self.client.send("Debugger.setBreakpointOnFunctionCall", msg)
 
-    def setBreakpointsActive(self, active: bool) -> Awaitable[Dict]:
+    def setBreakpointsActive(
+        self, active: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Activates / deactivates all breakpoints on the page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-setBreakpointsActive`
 
         :param active: New value for breakpoints active state.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setBreakpointsActive", {"active": active}
+            )
         return self.client.send("Debugger.setBreakpointsActive", {"active": active})
 
-    def setPauseOnExceptions(self, state: str) -> Awaitable[Dict]:
+    def setPauseOnExceptions(
+        self, state: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Defines pause on exceptions state. Can be set to stop on all exceptions, uncaught exceptions or
         no exceptions. Initial pause on exceptions state is `none`.
@@ -403,11 +473,19 @@ class Debugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-setPauseOnExceptions`
 
         :param state: Pause on exceptions mode.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setPauseOnExceptions", {"state": state}
+            )
         return self.client.send("Debugger.setPauseOnExceptions", {"state": state})
 
-    def setReturnValue(self, newValue: Dict[str, Any]) -> Awaitable[Dict]:
+    def setReturnValue(
+        self, newValue: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Changes return value in top frame. Available only at return break position.
 
@@ -416,8 +494,14 @@ class Debugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-setReturnValue`
 
         :param newValue: New return value.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setReturnValue", {"newValue": newValue}
+            )
         return self.client.send("Debugger.setReturnValue", {"newValue": newValue})
 
     def setScriptSource(
@@ -439,15 +523,21 @@ class Debugger:
             msg["dryRun"] = dryRun
         return self.client.send("Debugger.setScriptSource", msg)
 
-    def setSkipAllPauses(self, skip: bool) -> Awaitable[Dict]:
+    def setSkipAllPauses(
+        self, skip: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Makes page not interrupt on any pauses (breakpoint, exception, dom exception etc).
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-setSkipAllPauses`
 
         :param skip: New value for skip pauses state.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Debugger.setSkipAllPauses", {"skip": skip})
         return self.client.send("Debugger.setSkipAllPauses", {"skip": skip})
 
     def setVariableValue(
@@ -456,7 +546,8 @@ class Debugger:
         variableName: str,
         newValue: Dict[str, Any],
         callFrameId: str,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Changes value of variable in a callframe. Object-based scopes are not supported and must be
         mutated manually.
@@ -468,8 +559,20 @@ class Debugger:
         :param variableName: Variable name.
         :param newValue: New variable value.
         :param callFrameId: Id of callframe that holds variable.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Debugger.setVariableValue",
+                {
+                    "scopeNumber": scopeNumber,
+                    "variableName": variableName,
+                    "newValue": newValue,
+                    "callFrameId": callFrameId,
+                },
+            )
         return self.client.send(
             "Debugger.setVariableValue",
             {
@@ -480,7 +583,9 @@ class Debugger:
             },
         )
 
-    def stepInto(self, breakOnAsyncCall: Optional[bool] = None) -> Awaitable[Dict]:
+    def stepInto(
+        self, breakOnAsyncCall: Optional[bool] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Steps into the function call.
 
@@ -488,35 +593,51 @@ class Debugger:
 
         :param breakOnAsyncCall: Debugger will issue additional Debugger.paused notification if any async task is scheduled
          before next pause.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if breakOnAsyncCall is not None:
             msg["breakOnAsyncCall"] = breakOnAsyncCall
+        if nowait:
+            return self.client.send_nowait("Debugger.stepInto", msg)
         return self.client.send("Debugger.stepInto", msg)
 
-    def stepOut(self) -> Awaitable[Dict]:
+    def stepOut(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Steps out of the function call.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-stepOut`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Debugger.stepOut", {})
         return self.client.send("Debugger.stepOut", {})
 
-    def stepOver(self) -> Awaitable[Dict]:
+    def stepOver(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Steps over the statement.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#method-stepOver`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Debugger.stepOver", {})
         return self.client.send("Debugger.stepOver", {})
 
+    @event_accessor("Debugger.breakpointResolved")
     def breakpointResolved(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when breakpoint is resolved to an actual script and location.
@@ -524,76 +645,83 @@ class Debugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#event-breakpointResolved`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Debugger.breakpointResolved"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
-    def paused(self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None) -> Any:
+    @event_accessor("Debugger.paused")
+    def paused(
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Fired when the virtual machine stopped on breakpoint or exception or any other stop criteria.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#event-paused`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Debugger.paused"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
-    def resumed(self, listener: Optional[Callable[[Any], Any]] = None) -> Any:
+    @event_accessor("Debugger.resumed")
+    def resumed(
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Fired when the virtual machine resumed execution.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#event-resumed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Debugger.resumed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Debugger.scriptFailedToParse")
     def scriptFailedToParse(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when virtual machine fails to parse the script.
@@ -601,26 +729,27 @@ class Debugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#event-scriptFailedToParse`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Debugger.scriptFailedToParse"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Debugger.scriptParsed")
     def scriptParsed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when virtual machine parses script. This event is also fired for all known and uncollected
@@ -629,20 +758,17 @@ class Debugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Debugger#event-scriptParsed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Debugger.scriptParsed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -23,14 +23,22 @@ class DeviceOrientation:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def clearDeviceOrientationOverride(self) -> Awaitable[Dict]:
+    def clearDeviceOrientationOverride(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears the overridden Device Orientation.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DeviceOrientation#method-clearDeviceOrientationOverride`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DeviceOrientation.clearDeviceOrientationOverride", {}
+            )
         return self.client.send("DeviceOrientation.clearDeviceOrientationOverride", {})
 
     def setDeviceOrientationOverride(
@@ -38,7 +46,8 @@ class DeviceOrientation:
         alpha: Union[int, float],
         beta: Union[int, float],
         gamma: Union[int, float],
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides the Device Orientation.
 
@@ -47,8 +56,15 @@ class DeviceOrientation:
         :param alpha: Mock alpha
         :param beta: Mock beta
         :param gamma: Mock gamma
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DeviceOrientation.setDeviceOrientationOverride",
+                {"alpha": alpha, "beta": beta, "gamma": gamma},
+            )
         return self.client.send(
             "DeviceOrientation.setDeviceOrientationOverride",
             {"alpha": alpha, "beta": beta, "gamma": gamma},
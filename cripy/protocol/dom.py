@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -103,17 +105,23 @@ class DOM:
             msg["pierce"] = pierce
         return self.client.send("DOM.describeNode", msg)
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables DOM agent for the given page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.disable", {})
         return self.client.send("DOM.disable", {})
 
-    def discardSearchResults(self, searchId: str) -> Awaitable[Dict]:
+    def discardSearchResults(
+        self, searchId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Discards search results from the session with the given id. `getSearchResults` should no longer
         be called for that search.
@@ -123,18 +131,28 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-discardSearchResults`
 
         :param searchId: Unique search session identifier.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOM.discardSearchResults", {"searchId": searchId}
+            )
         return self.client.send("DOM.discardSearchResults", {"searchId": searchId})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables DOM agent for the given page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.enable", {})
         return self.client.send("DOM.enable", {})
 
     def focus(
@@ -142,7 +160,8 @@ class DOM:
         nodeId: Optional[int] = None,
         backendNodeId: Optional[int] = None,
         objectId: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Focuses the given element.
 
@@ -151,6 +170,8 @@ class DOM:
         :param nodeId: Identifier of the node.
         :param backendNodeId: Identifier of the backend node.
         :param objectId: JavaScript object id of the node wrapper.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -160,6 +181,8 @@ class DOM:
             msg["backendNodeId"] = backendNodeId
         if objectId is not None:
             msg["objectId"] = objectId
+        if nowait:
+            return self.client.send_nowait("DOM.focus", msg)
         return self.client.send("DOM.focus", msg)
 
     def getAttributes(self, nodeId: int) -> Awaitable[Dict]:
@@ -348,37 +371,49 @@ class DOM:
             {"searchId": searchId, "fromIndex": fromIndex, "toIndex": toIndex},
         )
 
-    def hideHighlight(self) -> Awaitable[Dict]:
+    def hideHighlight(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Hides any highlight.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-hideHighlight`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.hideHighlight", {})
         return self.client.send("DOM.hideHighlight", {})
 
-    def highlightNode(self) -> Awaitable[Dict]:
+    def highlightNode(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Highlights DOM node.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-highlightNode`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.highlightNode", {})
         return self.client.send("DOM.highlightNode", {})
 
-    def highlightRect(self) -> Awaitable[Dict]:
+    def highlightRect(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Highlights given rectangle.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-highlightRect`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.highlightRect", {})
         return self.client.send("DOM.highlightRect", {})
 
-    def markUndoableState(self) -> Awaitable[Dict]:
+    def markUndoableState(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Marks last undoable state.
 
@@ -386,8 +421,12 @@ class DOM:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-markUndoableState`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.markUndoableState", {})
         return self.client.send("DOM.markUndoableState", {})
 
     def moveTo(
@@ -487,7 +526,7 @@ class DOM:
             "DOM.querySelectorAll", {"nodeId": nodeId, "selector": selector}
         )
 
-    def redo(self) -> Awaitable[Dict]:
+    def redo(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Re-does the last undone action.
 
@@ -495,11 +534,17 @@ class DOM:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-redo`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.redo", {})
         return self.client.send("DOM.redo", {})
 
-    def removeAttribute(self, nodeId: int, name: str) -> Awaitable[Dict]:
+    def removeAttribute(
+        self, nodeId: int, name: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes attribute with given name from an element with given id.
 
@@ -507,24 +552,40 @@ class DOM:
 
         :param nodeId: Id of the element to remove attribute from.
         :param name: Name of the attribute to remove.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOM.removeAttribute", {"nodeId": nodeId, "name": name}
+            )
         return self.client.send("DOM.removeAttribute", {"nodeId": nodeId, "name": name})
 
-    def removeNode(self, nodeId: int) -> Awaitable[Dict]:
+    def removeNode(
+        self, nodeId: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes node with given id.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-removeNode`
 
         :param nodeId: Id of the node to remove.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.removeNode", {"nodeId": nodeId})
         return self.client.send("DOM.removeNode", {"nodeId": nodeId})
 
     def requestChildNodes(
-        self, nodeId: int, depth: Optional[int] = None, pierce: Optional[bool] = None
-    ) -> Awaitable[Dict]:
+        self,
+        nodeId: int,
+        depth: Optional[int] = None,
+        pierce: Optional[bool] = None,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Requests that children of the node with given id are returned to the caller in form of
         `setChildNodes` events where not only immediate children are retrieved, but all children down to
@@ -537,6 +598,8 @@ class DOM:
          entire subtree or provide an integer larger than 0.
         :param pierce: Whether or not iframes and shadow roots should be traversed when returning the sub-tree
          (default is false).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"nodeId": nodeId}
@@ -544,6 +607,8 @@ class DOM:
             msg["depth"] = depth
         if pierce is not None:
             msg["pierce"] = pierce
+        if nowait:
+            return self.client.send_nowait("DOM.requestChildNodes", msg)
         return self.client.send("DOM.requestChildNodes", msg)
 
     def requestNode(self, objectId: str) -> Awaitable[Dict]:
@@ -588,7 +653,9 @@ class DOM:
             msg["executionContextId"] = executionContextId
         return self.client.send("DOM.resolveNode", msg)
 
-    def setAttributeValue(self, nodeId: int, name: str, value: str) -> Awaitable[Dict]:
+    def setAttributeValue(
+        self, nodeId: int, name: str, value: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets attribute for an element with given id.
 
@@ -597,15 +664,22 @@ class DOM:
         :param nodeId: Id of the element to set attribute for.
         :param name: Attribute name.
         :param value: Attribute value.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOM.setAttributeValue",
+                {"nodeId": nodeId, "name": name, "value": value},
+            )
         return self.client.send(
             "DOM.setAttributeValue", {"nodeId": nodeId, "name": name, "value": value}
         )
 
     def setAttributesAsText(
-        self, nodeId: int, text: str, name: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, nodeId: int, text: str, name: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets attributes on element with given id. This method is useful when user edits some existing
         attribute value and types in several attribute name/value pairs.
@@ -616,11 +690,15 @@ class DOM:
         :param text: Text with a number of attributes. Will parse this text using HTML parser.
         :param name: Attribute name to replace with new attributes derived from text in case text parsed
          successfully.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"nodeId": nodeId, "text": text}
         if name is not None:
             msg["name"] = name
+        if nowait:
+            return self.client.send_nowait("DOM.setAttributesAsText", msg)
         return self.client.send("DOM.setAttributesAsText", msg)
 
     def setFileInputFiles(
@@ -629,7 +707,8 @@ class DOM:
         nodeId: Optional[int] = None,
         backendNodeId: Optional[int] = None,
         objectId: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets files for the given file input element.
 
@@ -639,6 +718,8 @@ class DOM:
         :param nodeId: Identifier of the node.
         :param backendNodeId: Identifier of the backend node.
         :param objectId: JavaScript object id of the node wrapper.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"files": files}
@@ -648,6 +729,8 @@ class DOM:
             msg["backendNodeId"] = backendNodeId
         if objectId is not None:
             msg["objectId"] = objectId
+        if nowait:
+            return self.client.send_nowait("DOM.setFileInputFiles", msg)
         return self.client.send("DOM.setFileInputFiles", msg)
 
     def getFileInfo(self, objectId: str) -> Awaitable[Dict]:
@@ -664,7 +747,9 @@ class DOM:
         """
         return self.client.send("DOM.getFileInfo", {"objectId": objectId})
 
-    def setInspectedNode(self, nodeId: int) -> Awaitable[Dict]:
+    def setInspectedNode(
+        self, nodeId: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables console to refer to the node with given id via $x (see Command Line API for more details
         $x functions).
@@ -674,8 +759,12 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-setInspectedNode`
 
         :param nodeId: DOM node id to be accessible by means of $x command line API.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.setInspectedNode", {"nodeId": nodeId})
         return self.client.send("DOM.setInspectedNode", {"nodeId": nodeId})
 
     def setNodeName(self, nodeId: int, name: str) -> Awaitable[Dict]:
@@ -690,7 +779,9 @@ class DOM:
         """
         return self.client.send("DOM.setNodeName", {"nodeId": nodeId, "name": name})
 
-    def setNodeValue(self, nodeId: int, value: str) -> Awaitable[Dict]:
+    def setNodeValue(
+        self, nodeId: int, value: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets node value for a node with given id.
 
@@ -698,11 +789,19 @@ class DOM:
 
         :param nodeId: Id of the node to set value for.
         :param value: New node's value.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOM.setNodeValue", {"nodeId": nodeId, "value": value}
+            )
         return self.client.send("DOM.setNodeValue", {"nodeId": nodeId, "value": value})
 
-    def setOuterHTML(self, nodeId: int, outerHTML: str) -> Awaitable[Dict]:
+    def setOuterHTML(
+        self, nodeId: int, outerHTML: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets node HTML markup, returns new node id.
 
@@ -710,13 +809,19 @@ class DOM:
 
         :param nodeId: Id of the node to set markup for.
         :param outerHTML: Outer HTML markup to set.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOM.setOuterHTML", {"nodeId": nodeId, "outerHTML": outerHTML}
+            )
         return self.client.send(
             "DOM.setOuterHTML", {"nodeId": nodeId, "outerHTML": outerHTML}
         )
 
-    def undo(self) -> Awaitable[Dict]:
+    def undo(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Undoes the last performed action.
 
@@ -724,8 +829,12 @@ class DOM:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#method-undo`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOM.undo", {})
         return self.client.send("DOM.undo", {})
 
     def getFrameOwner(self, frameId: str) -> Awaitable[Dict]:
@@ -741,8 +850,12 @@ class DOM:
         """
         return self.client.send("DOM.getFrameOwner", {"frameId": frameId})
 
+    @event_accessor("DOM.attributeModified")
     def attributeModified(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when `Element`'s attribute is modified.
@@ -750,26 +863,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-attributeModified`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.attributeModified"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.attributeRemoved")
     def attributeRemoved(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when `Element`'s attribute is removed.
@@ -777,26 +891,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-attributeRemoved`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.attributeRemoved"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.characterDataModified")
     def characterDataModified(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Mirrors `DOMCharacterDataModified` event.
@@ -804,26 +919,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-characterDataModified`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.characterDataModified"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.childNodeCountUpdated")
     def childNodeCountUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when `Container`'s child node count has changed.
@@ -831,26 +947,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-childNodeCountUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.childNodeCountUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.childNodeInserted")
     def childNodeInserted(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Mirrors `DOMNodeInserted` event.
@@ -858,26 +975,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-childNodeInserted`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.childNodeInserted"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.childNodeRemoved")
     def childNodeRemoved(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Mirrors `DOMNodeRemoved` event.
@@ -885,26 +1003,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-childNodeRemoved`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.childNodeRemoved"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.distributedNodesUpdated")
     def distributedNodesUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called when distrubution is changed.
@@ -912,51 +1031,55 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-distributedNodesUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.distributedNodesUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
-    def documentUpdated(self, listener: Optional[Callable[[Any], Any]] = None) -> Any:
+    @event_accessor("DOM.documentUpdated")
+    def documentUpdated(
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Fired when `Document` has been totally updated. Node ids are no longer valid.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-documentUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.documentUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.inlineStyleInvalidated")
     def inlineStyleInvalidated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when `Element`'s inline style is modified via a CSS property modification.
@@ -964,26 +1087,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-inlineStyleInvalidated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.inlineStyleInvalidated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.pseudoElementAdded")
     def pseudoElementAdded(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called when a pseudo element is added to an element.
@@ -991,26 +1115,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-pseudoElementAdded`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.pseudoElementAdded"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.pseudoElementRemoved")
     def pseudoElementRemoved(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called when a pseudo element is removed from an element.
@@ -1018,26 +1143,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-pseudoElementRemoved`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.pseudoElementRemoved"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.setChildNodes")
     def setChildNodes(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when backend wants to provide client with the missing DOM structure. This happens upon
@@ -1046,26 +1172,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-setChildNodes`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.setChildNodes"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.shadowRootPopped")
     def shadowRootPopped(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called when shadow root is popped from the element.
@@ -1073,26 +1200,27 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-shadowRootPopped`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.shadowRootPopped"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOM.shadowRootPushed")
     def shadowRootPushed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Called when shadow root is pushed into the element.
@@ -1100,20 +1228,17 @@ class DOM:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOM#event-shadowRootPushed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOM.shadowRootPushed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
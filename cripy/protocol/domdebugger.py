@@ -51,7 +51,9 @@ class DOMDebugger:
             msg["pierce"] = pierce
         return self.client.send("DOMDebugger.getEventListeners", msg)
 
-    def removeDOMBreakpoint(self, nodeId: int, type: str) -> Awaitable[Dict]:
+    def removeDOMBreakpoint(
+        self, nodeId: int, type: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes DOM breakpoint that was set using `setDOMBreakpoint`.
 
@@ -59,15 +61,21 @@ class DOMDebugger:
 
         :param nodeId: Identifier of the node to remove breakpoint from.
         :param type: Type of the breakpoint to remove.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.removeDOMBreakpoint", {"nodeId": nodeId, "type": type}
+            )
         return self.client.send(
             "DOMDebugger.removeDOMBreakpoint", {"nodeId": nodeId, "type": type}
         )
 
     def removeEventListenerBreakpoint(
-        self, eventName: str, targetName: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, eventName: str, targetName: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes breakpoint on particular DOM event.
 
@@ -75,14 +83,22 @@ class DOMDebugger:
 
         :param eventName: Event name.
         :param targetName: EventTarget interface name.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"eventName": eventName}
         if targetName is not None:
             msg["targetName"] = targetName
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.removeEventListenerBreakpoint", msg
+            )
         return self.client.send("DOMDebugger.removeEventListenerBreakpoint", msg)
 
-    def removeInstrumentationBreakpoint(self, eventName: str) -> Awaitable[Dict]:
+    def removeInstrumentationBreakpoint(
+        self, eventName: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes breakpoint on particular native event.
 
@@ -91,24 +107,40 @@ class DOMDebugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMDebugger#method-removeInstrumentationBreakpoint`
 
         :param eventName: Instrumentation name to stop on.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.removeInstrumentationBreakpoint", {"eventName": eventName}
+            )
         return self.client.send(
             "DOMDebugger.removeInstrumentationBreakpoint", {"eventName": eventName}
         )
 
-    def removeXHRBreakpoint(self, url: str) -> Awaitable[Dict]:
+    def removeXHRBreakpoint(
+        self, url: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes breakpoint from XMLHttpRequest.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMDebugger#method-removeXHRBreakpoint`
 
         :param url: Resource URL substring.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.removeXHRBreakpoint", {"url": url}
+            )
         return self.client.send("DOMDebugger.removeXHRBreakpoint", {"url": url})
 
-    def setDOMBreakpoint(self, nodeId: int, type: str) -> Awaitable[Dict]:
+    def setDOMBreakpoint(
+        self, nodeId: int, type: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets breakpoint on particular operation with DOM.
 
@@ -116,15 +148,21 @@ class DOMDebugger:
 
         :param nodeId: Identifier of the node to set breakpoint on.
         :param type: Type of the operation to stop upon.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.setDOMBreakpoint", {"nodeId": nodeId, "type": type}
+            )
         return self.client.send(
             "DOMDebugger.setDOMBreakpoint", {"nodeId": nodeId, "type": type}
         )
 
     def setEventListenerBreakpoint(
-        self, eventName: str, targetName: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, eventName: str, targetName: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets breakpoint on particular DOM event.
 
@@ -133,14 +171,22 @@ class DOMDebugger:
         :param eventName: DOM Event name to stop on (any DOM event will do).
         :param targetName: EventTarget interface name to stop on. If equal to `"*"` or not provided, will stop on any
          EventTarget.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"eventName": eventName}
         if targetName is not None:
             msg["targetName"] = targetName
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.setEventListenerBreakpoint", msg
+            )
         return self.client.send("DOMDebugger.setEventListenerBreakpoint", msg)
 
-    def setInstrumentationBreakpoint(self, eventName: str) -> Awaitable[Dict]:
+    def setInstrumentationBreakpoint(
+        self, eventName: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets breakpoint on particular native event.
 
@@ -149,19 +195,31 @@ class DOMDebugger:
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMDebugger#method-setInstrumentationBreakpoint`
 
         :param eventName: Instrumentation name to stop on.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMDebugger.setInstrumentationBreakpoint", {"eventName": eventName}
+            )
         return self.client.send(
             "DOMDebugger.setInstrumentationBreakpoint", {"eventName": eventName}
         )
 
-    def setXHRBreakpoint(self, url: str) -> Awaitable[Dict]:
+    def setXHRBreakpoint(
+        self, url: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets breakpoint on XMLHttpRequest.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMDebugger#method-setXHRBreakpoint`
 
         :param url: Resource URL substring. All XHRs having this substring in the URL will get stopped upon.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOMDebugger.setXHRBreakpoint", {"url": url})
         return self.client.send("DOMDebugger.setXHRBreakpoint", {"url": url})
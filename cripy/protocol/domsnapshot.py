@@ -30,24 +30,32 @@ class DOMSnapshot:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables DOM snapshot agent for the given page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMSnapshot#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOMSnapshot.disable", {})
         return self.client.send("DOMSnapshot.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables DOM snapshot agent for the given page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMSnapshot#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOMSnapshot.enable", {})
         return self.client.send("DOMSnapshot.enable", {})
 
     def getSnapshot(
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -24,33 +26,47 @@ class DOMStorage:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def clear(self, storageId: Dict[str, Any]) -> Awaitable[Dict]:
+    def clear(
+        self, storageId: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#method-clear`
 
         :param storageId: The storageId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOMStorage.clear", {"storageId": storageId})
         return self.client.send("DOMStorage.clear", {"storageId": storageId})
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables storage tracking, prevents storage events from being sent to the client.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOMStorage.disable", {})
         return self.client.send("DOMStorage.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables storage tracking, storage events will now be delivered to the client.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("DOMStorage.enable", {})
         return self.client.send("DOMStorage.enable", {})
 
     def getDOMStorageItems(self, storageId: Dict[str, Any]) -> Awaitable[Dict]:
@@ -65,131 +81,148 @@ class DOMStorage:
         )
 
     def removeDOMStorageItem(
-        self, storageId: Dict[str, Any], key: str
-    ) -> Awaitable[Dict]:
+        self, storageId: Dict[str, Any], key: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#method-removeDOMStorageItem`
 
         :param storageId: The storageId
         :param key: The key
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMStorage.removeDOMStorageItem", {"storageId": storageId, "key": key}
+            )
         return self.client.send(
             "DOMStorage.removeDOMStorageItem", {"storageId": storageId, "key": key}
         )
 
     def setDOMStorageItem(
-        self, storageId: Dict[str, Any], key: str, value: str
-    ) -> Awaitable[Dict]:
+        self, storageId: Dict[str, Any], key: str, value: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#method-setDOMStorageItem`
 
         :param storageId: The storageId
         :param key: The key
         :param value: The value
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "DOMStorage.setDOMStorageItem",
+                {"storageId": storageId, "key": key, "value": value},
+            )
         return self.client.send(
             "DOMStorage.setDOMStorageItem",
             {"storageId": storageId, "key": key, "value": value},
         )
 
+    @event_accessor("DOMStorage.domStorageItemAdded")
     def domStorageItemAdded(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#event-domStorageItemAdded`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOMStorage.domStorageItemAdded"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOMStorage.domStorageItemRemoved")
     def domStorageItemRemoved(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#event-domStorageItemRemoved`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOMStorage.domStorageItemRemoved"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOMStorage.domStorageItemUpdated")
     def domStorageItemUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#event-domStorageItemUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOMStorage.domStorageItemUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("DOMStorage.domStorageItemsCleared")
     def domStorageItemsCleared(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/DOMStorage#event-domStorageItemsCleared`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "DOMStorage.domStorageItemsCleared"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -38,27 +40,39 @@ class Emulation:
         """
         return self.client.send("Emulation.canEmulate", {})
 
-    def clearDeviceMetricsOverride(self) -> Awaitable[Dict]:
+    def clearDeviceMetricsOverride(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears the overriden device metrics.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-clearDeviceMetricsOverride`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Emulation.clearDeviceMetricsOverride", {})
         return self.client.send("Emulation.clearDeviceMetricsOverride", {})
 
-    def clearGeolocationOverride(self) -> Awaitable[Dict]:
+    def clearGeolocationOverride(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears the overriden Geolocation Position and Error.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-clearGeolocationOverride`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Emulation.clearGeolocationOverride", {})
         return self.client.send("Emulation.clearGeolocationOverride", {})
 
-    def resetPageScaleFactor(self) -> Awaitable[Dict]:
+    def resetPageScaleFactor(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Requests that page scale factor is reset to initial values.
 
@@ -66,11 +80,17 @@ class Emulation:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-resetPageScaleFactor`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Emulation.resetPageScaleFactor", {})
         return self.client.send("Emulation.resetPageScaleFactor", {})
 
-    def setFocusEmulationEnabled(self, enabled: bool) -> Awaitable[Dict]:
+    def setFocusEmulationEnabled(
+        self, enabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables or disables simulating a focused and active page.
 
@@ -79,13 +99,21 @@ class Emulation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setFocusEmulationEnabled`
 
         :param enabled: Whether to enable to disable focus emulation.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setFocusEmulationEnabled", {"enabled": enabled}
+            )
         return self.client.send(
             "Emulation.setFocusEmulationEnabled", {"enabled": enabled}
         )
 
-    def setCPUThrottlingRate(self, rate: Union[int, float]) -> Awaitable[Dict]:
+    def setCPUThrottlingRate(
+        self, rate: Union[int, float], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables CPU throttling to emulate slow CPUs.
 
@@ -94,13 +122,19 @@ class Emulation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setCPUThrottlingRate`
 
         :param rate: Throttling rate as a slowdown factor (1 is no throttle, 2 is 2x slowdown, etc).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setCPUThrottlingRate", {"rate": rate}
+            )
         return self.client.send("Emulation.setCPUThrottlingRate", {"rate": rate})
 
     def setDefaultBackgroundColorOverride(
-        self, color: Optional[Dict[str, Any]] = None
-    ) -> Awaitable[Dict]:
+        self, color: Optional[Dict[str, Any]] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets or clears an override of the default background color of the frame. This override is used
         if the content does not specify one.
@@ -109,11 +143,17 @@ class Emulation:
 
         :param color: RGBA of the default background color. If not specified, any existing override will be
          cleared.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if color is not None:
             msg["color"] = color
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setDefaultBackgroundColorOverride", msg
+            )
         return self.client.send("Emulation.setDefaultBackgroundColorOverride", msg)
 
     def setDeviceMetricsOverride(
@@ -130,7 +170,8 @@ class Emulation:
         dontSetVisibleSize: Optional[bool] = None,
         screenOrientation: Optional[Dict[str, Any]] = None,
         viewport: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
         window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
@@ -152,6 +193,8 @@ class Emulation:
         :param screenOrientation: Screen orientation override.
         :param viewport: If set, the visible area of the page will be overridden to this viewport. This viewport
          change is not observed by the page, e.g. viewport-relative elements do not change positions.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {
@@ -176,35 +219,53 @@ class Emulation:
             msg["screenOrientation"] = screenOrientation
         if viewport is not None:
             msg["viewport"] = viewport
+        if nowait:
+            return self.client.send_nowait("Emulation.setDeviceMetricsOverride", msg)
         return self.client.send("Emulation.setDeviceMetricsOverride", msg)
 
-    def setScrollbarsHidden(self, hidden: bool) -> Awaitable[Dict]:
+    def setScrollbarsHidden(
+        self, hidden: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Status: Experimental
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setScrollbarsHidden`
 
         :param hidden: Whether scrollbars should be always hidden.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setScrollbarsHidden", {"hidden": hidden}
+            )
         return self.client.send("Emulation.setScrollbarsHidden", {"hidden": hidden})
 
-    def setDocumentCookieDisabled(self, disabled: bool) -> Awaitable[Dict]:
+    def setDocumentCookieDisabled(
+        self, disabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Status: Experimental
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setDocumentCookieDisabled`
 
         :param disabled: Whether document.coookie API should be disabled.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setDocumentCookieDisabled", {"disabled": disabled}
+            )
         return self.client.send(
             "Emulation.setDocumentCookieDisabled", {"disabled": disabled}
         )
 
     def setEmitTouchEventsForMouse(
-        self, enabled: bool, configuration: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, enabled: bool, configuration: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Status: Experimental
 
@@ -212,22 +273,34 @@ class Emulation:
 
         :param enabled: Whether touch emulation based on mouse input should be enabled.
         :param configuration: Touch/gesture events configuration. Default: current platform.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"enabled": enabled}
         if configuration is not None:
             msg["configuration"] = configuration
+        if nowait:
+            return self.client.send_nowait("Emulation.setEmitTouchEventsForMouse", msg)
         return self.client.send("Emulation.setEmitTouchEventsForMouse", msg)
 
-    def setEmulatedMedia(self, media: str) -> Awaitable[Dict]:
+    def setEmulatedMedia(
+        self, media: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Emulates the given media for CSS media queries.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setEmulatedMedia`
 
         :param media: Media type to emulate. Empty string disables the override.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setEmulatedMedia", {"media": media}
+            )
         return self.client.send("Emulation.setEmulatedMedia", {"media": media})
 
     def setGeolocationOverride(
@@ -235,7 +308,8 @@ class Emulation:
         latitude: Optional[Union[int, float]] = None,
         longitude: Optional[Union[int, float]] = None,
         accuracy: Optional[Union[int, float]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides the Geolocation Position or Error. Omitting any of the parameters emulates position
         unavailable.
@@ -245,6 +319,8 @@ class Emulation:
         :param latitude: Mock latitude
         :param longitude: Mock longitude
         :param accuracy: Mock accuracy
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -254,9 +330,13 @@ class Emulation:
             msg["longitude"] = longitude
         if accuracy is not None:
             msg["accuracy"] = accuracy
+        if nowait:
+            return self.client.send_nowait("Emulation.setGeolocationOverride", msg)
         return self.client.send("Emulation.setGeolocationOverride", msg)
 
-    def setNavigatorOverrides(self, platform: str) -> Awaitable[Dict]:
+    def setNavigatorOverrides(
+        self, platform: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides value returned by the javascript navigator object.
 
@@ -265,13 +345,21 @@ class Emulation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setNavigatorOverrides`
 
         :param platform: The platform navigator.platform should return.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setNavigatorOverrides", {"platform": platform}
+            )
         return self.client.send(
             "Emulation.setNavigatorOverrides", {"platform": platform}
         )
 
-    def setPageScaleFactor(self, pageScaleFactor: Union[int, float]) -> Awaitable[Dict]:
+    def setPageScaleFactor(
+        self, pageScaleFactor: Union[int, float], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets a specified page scale factor.
 
@@ -280,28 +368,42 @@ class Emulation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setPageScaleFactor`
 
         :param pageScaleFactor: Page scale factor.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setPageScaleFactor", {"pageScaleFactor": pageScaleFactor}
+            )
         return self.client.send(
             "Emulation.setPageScaleFactor", {"pageScaleFactor": pageScaleFactor}
         )
 
-    def setScriptExecutionDisabled(self, value: bool) -> Awaitable[Dict]:
+    def setScriptExecutionDisabled(
+        self, value: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Switches script execution in the page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#method-setScriptExecutionDisabled`
 
         :param value: Whether script execution should be disabled in the page.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setScriptExecutionDisabled", {"value": value}
+            )
         return self.client.send(
             "Emulation.setScriptExecutionDisabled", {"value": value}
         )
 
     def setTouchEmulationEnabled(
-        self, enabled: bool, maxTouchPoints: Optional[int] = None
-    ) -> Awaitable[Dict]:
+        self, enabled: bool, maxTouchPoints: Optional[int] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables touch on platforms which do not support them.
 
@@ -309,11 +411,15 @@ class Emulation:
 
         :param enabled: Whether the touch event emulation should be enabled.
         :param maxTouchPoints: Maximum touch points supported. Defaults to one.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"enabled": enabled}
         if maxTouchPoints is not None:
             msg["maxTouchPoints"] = maxTouchPoints
+        if nowait:
+            return self.client.send_nowait("Emulation.setTouchEmulationEnabled", msg)
         return self.client.send("Emulation.setTouchEmulationEnabled", msg)
 
     def setVirtualTimePolicy(
@@ -353,7 +459,9 @@ class Emulation:
             msg["initialVirtualTime"] = initialVirtualTime
         return self.client.send("Emulation.setVirtualTimePolicy", msg)
 
-    def setVisibleSize(self, width: int, height: int) -> Awaitable[Dict]:
+    def setVisibleSize(
+        self, width: int, height: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Resizes the frame/viewport of the page. Note that this does not affect the frame's container
         (e.g. browser window). Can be used to produce screenshots of the specified size. Not supported
@@ -365,8 +473,14 @@ class Emulation:
 
         :param width: Frame width (DIP).
         :param height: Frame height (DIP).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Emulation.setVisibleSize", {"width": width, "height": height}
+            )
         return self.client.send(
             "Emulation.setVisibleSize", {"width": width, "height": height}
         )
@@ -376,7 +490,8 @@ class Emulation:
         userAgent: str,
         acceptLanguage: Optional[str] = None,
         platform: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Allows overriding user agent with the given string.
 
@@ -385,6 +500,8 @@ class Emulation:
         :param userAgent: User agent to use.
         :param acceptLanguage: Browser langugage to emulate.
         :param platform: The platform navigator.platform should return.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"userAgent": userAgent}
@@ -392,10 +509,16 @@ class Emulation:
             msg["acceptLanguage"] = acceptLanguage
         if platform is not None:
             msg["platform"] = platform
+        if nowait:
+            return self.client.send_nowait("Emulation.setUserAgentOverride", msg)
         return self.client.send("Emulation.setUserAgentOverride", msg)
 
+    @event_accessor("Emulation.virtualTimeBudgetExpired")
     def virtualTimeBudgetExpired(
-        self, listener: Optional[Callable[[Any], Any]] = None
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Notification sent after the virtual time budget for the current VirtualTimePolicy has run out.
@@ -403,20 +526,17 @@ class Emulation:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Emulation#event-virtualTimeBudgetExpired`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Emulation.virtualTimeBudgetExpired"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,5 +1,18 @@
 """This is an auto-generated file. Modify at your own risk"""
-from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import (
+    Awaitable,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
+
+from cripy.binary import binary_result
+from cripy.stream import event_accessor
 
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
@@ -29,21 +42,26 @@ class Fetch:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables the fetch domain.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Fetch#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Fetch.disable", {})
         return self.client.send("Fetch.disable", {})
 
     def enable(
         self,
         patterns: Optional[List[Dict[str, Any]]] = None,
         handleAuthRequests: Optional[bool] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables issuing of requestPaused events. A request will be paused until client
         calls one of failRequest, fulfillRequest or continueRequest/continueWithAuth.
@@ -55,6 +73,8 @@ class Fetch:
          all requests will be affected.
         :param handleAuthRequests: If true, authRequired events will be issued and requests will be paused
          expecting a call to continueWithAuth.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -62,9 +82,13 @@ class Fetch:
             msg["patterns"] = patterns
         if handleAuthRequests is not None:
             msg["handleAuthRequests"] = handleAuthRequests
+        if nowait:
+            return self.client.send_nowait("Fetch.enable", msg)
         return self.client.send("Fetch.enable", msg)
 
-    def failRequest(self, requestId: str, errorReason: str) -> Awaitable[Dict]:
+    def failRequest(
+        self, requestId: str, errorReason: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Causes the request to fail with specified reason.
 
@@ -72,8 +96,15 @@ class Fetch:
 
         :param requestId: An id the client received in requestPaused event.
         :param errorReason: Causes the request to fail with the given reason.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Fetch.failRequest",
+                {"requestId": requestId, "errorReason": errorReason},
+            )
         return self.client.send(
             "Fetch.failRequest", {"requestId": requestId, "errorReason": errorReason}
         )
@@ -85,7 +116,8 @@ class Fetch:
         responseHeaders: List[Dict[str, Any]],
         body: Optional[str] = None,
         responsePhrase: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Provides response to the request.
 
@@ -97,6 +129,8 @@ class Fetch:
         :param body: A response body.
         :param responsePhrase: A textual representation of responseCode.
          If absent, a standard phrase mathcing responseCode is used.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {
@@ -108,6 +142,8 @@ class Fetch:
             msg["body"] = body
         if responsePhrase is not None:
             msg["responsePhrase"] = responsePhrase
+        if nowait:
+            return self.client.send_nowait("Fetch.fulfillRequest", msg)
         return self.client.send("Fetch.fulfillRequest", msg)
 
     def continueRequest(
@@ -117,7 +153,8 @@ class Fetch:
         method: Optional[str] = None,
         postData: Optional[str] = None,
         headers: Optional[List[Dict[str, Any]]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Continues the request, optionally modifying some of its parameters.
 
@@ -128,6 +165,8 @@ class Fetch:
         :param method: If set, the request method is overridden.
         :param postData: If set, overrides the post data in the request.
         :param headers: If set, overrides the request headrts.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"requestId": requestId}
@@ -139,11 +178,16 @@ class Fetch:
             msg["postData"] = postData
         if headers is not None:
             msg["headers"] = headers
+        if nowait:
+            return self.client.send_nowait("Fetch.continueRequest", msg)
         return self.client.send("Fetch.continueRequest", msg)
 
     def continueWithAuth(
-        self, requestId: str, authChallengeResponse: Dict[str, Any]
-    ) -> Awaitable[Dict]:
+        self,
+        requestId: str,
+        authChallengeResponse: Dict[str, Any],
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Continues a request supplying authChallengeResponse following authRequired event.
 
@@ -151,14 +195,26 @@ class Fetch:
 
         :param requestId: An id the client received in authRequired event.
         :param authChallengeResponse: Response to  with an authChallenge.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Fetch.continueWithAuth",
+                {
+                    "requestId": requestId,
+                    "authChallengeResponse": authChallengeResponse,
+                },
+            )
         return self.client.send(
             "Fetch.continueWithAuth",
             {"requestId": requestId, "authChallengeResponse": authChallengeResponse},
         )
 
-    def getResponseBody(self, requestId: str) -> Awaitable[Dict]:
+    def getResponseBody(
+        self, requestId: str, as_bytes: bool = False, sink: Optional[BinaryIO] = None
+    ) -> Awaitable[Dict]:
         """
         Causes the body of the response to be received from the server and
         returned as a single string. May only be issued for a request that
@@ -170,8 +226,19 @@ class Fetch:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Fetch#method-getResponseBody`
 
         :param requestId: Identifier for the intercepted request to get body for.
+        :param as_bytes: If true body is returned as bytes, decoded from base64 if base64Encoded
+        otherwise encoded as UTF-8
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        body is written to in chunks, body is then the number of bytes written
         :return: The results of the command
         """
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send("Fetch.getResponseBody", {"requestId": requestId}),
+                "body",
+                sink,
+                "base64Encoded",
+            )
         return self.client.send("Fetch.getResponseBody", {"requestId": requestId})
 
     def takeResponseBodyAsStream(self, requestId: str) -> Awaitable[Dict]:
@@ -196,8 +263,12 @@ class Fetch:
             "Fetch.takeResponseBodyAsStream", {"requestId": requestId}
         )
 
+    @event_accessor("Fetch.requestPaused")
     def requestPaused(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when the domain is enabled and the request URL matches the
@@ -210,26 +281,27 @@ class Fetch:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Fetch#event-requestPaused`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Fetch.requestPaused"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Fetch.authRequired")
     def authRequired(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when the domain is enabled with handleAuthRequests set to true.
@@ -238,20 +310,17 @@ class Fetch:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Fetch#event-authRequired`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Fetch.authRequired"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
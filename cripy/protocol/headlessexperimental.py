@@ -1,5 +1,18 @@
 """This is an auto-generated file. Modify at your own risk"""
-from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import (
+    Awaitable,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
+
+from cripy.binary import binary_result
+from cripy.stream import event_accessor
 
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
@@ -34,6 +47,8 @@ class HeadlessExperimental:
         interval: Optional[Union[int, float]] = None,
         noDisplayUpdates: Optional[bool] = None,
         screenshot: Optional[Dict[str, Any]] = None,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
     ) -> Awaitable[Dict]:
         """
         Sends a BeginFrame to the target and returns when the frame was completed. Optionally captures a
@@ -53,6 +68,9 @@ class HeadlessExperimental:
         :param screenshot: If set, a screenshot of the frame will be captured and returned in the response. Otherwise,
          no screenshot will be captured. Note that capturing a screenshot can fail, for example,
          during renderer initialization. In such a case, no screenshot data will be returned.
+        :param as_bytes: If true screenshotData is decoded from base64 and returned as bytes
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        screenshotData is written to in chunks, screenshotData is then the number of bytes written
         :return: The results of the command
         """
         msg = {}
@@ -64,30 +82,48 @@ class HeadlessExperimental:
             msg["noDisplayUpdates"] = noDisplayUpdates
         if screenshot is not None:
             msg["screenshot"] = screenshot
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send("HeadlessExperimental.beginFrame", msg),
+                "screenshotData",
+                sink,
+            )
         return self.client.send("HeadlessExperimental.beginFrame", msg)
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables headless events for the target.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeadlessExperimental#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("HeadlessExperimental.disable", {})
         return self.client.send("HeadlessExperimental.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables headless events for the target.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeadlessExperimental#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("HeadlessExperimental.enable", {})
         return self.client.send("HeadlessExperimental.enable", {})
 
+    @event_accessor("HeadlessExperimental.needsBeginFramesChanged")
     def needsBeginFramesChanged(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when the target starts or stops needing BeginFrames.
@@ -95,20 +131,17 @@ class HeadlessExperimental:
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeadlessExperimental#event-needsBeginFramesChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "HeadlessExperimental.needsBeginFramesChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -25,7 +27,9 @@ class HeapProfiler:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def addInspectedHeapObject(self, heapObjectId: str) -> Awaitable[Dict]:
+    def addInspectedHeapObject(
+        self, heapObjectId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables console to refer to the node with given id via $x (see Command Line API for more details
         $x functions).
@@ -33,34 +37,52 @@ class HeapProfiler:
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-addInspectedHeapObject`
 
         :param heapObjectId: Heap snapshot object id to be accessible by means of $x command line API.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "HeapProfiler.addInspectedHeapObject", {"heapObjectId": heapObjectId}
+            )
         return self.client.send(
             "HeapProfiler.addInspectedHeapObject", {"heapObjectId": heapObjectId}
         )
 
-    def collectGarbage(self) -> Awaitable[Dict]:
+    def collectGarbage(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-collectGarbage`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.collectGarbage", {})
         return self.client.send("HeapProfiler.collectGarbage", {})
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.disable", {})
         return self.client.send("HeapProfiler.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.enable", {})
         return self.client.send("HeapProfiler.enable", {})
 
     def getHeapObjectId(self, objectId: str) -> Awaitable[Dict]:
@@ -96,32 +118,40 @@ class HeapProfiler:
         return self.client.send("HeapProfiler.getSamplingProfile", {})
 
     def startSampling(
-        self, samplingInterval: Optional[Union[int, float]] = None
-    ) -> Awaitable[Dict]:
+        self, samplingInterval: Optional[Union[int, float]] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-startSampling`
 
         :param samplingInterval: Average sample interval in bytes. Poisson distribution is used for the intervals. The
          default value is 32768 bytes.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if samplingInterval is not None:
             msg["samplingInterval"] = samplingInterval
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.startSampling", msg)
         return self.client.send("HeapProfiler.startSampling", msg)
 
     def startTrackingHeapObjects(
-        self, trackAllocations: Optional[bool] = None
-    ) -> Awaitable[Dict]:
+        self, trackAllocations: Optional[bool] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-startTrackingHeapObjects`
 
         :param trackAllocations: The trackAllocations
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if trackAllocations is not None:
             msg["trackAllocations"] = trackAllocations
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.startTrackingHeapObjects", msg)
         return self.client.send("HeapProfiler.startTrackingHeapObjects", msg)
 
     def stopSampling(self) -> Awaitable[Dict]:
@@ -133,61 +163,74 @@ class HeapProfiler:
         return self.client.send("HeapProfiler.stopSampling", {})
 
     def stopTrackingHeapObjects(
-        self, reportProgress: Optional[bool] = None
-    ) -> Awaitable[Dict]:
+        self, reportProgress: Optional[bool] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-stopTrackingHeapObjects`
 
         :param reportProgress: If true 'reportHeapSnapshotProgress' events will be generated while snapshot is being taken
          when the tracking is stopped.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if reportProgress is not None:
             msg["reportProgress"] = reportProgress
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.stopTrackingHeapObjects", msg)
         return self.client.send("HeapProfiler.stopTrackingHeapObjects", msg)
 
     def takeHeapSnapshot(
-        self, reportProgress: Optional[bool] = None
-    ) -> Awaitable[Dict]:
+        self, reportProgress: Optional[bool] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#method-takeHeapSnapshot`
 
         :param reportProgress: If true 'reportHeapSnapshotProgress' events will be generated while snapshot is being taken.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if reportProgress is not None:
             msg["reportProgress"] = reportProgress
+        if nowait:
+            return self.client.send_nowait("HeapProfiler.takeHeapSnapshot", msg)
         return self.client.send("HeapProfiler.takeHeapSnapshot", msg)
 
+    @event_accessor("HeapProfiler.addHeapSnapshotChunk")
     def addHeapSnapshotChunk(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#event-addHeapSnapshotChunk`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "HeapProfiler.addHeapSnapshotChunk"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("HeapProfiler.heapStatsUpdate")
     def heapStatsUpdate(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         If heap objects tracking has been started then backend may send update for one or more fragments
@@ -195,26 +238,27 @@ class HeapProfiler:
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#event-heapStatsUpdate`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "HeapProfiler.heapStatsUpdate"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("HeapProfiler.lastSeenObjectId")
     def lastSeenObjectId(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         If heap objects tracking has been started then backend regularly sends a current value for last
@@ -224,68 +268,69 @@ class HeapProfiler:
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#event-lastSeenObjectId`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "HeapProfiler.lastSeenObjectId"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("HeapProfiler.reportHeapSnapshotProgress")
     def reportHeapSnapshotProgress(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#event-reportHeapSnapshotProgress`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "HeapProfiler.reportHeapSnapshotProgress"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
-    def resetProfiles(self, listener: Optional[Callable[[Any], Any]] = None) -> Any:
+    @event_accessor("HeapProfiler.resetProfiles")
+    def resetProfiles(
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/HeapProfiler#event-resetProfiles`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "HeapProfiler.resetProfiles"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
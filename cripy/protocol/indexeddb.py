@@ -26,8 +26,12 @@ class IndexedDB:
         self.client: Union["ConnectionType", "SessionType"] = client
 
     def clearObjectStore(
-        self, securityOrigin: str, databaseName: str, objectStoreName: str
-    ) -> Awaitable[Dict]:
+        self,
+        securityOrigin: str,
+        databaseName: str,
+        objectStoreName: str,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears all entries from an object store.
 
@@ -36,8 +40,19 @@ class IndexedDB:
         :param securityOrigin: Security origin.
         :param databaseName: Database name.
         :param objectStoreName: Object store name.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "IndexedDB.clearObjectStore",
+                {
+                    "securityOrigin": securityOrigin,
+                    "databaseName": databaseName,
+                    "objectStoreName": objectStoreName,
+                },
+            )
         return self.client.send(
             "IndexedDB.clearObjectStore",
             {
@@ -47,7 +62,9 @@ class IndexedDB:
             },
         )
 
-    def deleteDatabase(self, securityOrigin: str, databaseName: str) -> Awaitable[Dict]:
+    def deleteDatabase(
+        self, securityOrigin: str, databaseName: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deletes a database.
 
@@ -55,8 +72,15 @@ class IndexedDB:
 
         :param securityOrigin: Security origin.
         :param databaseName: Database name.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "IndexedDB.deleteDatabase",
+                {"securityOrigin": securityOrigin, "databaseName": databaseName},
+            )
         return self.client.send(
             "IndexedDB.deleteDatabase",
             {"securityOrigin": securityOrigin, "databaseName": databaseName},
@@ -68,7 +92,8 @@ class IndexedDB:
         databaseName: str,
         objectStoreName: str,
         keyRange: Dict[str, Any],
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Delete a range of entries from an object store
 
@@ -78,8 +103,20 @@ class IndexedDB:
         :param databaseName: The databaseName
         :param objectStoreName: The objectStoreName
         :param keyRange: Range of entry keys to delete
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "IndexedDB.deleteObjectStoreEntries",
+                {
+                    "securityOrigin": securityOrigin,
+                    "databaseName": databaseName,
+                    "objectStoreName": objectStoreName,
+                    "keyRange": keyRange,
+                },
+            )
         return self.client.send(
             "IndexedDB.deleteObjectStoreEntries",
             {
@@ -90,24 +127,32 @@ class IndexedDB:
             },
         )
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables events from backend.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/IndexedDB#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("IndexedDB.disable", {})
         return self.client.send("IndexedDB.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables events from backend.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/IndexedDB#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("IndexedDB.enable", {})
         return self.client.send("IndexedDB.enable", {})
 
     def requestData(
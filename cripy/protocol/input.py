@@ -37,7 +37,8 @@ class Input:
         isKeypad: Optional[bool] = None,
         isSystemKey: Optional[bool] = None,
         location: Optional[int] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Dispatches a key event to the page.
 
@@ -62,6 +63,8 @@ class Input:
         :param isSystemKey: Whether the event was a system key event (default: false).
         :param location: Whether the event was from the left or right side of the keyboard. 1=Left, 2=Right (default:
          0).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"type": type}
@@ -91,9 +94,11 @@ class Input:
             msg["isSystemKey"] = isSystemKey
         if location is not None:
             msg["location"] = location
+        if nowait:
+            return self.client.send_nowait("Input.dispatchKeyEvent", msg)
         return self.client.send("Input.dispatchKeyEvent", msg)
 
-    def insertText(self, text: str) -> Awaitable[Dict]:
+    def insertText(self, text: str, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         This method emulates inserting text that doesn't come from a key press,
         for example an emoji keyboard or an IME.
@@ -103,8 +108,12 @@ class Input:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Input#method-insertText`
 
         :param text: The text to insert.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Input.insertText", {"text": text})
         return self.client.send("Input.insertText", {"text": text})
 
     def dispatchMouseEvent(
@@ -120,7 +129,8 @@ class Input:
         deltaX: Optional[Union[int, float]] = None,
         deltaY: Optional[Union[int, float]] = None,
         pointerType: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Dispatches a mouse event to the page.
 
@@ -140,6 +150,8 @@ class Input:
         :param deltaX: X delta in CSS pixels for mouse wheel event (default: 0).
         :param deltaY: Y delta in CSS pixels for mouse wheel event (default: 0).
         :param pointerType: Pointer type (default: "mouse").
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"type": type, "x": x, "y": y}
@@ -159,6 +171,8 @@ class Input:
             msg["deltaY"] = deltaY
         if pointerType is not None:
             msg["pointerType"] = pointerType
+        if nowait:
+            return self.client.send_nowait("Input.dispatchMouseEvent", msg)
         return self.client.send("Input.dispatchMouseEvent", msg)
 
     def dispatchTouchEvent(
@@ -167,7 +181,8 @@ class Input:
         touchPoints: List[Dict[str, Any]],
         modifiers: Optional[int] = None,
         timestamp: Optional[Union[int, float]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Dispatches a touch event to the page.
 
@@ -181,6 +196,8 @@ class Input:
         :param modifiers: Bit field representing pressed modifier keys. Alt=1, Ctrl=2, Meta/Command=4, Shift=8
          (default: 0).
         :param timestamp: Time at which the event occurred.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"type": type, "touchPoints": touchPoints}
@@ -188,6 +205,8 @@ class Input:
             msg["modifiers"] = modifiers
         if timestamp is not None:
             msg["timestamp"] = timestamp
+        if nowait:
+            return self.client.send_nowait("Input.dispatchTouchEvent", msg)
         return self.client.send("Input.dispatchTouchEvent", msg)
 
     def emulateTouchFromMouseEvent(
@@ -201,7 +220,8 @@ class Input:
         deltaY: Optional[Union[int, float]] = None,
         modifiers: Optional[int] = None,
         clickCount: Optional[int] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Emulates touch event from the mouse event parameters.
 
@@ -219,6 +239,8 @@ class Input:
         :param modifiers: Bit field representing pressed modifier keys. Alt=1, Ctrl=2, Meta/Command=4, Shift=8
          (default: 0).
         :param clickCount: Number of times the mouse button was clicked (default: 0).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"type": type, "x": x, "y": y, "button": button}
@@ -232,17 +254,27 @@ class Input:
             msg["modifiers"] = modifiers
         if clickCount is not None:
             msg["clickCount"] = clickCount
+        if nowait:
+            return self.client.send_nowait("Input.emulateTouchFromMouseEvent", msg)
         return self.client.send("Input.emulateTouchFromMouseEvent", msg)
 
-    def setIgnoreInputEvents(self, ignore: bool) -> Awaitable[Dict]:
+    def setIgnoreInputEvents(
+        self, ignore: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Ignores input events (useful while auditing page).
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Input#method-setIgnoreInputEvents`
 
         :param ignore: Ignores input events processing when set to true.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Input.setIgnoreInputEvents", {"ignore": ignore}
+            )
         return self.client.send("Input.setIgnoreInputEvents", {"ignore": ignore})
 
     def synthesizePinchGesture(
@@ -252,7 +284,8 @@ class Input:
         scaleFactor: Union[int, float],
         relativeSpeed: Optional[int] = None,
         gestureSourceType: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Synthesizes a pinch gesture over a time period by issuing appropriate touch events.
 
@@ -266,6 +299,8 @@ class Input:
         :param relativeSpeed: Relative pointer speed in pixels per second (default: 800).
         :param gestureSourceType: Which type of input events to be generated (default: 'default', which queries the platform
          for the preferred input type).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"x": x, "y": y, "scaleFactor": scaleFactor}
@@ -273,6 +308,8 @@ class Input:
             msg["relativeSpeed"] = relativeSpeed
         if gestureSourceType is not None:
             msg["gestureSourceType"] = gestureSourceType
+        if nowait:
+            return self.client.send_nowait("Input.synthesizePinchGesture", msg)
         return self.client.send("Input.synthesizePinchGesture", msg)
 
     def synthesizeScrollGesture(
@@ -289,7 +326,8 @@ class Input:
         repeatCount: Optional[int] = None,
         repeatDelayMs: Optional[int] = None,
         interactionMarkerName: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Synthesizes a scroll gesture over a time period by issuing appropriate touch events.
 
@@ -312,6 +350,8 @@ class Input:
         :param repeatCount: The number of times to repeat the gesture (default: 0).
         :param repeatDelayMs: The number of milliseconds delay between each repeat. (default: 250).
         :param interactionMarkerName: The name of the interaction markers to generate, if not empty (default: "").
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"x": x, "y": y}
@@ -335,6 +375,8 @@ class Input:
             msg["repeatDelayMs"] = repeatDelayMs
         if interactionMarkerName is not None:
             msg["interactionMarkerName"] = interactionMarkerName
+        if nowait:
+            return self.client.send_nowait("Input.synthesizeScrollGesture", msg)
         return self.client.send("Input.synthesizeScrollGesture", msg)
 
     def synthesizeTapGesture(
@@ -344,7 +386,8 @@ class Input:
         duration: Optional[int] = None,
         tapCount: Optional[int] = None,
         gestureSourceType: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Synthesizes a tap gesture over a time period by issuing appropriate touch events.
 
@@ -358,6 +401,8 @@ class Input:
         :param tapCount: Number of times to perform the tap (e.g. 2 for double tap, default: 1).
         :param gestureSourceType: Which type of input events to be generated (default: 'default', which queries the platform
          for the preferred input type).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"x": x, "y": y}
@@ -367,4 +412,6 @@ class Input:
             msg["tapCount"] = tapCount
         if gestureSourceType is not None:
             msg["gestureSourceType"] = gestureSourceType
+        if nowait:
+            return self.client.send_nowait("Input.synthesizeTapGesture", msg)
         return self.client.send("Input.synthesizeTapGesture", msg)
@@ -1,5 +1,7 @@
 """This is an auto-generated file. Modify at your own risk"""
-from typing import Awaitable, Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Awaitable, Any, BinaryIO, Dict, List, Optional, Union, TYPE_CHECKING
+
+from cripy.binary import binary_result
 
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
@@ -23,19 +25,28 @@ class IO:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def close(self, handle: str) -> Awaitable[Dict]:
+    def close(self, handle: str, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Close the stream, discard any temporary backing storage.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/IO#method-close`
 
         :param handle: Handle of the stream to close.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("IO.close", {"handle": handle})
         return self.client.send("IO.close", {"handle": handle})
 
     def read(
-        self, handle: str, offset: Optional[int] = None, size: Optional[int] = None
+        self,
+        handle: str,
+        offset: Optional[int] = None,
+        size: Optional[int] = None,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
     ) -> Awaitable[Dict]:
         """
         Read a chunk of the stream
@@ -46,6 +57,10 @@ class IO:
         :param offset: Seek to the specified offset before reading (if not specificed, proceed with offset
          following the last read). Some types of streams may only support sequential reads.
         :param size: Maximum number of bytes to read (left upon the agent discretion if not specified).
+        :param as_bytes: If true data is returned as bytes, decoded from base64 if base64Encoded
+        otherwise encoded as UTF-8
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        data is written to in chunks, data is then the number of bytes written
         :return: The results of the command
         """
         msg = {"handle": handle}
@@ -53,6 +68,10 @@ class IO:
             msg["offset"] = offset
         if size is not None:
             msg["size"] = size
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send("IO.read", msg), "data", sink, "base64Encoded"
+            )
         return self.client.send("IO.read", msg)
 
     def resolveBlob(self, objectId: str) -> Awaitable[Dict]:
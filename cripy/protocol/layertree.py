@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -36,24 +38,32 @@ class LayerTree:
         """
         return self.client.send("LayerTree.compositingReasons", {"layerId": layerId})
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables compositing tree inspection.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/LayerTree#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("LayerTree.disable", {})
         return self.client.send("LayerTree.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables compositing tree inspection.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/LayerTree#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("LayerTree.enable", {})
         return self.client.send("LayerTree.enable", {})
 
     def loadSnapshot(self, tiles: List[Dict[str, Any]]) -> Awaitable[Dict]:
@@ -103,15 +113,23 @@ class LayerTree:
             msg["clipRect"] = clipRect
         return self.client.send("LayerTree.profileSnapshot", msg)
 
-    def releaseSnapshot(self, snapshotId: str) -> Awaitable[Dict]:
+    def releaseSnapshot(
+        self, snapshotId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Releases layer snapshot captured by the back-end.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/LayerTree#method-releaseSnapshot`
 
         :param snapshotId: The id of the layer snapshot.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "LayerTree.releaseSnapshot", {"snapshotId": snapshotId}
+            )
         return self.client.send("LayerTree.releaseSnapshot", {"snapshotId": snapshotId})
 
     def replaySnapshot(
@@ -154,52 +172,54 @@ class LayerTree:
             "LayerTree.snapshotCommandLog", {"snapshotId": snapshotId}
         )
 
+    @event_accessor("LayerTree.layerPainted")
     def layerPainted(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/LayerTree#event-layerPainted`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "LayerTree.layerPainted"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("LayerTree.layerTreeDidChange")
     def layerTreeDidChange(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/LayerTree#event-layerTreeDidChange`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "LayerTree.layerTreeDidChange"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
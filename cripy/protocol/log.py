@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -27,60 +29,88 @@ class Log:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def clear(self) -> Awaitable[Dict]:
+    def clear(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Clears the log.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Log#method-clear`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Log.clear", {})
         return self.client.send("Log.clear", {})
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables log domain, prevents further log entries from being reported to the client.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Log#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Log.disable", {})
         return self.client.send("Log.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables log domain, sends the entries collected so far to the client by means of the
         `entryAdded` notification.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Log#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Log.enable", {})
         return self.client.send("Log.enable", {})
 
-    def startViolationsReport(self, config: List[Dict[str, Any]]) -> Awaitable[Dict]:
+    def startViolationsReport(
+        self, config: List[Dict[str, Any]], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         start violation reporting.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Log#method-startViolationsReport`
 
         :param config: Configuration for violations.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Log.startViolationsReport", {"config": config}
+            )
         return self.client.send("Log.startViolationsReport", {"config": config})
 
-    def stopViolationsReport(self) -> Awaitable[Dict]:
+    def stopViolationsReport(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Stop violation reporting.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Log#method-stopViolationsReport`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Log.stopViolationsReport", {})
         return self.client.send("Log.stopViolationsReport", {})
 
+    @event_accessor("Log.entryAdded")
     def entryAdded(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when new message was logged.
@@ -88,20 +118,17 @@ class Log:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Log#event-entryAdded`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Log.entryAdded"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
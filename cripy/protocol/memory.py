@@ -31,53 +31,82 @@ class Memory:
         """
         return self.client.send("Memory.getDOMCounters", {})
 
-    def prepareForLeakDetection(self) -> Awaitable[Dict]:
+    def prepareForLeakDetection(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Memory#method-prepareForLeakDetection`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Memory.prepareForLeakDetection", {})
         return self.client.send("Memory.prepareForLeakDetection", {})
 
-    def forciblyPurgeJavaScriptMemory(self) -> Awaitable[Dict]:
+    def forciblyPurgeJavaScriptMemory(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Simulate OomIntervention by purging V8 memory.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Memory#method-forciblyPurgeJavaScriptMemory`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Memory.forciblyPurgeJavaScriptMemory", {})
         return self.client.send("Memory.forciblyPurgeJavaScriptMemory", {})
 
-    def setPressureNotificationsSuppressed(self, suppressed: bool) -> Awaitable[Dict]:
+    def setPressureNotificationsSuppressed(
+        self, suppressed: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enable/disable suppressing memory pressure notifications in all processes.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Memory#method-setPressureNotificationsSuppressed`
 
         :param suppressed: If true, memory pressure notifications will be suppressed.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Memory.setPressureNotificationsSuppressed", {"suppressed": suppressed}
+            )
         return self.client.send(
             "Memory.setPressureNotificationsSuppressed", {"suppressed": suppressed}
         )
 
-    def simulatePressureNotification(self, level: str) -> Awaitable[Dict]:
+    def simulatePressureNotification(
+        self, level: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Simulate a memory pressure notification in all processes.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Memory#method-simulatePressureNotification`
 
         :param level: Memory pressure level of the notification.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Memory.simulatePressureNotification", {"level": level}
+            )
         return self.client.send("Memory.simulatePressureNotification", {"level": level})
 
     def startSampling(
         self,
         samplingInterval: Optional[int] = None,
         suppressRandomness: Optional[bool] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Start collecting native memory profile.
 
@@ -85,6 +114,8 @@ class Memory:
 
         :param samplingInterval: Average number of bytes between samples.
         :param suppressRandomness: Do not randomize intervals between samples.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -92,16 +123,22 @@ class Memory:
             msg["samplingInterval"] = samplingInterval
         if suppressRandomness is not None:
             msg["suppressRandomness"] = suppressRandomness
+        if nowait:
+            return self.client.send_nowait("Memory.startSampling", msg)
         return self.client.send("Memory.startSampling", msg)
 
-    def stopSampling(self) -> Awaitable[Dict]:
+    def stopSampling(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Stop collecting native memory profile.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Memory#method-stopSampling`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Memory.stopSampling", {})
         return self.client.send("Memory.stopSampling", {})
 
     def getAllTimeSamplingProfile(self) -> Awaitable[Dict]:
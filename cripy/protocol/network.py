@@ -1,5 +1,18 @@
 """This is an auto-generated file. Modify at your own risk"""
-from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import (
+    Awaitable,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
+
+from cripy.binary import binary_result
+from cripy.stream import event_accessor
 
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
@@ -65,24 +78,32 @@ class Network:
         """
         return self.client.send("Network.canEmulateNetworkConditions", {})
 
-    def clearBrowserCache(self) -> Awaitable[Dict]:
+    def clearBrowserCache(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Clears browser cache.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-clearBrowserCache`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Network.clearBrowserCache", {})
         return self.client.send("Network.clearBrowserCache", {})
 
-    def clearBrowserCookies(self) -> Awaitable[Dict]:
+    def clearBrowserCookies(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Clears browser cookies.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-clearBrowserCookies`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Network.clearBrowserCookies", {})
         return self.client.send("Network.clearBrowserCookies", {})
 
     def continueInterceptedRequest(
@@ -95,7 +116,8 @@ class Network:
         postData: Optional[str] = None,
         headers: Optional[Dict[str, Any]] = None,
         authChallengeResponse: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Response to Network.requestIntercepted which either modifies the request to continue with any
         modifications, or blocks it, or completes it with the provided response bytes. If a network
@@ -120,6 +142,8 @@ class Network:
         :param headers: If set this allows the request headers to be changed. Must not be set in response to an
          authChallenge.
         :param authChallengeResponse: Response to a requestIntercepted with an authChallenge. Must not be set otherwise.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"interceptionId": interceptionId}
@@ -137,6 +161,8 @@ class Network:
             msg["headers"] = headers
         if authChallengeResponse is not None:
             msg["authChallengeResponse"] = authChallengeResponse
+        if nowait:
+            return self.client.send_nowait("Network.continueInterceptedRequest", msg)
         return self.client.send("Network.continueInterceptedRequest", msg)
 
     def deleteCookies(
@@ -145,7 +171,8 @@ class Network:
         url: Optional[str] = None,
         domain: Optional[str] = None,
         path: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deletes browser cookies with matching name and url or domain/path pair.
 
@@ -156,6 +183,8 @@ class Network:
          provided URL.
         :param domain: If specified, deletes only cookies with the exact domain.
         :param path: If specified, deletes only cookies with the exact path.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"name": name}
@@ -165,16 +194,22 @@ class Network:
             msg["domain"] = domain
         if path is not None:
             msg["path"] = path
+        if nowait:
+            return self.client.send_nowait("Network.deleteCookies", msg)
         return self.client.send("Network.deleteCookies", msg)
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables network tracking, prevents network events from being sent to the client.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Network.disable", {})
         return self.client.send("Network.disable", {})
 
     def emulateNetworkConditions(
@@ -184,7 +219,8 @@ class Network:
         downloadThroughput: Union[int, float],
         uploadThroughput: Union[int, float],
         connectionType: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Activates emulation of network conditions.
 
@@ -195,6 +231,8 @@ class Network:
         :param downloadThroughput: Maximal aggregated download throughput (bytes/sec). -1 disables download throttling.
         :param uploadThroughput: Maximal aggregated upload throughput (bytes/sec).  -1 disables upload throttling.
         :param connectionType: Connection type if known.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {
@@ -205,6 +243,8 @@ class Network:
         }
         if connectionType is not None:
             msg["connectionType"] = connectionType
+        if nowait:
+            return self.client.send_nowait("Network.emulateNetworkConditions", msg)
         return self.client.send("Network.emulateNetworkConditions", msg)
 
     def enable(
@@ -212,7 +252,8 @@ class Network:
         maxTotalBufferSize: Optional[int] = None,
         maxResourceBufferSize: Optional[int] = None,
         maxPostDataSize: Optional[int] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables network tracking, network events will now be delivered to the client.
 
@@ -221,6 +262,8 @@ class Network:
         :param maxTotalBufferSize: Buffer size in bytes to use when preserving network payloads (XHRs, etc).
         :param maxResourceBufferSize: Per-resource buffer size in bytes to use when preserving network payloads (XHRs, etc).
         :param maxPostDataSize: Longest post body size (in bytes) that would be included in requestWillBeSent notification
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -230,6 +273,8 @@ class Network:
             msg["maxResourceBufferSize"] = maxResourceBufferSize
         if maxPostDataSize is not None:
             msg["maxPostDataSize"] = maxPostDataSize
+        if nowait:
+            return self.client.send_nowait("Network.enable", msg)
         return self.client.send("Network.enable", msg)
 
     def getAllCookies(self) -> Awaitable[Dict]:
@@ -271,15 +316,28 @@ class Network:
             msg["urls"] = urls
         return self.client.send("Network.getCookies", msg)
 
-    def getResponseBody(self, requestId: str) -> Awaitable[Dict]:
+    def getResponseBody(
+        self, requestId: str, as_bytes: bool = False, sink: Optional[BinaryIO] = None
+    ) -> Awaitable[Dict]:
         """
         Returns content served for the given request.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-getResponseBody`
 
         :param requestId: Identifier of the network request to get content for.
+        :param as_bytes: If true body is returned as bytes, decoded from base64 if base64Encoded
+        otherwise encoded as UTF-8
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        body is written to in chunks, body is then the number of bytes written
         :return: The results of the command
         """
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send("Network.getResponseBody", {"requestId": requestId}),
+                "body",
+                sink,
+                "base64Encoded",
+            )
         return self.client.send("Network.getResponseBody", {"requestId": requestId})
 
     def getRequestPostData(self, requestId: str) -> Awaitable[Dict]:
@@ -293,7 +351,12 @@ class Network:
         """
         return self.client.send("Network.getRequestPostData", {"requestId": requestId})
 
-    def getResponseBodyForInterception(self, interceptionId: str) -> Awaitable[Dict]:
+    def getResponseBodyForInterception(
+        self,
+        interceptionId: str,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
+    ) -> Awaitable[Dict]:
         """
         Returns content served for the given currently intercepted request.
 
@@ -302,8 +365,22 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-getResponseBodyForInterception`
 
         :param interceptionId: Identifier for the intercepted request to get body for.
+        :param as_bytes: If true body is returned as bytes, decoded from base64 if base64Encoded
+        otherwise encoded as UTF-8
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        body is written to in chunks, body is then the number of bytes written
         :return: The results of the command
         """
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send(
+                    "Network.getResponseBodyForInterception",
+                    {"interceptionId": interceptionId},
+                ),
+                "body",
+                sink,
+                "base64Encoded",
+            )
         return self.client.send(
             "Network.getResponseBodyForInterception", {"interceptionId": interceptionId}
         )
@@ -329,7 +406,9 @@ class Network:
             {"interceptionId": interceptionId},
         )
 
-    def replayXHR(self, requestId: str) -> Awaitable[Dict]:
+    def replayXHR(
+        self, requestId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         This method sends a new XMLHttpRequest which is identical to the original one. The following
         parameters should be identical: method, url, async, request body, extra headers, withCredentials
@@ -340,8 +419,14 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-replayXHR`
 
         :param requestId: Identifier of XHR to replay.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Network.replayXHR", {"requestId": requestId}
+            )
         return self.client.send("Network.replayXHR", {"requestId": requestId})
 
     def searchInResponseBody(
@@ -371,7 +456,9 @@ class Network:
             msg["isRegex"] = isRegex
         return self.client.send("Network.searchInResponseBody", msg)
 
-    def setBlockedURLs(self, urls: List[str]) -> Awaitable[Dict]:
+    def setBlockedURLs(
+        self, urls: List[str], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Blocks URLs from loading.
 
@@ -380,11 +467,17 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-setBlockedURLs`
 
         :param urls: URL patterns to block. Wildcards ('*') are allowed.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Network.setBlockedURLs", {"urls": urls})
         return self.client.send("Network.setBlockedURLs", {"urls": urls})
 
-    def setBypassServiceWorker(self, bypass: bool) -> Awaitable[Dict]:
+    def setBypassServiceWorker(
+        self, bypass: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Toggles ignoring of service worker for each request.
 
@@ -393,19 +486,33 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-setBypassServiceWorker`
 
         :param bypass: Bypass service worker and load from network.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Network.setBypassServiceWorker", {"bypass": bypass}
+            )
         return self.client.send("Network.setBypassServiceWorker", {"bypass": bypass})
 
-    def setCacheDisabled(self, cacheDisabled: bool) -> Awaitable[Dict]:
+    def setCacheDisabled(
+        self, cacheDisabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Toggles ignoring cache for each request. If `true`, cache will not be used.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-setCacheDisabled`
 
         :param cacheDisabled: Cache disabled state.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Network.setCacheDisabled", {"cacheDisabled": cacheDisabled}
+            )
         return self.client.send(
             "Network.setCacheDisabled", {"cacheDisabled": cacheDisabled}
         )
@@ -456,20 +563,26 @@ class Network:
             msg["expires"] = expires
         return self.client.send("Network.setCookie", msg)
 
-    def setCookies(self, cookies: List[Dict[str, Any]]) -> Awaitable[Dict]:
+    def setCookies(
+        self, cookies: List[Dict[str, Any]], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets given cookies.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-setCookies`
 
         :param cookies: Cookies to be set.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Network.setCookies", {"cookies": cookies})
         return self.client.send("Network.setCookies", {"cookies": cookies})
 
     def setDataSizeLimitsForTest(
-        self, maxTotalSize: int, maxResourceSize: int
-    ) -> Awaitable[Dict]:
+        self, maxTotalSize: int, maxResourceSize: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         For testing.
 
@@ -479,25 +592,42 @@ class Network:
 
         :param maxTotalSize: Maximum total buffer size.
         :param maxResourceSize: Maximum per-resource size.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Network.setDataSizeLimitsForTest",
+                {"maxTotalSize": maxTotalSize, "maxResourceSize": maxResourceSize},
+            )
         return self.client.send(
             "Network.setDataSizeLimitsForTest",
             {"maxTotalSize": maxTotalSize, "maxResourceSize": maxResourceSize},
         )
 
-    def setExtraHTTPHeaders(self, headers: Dict[str, Any]) -> Awaitable[Dict]:
+    def setExtraHTTPHeaders(
+        self, headers: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Specifies whether to always send extra HTTP headers with the requests from this page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#method-setExtraHTTPHeaders`
 
         :param headers: Map with extra HTTP headers.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Network.setExtraHTTPHeaders", {"headers": headers}
+            )
         return self.client.send("Network.setExtraHTTPHeaders", {"headers": headers})
 
-    def setRequestInterception(self, patterns: List[Dict[str, Any]]) -> Awaitable[Dict]:
+    def setRequestInterception(
+        self, patterns: List[Dict[str, Any]], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets the requests to intercept that match the provided patterns and optionally resource types.
 
@@ -507,8 +637,14 @@ class Network:
 
         :param patterns: Requests matching any of these patterns will be forwarded and wait for the corresponding
          continueInterceptedRequest call.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Network.setRequestInterception", {"patterns": patterns}
+            )
         return self.client.send(
             "Network.setRequestInterception", {"patterns": patterns}
         )
@@ -518,7 +654,8 @@ class Network:
         userAgent: str,
         acceptLanguage: Optional[str] = None,
         platform: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Allows overriding user agent with the given string.
 
@@ -527,6 +664,8 @@ class Network:
         :param userAgent: User agent to use.
         :param acceptLanguage: Browser langugage to emulate.
         :param platform: The platform navigator.platform should return.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"userAgent": userAgent}
@@ -534,10 +673,16 @@ class Network:
             msg["acceptLanguage"] = acceptLanguage
         if platform is not None:
             msg["platform"] = platform
+        if nowait:
+            return self.client.send_nowait("Network.setUserAgentOverride", msg)
         return self.client.send("Network.setUserAgentOverride", msg)
 
+    @event_accessor("Network.dataReceived")
     def dataReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when data chunk was received over the network.
@@ -545,26 +690,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-dataReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.dataReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.eventSourceMessageReceived")
     def eventSourceMessageReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when EventSource message is received.
@@ -572,26 +718,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-eventSourceMessageReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.eventSourceMessageReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.loadingFailed")
     def loadingFailed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when HTTP request has failed to load.
@@ -599,26 +746,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-loadingFailed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.loadingFailed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.loadingFinished")
     def loadingFinished(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when HTTP request has finished loading.
@@ -626,26 +774,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-loadingFinished`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.loadingFinished"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.requestIntercepted")
     def requestIntercepted(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Details of an intercepted HTTP request, which must be either allowed, blocked, modified or
@@ -654,26 +803,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-requestIntercepted`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.requestIntercepted"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.requestServedFromCache")
     def requestServedFromCache(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired if request ended up loading from cache.
@@ -681,26 +831,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-requestServedFromCache`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.requestServedFromCache"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.requestWillBeSent")
     def requestWillBeSent(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when page is about to send HTTP request.
@@ -708,26 +859,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-requestWillBeSent`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.requestWillBeSent"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.resourceChangedPriority")
     def resourceChangedPriority(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when resource loading priority is changed
@@ -735,26 +887,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-resourceChangedPriority`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.resourceChangedPriority"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.signedExchangeReceived")
     def signedExchangeReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when a signed exchange was received over the network
@@ -762,26 +915,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-signedExchangeReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.signedExchangeReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.responseReceived")
     def responseReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when HTTP response is available.
@@ -789,26 +943,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-responseReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.responseReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketClosed")
     def webSocketClosed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when WebSocket is closed.
@@ -816,26 +971,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketClosed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketClosed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketCreated")
     def webSocketCreated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired upon WebSocket creation.
@@ -843,26 +999,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketCreated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketCreated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketFrameError")
     def webSocketFrameError(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when WebSocket message error occurs.
@@ -870,26 +1027,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketFrameError`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketFrameError"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketFrameReceived")
     def webSocketFrameReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when WebSocket message is received.
@@ -897,26 +1055,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketFrameReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketFrameReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketFrameSent")
     def webSocketFrameSent(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when WebSocket message is sent.
@@ -924,26 +1083,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketFrameSent`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketFrameSent"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketHandshakeResponseReceived")
     def webSocketHandshakeResponseReceived(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when WebSocket handshake response becomes available.
@@ -951,26 +1111,27 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketHandshakeResponseReceived`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketHandshakeResponseReceived"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Network.webSocketWillSendHandshakeRequest")
     def webSocketWillSendHandshakeRequest(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when WebSocket is about to initiate handshake.
@@ -978,20 +1139,17 @@ class Network:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Network#event-webSocketWillSendHandshakeRequest`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Network.webSocketWillSendHandshakeRequest"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
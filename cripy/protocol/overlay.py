@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -29,24 +31,32 @@ class Overlay:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Overlay.disable", {})
         return self.client.send("Overlay.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Overlay.enable", {})
         return self.client.send("Overlay.enable", {})
 
     def getHighlightObjectForTest(self, nodeId: int) -> Awaitable[Dict]:
@@ -60,14 +70,18 @@ class Overlay:
         """
         return self.client.send("Overlay.getHighlightObjectForTest", {"nodeId": nodeId})
 
-    def hideHighlight(self) -> Awaitable[Dict]:
+    def hideHighlight(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Hides any highlight.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-hideHighlight`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Overlay.hideHighlight", {})
         return self.client.send("Overlay.hideHighlight", {})
 
     def highlightFrame(
@@ -75,7 +89,8 @@ class Overlay:
         frameId: str,
         contentColor: Optional[Dict[str, Any]] = None,
         contentOutlineColor: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Highlights owner element of the frame with given id.
 
@@ -84,6 +99,8 @@ class Overlay:
         :param frameId: Identifier of the frame to highlight.
         :param contentColor: The content box highlight fill color (default: transparent).
         :param contentOutlineColor: The content box highlight outline color (default: transparent).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"frameId": frameId}
@@ -91,6 +108,8 @@ class Overlay:
             msg["contentColor"] = contentColor
         if contentOutlineColor is not None:
             msg["contentOutlineColor"] = contentOutlineColor
+        if nowait:
+            return self.client.send_nowait("Overlay.highlightFrame", msg)
         return self.client.send("Overlay.highlightFrame", msg)
 
     def highlightNode(
@@ -100,7 +119,8 @@ class Overlay:
         backendNodeId: Optional[int] = None,
         objectId: Optional[str] = None,
         selector: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Highlights DOM node with given id or with the given JavaScript object wrapper. Either nodeId or
         objectId must be specified.
@@ -112,6 +132,8 @@ class Overlay:
         :param backendNodeId: Identifier of the backend node to highlight.
         :param objectId: JavaScript object id of the node to be highlighted.
         :param selector: Selectors to highlight relevant nodes.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"highlightConfig": highlightConfig}
@@ -123,6 +145,8 @@ class Overlay:
             msg["objectId"] = objectId
         if selector is not None:
             msg["selector"] = selector
+        if nowait:
+            return self.client.send_nowait("Overlay.highlightNode", msg)
         return self.client.send("Overlay.highlightNode", msg)
 
     def highlightQuad(
@@ -130,7 +154,8 @@ class Overlay:
         quad: List[Union[int, float]],
         color: Optional[Dict[str, Any]] = None,
         outlineColor: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Highlights given quad. Coordinates are absolute with respect to the main frame viewport.
 
@@ -139,6 +164,8 @@ class Overlay:
         :param quad: Quad to highlight
         :param color: The highlight fill color (default: transparent).
         :param outlineColor: The highlight outline color (default: transparent).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"quad": quad}
@@ -146,6 +173,8 @@ class Overlay:
             msg["color"] = color
         if outlineColor is not None:
             msg["outlineColor"] = outlineColor
+        if nowait:
+            return self.client.send_nowait("Overlay.highlightQuad", msg)
         return self.client.send("Overlay.highlightQuad", msg)
 
     def highlightRect(
@@ -156,7 +185,8 @@ class Overlay:
         height: int,
         color: Optional[Dict[str, Any]] = None,
         outlineColor: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Highlights given rectangle. Coordinates are absolute with respect to the main frame viewport.
 
@@ -168,6 +198,8 @@ class Overlay:
         :param height: Rectangle height
         :param color: The highlight fill color (default: transparent).
         :param outlineColor: The highlight outline color (default: transparent).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"x": x, "y": y, "width": width, "height": height}
@@ -175,11 +207,16 @@ class Overlay:
             msg["color"] = color
         if outlineColor is not None:
             msg["outlineColor"] = outlineColor
+        if nowait:
+            return self.client.send_nowait("Overlay.highlightRect", msg)
         return self.client.send("Overlay.highlightRect", msg)
 
     def setInspectMode(
-        self, mode: str, highlightConfig: Optional[Dict[str, Any]] = None
-    ) -> Awaitable[Dict]:
+        self,
+        mode: str,
+        highlightConfig: Optional[Dict[str, Any]] = None,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enters the 'inspect' mode. In this mode, elements that user is hovering over are highlighted.
         Backend then generates 'inspectNodeRequested' event upon element selection.
@@ -189,106 +226,172 @@ class Overlay:
         :param mode: Set an inspection mode.
         :param highlightConfig: A descriptor for the highlight appearance of hovered-over nodes. May be omitted if `enabled
          == false`.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"mode": mode}
         if highlightConfig is not None:
             msg["highlightConfig"] = highlightConfig
+        if nowait:
+            return self.client.send_nowait("Overlay.setInspectMode", msg)
         return self.client.send("Overlay.setInspectMode", msg)
 
-    def setShowAdHighlights(self, show: bool) -> Awaitable[Dict]:
+    def setShowAdHighlights(
+        self, show: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Highlights owner element of all frames detected to be ads.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowAdHighlights`
 
         :param show: True for showing ad highlights
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Overlay.setShowAdHighlights", {"show": show}
+            )
         return self.client.send("Overlay.setShowAdHighlights", {"show": show})
 
     def setPausedInDebuggerMessage(
-        self, message: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, message: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setPausedInDebuggerMessage`
 
         :param message: The message to display, also triggers resume and step over controls.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
         if message is not None:
             msg["message"] = message
+        if nowait:
+            return self.client.send_nowait("Overlay.setPausedInDebuggerMessage", msg)
         return self.client.send("Overlay.setPausedInDebuggerMessage", msg)
 
-    def setShowDebugBorders(self, show: bool) -> Awaitable[Dict]:
+    def setShowDebugBorders(
+        self, show: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Requests that backend shows debug borders on layers
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowDebugBorders`
 
         :param show: True for showing debug borders
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Overlay.setShowDebugBorders", {"show": show}
+            )
         return self.client.send("Overlay.setShowDebugBorders", {"show": show})
 
-    def setShowFPSCounter(self, show: bool) -> Awaitable[Dict]:
+    def setShowFPSCounter(
+        self, show: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Requests that backend shows the FPS counter
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowFPSCounter`
 
         :param show: True for showing the FPS counter
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Overlay.setShowFPSCounter", {"show": show})
         return self.client.send("Overlay.setShowFPSCounter", {"show": show})
 
-    def setShowPaintRects(self, result: bool) -> Awaitable[Dict]:
+    def setShowPaintRects(
+        self, result: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Requests that backend shows paint rectangles
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowPaintRects`
 
         :param result: True for showing paint rectangles
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Overlay.setShowPaintRects", {"result": result}
+            )
         return self.client.send("Overlay.setShowPaintRects", {"result": result})
 
-    def setShowScrollBottleneckRects(self, show: bool) -> Awaitable[Dict]:
+    def setShowScrollBottleneckRects(
+        self, show: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Requests that backend shows scroll bottleneck rects
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowScrollBottleneckRects`
 
         :param show: True for showing scroll bottleneck rects
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Overlay.setShowScrollBottleneckRects", {"show": show}
+            )
         return self.client.send("Overlay.setShowScrollBottleneckRects", {"show": show})
 
-    def setShowHitTestBorders(self, show: bool) -> Awaitable[Dict]:
+    def setShowHitTestBorders(
+        self, show: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Requests that backend shows hit-test borders on layers
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowHitTestBorders`
 
         :param show: True for showing hit-test borders
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Overlay.setShowHitTestBorders", {"show": show}
+            )
         return self.client.send("Overlay.setShowHitTestBorders", {"show": show})
 
-    def setShowViewportSizeOnResize(self, show: bool) -> Awaitable[Dict]:
+    def setShowViewportSizeOnResize(
+        self, show: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Paints viewport size upon main frame resize.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#method-setShowViewportSizeOnResize`
 
         :param show: Whether to paint size or not.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Overlay.setShowViewportSizeOnResize", {"show": show}
+            )
         return self.client.send("Overlay.setShowViewportSizeOnResize", {"show": show})
 
+    @event_accessor("Overlay.inspectNodeRequested")
     def inspectNodeRequested(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when the node should be inspected. This happens after call to `setInspectMode` or when
@@ -297,26 +400,27 @@ class Overlay:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#event-inspectNodeRequested`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Overlay.inspectNodeRequested"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Overlay.nodeHighlightRequested")
     def nodeHighlightRequested(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when the node should be highlighted. This happens after call to `setInspectMode`.
@@ -324,26 +428,27 @@ class Overlay:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#event-nodeHighlightRequested`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Overlay.nodeHighlightRequested"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Overlay.screenshotRequested")
     def screenshotRequested(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when user asks to capture screenshot of some area on the page.
@@ -351,26 +456,27 @@ class Overlay:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#event-screenshotRequested`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Overlay.screenshotRequested"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Overlay.inspectModeCanceled")
     def inspectModeCanceled(
-        self, listener: Optional[Callable[[Any], Any]] = None
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when user cancels the inspect mode.
@@ -378,20 +484,17 @@ class Overlay:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Overlay#event-inspectModeCanceled`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Overlay.inspectModeCanceled"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,5 +1,18 @@
 """This is an auto-generated file. Modify at your own risk"""
-from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import (
+    Awaitable,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
+
+from cripy.binary import binary_result
+from cripy.stream import event_accessor
 
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
@@ -63,14 +76,18 @@ class Page:
             msg["worldName"] = worldName
         return self.client.send("Page.addScriptToEvaluateOnNewDocument", msg)
 
-    def bringToFront(self) -> Awaitable[Dict]:
+    def bringToFront(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Brings page to front (activates tab).
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-bringToFront`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.bringToFront", {})
         return self.client.send("Page.bringToFront", {})
 
     def captureScreenshot(
@@ -79,6 +96,8 @@ class Page:
         quality: Optional[int] = None,
         clip: Optional[Dict[str, Any]] = None,
         fromSurface: Optional[bool] = None,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
     ) -> Awaitable[Dict]:
         """
         Capture page screenshot.
@@ -89,6 +108,9 @@ class Page:
         :param quality: Compression quality from range [0..100] (jpeg only).
         :param clip: Capture the screenshot of a given region only.
         :param fromSurface: Capture the screenshot from the surface, rather than the view. Defaults to true.
+        :param as_bytes: If true data is decoded from base64 and returned as bytes
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        data is written to in chunks, data is then the number of bytes written
         :return: The results of the command
         """
         msg = {}
@@ -100,6 +122,10 @@ class Page:
             msg["clip"] = clip
         if fromSurface is not None:
             msg["fromSurface"] = fromSurface
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send("Page.captureScreenshot", msg), "data", sink
+            )
         return self.client.send("Page.captureScreenshot", msg)
 
     def captureSnapshot(self, format: Optional[str] = None) -> Awaitable[Dict]:
@@ -119,7 +145,9 @@ class Page:
             msg["format"] = format
         return self.client.send("Page.captureSnapshot", msg)
 
-    def clearDeviceMetricsOverride(self) -> Awaitable[Dict]:
+    def clearDeviceMetricsOverride(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears the overriden device metrics.
 
@@ -127,11 +155,17 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-clearDeviceMetricsOverride`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.clearDeviceMetricsOverride", {})
         return self.client.send("Page.clearDeviceMetricsOverride", {})
 
-    def clearDeviceOrientationOverride(self) -> Awaitable[Dict]:
+    def clearDeviceOrientationOverride(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears the overridden Device Orientation.
 
@@ -139,11 +173,17 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-clearDeviceOrientationOverride`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.clearDeviceOrientationOverride", {})
         return self.client.send("Page.clearDeviceOrientationOverride", {})
 
-    def clearGeolocationOverride(self) -> Awaitable[Dict]:
+    def clearGeolocationOverride(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears the overriden Geolocation Position and Error.
 
@@ -151,8 +191,12 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-clearGeolocationOverride`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.clearGeolocationOverride", {})
         return self.client.send("Page.clearGeolocationOverride", {})
 
     def createIsolatedWorld(
@@ -179,7 +223,9 @@ class Page:
             msg["grantUniveralAccess"] = grantUniveralAccess
         return self.client.send("Page.createIsolatedWorld", msg)
 
-    def deleteCookie(self, cookieName: str, url: str) -> Awaitable[Dict]:
+    def deleteCookie(
+        self, cookieName: str, url: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deletes browser cookie with given name, domain and path.
 
@@ -189,30 +235,44 @@ class Page:
 
         :param cookieName: Name of the cookie to remove.
         :param url: URL to match cooke domain and path.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.deleteCookie", {"cookieName": cookieName, "url": url}
+            )
         return self.client.send(
             "Page.deleteCookie", {"cookieName": cookieName, "url": url}
         )
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables page domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.disable", {})
         return self.client.send("Page.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables page domain notifications.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.enable", {})
         return self.client.send("Page.enable", {})
 
     def getAppManifest(self) -> Awaitable[Dict]:
@@ -276,17 +336,27 @@ class Page:
         """
         return self.client.send("Page.getNavigationHistory", {})
 
-    def resetNavigationHistory(self) -> Awaitable[Dict]:
+    def resetNavigationHistory(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Resets navigation history for the current page.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-resetNavigationHistory`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.resetNavigationHistory", {})
         return self.client.send("Page.resetNavigationHistory", {})
 
-    def getResourceContent(self, frameId: str, url: str) -> Awaitable[Dict]:
+    def getResourceContent(
+        self,
+        frameId: str,
+        url: str,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
+    ) -> Awaitable[Dict]:
         """
         Returns content of the given resource.
 
@@ -296,8 +366,21 @@ class Page:
 
         :param frameId: Frame id to get resource for.
         :param url: URL of the resource to get content for.
+        :param as_bytes: If true content is returned as bytes, decoded from base64 if base64Encoded
+        otherwise encoded as UTF-8
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        content is written to in chunks, content is then the number of bytes written
         :return: The results of the command
         """
+        if as_bytes or sink is not None:
+            return binary_result(
+                self.client.send(
+                    "Page.getResourceContent", {"frameId": frameId, "url": url}
+                ),
+                "content",
+                sink,
+                "base64Encoded",
+            )
         return self.client.send(
             "Page.getResourceContent", {"frameId": frameId, "url": url}
         )
@@ -315,8 +398,8 @@ class Page:
         return self.client.send("Page.getResourceTree", {})
 
     def handleJavaScriptDialog(
-        self, accept: bool, promptText: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, accept: bool, promptText: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Accepts or dismisses a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload).
 
@@ -325,11 +408,15 @@ class Page:
         :param accept: Whether to accept or dismiss the dialog.
         :param promptText: The text to enter into the dialog prompt before accepting. Used only if this is a prompt
          dialog.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"accept": accept}
         if promptText is not None:
             msg["promptText"] = promptText
+        if nowait:
+            return self.client.send_nowait("Page.handleJavaScriptDialog", msg)
         return self.client.send("Page.handleJavaScriptDialog", msg)
 
     def navigate(
@@ -359,15 +446,23 @@ class Page:
             msg["frameId"] = frameId
         return self.client.send("Page.navigate", msg)
 
-    def navigateToHistoryEntry(self, entryId: int) -> Awaitable[Dict]:
+    def navigateToHistoryEntry(
+        self, entryId: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Navigates current page to the given history entry.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-navigateToHistoryEntry`
 
         :param entryId: Unique id of the entry to navigate to.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.navigateToHistoryEntry", {"entryId": entryId}
+            )
         return self.client.send("Page.navigateToHistoryEntry", {"entryId": entryId})
 
     def printToPDF(
@@ -387,6 +482,8 @@ class Page:
         headerTemplate: Optional[str] = None,
         footerTemplate: Optional[str] = None,
         preferCSSPageSize: Optional[bool] = None,
+        as_bytes: bool = False,
+        sink: Optional[BinaryIO] = None,
     ) -> Awaitable[Dict]:
         """
         Print page as PDF.
@@ -419,6 +516,9 @@ class Page:
         :param footerTemplate: HTML template for the print footer. Should use the same format as the `headerTemplate`.
         :param preferCSSPageSize: Whether or not to prefer page size as defined by css. Defaults to false,
          in which case the content will be scaled to fit the paper size.
+        :param as_bytes: If true data is decoded from base64 and returned as bytes
+        :param sink: Optional file-like object opened for writing bytes that the decoded
+        data is written to in chunks, data is then the number of bytes written
         :return: The results of the command
         """
         msg = {}
@@ -452,13 +552,16 @@ class Page:
             msg["footerTemplate"] = footerTemplate
         if preferCSSPageSize is not None:
             msg["preferCSSPageSize"] = preferCSSPageSize
+        if as_bytes or sink is not None:
+            return binary_result(self.client.send("Page.printToPDF", msg), "data", sink)
         return self.client.send("Page.printToPDF", msg)
 
     def reload(
         self,
         ignoreCache: Optional[bool] = None,
         scriptToEvaluateOnLoad: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Reloads given page optionally ignoring the cache.
 
@@ -467,6 +570,8 @@ class Page:
         :param ignoreCache: If true, browser cache is ignored (as if the user pressed Shift+refresh).
         :param scriptToEvaluateOnLoad: If set, the script will be injected into all frames of the inspected page after reload.
          Argument will be ignored if reloading dataURL origin.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -474,9 +579,13 @@ class Page:
             msg["ignoreCache"] = ignoreCache
         if scriptToEvaluateOnLoad is not None:
             msg["scriptToEvaluateOnLoad"] = scriptToEvaluateOnLoad
+        if nowait:
+            return self.client.send_nowait("Page.reload", msg)
         return self.client.send("Page.reload", msg)
 
-    def removeScriptToEvaluateOnLoad(self, identifier: str) -> Awaitable[Dict]:
+    def removeScriptToEvaluateOnLoad(
+        self, identifier: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deprecated, please use removeScriptToEvaluateOnNewDocument instead.
 
@@ -485,26 +594,42 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-removeScriptToEvaluateOnLoad`
 
         :param identifier: The identifier
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.removeScriptToEvaluateOnLoad", {"identifier": identifier}
+            )
         return self.client.send(
             "Page.removeScriptToEvaluateOnLoad", {"identifier": identifier}
         )
 
-    def removeScriptToEvaluateOnNewDocument(self, identifier: str) -> Awaitable[Dict]:
+    def removeScriptToEvaluateOnNewDocument(
+        self, identifier: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Removes given script from the list.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-removeScriptToEvaluateOnNewDocument`
 
         :param identifier: The identifier
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier}
+            )
         return self.client.send(
             "Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier}
         )
 
-    def screencastFrameAck(self, sessionId: int) -> Awaitable[Dict]:
+    def screencastFrameAck(
+        self, sessionId: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Acknowledges that a screencast frame has been received by the frontend.
 
@@ -513,8 +638,14 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-screencastFrameAck`
 
         :param sessionId: Frame number.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.screencastFrameAck", {"sessionId": sessionId}
+            )
         return self.client.send("Page.screencastFrameAck", {"sessionId": sessionId})
 
     def searchInResource(
@@ -546,7 +677,9 @@ class Page:
             msg["isRegex"] = isRegex
         return self.client.send("Page.searchInResource", msg)
 
-    def setAdBlockingEnabled(self, enabled: bool) -> Awaitable[Dict]:
+    def setAdBlockingEnabled(
+        self, enabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enable Chrome's experimental ad filter on all sites.
 
@@ -555,11 +688,19 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setAdBlockingEnabled`
 
         :param enabled: Whether to block ads.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setAdBlockingEnabled", {"enabled": enabled}
+            )
         return self.client.send("Page.setAdBlockingEnabled", {"enabled": enabled})
 
-    def setBypassCSP(self, enabled: bool) -> Awaitable[Dict]:
+    def setBypassCSP(
+        self, enabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enable page Content Security Policy by-passing.
 
@@ -568,8 +709,12 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setBypassCSP`
 
         :param enabled: Whether to bypass page CSP.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.setBypassCSP", {"enabled": enabled})
         return self.client.send("Page.setBypassCSP", {"enabled": enabled})
 
     def setDeviceMetricsOverride(
@@ -586,7 +731,8 @@ class Page:
         dontSetVisibleSize: Optional[bool] = None,
         screenOrientation: Optional[Dict[str, Any]] = None,
         viewport: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides the values of device screen dimensions (window.screen.width, window.screen.height,
         window.innerWidth, window.innerHeight, and "device-width"/"device-height"-related CSS media
@@ -609,6 +755,8 @@ class Page:
         :param dontSetVisibleSize: Do not set visible view size, rely upon explicit setVisibleSize call.
         :param screenOrientation: Screen orientation override.
         :param viewport: The viewport dimensions and scale. If not set, the override is cleared.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {
@@ -633,6 +781,8 @@ class Page:
             msg["screenOrientation"] = screenOrientation
         if viewport is not None:
             msg["viewport"] = viewport
+        if nowait:
+            return self.client.send_nowait("Page.setDeviceMetricsOverride", msg)
         return self.client.send("Page.setDeviceMetricsOverride", msg)
 
     def setDeviceOrientationOverride(
@@ -640,7 +790,8 @@ class Page:
         alpha: Union[int, float],
         beta: Union[int, float],
         gamma: Union[int, float],
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides the Device Orientation.
 
@@ -651,14 +802,23 @@ class Page:
         :param alpha: Mock alpha
         :param beta: Mock beta
         :param gamma: Mock gamma
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setDeviceOrientationOverride",
+                {"alpha": alpha, "beta": beta, "gamma": gamma},
+            )
         return self.client.send(
             "Page.setDeviceOrientationOverride",
             {"alpha": alpha, "beta": beta, "gamma": gamma},
         )
 
-    def setFontFamilies(self, fontFamilies: Dict[str, Any]) -> Awaitable[Dict]:
+    def setFontFamilies(
+        self, fontFamilies: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Set generic font families.
 
@@ -667,11 +827,19 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setFontFamilies`
 
         :param fontFamilies: Specifies font families to set. If a font family is not specified, it won't be changed.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setFontFamilies", {"fontFamilies": fontFamilies}
+            )
         return self.client.send("Page.setFontFamilies", {"fontFamilies": fontFamilies})
 
-    def setFontSizes(self, fontSizes: Dict[str, Any]) -> Awaitable[Dict]:
+    def setFontSizes(
+        self, fontSizes: Dict[str, Any], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Set default font sizes.
 
@@ -680,11 +848,19 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setFontSizes`
 
         :param fontSizes: Specifies font sizes to set. If a font size is not specified, it won't be changed.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setFontSizes", {"fontSizes": fontSizes}
+            )
         return self.client.send("Page.setFontSizes", {"fontSizes": fontSizes})
 
-    def setDocumentContent(self, frameId: str, html: str) -> Awaitable[Dict]:
+    def setDocumentContent(
+        self, frameId: str, html: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets given markup as the document's HTML.
 
@@ -692,15 +868,21 @@ class Page:
 
         :param frameId: Frame id to set HTML for.
         :param html: HTML content to set.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setDocumentContent", {"frameId": frameId, "html": html}
+            )
         return self.client.send(
             "Page.setDocumentContent", {"frameId": frameId, "html": html}
         )
 
     def setDownloadBehavior(
-        self, behavior: str, downloadPath: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, behavior: str, downloadPath: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Set the behavior when downloading a file.
 
@@ -711,11 +893,15 @@ class Page:
         :param behavior: Whether to allow all or deny all download requests, or use default Chrome behavior if
          available (otherwise deny).
         :param downloadPath: The default path to save downloaded files to. This is requred if behavior is set to 'allow'
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"behavior": behavior}
         if downloadPath is not None:
             msg["downloadPath"] = downloadPath
+        if nowait:
+            return self.client.send_nowait("Page.setDownloadBehavior", msg)
         return self.client.send("Page.setDownloadBehavior", msg)
 
     def setGeolocationOverride(
@@ -723,7 +909,8 @@ class Page:
         latitude: Optional[Union[int, float]] = None,
         longitude: Optional[Union[int, float]] = None,
         accuracy: Optional[Union[int, float]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Overrides the Geolocation Position or Error. Omitting any of the parameters emulates position
         unavailable.
@@ -735,6 +922,8 @@ class Page:
         :param latitude: Mock latitude
         :param longitude: Mock longitude
         :param accuracy: Mock accuracy
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -744,9 +933,13 @@ class Page:
             msg["longitude"] = longitude
         if accuracy is not None:
             msg["accuracy"] = accuracy
+        if nowait:
+            return self.client.send_nowait("Page.setGeolocationOverride", msg)
         return self.client.send("Page.setGeolocationOverride", msg)
 
-    def setLifecycleEventsEnabled(self, enabled: bool) -> Awaitable[Dict]:
+    def setLifecycleEventsEnabled(
+        self, enabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Controls whether page will emit lifecycle events.
 
@@ -755,13 +948,19 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setLifecycleEventsEnabled`
 
         :param enabled: If true, starts emitting lifecycle events.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setLifecycleEventsEnabled", {"enabled": enabled}
+            )
         return self.client.send("Page.setLifecycleEventsEnabled", {"enabled": enabled})
 
     def setTouchEmulationEnabled(
-        self, enabled: bool, configuration: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, enabled: bool, configuration: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Toggles mouse event-based touch event emulation.
 
@@ -771,11 +970,15 @@ class Page:
 
         :param enabled: Whether the touch event emulation should be enabled.
         :param configuration: Touch/gesture events configuration. Default: current platform.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"enabled": enabled}
         if configuration is not None:
             msg["configuration"] = configuration
+        if nowait:
+            return self.client.send_nowait("Page.setTouchEmulationEnabled", msg)
         return self.client.send("Page.setTouchEmulationEnabled", msg)
 
     def startScreencast(
@@ -785,7 +988,8 @@ class Page:
         maxWidth: Optional[int] = None,
         maxHeight: Optional[int] = None,
         everyNthFrame: Optional[int] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Starts sending each frame using the `screencastFrame` event.
 
@@ -798,6 +1002,8 @@ class Page:
         :param maxWidth: Maximum screenshot width.
         :param maxHeight: Maximum screenshot height.
         :param everyNthFrame: Send every n-th frame.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -811,19 +1017,25 @@ class Page:
             msg["maxHeight"] = maxHeight
         if everyNthFrame is not None:
             msg["everyNthFrame"] = everyNthFrame
+        if nowait:
+            return self.client.send_nowait("Page.startScreencast", msg)
         return self.client.send("Page.startScreencast", msg)
 
-    def stopLoading(self) -> Awaitable[Dict]:
+    def stopLoading(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Force the page stop all navigations and pending resource fetches.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-stopLoading`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.stopLoading", {})
         return self.client.send("Page.stopLoading", {})
 
-    def crash(self) -> Awaitable[Dict]:
+    def crash(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Crashes renderer on the IO thread, generates minidumps.
 
@@ -831,11 +1043,15 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-crash`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.crash", {})
         return self.client.send("Page.crash", {})
 
-    def close(self) -> Awaitable[Dict]:
+    def close(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Tries to close page, running its beforeunload hooks, if any.
 
@@ -843,11 +1059,17 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-close`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.close", {})
         return self.client.send("Page.close", {})
 
-    def setWebLifecycleState(self, state: str) -> Awaitable[Dict]:
+    def setWebLifecycleState(
+        self, state: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Tries to update the web lifecycle state of the page.
         It will transition the page to the given state according to:
@@ -858,11 +1080,17 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setWebLifecycleState`
 
         :param state: Target lifecycle state
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setWebLifecycleState", {"state": state}
+            )
         return self.client.send("Page.setWebLifecycleState", {"state": state})
 
-    def stopScreencast(self) -> Awaitable[Dict]:
+    def stopScreencast(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Stops sending each frame in the `screencastFrame`.
 
@@ -870,11 +1098,17 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-stopScreencast`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.stopScreencast", {})
         return self.client.send("Page.stopScreencast", {})
 
-    def setProduceCompilationCache(self, enabled: bool) -> Awaitable[Dict]:
+    def setProduceCompilationCache(
+        self, enabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Forces compilation cache to be generated for every subresource script.
 
@@ -883,11 +1117,19 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-setProduceCompilationCache`
 
         :param enabled: The enabled
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.setProduceCompilationCache", {"enabled": enabled}
+            )
         return self.client.send("Page.setProduceCompilationCache", {"enabled": enabled})
 
-    def addCompilationCache(self, url: str, data: str) -> Awaitable[Dict]:
+    def addCompilationCache(
+        self, url: str, data: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Seeds compilation cache for given url. Compilation cache does not survive
         cross-process navigation.
@@ -898,11 +1140,17 @@ class Page:
 
         :param url: The url
         :param data: Base64-encoded data
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Page.addCompilationCache", {"url": url, "data": data}
+            )
         return self.client.send("Page.addCompilationCache", {"url": url, "data": data})
 
-    def clearCompilationCache(self) -> Awaitable[Dict]:
+    def clearCompilationCache(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Clears seeded compilation cache.
 
@@ -910,13 +1158,17 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-clearCompilationCache`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.clearCompilationCache", {})
         return self.client.send("Page.clearCompilationCache", {})
 
     def generateTestReport(
-        self, message: str, group: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, message: str, group: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Generates a report for testing.
 
@@ -926,14 +1178,18 @@ class Page:
 
         :param message: Message to be displayed in the report.
         :param group: Specifies the endpoint group to deliver the report to.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"message": message}
         if group is not None:
             msg["group"] = group
+        if nowait:
+            return self.client.send_nowait("Page.generateTestReport", msg)
         return self.client.send("Page.generateTestReport", msg)
 
-    def waitForDebugger(self) -> Awaitable[Dict]:
+    def waitForDebugger(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Pauses page execution. Can be resumed using generic Runtime.runIfWaitingForDebugger.
 
@@ -941,37 +1197,46 @@ class Page:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#method-waitForDebugger`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Page.waitForDebugger", {})
         return self.client.send("Page.waitForDebugger", {})
 
+    @event_accessor("Page.domContentEventFired")
     def domContentEventFired(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-domContentEventFired`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.domContentEventFired"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameAttached")
     def frameAttached(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when frame has been attached to its parent.
@@ -979,26 +1244,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameAttached`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameAttached"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameClearedScheduledNavigation")
     def frameClearedScheduledNavigation(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when frame no longer has a scheduled navigation.
@@ -1006,26 +1272,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameClearedScheduledNavigation`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameClearedScheduledNavigation"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameDetached")
     def frameDetached(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when frame has been detached from its parent.
@@ -1033,26 +1300,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameDetached`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameDetached"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameNavigated")
     def frameNavigated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired once navigation of the frame has completed. Frame is now associated with the new loader.
@@ -1060,49 +1328,53 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameNavigated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameNavigated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
-    def frameResized(self, listener: Optional[Callable[[Any], Any]] = None) -> Any:
+    @event_accessor("Page.frameResized")
+    def frameResized(
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameResized`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameResized"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameRequestedNavigation")
     def frameRequestedNavigation(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when a renderer-initiated navigation is requested.
@@ -1111,26 +1383,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameRequestedNavigation`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameRequestedNavigation"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameScheduledNavigation")
     def frameScheduledNavigation(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when frame schedules a potential navigation.
@@ -1138,26 +1411,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameScheduledNavigation`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameScheduledNavigation"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameStartedLoading")
     def frameStartedLoading(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when frame has started loading.
@@ -1165,26 +1439,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameStartedLoading`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameStartedLoading"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.frameStoppedLoading")
     def frameStoppedLoading(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when frame has stopped loading.
@@ -1192,26 +1467,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-frameStoppedLoading`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.frameStoppedLoading"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.interstitialHidden")
     def interstitialHidden(
-        self, listener: Optional[Callable[[Any], Any]] = None
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when interstitial page was hidden
@@ -1219,51 +1495,55 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-interstitialHidden`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.interstitialHidden"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
-    def interstitialShown(self, listener: Optional[Callable[[Any], Any]] = None) -> Any:
+    @event_accessor("Page.interstitialShown")
+    def interstitialShown(
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
         """
         Fired when interstitial page was shown
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-interstitialShown`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.interstitialShown"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.javascriptDialogClosed")
     def javascriptDialogClosed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) has been
@@ -1272,26 +1552,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-javascriptDialogClosed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.javascriptDialogClosed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.javascriptDialogOpening")
     def javascriptDialogOpening(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when a JavaScript initiated dialog (alert, confirm, prompt, or onbeforeunload) is about to
@@ -1300,26 +1581,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-javascriptDialogOpening`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.javascriptDialogOpening"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.lifecycleEvent")
     def lifecycleEvent(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired for top level page lifecycle events such as navigation, load, paint, etc.
@@ -1327,51 +1609,53 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-lifecycleEvent`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.lifecycleEvent"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.loadEventFired")
     def loadEventFired(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-loadEventFired`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.loadEventFired"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.navigatedWithinDocument")
     def navigatedWithinDocument(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when same-document navigation happens, e.g. due to history API usage or anchor navigation.
@@ -1379,26 +1663,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-navigatedWithinDocument`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.navigatedWithinDocument"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.screencastFrame")
     def screencastFrame(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Compressed image data requested by the `startScreencast`.
@@ -1406,26 +1691,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-screencastFrame`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.screencastFrame"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.screencastVisibilityChanged")
     def screencastVisibilityChanged(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when the page with currently enabled screencast was shown or hidden `.
@@ -1433,26 +1719,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-screencastVisibilityChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.screencastVisibilityChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.windowOpen")
     def windowOpen(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Fired when a new window is going to be opened, via window.open(), link click, form submission,
@@ -1461,26 +1748,27 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-windowOpen`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.windowOpen"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Page.compilationCacheProduced")
     def compilationCacheProduced(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued for every compilation cache generated. Is only available
@@ -1489,20 +1777,17 @@ class Page:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Page#event-compilationCacheProduced`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Page.compilationCacheProduced"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -21,27 +23,37 @@ class Performance:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disable collecting and reporting metrics.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Performance#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Performance.disable", {})
         return self.client.send("Performance.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enable collecting and reporting metrics.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Performance#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Performance.enable", {})
         return self.client.send("Performance.enable", {})
 
-    def setTimeDomain(self, timeDomain: str) -> Awaitable[Dict]:
+    def setTimeDomain(
+        self, timeDomain: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sets time domain to use for collecting and reporting duration metrics.
         Note that this must be called before enabling metrics collection. Calling
@@ -52,8 +64,14 @@ class Performance:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Performance#method-setTimeDomain`
 
         :param timeDomain: Time domain
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Performance.setTimeDomain", {"timeDomain": timeDomain}
+            )
         return self.client.send("Performance.setTimeDomain", {"timeDomain": timeDomain})
 
     def getMetrics(self) -> Awaitable[Dict]:
@@ -66,8 +84,12 @@ class Performance:
         """
         return self.client.send("Performance.getMetrics", {})
 
+    @event_accessor("Performance.metrics")
     def metrics(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Current values of the metrics.
@@ -75,20 +97,17 @@ class Performance:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Performance#event-metrics`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Performance.metrics"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
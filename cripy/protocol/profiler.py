@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -25,20 +27,28 @@ class Profiler:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Profiler.disable", {})
         return self.client.send("Profiler.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Profiler.enable", {})
         return self.client.send("Profiler.enable", {})
 
     def getBestEffortCoverage(self) -> Awaitable[Dict]:
@@ -52,28 +62,43 @@ class Profiler:
         """
         return self.client.send("Profiler.getBestEffortCoverage", {})
 
-    def setSamplingInterval(self, interval: int) -> Awaitable[Dict]:
+    def setSamplingInterval(
+        self, interval: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Changes CPU profiler sampling interval. Must be called before CPU profiles recording started.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-setSamplingInterval`
 
         :param interval: New sampling interval in microseconds.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Profiler.setSamplingInterval", {"interval": interval}
+            )
         return self.client.send("Profiler.setSamplingInterval", {"interval": interval})
 
-    def start(self) -> Awaitable[Dict]:
+    def start(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-start`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Profiler.start", {})
         return self.client.send("Profiler.start", {})
 
     def startPreciseCoverage(
-        self, callCount: Optional[bool] = None, detailed: Optional[bool] = None
-    ) -> Awaitable[Dict]:
+        self,
+        callCount: Optional[bool] = None,
+        detailed: Optional[bool] = None,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enable precise code coverage. Coverage data for JavaScript executed before enabling precise code
         coverage may be incomplete. Enabling prevents running optimized code and resets execution
@@ -83,6 +108,8 @@ class Profiler:
 
         :param callCount: Collect accurate call counts beyond simple 'covered' or 'not covered'.
         :param detailed: Collect block-based coverage.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -90,9 +117,11 @@ class Profiler:
             msg["callCount"] = callCount
         if detailed is not None:
             msg["detailed"] = detailed
+        if nowait:
+            return self.client.send_nowait("Profiler.startPreciseCoverage", msg)
         return self.client.send("Profiler.startPreciseCoverage", msg)
 
-    def startTypeProfile(self) -> Awaitable[Dict]:
+    def startTypeProfile(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enable type profile.
 
@@ -100,8 +129,12 @@ class Profiler:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-startTypeProfile`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Profiler.startTypeProfile", {})
         return self.client.send("Profiler.startTypeProfile", {})
 
     def stop(self) -> Awaitable[Dict]:
@@ -112,18 +145,22 @@ class Profiler:
         """
         return self.client.send("Profiler.stop", {})
 
-    def stopPreciseCoverage(self) -> Awaitable[Dict]:
+    def stopPreciseCoverage(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disable precise code coverage. Disabling releases unnecessary execution count records and allows
         executing optimized code.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-stopPreciseCoverage`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Profiler.stopPreciseCoverage", {})
         return self.client.send("Profiler.stopPreciseCoverage", {})
 
-    def stopTypeProfile(self) -> Awaitable[Dict]:
+    def stopTypeProfile(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disable type profile. Disabling releases type profile data collected so far.
 
@@ -131,8 +168,12 @@ class Profiler:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#method-stopTypeProfile`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Profiler.stopTypeProfile", {})
         return self.client.send("Profiler.stopTypeProfile", {})
 
     def takePreciseCoverage(self) -> Awaitable[Dict]:
@@ -158,33 +199,38 @@ class Profiler:
         """
         return self.client.send("Profiler.takeTypeProfile", {})
 
+    @event_accessor("Profiler.consoleProfileFinished")
     def consoleProfileFinished(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#event-consoleProfileFinished`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Profiler.consoleProfileFinished"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Profiler.consoleProfileStarted")
     def consoleProfileStarted(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Sent when new profile recording is started using console.profile() call.
@@ -192,20 +238,17 @@ class Profiler:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Profiler#event-consoleProfileStarted`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Profiler.consoleProfileStarted"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -136,27 +138,35 @@ class Runtime:
             msg["executionContextId"] = executionContextId
         return self.client.send("Runtime.compileScript", msg)
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables reporting of execution contexts creation.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Runtime.disable", {})
         return self.client.send("Runtime.disable", {})
 
-    def discardConsoleEntries(self) -> Awaitable[Dict]:
+    def discardConsoleEntries(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Discards collected exceptions and console API calls.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-discardConsoleEntries`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Runtime.discardConsoleEntries", {})
         return self.client.send("Runtime.discardConsoleEntries", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables reporting of execution contexts creation by means of `executionContextCreated` event.
         When the reporting gets enabled the event will be sent immediately for each existing execution
@@ -164,8 +174,12 @@ class Runtime:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Runtime.enable", {})
         return self.client.send("Runtime.enable", {})
 
     def evaluate(
@@ -312,38 +326,60 @@ class Runtime:
             msg["objectGroup"] = objectGroup
         return self.client.send("Runtime.queryObjects", msg)
 
-    def releaseObject(self, objectId: str) -> Awaitable[Dict]:
+    def releaseObject(
+        self, objectId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Releases remote object with given id.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-releaseObject`
 
         :param objectId: Identifier of the object to release.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Runtime.releaseObject", {"objectId": objectId}
+            )
         return self.client.send("Runtime.releaseObject", {"objectId": objectId})
 
-    def releaseObjectGroup(self, objectGroup: str) -> Awaitable[Dict]:
+    def releaseObjectGroup(
+        self, objectGroup: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Releases all remote objects that belong to a given group.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-releaseObjectGroup`
 
         :param objectGroup: Symbolic object group name.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Runtime.releaseObjectGroup", {"objectGroup": objectGroup}
+            )
         return self.client.send(
             "Runtime.releaseObjectGroup", {"objectGroup": objectGroup}
         )
 
-    def runIfWaitingForDebugger(self) -> Awaitable[Dict]:
+    def runIfWaitingForDebugger(
+        self, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Tells inspected instance to run if it was waiting for debugger to attach.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-runIfWaitingForDebugger`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Runtime.runIfWaitingForDebugger", {})
         return self.client.send("Runtime.runIfWaitingForDebugger", {})
 
     def runScript(
@@ -392,7 +428,9 @@ class Runtime:
             msg["awaitPromise"] = awaitPromise
         return self.client.send("Runtime.runScript", msg)
 
-    def setAsyncCallStackDepth(self, maxDepth: int) -> Awaitable[Dict]:
+    def setAsyncCallStackDepth(
+        self, maxDepth: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables or disables async call stacks tracking.
 
@@ -400,37 +438,59 @@ class Runtime:
 
         :param maxDepth: Maximum depth of async call stacks. Setting to `0` will effectively disable collecting async
          call stacks (default).
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Runtime.setAsyncCallStackDepth", {"maxDepth": maxDepth}
+            )
         return self.client.send(
             "Runtime.setAsyncCallStackDepth", {"maxDepth": maxDepth}
         )
 
-    def setCustomObjectFormatterEnabled(self, enabled: bool) -> Awaitable[Dict]:
+    def setCustomObjectFormatterEnabled(
+        self, enabled: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Status: Experimental
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-setCustomObjectFormatterEnabled`
 
         :param enabled: The enabled
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Runtime.setCustomObjectFormatterEnabled", {"enabled": enabled}
+            )
         return self.client.send(
             "Runtime.setCustomObjectFormatterEnabled", {"enabled": enabled}
         )
 
-    def setMaxCallStackSizeToCapture(self, size: int) -> Awaitable[Dict]:
+    def setMaxCallStackSizeToCapture(
+        self, size: int, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Status: Experimental
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-setMaxCallStackSizeToCapture`
 
         :param size: The size
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Runtime.setMaxCallStackSizeToCapture", {"size": size}
+            )
         return self.client.send("Runtime.setMaxCallStackSizeToCapture", {"size": size})
 
-    def terminateExecution(self) -> Awaitable[Dict]:
+    def terminateExecution(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Terminate current or next JavaScript execution.
         Will cancel the termination when the outer-most script execution ends.
@@ -439,13 +499,17 @@ class Runtime:
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-terminateExecution`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Runtime.terminateExecution", {})
         return self.client.send("Runtime.terminateExecution", {})
 
     def addBinding(
-        self, name: str, executionContextId: Optional[int] = None
-    ) -> Awaitable[Dict]:
+        self, name: str, executionContextId: Optional[int] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         If executionContextId is empty, adds binding with the given name on the
         global objects of all inspected contexts, including those created later,
@@ -462,14 +526,20 @@ class Runtime:
 
         :param name: The name
         :param executionContextId: The executionContextId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"name": name}
         if executionContextId is not None:
             msg["executionContextId"] = executionContextId
+        if nowait:
+            return self.client.send_nowait("Runtime.addBinding", msg)
         return self.client.send("Runtime.addBinding", msg)
 
-    def removeBinding(self, name: str) -> Awaitable[Dict]:
+    def removeBinding(
+        self, name: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         This method does not remove binding function from global object but
         unsubscribes current runtime agent from Runtime.bindingCalled notifications.
@@ -479,12 +549,20 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#method-removeBinding`
 
         :param name: The name
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Runtime.removeBinding", {"name": name})
         return self.client.send("Runtime.removeBinding", {"name": name})
 
+    @event_accessor("Runtime.bindingCalled")
     def bindingCalled(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Notification is issued every time when binding is called.
@@ -492,26 +570,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-bindingCalled`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.bindingCalled"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.consoleAPICalled")
     def consoleAPICalled(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when console API was called.
@@ -519,26 +598,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-consoleAPICalled`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.consoleAPICalled"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.exceptionRevoked")
     def exceptionRevoked(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when unhandled exception was revoked.
@@ -546,26 +626,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-exceptionRevoked`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.exceptionRevoked"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.exceptionThrown")
     def exceptionThrown(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when exception was thrown and unhandled.
@@ -573,26 +654,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-exceptionThrown`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.exceptionThrown"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.executionContextCreated")
     def executionContextCreated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when new execution context is created.
@@ -600,26 +682,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-executionContextCreated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.executionContextCreated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.executionContextDestroyed")
     def executionContextDestroyed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when execution context is destroyed.
@@ -627,26 +710,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-executionContextDestroyed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.executionContextDestroyed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.executionContextsCleared")
     def executionContextsCleared(
-        self, listener: Optional[Callable[[Any], Any]] = None
+        self,
+        listener: Optional[Callable[[Any], Any]] = None,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when all executionContexts were cleared in browser
@@ -654,26 +738,27 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-executionContextsCleared`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.executionContextsCleared"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Runtime.inspectRequested")
     def inspectRequested(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when object should be inspected (for example, as a result of inspect() command line API
@@ -682,20 +767,17 @@ class Runtime:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Runtime#event-inspectRequested`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Runtime.inspectRequested"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -23,27 +25,37 @@ class Security:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Disables tracking security state changes.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Security#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Security.disable", {})
         return self.client.send("Security.disable", {})
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Enables tracking security state changes.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Security#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Security.enable", {})
         return self.client.send("Security.enable", {})
 
-    def setIgnoreCertificateErrors(self, ignore: bool) -> Awaitable[Dict]:
+    def setIgnoreCertificateErrors(
+        self, ignore: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enable/disable whether all certificate errors should be ignored.
 
@@ -52,13 +64,21 @@ class Security:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Security#method-setIgnoreCertificateErrors`
 
         :param ignore: If true, all certificate errors will be ignored.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Security.setIgnoreCertificateErrors", {"ignore": ignore}
+            )
         return self.client.send(
             "Security.setIgnoreCertificateErrors", {"ignore": ignore}
         )
 
-    def handleCertificateError(self, eventId: int, action: str) -> Awaitable[Dict]:
+    def handleCertificateError(
+        self, eventId: int, action: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Handles a certificate error that fired a certificateError event.
 
@@ -68,13 +88,22 @@ class Security:
 
         :param eventId: The ID of the event.
         :param action: The action to take on the certificate error.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Security.handleCertificateError",
+                {"eventId": eventId, "action": action},
+            )
         return self.client.send(
             "Security.handleCertificateError", {"eventId": eventId, "action": action}
         )
 
-    def setOverrideCertificateErrors(self, override: bool) -> Awaitable[Dict]:
+    def setOverrideCertificateErrors(
+        self, override: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enable/disable overriding certificate errors. If enabled, all certificate error events need to
         be handled by the DevTools client and should be answered with `handleCertificateError` commands.
@@ -84,14 +113,24 @@ class Security:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Security#method-setOverrideCertificateErrors`
 
         :param override: If true, certificate errors will be overridden.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Security.setOverrideCertificateErrors", {"override": override}
+            )
         return self.client.send(
             "Security.setOverrideCertificateErrors", {"override": override}
         )
 
+    @event_accessor("Security.certificateError")
     def certificateError(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         There is a certificate error. If overriding certificate errors is enabled, then it should be
@@ -102,26 +141,27 @@ class Security:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Security#event-certificateError`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Security.certificateError"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Security.securityStateChanged")
     def securityStateChanged(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         The security state of the page changed.
@@ -129,20 +169,17 @@ class Security:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Security#event-securityStateChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Security.securityStateChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -24,32 +26,48 @@ class ServiceWorker:
         self.client: Union["ConnectionType", "SessionType"] = client
 
     def deliverPushMessage(
-        self, origin: str, registrationId: str, data: str
-    ) -> Awaitable[Dict]:
+        self, origin: str, registrationId: str, data: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-deliverPushMessage`
 
         :param origin: The origin
         :param registrationId: The registrationId
         :param data: The data
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.deliverPushMessage",
+                {"origin": origin, "registrationId": registrationId, "data": data},
+            )
         return self.client.send(
             "ServiceWorker.deliverPushMessage",
             {"origin": origin, "registrationId": registrationId, "data": data},
         )
 
-    def disable(self) -> Awaitable[Dict]:
+    def disable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-disable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("ServiceWorker.disable", {})
         return self.client.send("ServiceWorker.disable", {})
 
     def dispatchSyncEvent(
-        self, origin: str, registrationId: str, tag: str, lastChance: bool
-    ) -> Awaitable[Dict]:
+        self,
+        origin: str,
+        registrationId: str,
+        tag: str,
+        lastChance: bool,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-dispatchSyncEvent`
 
@@ -57,8 +75,20 @@ class ServiceWorker:
         :param registrationId: The registrationId
         :param tag: The tag
         :param lastChance: The lastChance
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.dispatchSyncEvent",
+                {
+                    "origin": origin,
+                    "registrationId": registrationId,
+                    "tag": tag,
+                    "lastChance": lastChance,
+                },
+            )
         return self.client.send(
             "ServiceWorker.dispatchSyncEvent",
             {
@@ -69,161 +99,229 @@ class ServiceWorker:
             },
         )
 
-    def enable(self) -> Awaitable[Dict]:
+    def enable(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-enable`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("ServiceWorker.enable", {})
         return self.client.send("ServiceWorker.enable", {})
 
-    def inspectWorker(self, versionId: str) -> Awaitable[Dict]:
+    def inspectWorker(
+        self, versionId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-inspectWorker`
 
         :param versionId: The versionId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.inspectWorker", {"versionId": versionId}
+            )
         return self.client.send("ServiceWorker.inspectWorker", {"versionId": versionId})
 
-    def setForceUpdateOnPageLoad(self, forceUpdateOnPageLoad: bool) -> Awaitable[Dict]:
+    def setForceUpdateOnPageLoad(
+        self, forceUpdateOnPageLoad: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-setForceUpdateOnPageLoad`
 
         :param forceUpdateOnPageLoad: The forceUpdateOnPageLoad
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.setForceUpdateOnPageLoad",
+                {"forceUpdateOnPageLoad": forceUpdateOnPageLoad},
+            )
         return self.client.send(
             "ServiceWorker.setForceUpdateOnPageLoad",
             {"forceUpdateOnPageLoad": forceUpdateOnPageLoad},
         )
 
-    def skipWaiting(self, scopeURL: str) -> Awaitable[Dict]:
+    def skipWaiting(
+        self, scopeURL: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-skipWaiting`
 
         :param scopeURL: The scopeURL
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.skipWaiting", {"scopeURL": scopeURL}
+            )
         return self.client.send("ServiceWorker.skipWaiting", {"scopeURL": scopeURL})
 
-    def startWorker(self, scopeURL: str) -> Awaitable[Dict]:
+    def startWorker(
+        self, scopeURL: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-startWorker`
 
         :param scopeURL: The scopeURL
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.startWorker", {"scopeURL": scopeURL}
+            )
         return self.client.send("ServiceWorker.startWorker", {"scopeURL": scopeURL})
 
-    def stopAllWorkers(self) -> Awaitable[Dict]:
+    def stopAllWorkers(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-stopAllWorkers`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("ServiceWorker.stopAllWorkers", {})
         return self.client.send("ServiceWorker.stopAllWorkers", {})
 
-    def stopWorker(self, versionId: str) -> Awaitable[Dict]:
+    def stopWorker(
+        self, versionId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-stopWorker`
 
         :param versionId: The versionId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.stopWorker", {"versionId": versionId}
+            )
         return self.client.send("ServiceWorker.stopWorker", {"versionId": versionId})
 
-    def unregister(self, scopeURL: str) -> Awaitable[Dict]:
+    def unregister(
+        self, scopeURL: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-unregister`
 
         :param scopeURL: The scopeURL
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.unregister", {"scopeURL": scopeURL}
+            )
         return self.client.send("ServiceWorker.unregister", {"scopeURL": scopeURL})
 
-    def updateRegistration(self, scopeURL: str) -> Awaitable[Dict]:
+    def updateRegistration(
+        self, scopeURL: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#method-updateRegistration`
 
         :param scopeURL: The scopeURL
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "ServiceWorker.updateRegistration", {"scopeURL": scopeURL}
+            )
         return self.client.send(
             "ServiceWorker.updateRegistration", {"scopeURL": scopeURL}
         )
 
+    @event_accessor("ServiceWorker.workerErrorReported")
     def workerErrorReported(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#event-workerErrorReported`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "ServiceWorker.workerErrorReported"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("ServiceWorker.workerRegistrationUpdated")
     def workerRegistrationUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#event-workerRegistrationUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "ServiceWorker.workerRegistrationUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("ServiceWorker.workerVersionUpdated")
     def workerVersionUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/ServiceWorker#event-workerVersionUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "ServiceWorker.workerVersionUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
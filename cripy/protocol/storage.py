@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -23,7 +25,9 @@ class Storage:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def clearDataForOrigin(self, origin: str, storageTypes: str) -> Awaitable[Dict]:
+    def clearDataForOrigin(
+        self, origin: str, storageTypes: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Clears storage for origin.
 
@@ -31,8 +35,15 @@ class Storage:
 
         :param origin: Security origin.
         :param storageTypes: Comma separated list of StorageType to clear.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": storageTypes},
+            )
         return self.client.send(
             "Storage.clearDataForOrigin",
             {"origin": origin, "storageTypes": storageTypes},
@@ -49,56 +60,92 @@ class Storage:
         """
         return self.client.send("Storage.getUsageAndQuota", {"origin": origin})
 
-    def trackCacheStorageForOrigin(self, origin: str) -> Awaitable[Dict]:
+    def trackCacheStorageForOrigin(
+        self, origin: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Registers origin to be notified when an update occurs to its cache storage list.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#method-trackCacheStorageForOrigin`
 
         :param origin: Security origin.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Storage.trackCacheStorageForOrigin", {"origin": origin}
+            )
         return self.client.send(
             "Storage.trackCacheStorageForOrigin", {"origin": origin}
         )
 
-    def trackIndexedDBForOrigin(self, origin: str) -> Awaitable[Dict]:
+    def trackIndexedDBForOrigin(
+        self, origin: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Registers origin to be notified when an update occurs to its IndexedDB.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#method-trackIndexedDBForOrigin`
 
         :param origin: Security origin.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Storage.trackIndexedDBForOrigin", {"origin": origin}
+            )
         return self.client.send("Storage.trackIndexedDBForOrigin", {"origin": origin})
 
-    def untrackCacheStorageForOrigin(self, origin: str) -> Awaitable[Dict]:
+    def untrackCacheStorageForOrigin(
+        self, origin: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Unregisters origin from receiving notifications for cache storage.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#method-untrackCacheStorageForOrigin`
 
         :param origin: Security origin.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Storage.untrackCacheStorageForOrigin", {"origin": origin}
+            )
         return self.client.send(
             "Storage.untrackCacheStorageForOrigin", {"origin": origin}
         )
 
-    def untrackIndexedDBForOrigin(self, origin: str) -> Awaitable[Dict]:
+    def untrackIndexedDBForOrigin(
+        self, origin: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Unregisters origin from receiving notifications for IndexedDB.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#method-untrackIndexedDBForOrigin`
 
         :param origin: Security origin.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Storage.untrackIndexedDBForOrigin", {"origin": origin}
+            )
         return self.client.send("Storage.untrackIndexedDBForOrigin", {"origin": origin})
 
+    @event_accessor("Storage.cacheStorageContentUpdated")
     def cacheStorageContentUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         A cache's contents have been modified.
@@ -106,26 +153,27 @@ class Storage:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#event-cacheStorageContentUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Storage.cacheStorageContentUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Storage.cacheStorageListUpdated")
     def cacheStorageListUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         A cache has been added/deleted.
@@ -133,26 +181,27 @@ class Storage:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#event-cacheStorageListUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Storage.cacheStorageListUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Storage.indexedDBContentUpdated")
     def indexedDBContentUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         The origin's IndexedDB object store has been modified.
@@ -160,26 +209,27 @@ class Storage:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#event-indexedDBContentUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Storage.indexedDBContentUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Storage.indexedDBListUpdated")
     def indexedDBListUpdated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         The origin's IndexedDB database list has been modified.
@@ -187,20 +237,17 @@ class Storage:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Storage#event-indexedDBListUpdated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Storage.indexedDBListUpdated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -23,15 +25,23 @@ class Target:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def activateTarget(self, targetId: str) -> Awaitable[Dict]:
+    def activateTarget(
+        self, targetId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Activates (focuses) the target.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#method-activateTarget`
 
         :param targetId: The targetId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Target.activateTarget", {"targetId": targetId}
+            )
         return self.client.send("Target.activateTarget", {"targetId": targetId})
 
     def attachToTarget(
@@ -75,8 +85,8 @@ class Target:
         return self.client.send("Target.closeTarget", {"targetId": targetId})
 
     def exposeDevToolsProtocol(
-        self, targetId: str, bindingName: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self, targetId: str, bindingName: Optional[str] = None, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Inject object to the target's main frame that provides a communication
         channel with browser target.
@@ -93,11 +103,15 @@ class Target:
 
         :param targetId: The targetId
         :param bindingName: Binding name, 'cdp' if not specified.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"targetId": targetId}
         if bindingName is not None:
             msg["bindingName"] = bindingName
+        if nowait:
+            return self.client.send_nowait("Target.exposeDevToolsProtocol", msg)
         return self.client.send("Target.exposeDevToolsProtocol", msg)
 
     def createBrowserContext(self) -> Awaitable[Dict]:
@@ -158,8 +172,11 @@ class Target:
         return self.client.send("Target.createTarget", msg)
 
     def detachFromTarget(
-        self, sessionId: Optional[str] = None, targetId: Optional[str] = None
-    ) -> Awaitable[Dict]:
+        self,
+        sessionId: Optional[str] = None,
+        targetId: Optional[str] = None,
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Detaches session with given id.
 
@@ -167,6 +184,8 @@ class Target:
 
         :param sessionId: Session to detach.
         :param targetId: Deprecated.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -174,9 +193,13 @@ class Target:
             msg["sessionId"] = sessionId
         if targetId is not None:
             msg["targetId"] = targetId
+        if nowait:
+            return self.client.send_nowait("Target.detachFromTarget", msg)
         return self.client.send("Target.detachFromTarget", msg)
 
-    def disposeBrowserContext(self, browserContextId: str) -> Awaitable[Dict]:
+    def disposeBrowserContext(
+        self, browserContextId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Deletes a BrowserContext. All the belonging pages will be closed without calling their
         beforeunload hooks.
@@ -186,8 +209,14 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#method-disposeBrowserContext`
 
         :param browserContextId: The browserContextId
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Target.disposeBrowserContext", {"browserContextId": browserContextId}
+            )
         return self.client.send(
             "Target.disposeBrowserContext", {"browserContextId": browserContextId}
         )
@@ -223,7 +252,8 @@ class Target:
         message: str,
         sessionId: Optional[str] = None,
         targetId: Optional[str] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Sends protocol message over session with given id.
 
@@ -232,6 +262,8 @@ class Target:
         :param message: The message
         :param sessionId: Identifier of the session.
         :param targetId: Deprecated.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {"message": message}
@@ -239,6 +271,8 @@ class Target:
             msg["sessionId"] = sessionId
         if targetId is not None:
             msg["targetId"] = targetId
+        if nowait:
+            return self.client.send_nowait("Target.sendMessageToTarget", msg)
         return self.client.send("Target.sendMessageToTarget", msg)
 
     def setAutoAttach(
@@ -246,7 +280,8 @@ class Target:
         autoAttach: bool,
         waitForDebuggerOnStart: bool,
         flatten: Optional[bool] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Controls whether to automatically attach to new targets which are considered to be related to
         this one. When turned on, attaches to all existing related targets as well. When turned off,
@@ -260,6 +295,8 @@ class Target:
         :param waitForDebuggerOnStart: Whether to pause new targets when attaching to them. Use `Runtime.runIfWaitingForDebugger`
          to run paused targets.
         :param flatten: Enables "flat" access to the session via specifying sessionId attribute in the commands.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {
@@ -268,9 +305,13 @@ class Target:
         }
         if flatten is not None:
             msg["flatten"] = flatten
+        if nowait:
+            return self.client.send_nowait("Target.setAutoAttach", msg)
         return self.client.send("Target.setAutoAttach", msg)
 
-    def setDiscoverTargets(self, discover: bool) -> Awaitable[Dict]:
+    def setDiscoverTargets(
+        self, discover: bool, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Controls whether to discover available targets and notify via
         `targetCreated/targetInfoChanged/targetDestroyed` events.
@@ -278,11 +319,19 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#method-setDiscoverTargets`
 
         :param discover: Whether to discover available targets.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Target.setDiscoverTargets", {"discover": discover}
+            )
         return self.client.send("Target.setDiscoverTargets", {"discover": discover})
 
-    def setRemoteLocations(self, locations: List[Dict[str, Any]]) -> Awaitable[Dict]:
+    def setRemoteLocations(
+        self, locations: List[Dict[str, Any]], nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Enables target discovery for the specified locations, when `setDiscoverTargets` was set to
         `true`.
@@ -292,12 +341,22 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#method-setRemoteLocations`
 
         :param locations: List of remote locations.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Target.setRemoteLocations", {"locations": locations}
+            )
         return self.client.send("Target.setRemoteLocations", {"locations": locations})
 
+    @event_accessor("Target.attachedToTarget")
     def attachedToTarget(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when attached to target because of auto-attach or `attachToTarget` command.
@@ -305,26 +364,27 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-attachedToTarget`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.attachedToTarget"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Target.detachedFromTarget")
     def detachedFromTarget(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when detached from target for any reason (including `detachFromTarget` command). Can be
@@ -333,26 +393,27 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-detachedFromTarget`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.detachedFromTarget"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Target.receivedMessageFromTarget")
     def receivedMessageFromTarget(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Notifies about a new protocol message received from the session (as reported in
@@ -361,26 +422,27 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-receivedMessageFromTarget`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.receivedMessageFromTarget"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Target.targetCreated")
     def targetCreated(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when a possible inspection target is created.
@@ -388,26 +450,27 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-targetCreated`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.targetCreated"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Target.targetDestroyed")
     def targetDestroyed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when a target is destroyed.
@@ -415,26 +478,27 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-targetDestroyed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.targetDestroyed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Target.targetCrashed")
     def targetCrashed(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when a target has crashed.
@@ -442,26 +506,27 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-targetCrashed`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.targetCrashed"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Target.targetInfoChanged")
     def targetInfoChanged(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Issued when some information about a target has changed. This only happens between
@@ -470,20 +535,17 @@ class Target:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Target#event-targetInfoChanged`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Target.targetInfoChanged"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
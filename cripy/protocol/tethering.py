@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -24,30 +26,42 @@ class Tethering:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def bind(self, port: int) -> Awaitable[Dict]:
+    def bind(self, port: int, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Request browser port binding.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tethering#method-bind`
 
         :param port: Port number to bind.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Tethering.bind", {"port": port})
         return self.client.send("Tethering.bind", {"port": port})
 
-    def unbind(self, port: int) -> Awaitable[Dict]:
+    def unbind(self, port: int, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Request browser port unbinding.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tethering#method-unbind`
 
         :param port: Port number to unbind.
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Tethering.unbind", {"port": port})
         return self.client.send("Tethering.unbind", {"port": port})
 
+    @event_accessor("Tethering.accepted")
     def accepted(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Informs that port was successfully bound and got a specified connection id.
@@ -55,20 +69,17 @@ class Tethering:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tethering#event-accepted`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Tethering.accepted"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
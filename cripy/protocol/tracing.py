@@ -1,6 +1,8 @@
 """This is an auto-generated file. Modify at your own risk"""
 from typing import Awaitable, Any, Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
+from cripy.stream import event_accessor
+
 if TYPE_CHECKING:
     from cripy import ConnectionType, SessionType
 
@@ -25,14 +27,18 @@ class Tracing:
         """
         self.client: Union["ConnectionType", "SessionType"] = client
 
-    def end(self) -> Awaitable[Dict]:
+    def end(self, nowait: bool = False) -> Optional[Awaitable[Dict]]:
         """
         Stop trace events collection.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tracing#method-end`
 
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait("Tracing.end", {})
         return self.client.send("Tracing.end", {})
 
     def getCategories(self) -> Awaitable[Dict]:
@@ -45,15 +51,23 @@ class Tracing:
         """
         return self.client.send("Tracing.getCategories", {})
 
-    def recordClockSyncMarker(self, syncId: str) -> Awaitable[Dict]:
+    def recordClockSyncMarker(
+        self, syncId: str, nowait: bool = False
+    ) -> Optional[Awaitable[Dict]]:
         """
         Record a clock sync marker in the trace.
 
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tracing#method-recordClockSyncMarker`
 
         :param syncId: The ID of this clock sync marker
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
+        if nowait:
+            return self.client.send_nowait(
+                "Tracing.recordClockSyncMarker", {"syncId": syncId}
+            )
         return self.client.send("Tracing.recordClockSyncMarker", {"syncId": syncId})
 
     def requestMemoryDump(self) -> Awaitable[Dict]:
@@ -75,7 +89,8 @@ class Tracing:
         streamFormat: Optional[str] = None,
         streamCompression: Optional[str] = None,
         traceConfig: Optional[Dict[str, Any]] = None,
-    ) -> Awaitable[Dict]:
+        nowait: bool = False,
+    ) -> Optional[Awaitable[Dict]]:
         """
         Start trace events collection.
 
@@ -91,6 +106,8 @@ class Tracing:
         :param streamCompression: Compression format to use. This only applies when using `ReturnAsStream`
          transfer mode (defaults to `none`)
         :param traceConfig: The traceConfig
+        :param nowait: Send the command without waiting for its response, only errors are
+        tracked using the clients notification_errors. If true None is returned
         :return: The results of the command
         """
         msg = {}
@@ -108,35 +125,42 @@ class Tracing:
             msg["streamCompression"] = streamCompression
         if traceConfig is not None:
             msg["traceConfig"] = traceConfig
+        if nowait:
+            return self.client.send_nowait("Tracing.start", msg)
         return self.client.send("Tracing.start", msg)
 
+    @event_accessor("Tracing.bufferUsage")
     def bufferUsage(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tracing#event-bufferUsage`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Tracing.bufferUsage"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Tracing.dataCollected")
     def dataCollected(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Contains an bucket of collected trace events. When tracing is stopped collected events will be
@@ -145,26 +169,27 @@ class Tracing:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tracing#event-dataCollected`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Tracing.dataCollected"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
 
+    @event_accessor("Tracing.tracingComplete")
     def tracingComplete(
-        self, listener: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self,
+        listener: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
         """
         Signals that tracing is stopped and there is no trace buffers pending flush, all data were
@@ -173,20 +198,17 @@ class Tracing:
         See `https://chromedevtools.github.io/devtools-protocol/tot/Tracing#event-tracingComplete`
 
         :param listener: Optional listener function
+        :param predicate: Optional function called with each event, when no listener
+        was supplied, that returns T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event, when no
+        listener was supplied, before failing with EventTimeoutError
         :return: If a listener was supplied the return value is a callable that
         will remove the supplied listener otherwise a future that resolves
         with the value of the event
         """
         event_name = "Tracing.tracingComplete"
         if listener is None:
-            future = self.client.loop.create_future()
-
-            def _listener(event: Optional[Dict] = None) -> None:
-                future.set_result(event)
-
-            self.client.once(event_name, _listener)
-
-            return future
+            return self.client.wait_for(event_name, predicate, timeout)
 
         self.client.on(event_name, listener)
         return lambda: self.client.remove_listener(event_name, listener)
@@ -471,10 +471,35 @@ class Command:
     def has_description(self) -> bool:
         return self.description is not None
 
+    @property
+    def has_returns(self) -> bool:
+        return self.returns is not None
+
     @property
     def has_description_and_params(self) -> bool:
         return self.has_parameters and self.has_parameters
 
+    @property
+    def binary_return(self) -> OptStr:
+        if self.returns is None:
+            return None
+        names = [ret.name for ret in self.returns]
+        for ret in self.returns:
+            if ret.type == "binary":
+                return ret.name
+            if "base64Encoded" in names and ret.type == "string":
+                return ret.name
+        return None
+
+    @property
+    def binary_flag(self) -> OptStr:
+        if self.returns is None:
+            return None
+        for ret in self.returns:
+            if ret.name == "base64Encoded":
+                return ret.name
+        return None
+
     @property
     def is_deprecation_or_experimental(self) -> bool:
         return self.deprecated or self.experimental
@@ -491,7 +516,11 @@ class Command:
 
     def command_sig(self) -> str:
         arg_str = f", {self.command_arg_string()}" if self.has_parameters else ""
-        return f"def {self.name}(self{arg_str}) -> Awaitable[Dict]:"
+        if self.binary_return is not None:
+            return f"def {self.name}(self{arg_str}, as_bytes: bool = False, sink: Optional[BinaryIO] = None) -> Awaitable[Dict]:"
+        if self.has_returns:
+            return f"def {self.name}(self{arg_str}) -> Awaitable[Dict]:"
+        return f"def {self.name}(self{arg_str}, nowait: bool = False) -> Optional[Awaitable[Dict]]:"
 
     def command_link(self) -> str:
         url_domain = (
@@ -653,6 +682,12 @@ class Domain:
     def has_types(self) -> bool:
         return self.events is not None
 
+    @property
+    def has_binary_commands(self) -> bool:
+        if self.commands is None:
+            return False
+        return any(command.binary_return is not None for command in self.commands)
+
     @property
     def name(self) -> str:
         return self.domain
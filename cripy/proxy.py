@@ -0,0 +1,454 @@
+import logging
+from asyncio import (
+    AbstractEventLoop,
+    AbstractServer,
+    Event,
+    Future,
+    Task,
+    start_unix_server,
+)
+from collections import deque
+from functools import partial
+from typing import Any, Deque, Dict, FrozenSet, Optional, Set
+
+from websockets import serve
+
+from .codec import Codec
+from .connection import Connection
+from .errors import ClientError, ProtocolError
+from .transports import (
+    PIPE_READ_LIMIT,
+    TRANSPORT_CLOSED_ERRORS,
+    PipeTransport,
+    Transport,
+    WebSocketTransport,
+)
+
+__all__ = ["CDPProxy"]
+
+logger = logging.getLogger(__name__)
+
+# The code of the errors the proxy answers commands with when the command
+# could not be sent to the browser, the same code Chrome uses for server errors
+PROXY_ERROR_CODE: int = -32000
+# The codes of the errors the proxy answers invalid messages with, the same codes
+# Chrome uses
+PARSE_ERROR_CODE: int = -32700
+INVALID_REQUEST_CODE: int = -32600
+SESSION_NOT_FOUND: str = "Session with given id not found."
+# The browser level events about a session that are sent to the owner of the session
+SESSION_LIFECYCLE_EVENTS: FrozenSet[str] = frozenset(
+    ["Target.attachedToTarget", "Target.detachedFromTarget"]
+)
+
+
+class ProxyClient:
+    """A downstream client of a CDPProxy"""
+
+    __slots__ = [
+        "_closed",
+        "_codec",
+        "_outbox",
+        "_ready",
+        "_transport",
+        "_writer_task",
+        "domains",
+        "sessions",
+    ]
+
+    def __init__(
+        self, transport: Transport, codec: Codec, loop: AbstractEventLoop
+    ) -> None:
+        """Create a new ProxyClient
+
+        :param transport: The transport connected to the client
+        :param codec: The codec used to encode the messages sent to the client
+        :param loop: The event loop to use
+        """
+        self._transport: Transport = transport
+        self._codec: Codec = codec
+        self._closed: bool = False
+        self._outbox: Deque[Dict] = deque()
+        self._ready: Event = Event()
+        self._writer_task: Task = loop.create_task(self._write_loop())
+        # the domains of the browser level events the client receives
+        self.domains: Set[str] = set()
+        # the ids of the sessions owned by the client
+        self.sessions: Set[str] = set()
+
+    @property
+    def closed(self) -> bool:
+        """Returns T/F indicating if the client disconnected"""
+        return self._closed
+
+    def deliver(self, msg: Dict) -> None:
+        """Sends the supplied message to the client
+
+        :param msg: The message
+        """
+        if self._closed:
+            return
+        self._outbox.append(msg)
+        self._ready.set()
+
+    def reply(self, _id: int, session_id: Optional[str], future: Future) -> None:
+        """Answers the command of the client identified by the supplied id
+        with the outcome of the upstream command
+
+        :param _id: The id the client gave the command
+        :param session_id: The id of the session the command was sent to, if any
+        :param future: The future of the upstream command
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        response: Dict[str, Any] = {"id": _id}
+        if error is None:
+            response["result"] = future.result()
+        elif isinstance(error, ProtocolError) and error.error is not None:
+            response["error"] = error.error
+        else:
+            response["error"] = {"code": PROXY_ERROR_CODE, "message": str(error)}
+        if session_id is not None:
+            response["sessionId"] = session_id
+        self.deliver(response)
+
+    def close(self) -> None:
+        """Stops sending messages to the client"""
+        self._closed = True
+        self._outbox.clear()
+        self._writer_task.cancel()
+
+    async def _write_loop(self) -> None:
+        """Loop that sends the messages delivered to the client"""
+        outbox = self._outbox
+        ready = self._ready
+        send = self._transport.send
+        dumps = (
+            self._codec.dumps_str if self._transport.text_only else self._codec.dumps
+        )
+        while 1:
+            await ready.wait()
+            ready.clear()
+            try:
+                while outbox:
+                    await send(dumps(outbox.popleft()))
+            except TRANSPORT_CLOSED_ERRORS:
+                self._closed = True
+                return
+
+
+class CDPProxy:
+    """Multiplexes many downstream CDP clients, e.g. worker processes, onto one
+    connection to a browser.
+
+    The ids of the commands of the clients are rewritten by sending them using the
+    connection and the responses are sent back with the clients original ids. Flat
+    sessions are owned by the client that attached to their target and their events,
+    including those of the sessions they auto-attach to, are sent to that client only.
+    Browser level events are fanned out to the clients subscribed to their domain,
+    a client subscribes to a domain by sending a browser level command of the domain,
+    e.g. Target.setDiscoverTargets, and unsubscribes using its disable command.
+
+    The connection must use flat sessions.
+    """
+
+    __slots__ = ["_clients", "_connection", "_owners", "_pending_attach"]
+
+    def __init__(self, connection: Connection) -> None:
+        """Create a new CDPProxy
+
+        :param connection: The connection to the browser the clients share
+        """
+        if connection.flatten_sessions is False:
+            raise ClientError("CDPProxy requires a connection using flat sessions")
+        self._connection: Connection = connection
+        self._clients: Set[ProxyClient] = set()
+        self._owners: Dict[str, ProxyClient] = {}
+        self._pending_attach: Dict[str, Deque[ProxyClient]] = {}
+        connection.set_event_hook(self._on_upstream_event)
+
+    @property
+    def connection(self) -> Connection:
+        """Returns the connection to the browser"""
+        return self._connection
+
+    @property
+    def clients(self) -> int:
+        """Returns the number of connected clients"""
+        return len(self._clients)
+
+    async def serve_websocket(self, host: str = "localhost", port: int = 0) -> Any:
+        """Starts accepting clients connecting using websockets
+
+        :param host: The host to listen on
+        :param port: The port to listen on, 0 picks a free port
+        :return: The websocket server
+        """
+        return await serve(
+            self._handle_websocket,
+            host,
+            port,
+            ping_interval=None,
+            ping_timeout=None,
+            max_size=None,
+            compression=None,
+        )
+
+    async def serve_unix(self, path: str) -> AbstractServer:
+        """Starts accepting clients connecting to a Unix domain socket
+        at the supplied path, e.g. using UnixSocketTransport
+
+        :param path: The path of the socket
+        :return: The server
+        """
+        return await start_unix_server(
+            lambda reader, writer: self.handle_client(PipeTransport(reader, writer)),
+            path,
+            limit=PIPE_READ_LIMIT,
+        )
+
+    async def handle_client(self, transport: Transport) -> None:
+        """Serves the client connected using the supplied transport until it disconnects
+
+        :param transport: The transport connected to the client
+        """
+        connection = self._connection
+        codec = connection.codec
+        client = ProxyClient(transport, codec, connection.loop)
+        self._clients.add(client)
+        recv = transport.recv
+        try:
+            while not client.closed:
+                try:
+                    frame = await recv()
+                except TRANSPORT_CLOSED_ERRORS:
+                    break
+                try:
+                    msg = codec.loads(frame)
+                except Exception as e:
+                    logger.debug(
+                        f"Received an invalid message from a proxy client: {e}"
+                    )
+                    client.deliver(
+                        {
+                            "error": {
+                                "code": PARSE_ERROR_CODE,
+                                "message": "Message must be a valid JSON",
+                            }
+                        }
+                    )
+                    continue
+                self._on_client_message(client, msg)
+        finally:
+            self._on_client_closed(client)
+            if not transport.closed:
+                await transport.close()
+
+    def _on_client_message(self, client: ProxyClient, msg: Dict) -> None:
+        """Sends the command of the client to the browser
+
+        :param client: The client that sent the command
+        :param msg: The command
+        """
+        invalid = _validate_command(msg)
+        if invalid is not None:
+            response: Dict[str, Any] = {
+                "error": {"code": INVALID_REQUEST_CODE, "message": invalid}
+            }
+            if isinstance(msg, dict) and isinstance(msg.get("id"), int):
+                response["id"] = msg["id"]
+            client.deliver(response)
+            return
+        _id = msg["id"]
+        method = msg["method"]
+        params = msg.get("params")
+        session_id = msg.get("sessionId")
+        if session_id is None:
+            self._track_browser_command(client, method, params)
+            try:
+                future = self._connection.send(method, params)
+            except Exception as e:
+                client.deliver(_error_response(_id, None, str(e)))
+                return
+        else:
+            session = self._connection.session(session_id)
+            owner = self._owners.get(session_id)
+            # the sessions of other clients are as unknown to a client as
+            # sessions that do not exist
+            if session is None or (owner is not None and owner is not client):
+                client.deliver(_error_response(_id, session_id, SESSION_NOT_FOUND))
+                return
+            if owner is None:
+                self._claim(client, session_id)
+            try:
+                future = session.send(method, params)
+            except Exception as e:
+                client.deliver(_error_response(_id, session_id, str(e)))
+                return
+        future.add_done_callback(partial(client.reply, _id, session_id))
+
+    def _track_browser_command(
+        self, client: ProxyClient, method: str, params: Optional[Dict]
+    ) -> None:
+        """Updates the subscriptions of the client and the pending attachments
+        for the browser level command it sent
+
+        :param client: The client that sent the command
+        :param method: The method of the command
+        :param params: The parameters of the command
+        """
+        domain, _, command = method.partition(".")
+        if command == "disable":
+            client.domains.discard(domain)
+        else:
+            client.domains.add(domain)
+        if method == "Target.attachToTarget" and params:
+            target_id = params.get("targetId")
+            pending = self._pending_attach.get(target_id)
+            if pending is None:
+                pending = self._pending_attach[target_id] = deque()
+            pending.append(client)
+
+    def _on_upstream_event(self, msg: Dict) -> bool:
+        """Routes an event received from the browser to the clients it is for,
+        the connection's event hook. Responses are answered by the futures
+        of the commands
+
+        :param msg: The event
+        :return: T/F indicating if the event was for a session owned by a client,
+        which the connection does not emit
+        """
+        method = msg["method"]
+        session_id = msg.get("sessionId")
+        params = msg.get("params", {})
+        if method == "Target.attachedToTarget":
+            self._on_attached(session_id, params)
+        if session_id is None and method in SESSION_LIFECYCLE_EVENTS:
+            # attachments of a client are its own business
+            session_id = params.get("sessionId")
+        consumed = False
+        if session_id is not None:
+            owner = self._owners.get(session_id)
+            if owner is not None:
+                owner.deliver(msg)
+                consumed = msg.get("sessionId") is not None
+            elif msg.get("sessionId") is None:
+                self._fan_out(method, msg)
+        else:
+            self._fan_out(method, msg)
+        if method == "Target.detachedFromTarget":
+            detached = params.get("sessionId")
+            owner = self._owners.pop(detached, None)
+            if owner is not None:
+                owner.sessions.discard(detached)
+        return consumed
+
+    def _fan_out(self, method: str, msg: Dict) -> None:
+        """Sends the browser level event to the clients subscribed to its domain
+
+        :param method: The method of the event
+        :param msg: The event
+        """
+        domain = method.partition(".")[0]
+        for client in self._clients:
+            if domain in client.domains:
+                client.deliver(msg)
+
+    def _on_attached(self, parent_id: Optional[str], params: Dict) -> None:
+        """Records the owner of the newly attached session, the owner of its parent
+        session or the client that attached to its target
+
+        :param parent_id: The id of the session the event was received for, if any
+        :param params: The parameters of the event
+        """
+        session_id = params.get("sessionId")
+        if parent_id is not None:
+            owner = self._owners.get(parent_id)
+        else:
+            target_id = params.get("targetInfo", {}).get("targetId")
+            pending = self._pending_attach.get(target_id)
+            owner = pending.popleft() if pending else None
+            if pending is not None and not pending:
+                del self._pending_attach[target_id]
+        if owner is not None and not owner.closed:
+            self._claim(owner, session_id)
+
+    def _claim(self, client: ProxyClient, session_id: str) -> None:
+        """Makes the client the owner of the session
+
+        :param client: The client
+        :param session_id: The id of the session
+        """
+        self._owners[session_id] = client
+        client.sessions.add(session_id)
+
+    def _on_client_closed(self, client: ProxyClient) -> None:
+        """Forgets the disconnected client and detaches the sessions it owned
+
+        :param client: The client
+        """
+        client.close()
+        self._clients.discard(client)
+        for pending in self._pending_attach.values():
+            if client in pending:
+                pending.remove(client)
+        connection = self._connection
+        for session_id in client.sessions:
+            self._owners.pop(session_id, None)
+            if connection.session(session_id) is not None and not connection.closed:
+                connection.send_nowait(
+                    "Target.detachFromTarget", {"sessionId": session_id}
+                )
+        client.sessions.clear()
+
+    async def _handle_websocket(self, ws: Any, path: Optional[str] = None) -> None:
+        """Serves a client connected using websockets
+
+        :param ws: The websocket connected to the client
+        :param path: The path of the request, unused
+        """
+        await self.handle_client(WebSocketTransport(ws))
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(clients={len(self._clients)})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def _validate_command(msg: Any) -> Optional[str]:
+    """Checks the command received from a proxy client is well formed
+
+    :param msg: The decoded command
+    :return: The reason the command is invalid or None if it is valid
+    """
+    if not isinstance(msg, dict):
+        return "Message must be an object"
+    _id = msg.get("id")
+    if not isinstance(_id, int) or isinstance(_id, bool):
+        return "Message must have integer 'id' property"
+    if not isinstance(msg.get("method"), str):
+        return "Message must have string 'method' property"
+    if not isinstance(msg.get("params", {}), (dict, type(None))):
+        return "Message has non-object 'params' property"
+    if not isinstance(msg.get("sessionId", ""), (str, type(None))):
+        return "Message has non-string 'sessionId' property"
+    return None
+
+
+def _error_response(_id: int, session_id: Optional[str], message: str) -> Dict:
+    """Creates the response answering a command of a proxy client with an error
+
+    :param _id: The id the client gave the command
+    :param session_id: The id of the session the command was sent to, if any
+    :param message: The message of the error
+    :return: The response
+    """
+    response: Dict[str, Any] = {
+        "id": _id,
+        "error": {"code": PROXY_ERROR_CODE, "message": message},
+    }
+    if session_id is not None:
+        response["sessionId"] = session_id
+    return response
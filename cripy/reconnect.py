@@ -0,0 +1,87 @@
+from random import uniform
+from typing import Dict, FrozenSet, Iterator, Optional
+
+from .errors import ClientError
+
+__all__ = ["REPLAYED_METHODS", "ReconnectPolicy", "record_state"]
+
+# Commands, other than the *.enable commands, whose last call is replayed once
+# the connection or a session is restored
+REPLAYED_METHODS: FrozenSet[str] = frozenset(
+    ["Target.setAutoAttach", "Target.setDiscoverTargets"]
+)
+
+
+class ReconnectPolicy:
+    """Describes how a Connection reconnects once its websocket drops.
+
+    The delay before each attempt starts at initial_delay and is multiplied by
+    multiplier after each failed attempt up to max_delay, with up to jitter
+    (a fraction of the delay) added or removed at random so that many clients
+    do not reconnect in lockstep.
+    """
+
+    __slots__ = ["initial_delay", "jitter", "max_attempts", "max_delay", "multiplier"]
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = 5,
+        initial_delay: float = 0.1,
+        max_delay: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+    ) -> None:
+        """Create a new ReconnectPolicy
+
+        :param max_attempts: The maximum number of reconnect attempts made before
+        the connection is closed, None for no limit
+        :param initial_delay: The number of seconds waited before the first attempt
+        :param max_delay: The maximum number of seconds waited before an attempt
+        :param multiplier: The factor the delay is multiplied by after each failed attempt
+        :param jitter: The fraction of the delay randomly added to or removed from it
+        """
+        if max_attempts is not None and max_attempts < 1:
+            raise ClientError(
+                f"The max_attempts of a ReconnectPolicy must be >= 1, got {max_attempts}"
+            )
+        self.max_attempts: Optional[int] = max_attempts
+        self.initial_delay: float = initial_delay
+        self.max_delay: float = max_delay
+        self.multiplier: float = multiplier
+        self.jitter: float = jitter
+
+    def delays(self) -> Iterator[float]:
+        """Returns an iterator over the delays before each reconnect attempt
+
+        :return: The delays, in seconds
+        """
+        attempt = 0
+        delay = self.initial_delay
+        while self.max_attempts is None or attempt < self.max_attempts:
+            attempt += 1
+            spread = delay * self.jitter
+            yield max(0.0, delay + uniform(-spread, spread))
+            delay = min(delay * self.multiplier, self.max_delay)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_attempts={self.max_attempts}, "
+            f"initial_delay={self.initial_delay}, max_delay={self.max_delay})"
+        )
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def record_state(state: Dict[str, Dict], method: str, params: Dict) -> None:
+    """Records the command in the supplied state if it is to be replayed
+    once the connection is restored. Disabling a domain forgets its enable.
+
+    :param state: The recorded commands, method to params
+    :param method: The method of the command
+    :param params: The params of the command
+    """
+    if method.endswith(".enable") or method in REPLAYED_METHODS:
+        state[method] = params
+    elif method.endswith(".disable"):
+        state.pop(f"{method[:-8]}.enable", None)
@@ -0,0 +1,353 @@
+import asyncio
+import multiprocessing
+import os
+from queue import Empty
+from time import perf_counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .errors import ClientError
+
+__all__ = ["CrawlRunner", "JobResult", "WorkerStats"]
+
+JobFn = Callable[[Any, Any], Awaitable[Any]]
+ClientFactory = Callable[[], Awaitable[Any]]
+
+# The kinds of the messages workers send over the result channel
+RESULT: int = 0
+DONE: int = 1
+# How often, in seconds, the runner checks for workers that died
+# while waiting for results
+POLL_INTERVAL: float = 0.5
+
+
+class JobResult:
+    """The outcome of a job run by a CrawlRunner"""
+
+    __slots__ = ["error", "index", "job", "value", "worker"]
+
+    def __init__(
+        self, index: int, job: Any, worker: int, value: Any, error: Optional[str]
+    ) -> None:
+        """Create a new JobResult
+
+        :param index: The index of the job in the jobs supplied to the runner
+        :param job: The job
+        :param worker: The number of the worker that ran the job
+        :param value: The value returned by the job function
+        :param error: The representation of the exception raised by the
+        job function, if it raised one
+        """
+        self.index: int = index
+        self.job: Any = job
+        self.worker: int = worker
+        self.value: Any = value
+        self.error: Optional[str] = error
+
+    @property
+    def ok(self) -> bool:
+        """Returns T/F indicating if the job succeeded"""
+        return self.error is None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(index={self.index}, worker={self.worker}, ok={self.ok})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class WorkerStats:
+    """The statistics of a worker process of a CrawlRunner"""
+
+    __slots__ = ["busy", "elapsed", "error", "failures", "jobs", "pid", "worker"]
+
+    def __init__(self, worker: int) -> None:
+        """Create a new WorkerStats
+
+        :param worker: The number of the worker
+        """
+        self.worker: int = worker
+        self.pid: Optional[int] = None
+        # number of jobs run and the number of those that failed
+        self.jobs: int = 0
+        self.failures: int = 0
+        # seconds spent running jobs, summed across the concurrent jobs of the worker
+        self.busy: float = 0.0
+        # seconds the worker was connected to the browser
+        self.elapsed: float = 0.0
+        # why the worker stopped early, if it did
+        self.error: Optional[str] = None
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(worker={self.worker}, pid={self.pid}, jobs={self.jobs}, "
+            f"failures={self.failures}, busy={self.busy:.3f}, elapsed={self.elapsed:.3f})"
+        )
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class CrawlRunner:
+    """Runs jobs across worker processes, each with its own event loop and client
+    connected to the browser, so that decoding and dispatching the messages of the
+    browser is not limited to a single core.
+
+    Jobs are pulled by the workers from a shared queue and are run by calling the job
+    function with the client of the worker and the job. The outcome of each job is sent
+    back over a shared result channel as a small tuple. The job function, the jobs,
+    their results and the client factory must be picklable, so the functions
+    must be defined at the top level of a module.
+    """
+
+    __slots__ = [
+        "_client_factory",
+        "_concurrency",
+        "_connect_kwargs",
+        "_context",
+        "_job_fn",
+        "_stats",
+        "_url",
+        "_workers",
+    ]
+
+    def __init__(
+        self,
+        job_fn: JobFn,
+        workers: Optional[int] = None,
+        url: Optional[str] = None,
+        concurrency: int = 1,
+        client_factory: Optional[ClientFactory] = None,
+        start_method: Optional[str] = None,
+        **connect_kwargs: Any,
+    ) -> None:
+        """Create a new CrawlRunner
+
+        :param job_fn: The coroutine function called with the client of the worker
+        and a job to run the job, its return value is the result of the job
+        :param workers: The number of worker processes. Defaults to the number of CPUs
+        :param url: The URL each worker connects to using cripy.connect.
+        Defaults to cripy.connect's default
+        :param concurrency: The number of jobs each worker runs concurrently
+        :param client_factory: Optional coroutine function returning the connected
+        client of a worker, used rather than cripy.connect. The client is disposed of
+        by the worker once it is done
+        :param start_method: Optional multiprocessing start method.
+        Defaults to the platforms default
+        :param connect_kwargs: Additional keyword arguments for cripy.connect
+        """
+        if concurrency < 1:
+            raise ClientError(
+                f"The concurrency of a CrawlRunner must be >= 1, got {concurrency}"
+            )
+        self._job_fn: JobFn = job_fn
+        self._workers: int = workers or os.cpu_count() or 1
+        self._url: Optional[str] = url
+        self._concurrency: int = concurrency
+        self._client_factory: Optional[ClientFactory] = client_factory
+        self._connect_kwargs: Dict[str, Any] = connect_kwargs
+        self._context: Any = multiprocessing.get_context(start_method)
+        self._stats: List[WorkerStats] = []
+
+    @property
+    def workers(self) -> int:
+        """Returns the number of worker processes"""
+        return self._workers
+
+    @property
+    def stats(self) -> List[WorkerStats]:
+        """Returns the statistics of the workers of the current or last run"""
+        return self._stats
+
+    def run(self, jobs: Iterable[Any]) -> List[JobResult]:
+        """Runs the supplied jobs, blocking until all are done
+
+        :param jobs: The jobs
+        :return: The results of the jobs in the order of the jobs
+        """
+        results = list(self.imap(jobs))
+        results.sort(key=lambda result: result.index)
+        return results
+
+    def imap(self, jobs: Iterable[Any]) -> Iterator[JobResult]:
+        """Runs the supplied jobs, yielding their results as they complete
+
+        :param jobs: The jobs
+        :return: An iterator of the results of the jobs in the order they complete
+        """
+        jobs = list(jobs)
+        context = self._context
+        job_queue = context.Queue()
+        result_queue = context.Queue()
+        for index, job in enumerate(jobs):
+            job_queue.put((index, job))
+        for _ in range(self._workers * self._concurrency):
+            job_queue.put(None)
+        self._stats = stats = [WorkerStats(worker) for worker in range(self._workers)]
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(
+                    worker,
+                    job_queue,
+                    result_queue,
+                    self._job_fn,
+                    self._url,
+                    self._concurrency,
+                    self._client_factory,
+                    self._connect_kwargs,
+                ),
+                name=f"cripy-worker-{worker}",
+                daemon=True,
+            )
+            for worker in range(self._workers)
+        ]
+        for process in processes:
+            process.start()
+        for worker, process in enumerate(processes):
+            stats[worker].pid = process.pid
+        running = set(range(self._workers))
+        try:
+            while running:
+                try:
+                    message = result_queue.get(timeout=POLL_INTERVAL)
+                except Empty:
+                    for worker in list(running):
+                        if not processes[worker].is_alive():
+                            running.discard(worker)
+                            stats[
+                                worker
+                            ].error = f"exited with code {processes[worker].exitcode}"
+                    continue
+                if message[0] == RESULT:
+                    _, worker, index, value, error, took = message
+                    worker_stats = stats[worker]
+                    worker_stats.jobs += 1
+                    worker_stats.busy += took
+                    if error is not None:
+                        worker_stats.failures += 1
+                    yield JobResult(index, jobs[index], worker, value, error)
+                else:
+                    _, worker, elapsed, error = message
+                    running.discard(worker)
+                    stats[worker].elapsed = elapsed
+                    stats[worker].error = error
+        finally:
+            for process in processes:
+                process.join(POLL_INTERVAL)
+                if process.is_alive():
+                    process.terminate()
+            job_queue.close()
+            result_queue.close()
+        if all(worker_stats.error is not None for worker_stats in stats):
+            raise ClientError(
+                f"Every worker of the CrawlRunner failed, the first with: {stats[0].error}"
+            )
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(workers={self._workers}, concurrency={self._concurrency})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def _worker_main(
+    worker: int,
+    job_queue: Any,
+    result_queue: Any,
+    job_fn: JobFn,
+    url: Optional[str],
+    concurrency: int,
+    client_factory: Optional[ClientFactory],
+    connect_kwargs: Dict[str, Any],
+) -> None:
+    """The entry point of a worker process, runs jobs using its own event loop
+    and client until it is handed as many stop sentinels as it runs jobs concurrently
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    start = perf_counter()
+    error = None
+    try:
+        loop.run_until_complete(
+            _work(
+                worker,
+                job_queue,
+                result_queue,
+                job_fn,
+                url,
+                concurrency,
+                client_factory,
+                connect_kwargs,
+            )
+        )
+    except Exception as e:
+        error = repr(e)
+    finally:
+        loop.close()
+    result_queue.put((DONE, worker, perf_counter() - start, error))
+
+
+async def _work(
+    worker: int,
+    job_queue: Any,
+    result_queue: Any,
+    job_fn: JobFn,
+    url: Optional[str],
+    concurrency: int,
+    client_factory: Optional[ClientFactory],
+    connect_kwargs: Dict[str, Any],
+) -> None:
+    """Connects the client of the worker and runs the jobs"""
+    if client_factory is not None:
+        client = await client_factory()
+    else:
+        from .cdp import connect
+
+        if url is not None:
+            connect_kwargs = dict(connect_kwargs, url=url)
+        client = await connect(**connect_kwargs)
+    loop = asyncio.get_event_loop()
+    try:
+        await asyncio.gather(
+            *[
+                _run_jobs(worker, job_queue, result_queue, job_fn, client, loop)
+                for _ in range(concurrency)
+            ]
+        )
+    finally:
+        await client.dispose()
+
+
+async def _run_jobs(
+    worker: int,
+    job_queue: Any,
+    result_queue: Any,
+    job_fn: JobFn,
+    client: Any,
+    loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Runs jobs pulled from the job queue until the stop sentinel is pulled"""
+    while 1:
+        entry: Optional[Tuple[int, Any]] = await loop.run_in_executor(
+            None, job_queue.get
+        )
+        if entry is None:
+            return
+        index, job = entry
+        start = perf_counter()
+        value = error = None
+        try:
+            value = await job_fn(client, job)
+        except Exception as e:
+            error = repr(e)
+        result_queue.put((RESULT, worker, index, value, error, perf_counter() - start))
@@ -0,0 +1,372 @@
+from asyncio import Future
+from collections import deque
+from functools import WRAPPER_ASSIGNMENTS
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Deque,
+    FrozenSet,
+    List,
+    Optional,
+)
+
+from .errors import ClientError
+
+__all__ = [
+    "BoundEventAccessor",
+    "DEFAULT_STREAM_SIZE",
+    "EventAccessor",
+    "EventStream",
+    "Overflow",
+    "event_accessor",
+]
+
+# The number of events an EventStream buffers unless told otherwise
+DEFAULT_STREAM_SIZE: int = 1024
+
+
+class Overflow:
+    """What an EventStream does with an event received while its buffer is full"""
+
+    # the oldest buffered event is dropped to make room for the event
+    DROP_OLDEST: ClassVar[str] = "drop_oldest"
+    # the event is buffered and the connection pauses reading, holding the events
+    # it receives but not the responses of commands, until the consumer made room
+    # in the buffer. See Connection.pause_reading
+    BLOCK: ClassVar[str] = "block"
+    # the newest buffered event is replaced by the event
+    COALESCE: ClassVar[str] = "coalesce"
+
+
+OVERFLOW_POLICIES: FrozenSet[str] = frozenset(
+    [Overflow.DROP_OLDEST, Overflow.BLOCK, Overflow.COALESCE]
+)
+
+
+class EventStream:
+    """An async iterator of the events, emitted by a connection or session, with the
+    supplied name buffered in a ring buffer of a fixed size.
+
+    The listener of the stream is removed once the stream is closed, by calling close
+    or aclose, exiting the stream when used as an async context manager, leaving an
+    async for loop over the stream, including using break or because of an exception,
+    and once the client disconnects. Iterating a closed stream yields the events that
+    were still buffered. Prefer using the stream as an async context manager:
+
+        async with Network(session).requestWillBeSent.stream() as stream:
+            async for event in stream:
+                ...
+
+    so that the stream is closed as soon as the block is left. Leaving an async for
+    loop closes the stream only once the event loop finalizes the loop's iterator,
+    which happens on a later iteration of the event loop.
+    """
+
+    __slots__ = [
+        "_buffer",
+        "_client",
+        "_closed",
+        "_dropped",
+        "_event",
+        "_maxsize",
+        "_overflow",
+        "_paused",
+        "_received",
+        "_waiter",
+    ]
+
+    def __init__(
+        self,
+        client: Any,
+        event: str,
+        maxsize: int = DEFAULT_STREAM_SIZE,
+        overflow: str = Overflow.DROP_OLDEST,
+    ) -> None:
+        """Create a new EventStream
+
+        :param client: The connection or session emitting the events
+        :param event: The name of the event, e.g. Network.requestWillBeSent
+        :param maxsize: The maximum number of buffered events
+        :param overflow: What is done with an event received while the buffer is full,
+        one of Overflow.DROP_OLDEST, Overflow.BLOCK or Overflow.COALESCE
+        """
+        if maxsize < 1:
+            raise ClientError(
+                f"The maxsize of an EventStream must be >= 1, got {maxsize}"
+            )
+        if overflow not in OVERFLOW_POLICIES:
+            raise ClientError(f"Unknown EventStream overflow policy {overflow!r}")
+        self._client: Any = client
+        self._event: str = event
+        self._maxsize: int = maxsize
+        self._overflow: str = overflow
+        # when blocking the connection stops reading once the buffer is full
+        # so the buffer never grows past maxsize
+        self._buffer: Deque[Any] = deque(
+            maxlen=None if overflow == Overflow.BLOCK else maxsize
+        )
+        self._waiter: Optional[Future] = None
+        self._closed: bool = False
+        # the epoch returned by pause_reading while the stream paused the connection
+        self._paused: Optional[int] = None
+        self._received: int = 0
+        self._dropped: int = 0
+        client.on(event, self._on_event)
+        client.on(client.Events.Disconnected, self.close)
+
+    @property
+    def event(self) -> str:
+        """Returns the name of the events of the stream"""
+        return self._event
+
+    @property
+    def maxsize(self) -> int:
+        """Returns the maximum number of buffered events"""
+        return self._maxsize
+
+    @property
+    def overflow(self) -> str:
+        """Returns the overflow policy of the stream"""
+        return self._overflow
+
+    @property
+    def closed(self) -> bool:
+        """Returns T/F indicating if the stream was closed"""
+        return self._closed
+
+    @property
+    def received(self) -> int:
+        """Returns the number of events received by the stream"""
+        return self._received
+
+    @property
+    def dropped(self) -> int:
+        """Returns the number of events dropped or replaced because the buffer was full"""
+        return self._dropped
+
+    @property
+    def buffered(self) -> int:
+        """Returns the number of events waiting to be consumed"""
+        return len(self._buffer)
+
+    def close(self) -> None:
+        """Removes the listener of the stream, resumes the connection if the stream
+        paused it and ends iterating once the buffered events are consumed
+        """
+        if self._closed:
+            return
+        self._closed = True
+        client = self._client
+        client.remove_listener(self._event, self._on_event)
+        client.remove_listener(client.Events.Disconnected, self.close)
+        if self._paused is not None:
+            epoch = self._paused
+            self._paused = None
+            client.resume_reading(epoch)
+        self._wake()
+
+    async def aclose(self) -> None:
+        """Closes the stream. See close"""
+        self.close()
+
+    def _on_event(self, event: Any = None) -> None:
+        """Buffers the event applying the overflow policy if the buffer is full
+
+        :param event: The event
+        """
+        self._received += 1
+        buffer = self._buffer
+        maxsize = self._maxsize
+        overflow = self._overflow
+        if len(buffer) >= maxsize:
+            if overflow == Overflow.COALESCE:
+                buffer[-1] = event
+                self._dropped += 1
+                return
+            if overflow == Overflow.DROP_OLDEST:
+                # the buffer has a maxlen so appending drops the oldest event
+                self._dropped += 1
+        buffer.append(event)
+        if (
+            overflow == Overflow.BLOCK
+            and self._paused is None
+            and len(buffer) >= maxsize
+        ):
+            self._paused = self._client.pause_reading()
+        self._wake()
+
+    def _wake(self) -> None:
+        """Resolves the future the consumer is waiting on, if it is waiting"""
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[Any]:
+        """Yields the events of the stream, closing the stream once iterating
+        ends for any reason"""
+        try:
+            while 1:
+                try:
+                    event = await self.__anext__()
+                except StopAsyncIteration:
+                    return
+                yield event
+        finally:
+            self.close()
+
+    async def __anext__(self) -> Any:
+        buffer = self._buffer
+        while not buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = self._client.loop.create_future()
+            await self._waiter
+        event = buffer.popleft()
+        if self._paused is not None and len(buffer) < self._maxsize:
+            epoch = self._paused
+            self._paused = None
+            self._client.resume_reading(epoch)
+        return event
+
+    async def __aenter__(self) -> "EventStream":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(event={self._event}, maxsize={self._maxsize}, overflow={self._overflow}, dropped={self._dropped})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class BoundEventAccessor:
+    """The event accessor of a domain instance, calling it registers a listener
+    for the event or returns a future resolving with the next event"""
+
+    __slots__ = ["_domain", "_event", "_fn"]
+
+    def __init__(self, fn: Callable[..., Any], domain: Any, event: str) -> None:
+        """Create a new BoundEventAccessor
+
+        :param fn: The generated event accessor method
+        :param domain: The domain instance
+        :param event: The name of the event
+        """
+        self._fn: Callable[..., Any] = fn
+        self._domain: Any = domain
+        self._event: str = event
+
+    @property
+    def event(self) -> str:
+        """Returns the name of the event"""
+        return self._event
+
+    def stream(
+        self, maxsize: int = DEFAULT_STREAM_SIZE, overflow: str = Overflow.DROP_OLDEST
+    ) -> EventStream:
+        """Returns a bounded async iterator of the events, best used as an async
+        context manager (async with ... as stream) so it is closed when done.
+        See EventStream
+
+        :param maxsize: The maximum number of buffered events
+        :param overflow: What is done with an event received while the buffer is full,
+        one of Overflow.DROP_OLDEST, Overflow.BLOCK or Overflow.COALESCE
+        :return: The stream of the events
+        """
+        return EventStream(self._domain.client, self._event, maxsize, overflow)
+
+    def batch(
+        self,
+        handler: Callable[[List[Any]], Any],
+        window: Optional[float] = None,
+        max_size: Optional[int] = None,
+    ) -> Any:
+        """Registers a handler called with lists of the events. See EventBatcher
+
+        :param handler: The function called with each batch of events
+        :param window: Optional number of seconds the events of a batch are collected
+        for after its first event. Defaults to delivering a batch per receive burst
+        :param max_size: Optional maximum number of events in a batch.
+        Defaults to no limit
+        :return: The batcher, whose close method removes the handler
+        """
+        return self._domain.client.on_batch(self._event, handler, window, max_size)
+
+    def coalesce(
+        self,
+        handler: Callable[[Any], Any],
+        key: Optional[Any] = None,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+        window: Optional[float] = None,
+    ) -> Any:
+        """Registers a handler called only with the newest, or merged, event per key.
+        See EventCoalescer
+
+        :param handler: The function called with the event of each key
+        :param key: Optional name of the field of the events, e.g. requestId, or function
+        returning the key of an event. Defaults to every event sharing one key
+        :param merge: Optional function called with the pending event of a key and
+        a newer event of that key that returns the event kept. Defaults to the newer event
+        :param window: Optional number of seconds the events are collected for after
+        the first event. Defaults to delivering the events once per receive burst
+        :return: The coalescer, whose close method removes the handler
+        """
+        return self._domain.client.on_coalesced(
+            self._event, handler, key, merge, window
+        )
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._fn(self._domain, *args, **kwargs)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(event={self._event})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class EventAccessor:
+    """Descriptor wrapping the event accessor methods of the generated domain classes,
+    accessing it on a domain instance returns a BoundEventAccessor"""
+
+    def __init__(self, fn: Callable[..., Any], event: str) -> None:
+        """Create a new EventAccessor
+
+        :param fn: The generated event accessor method
+        :param event: The name of the event
+        """
+        # the same as functools.update_wrapper, which expects a callable wrapper
+        for attr in WRAPPER_ASSIGNMENTS:
+            if hasattr(fn, attr):
+                setattr(self, attr, getattr(fn, attr))
+        self.__wrapped__: Callable[..., Any] = fn
+        self._fn: Callable[..., Any] = fn
+        self._event: str = event
+
+    def __get__(self, domain: Any, owner: Any = None) -> Any:
+        if domain is None:
+            return self
+        return BoundEventAccessor(self._fn, domain, self._event)
+
+
+def event_accessor(event: str) -> Callable[[Callable[..., Any]], EventAccessor]:
+    """Decorator turning an event accessor method, of a generated domain class,
+    into an EventAccessor
+
+    :param event: The name of the event
+    :return: The decorator
+    """
+
+    def decorator(fn: Callable[..., Any]) -> EventAccessor:
+        return EventAccessor(fn, event)
+
+    return decorator
@@ -1,4 +1,4 @@
-from typing import Dict, TYPE_CHECKING, Union
+from typing import Dict, Optional, TYPE_CHECKING, Union
 
 from .connection import CDPSession
 from .protocol import (
@@ -48,7 +48,7 @@ from .protocol import (
 )
 
 if TYPE_CHECKING:
-    from .client import Client, ClientDynamic
+    from cripy import ConnectionType, SessionType  # noqa: F401
 
 __all__ = ["TargetSession", "TargetSessionDynamic"]
 
@@ -102,10 +102,11 @@ class TargetSession(CDPSession):
 
     def __init__(
         self,
-        client: Union["Client", "TargetSession"],
+        client: Union["ConnectionType", "SessionType"],
         target_type: str,
         session_id: str,
         flat_session: bool = False,
+        target_id: Optional[str] = None,
     ) -> None:
         """Creat a new TargetSession
 
@@ -113,8 +114,11 @@ class TargetSession(CDPSession):
         :param target_type: The type of the target
         :param session_id: The session id for communication with the target
         :param flat_session: Is flat session mode enabled
+        :param target_id: The id of the target, if known
         """
-        super().__init__(client, target_type, session_id, flat_session)
+        super().__init__(
+            client, target_type, session_id, flat_session, target_id=target_id
+        )
         self.Accessibility: Accessibility = Accessibility(self)
         self.Animation: Animation = Animation(self)
         self.ApplicationCache: ApplicationCache = ApplicationCache(self)
@@ -172,7 +176,7 @@ class TargetSession(CDPSession):
             connection, target_type, session_id, flat_session=self._flat_session
         )
         if self._flat_session:
-            self._connection.add_session(session)
+            self._flat_connection.add_session(session)
         else:
             self._sessions[session_id] = session
         return session
@@ -181,11 +185,12 @@ class TargetSession(CDPSession):
 class TargetSessionDynamic(CDPSession):
     def __init__(
         self,
-        client: Union["ClientDynamic", "TargetSessionDynamic"],
+        client: Union["ConnectionType", "SessionType"],
         target_type: str,
         session_id: str,
         flat_session: bool = False,
         proto_def: Dict = None,
+        target_id: Optional[str] = None,
     ) -> None:
         """Creat a new TargetSession
 
@@ -194,8 +199,11 @@ class TargetSessionDynamic(CDPSession):
         :param session_id: The session id for communication with the target
         :param flat_session: Is flat session mode enabled
         :param proto_def: The CDP protocol definition
+        :param target_id: The id of the target, if known
         """
-        super().__init__(client, target_type, session_id, flat_session)
+        super().__init__(
+            client, target_type, session_id, flat_session, target_id=target_id
+        )
         self._proto_def: Dict = proto_def
         for domain, clazz in proto_def.items():
             setattr(self, domain, clazz(self))
@@ -219,7 +227,7 @@ class TargetSessionDynamic(CDPSession):
             proto_def=self._proto_def,
         )
         if self._flat_session:
-            self._connection.add_session(session)
+            self._flat_connection.add_session(session)
         else:
             self._sessions[session_id] = session
         return session
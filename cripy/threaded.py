@@ -0,0 +1,272 @@
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    set_event_loop,
+)
+from collections import deque
+from concurrent.futures import CancelledError, Future as ConcurrentFuture
+from functools import partial
+from threading import Lock, Thread
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from .connection import Connection
+from .errors import ClientError
+
+__all__ = ["ThreadedClient"]
+
+Submission = Tuple[
+    ConcurrentFuture, str, Optional[Dict], Optional[str], Optional[float]
+]
+
+
+class ThreadedClient:
+    """A thread-safe facade of a Connection for code running in other threads,
+    e.g. the workers of a thread pool.
+
+    The connection runs on an event loop in a dedicated thread. Commands submitted
+    from any thread return a concurrent.futures.Future, or block until their response
+    is received when using send. Submissions are queued and handed to the loop thread
+    in batches, a submission only wakes the loop if no batch is already scheduled, so
+    commands submitted in quick succession share a single call_soon_threadsafe.
+    """
+
+    __slots__ = [
+        "_batches",
+        "_connection",
+        "_connection_kwargs",
+        "_lock",
+        "_loop",
+        "_pending",
+        "_scheduled",
+        "_thread",
+        "_ws_url",
+    ]
+
+    def __init__(self, ws_url: Optional[str] = None, **connection_kwargs: Any) -> None:
+        """Create a new ThreadedClient
+
+        :param ws_url: The WS endpoint of the remote browser
+        :param connection_kwargs: Additional keyword arguments for the Connection,
+        e.g. transport_factory or command_timeout
+        """
+        self._ws_url: Optional[str] = ws_url
+        self._connection_kwargs: Dict[str, Any] = connection_kwargs
+        self._connection: Optional[Connection] = None
+        self._loop: Optional[AbstractEventLoop] = None
+        self._thread: Optional[Thread] = None
+        self._pending: Deque[Submission] = deque()
+        self._lock: Lock = Lock()
+        self._scheduled: bool = False
+        self._batches: int = 0
+
+    @property
+    def loop(self) -> Optional[AbstractEventLoop]:
+        """Returns the event loop of the loop thread"""
+        return self._loop
+
+    @property
+    def connection(self) -> Optional[Connection]:
+        """Returns the connection, which must only be used in the loop thread"""
+        return self._connection
+
+    @property
+    def batches(self) -> int:
+        """Returns the number of batches of submissions handed to the loop thread"""
+        return self._batches
+
+    def start(self, timeout: Optional[float] = None) -> "ThreadedClient":
+        """Starts the loop thread and connects to the browser, blocking until connected
+
+        :param timeout: Optional number of seconds connecting may take
+        :return: This client
+        """
+        if self._thread is not None:
+            raise ClientError("The ThreadedClient was already started")
+        loop = new_event_loop()
+        self._loop = loop
+        self._thread = Thread(
+            target=self._run_loop, name="cripy-loop", args=(loop,), daemon=True
+        )
+        self._thread.start()
+        try:
+            run_coroutine_threadsafe(self._connect(), loop).result(timeout)
+        except BaseException:
+            self._stop_loop()
+            raise
+        return self
+
+    def submit(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> ConcurrentFuture:
+        """Sends a command to the browser, or the session identified by the
+        supplied session id, from any thread
+
+        :param method: The method to be used
+        :param params: The optional parameters (arguments) for the command
+        :param session_id: Optional id of the session the command is sent to
+        :param timeout: Optional number of seconds the command has to receive a response
+        :return: A future that resolves once the commands response is received
+        """
+        loop = self._loop
+        if loop is None or self._connection is None:
+            raise ClientError("The ThreadedClient is not started")
+        future: ConcurrentFuture = ConcurrentFuture()
+        self._pending.append((future, method, params, session_id, timeout))
+        with self._lock:
+            if self._scheduled:
+                return future
+            self._scheduled = True
+        loop.call_soon_threadsafe(self._drain)
+        return future
+
+    def send(
+        self,
+        method: str,
+        params: Optional[Dict] = None,
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict:
+        """Sends a command to the browser, or the session identified by the
+        supplied session id, from any thread and blocks until its response is received
+
+        :param method: The method to be used
+        :param params: The optional parameters (arguments) for the command
+        :param session_id: Optional id of the session the command is sent to
+        :param timeout: Optional number of seconds the command has to receive a response
+        :return: The result of the command
+        """
+        return self.submit(method, params, session_id, timeout).result()
+
+    def create_session(self, target_id: str, timeout: Optional[float] = None) -> str:
+        """Attaches to the target specified by the supplied target id,
+        blocking until attached
+
+        :param target_id: The id of the target connecting to
+        :param timeout: Optional number of seconds attaching may take
+        :return: The id of the session, to be supplied to send and submit
+        """
+
+        async def create_session(connection: Connection) -> str:
+            session = await connection.create_session(target_id)
+            return session.session_id
+
+        return self.run(create_session).result(timeout)
+
+    def run(self, fn: Callable[[Connection], Awaitable[Any]]) -> ConcurrentFuture:
+        """Runs the supplied coroutine function, with the connection, in the loop thread
+
+        :param fn: The coroutine function
+        :return: A future that resolves with the result of the coroutine
+        """
+        if self._loop is None:
+            raise ClientError("The ThreadedClient is not started")
+        return run_coroutine_threadsafe(self._call(fn), self._loop)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Disposes of the connection and stops the loop thread
+
+        :param timeout: Optional number of seconds closing may take
+        """
+        if self._loop is None:
+            return
+        try:
+            if self._connection is not None:
+                self.run(lambda connection: connection.dispose()).result(timeout)
+        finally:
+            self._stop_loop()
+
+    async def _connect(self) -> None:
+        """Creates the connection, in the loop thread, and connects it"""
+        connection = Connection(
+            self._ws_url, loop=self._loop, **self._connection_kwargs
+        )
+        await connection.connect()
+        self._connection = connection
+
+    async def _call(self, fn: Callable[[Connection], Awaitable[Any]]) -> Any:
+        """Calls the coroutine function with the connection
+
+        :param fn: The coroutine function
+        :return: The result of the coroutine
+        """
+        return await fn(self._connection)
+
+    def _drain(self) -> None:
+        """Sends every submitted command, called in the loop thread"""
+        with self._lock:
+            self._scheduled = False
+        self._batches += 1
+        pending = self._pending
+        connection = self._connection
+        while pending:
+            future, method, params, session_id, timeout = pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if session_id is None:
+                    result = connection.send(method, params, timeout)
+                else:
+                    session = connection.session(session_id)
+                    if session is None:
+                        raise ClientError(f"No session with the id {session_id}")
+                    result = session.send(method, params, timeout)
+            except Exception as e:
+                future.set_exception(e)
+                continue
+            result.add_done_callback(partial(_copy_outcome, future))
+
+    def _run_loop(self, loop: AbstractEventLoop) -> None:
+        """Runs the event loop of the loop thread
+
+        :param loop: The event loop
+        """
+        set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _stop_loop(self) -> None:
+        """Stops the event loop and waits for the loop thread to exit"""
+        loop, thread = self._loop, self._thread
+        self._loop = None
+        self._thread = None
+        self._connection = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    def __enter__(self) -> "ThreadedClient":
+        if self._thread is None:
+            self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(wsurl={self._ws_url}, started={self._thread is not None})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+def _copy_outcome(future: ConcurrentFuture, result: Future) -> None:
+    """Copies the outcome of the commands asyncio future to the concurrent future
+
+    :param future: The future returned by submit
+    :param result: The future of the command
+    """
+    if result.cancelled():
+        future.set_exception(CancelledError())
+        return
+    error = result.exception()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result.result())
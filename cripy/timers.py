@@ -0,0 +1,156 @@
+import logging
+from asyncio import AbstractEventLoop, TimerHandle
+from heapq import heapify, heappop, heappush
+from typing import Any, Callable, List, Optional, Tuple
+
+__all__ = ["Timer", "Timers"]
+
+logger = logging.getLogger(__name__)
+
+
+class Timer:
+    """A callback scheduled using Timers"""
+
+    __slots__ = ["when", "callback", "args", "cancelled", "_timers"]
+
+    def __init__(
+        self,
+        when: float,
+        callback: Callable[..., Any],
+        args: Tuple,
+        timers: Optional["Timers"] = None,
+    ) -> None:
+        self.when: float = when
+        self.callback: Callable[..., Any] = callback
+        self.args: Tuple = args
+        self.cancelled: bool = False
+        # the Timers whose heap holds the timer, if it is still in the heap
+        self._timers: Optional[Timers] = timers
+
+    def cancel(self) -> None:
+        """Cancel the timer, its callback will not be called"""
+        if self.cancelled:
+            return
+        self.cancelled = True
+        self.callback = None
+        self.args = None
+        timers = self._timers
+        if timers is not None:
+            self._timers = None
+            timers._discard()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(when={self.when}, cancelled={self.cancelled})"
+        )
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class Timers:
+    """Shared timer structure for all the timeouts of a connection.
+
+    Rather than creating a TimerHandle for every timeout, timers are kept in a
+    heap ordered by their deadline and a single TimerHandle is scheduled for the
+    earliest one. Since most timeouts share the same duration, a newly added timer
+    rarely becomes the earliest and so rarely causes the handle to be rescheduled.
+    Cancelled timers are dropped lazily when they reach the top of the heap, or all
+    at once when they make up more than half of the heap, so timers cancelled long
+    before their deadline, e.g. those of commands that received their response,
+    do not accumulate.
+    """
+
+    __slots__ = ["_loop", "_heap", "_handle", "_handle_when", "_seq", "_cancelled"]
+
+    def __init__(self, loop: AbstractEventLoop) -> None:
+        """Create a new Timers
+
+        :param loop: The event loop used to schedule the wake ups
+        """
+        self._loop: AbstractEventLoop = loop
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._handle: Optional[TimerHandle] = None
+        self._handle_when: float = 0.0
+        self._seq: int = 0
+        # the number of cancelled timers still in the heap
+        self._cancelled: int = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def call_later(
+        self, delay: float, callback: Callable[..., Any], *args: Any
+    ) -> Timer:
+        """Schedule the callback to be called with the supplied args after delay seconds
+
+        :param delay: Number of seconds until the callback is called
+        :param callback: The callback to be called
+        :param args: The arguments the callback is to be called with
+        :return: The timer, that can be used to cancel the callback
+        """
+        when = self._loop.time() + delay
+        timer = Timer(when, callback, args, self)
+        self._seq += 1
+        heappush(self._heap, (when, self._seq, timer))
+        if self._handle is None or when < self._handle_when:
+            self._schedule(when)
+        return timer
+
+    def clear(self) -> None:
+        """Cancels all timers"""
+        for _, _, timer in self._heap:
+            timer._timers = None
+            timer.cancel()
+        self._heap.clear()
+        self._cancelled = 0
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _discard(self) -> None:
+        """Called when a timer in the heap is cancelled, removes the cancelled
+        timers from the heap once they make up more than half of it"""
+        self._cancelled += 1
+        heap = self._heap
+        if self._cancelled * 2 <= len(heap):
+            return
+        heap[:] = [entry for entry in heap if not entry[2].cancelled]
+        heapify(heap)
+        self._cancelled = 0
+        if not heap and self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self, when: float) -> None:
+        """Schedules the wake up for the earliest timer
+
+        :param when: The loop time of the earliest timer
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle_when = when
+        self._handle = self._loop.call_at(when, self._run)
+
+    def _run(self) -> None:
+        """Calls the callbacks of every expired timer and schedules the next wake up"""
+        self._handle = None
+        heap = self._heap
+        now = self._loop.time()
+        while heap:
+            when, _, timer = heap[0]
+            if timer.cancelled:
+                heappop(heap)
+                self._cancelled -= 1
+                continue
+            if when > now:
+                self._schedule(when)
+                return
+            heappop(heap)
+            callback, args = timer.callback, timer.args
+            timer._timers = None
+            timer.cancel()
+            try:
+                callback(*args)
+            except Exception:  # pragma: no cover
+                logger.exception("timer callback raised an exception")
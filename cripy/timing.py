@@ -0,0 +1,44 @@
+from typing import Callable, Dict, Optional, Union
+
+__all__ = ["TimedEvent", "wire_size"]
+
+Frame = Union[str, bytes]
+
+# CPython knows if a str is ASCII, one byte per character, without scanning it.
+# str.isascii is new in Python 3.7
+STR_IS_ASCII: Optional[Callable[[str], bool]] = getattr(str, "isascii", None)
+
+
+class TimedEvent(dict):
+    """The params of an event, emitted in place of the plain dict when the
+    connection records timing, along with when the frame carrying the event
+    was received and its size.
+
+    Being a dict, listeners that do not care about the timing are unaffected.
+    """
+
+    __slots__ = ["received_at", "size"]
+
+    def __init__(self, params: Dict, received_at: float, size: int) -> None:
+        """Create a new TimedEvent
+
+        :param params: The params of the event
+        :param received_at: The time.monotonic timestamp of when the frame was received
+        :param size: The size in bytes of the frame
+        """
+        super().__init__(params)
+        self.received_at: float = received_at
+        self.size: int = size
+
+
+def wire_size(frame: Frame) -> int:
+    """Returns the size in bytes of the supplied frame as it was received
+
+    :param frame: The raw frame
+    :return: The number of bytes of the frame, text frames are UTF-8
+    """
+    if isinstance(frame, str):
+        if STR_IS_ASCII is not None and STR_IS_ASCII(frame):
+            return len(frame)
+        return len(frame.encode("utf-8"))
+    return len(frame)
@@ -0,0 +1,439 @@
+import os
+import sys
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    IncompleteReadError,
+    StreamReader,
+    StreamReaderProtocol,
+    StreamWriter,
+    get_event_loop,
+    open_unix_connection,
+    shield,
+    sleep,
+)
+from asyncio.subprocess import DEVNULL, Process, create_subprocess_exec
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Deque,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from websockets import ConnectionClosed, WebSocketClientProtocol, connect
+
+from .errors import TransportClosedError
+
+__all__ = [
+    "InMemoryTransport",
+    "PipeTransport",
+    "TRANSPORT_CLOSED_ERRORS",
+    "Transport",
+    "TransportFactory",
+    "UnixSocketTransport",
+    "WebSocketTransport",
+    "launch_with_pipe",
+]
+
+Frame = Union[str, bytes]
+
+# The errors raised by a transports recv and send once the transport is closed
+TRANSPORT_CLOSED_ERRORS: Tuple = (
+    ConnectionClosed,
+    ConnectionResetError,
+    BrokenPipeError,
+    TransportClosedError,
+)
+
+# The fds Chrome reads commands from and writes responses to when
+# launched with --remote-debugging-pipe
+CHROME_PIPE_IN_FD: int = 3
+CHROME_PIPE_OUT_FD: int = 4
+# Messages sent over the pipe are delimited by a NUL byte
+PIPE_DELIMITER: bytes = b"\0"
+# The maximum size of a single message read from the pipe
+PIPE_READ_LIMIT: int = 2 ** 31 - 1
+# The number of seconds between the checks of Transport.wait_closed's default
+# implementation
+CLOSED_POLL_INTERVAL: float = 0.5
+
+
+class Transport:
+    """The interface of the byte streams a Connection uses to communicate with
+    the remote browser.
+
+    recv and send are looked up once by the connection's receive and writer loops,
+    so implementations can make them attributes bound directly to the methods of
+    the underlying stream to avoid an extra coroutine per message. Both must raise
+    one of TRANSPORT_CLOSED_ERRORS once the transport is closed.
+    """
+
+    __slots__ = []
+
+    # If true, messages are only sent as str
+    text_only: ClassVar[bool] = False
+
+    @property
+    def closed(self) -> bool:
+        """Returns T/F indicating if the transport is closed"""
+        raise NotImplementedError()  # pragma: no cover
+
+    async def recv(self) -> Frame:
+        """Receives the next message
+
+        :return: The message
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    async def send(self, data: Frame) -> None:
+        """Sends the supplied message
+
+        :param data: The message to be sent
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+    async def close(self) -> None:
+        """Gracefully closes the transport"""
+        raise NotImplementedError()  # pragma: no cover
+
+    def abort(self) -> None:
+        """Closes the transport immediately, discarding anything not yet sent"""
+        raise NotImplementedError()  # pragma: no cover
+
+    async def wait_closed(self) -> None:
+        """Waits until the transport is closed, by either end, without receiving
+        any message. The default implementation polls closed
+        """
+        while not self.closed:
+            await sleep(CLOSED_POLL_INTERVAL)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(closed={self.closed})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+TransportFactory = Callable[[], Awaitable[Transport]]
+
+
+class WebSocketTransport(Transport):
+    """Transport over a websocket, the default transport"""
+
+    __slots__ = ["_ws"]
+
+    # chrome only accepts text frames
+    text_only: ClassVar[bool] = True
+
+    @classmethod
+    async def connect(
+        cls, ws_url: str, loop: Optional[AbstractEventLoop] = None
+    ) -> "WebSocketTransport":
+        """Connects to the remote browser's websocket endpoint
+
+        :param ws_url: The websocket URL to connect to
+        :param loop: Optional event loop to use
+        :return: The connected transport
+        """
+        ws = await connect(
+            ws_url,
+            ping_interval=None,  # chrome no ping pong and websockets closes down on no pong :'(
+            ping_timeout=None,
+            max_size=None,
+            compression=None,
+            max_queue=2 ** 7,
+            loop=loop,
+        )
+        return cls(ws)
+
+    def __init__(self, ws: WebSocketClientProtocol) -> None:
+        """Create a new WebSocketTransport
+
+        :param ws: The connected websocket
+        """
+        self._ws: WebSocketClientProtocol = ws
+
+    @property
+    def closed(self) -> bool:
+        return self._ws.closed
+
+    async def recv(self) -> Frame:
+        return await self._ws.recv()
+
+    async def send(self, data: Frame) -> None:
+        await self._ws.send(data)
+
+    async def close(self) -> None:
+        await self._ws.close()
+
+    def abort(self) -> None:
+        transport = getattr(self._ws, "transport", None)
+        if transport is not None:
+            transport.abort()
+
+    async def wait_closed(self) -> None:
+        await self._ws.wait_closed()
+
+
+class PipeTransport(Transport):
+    """Transport over a pair of pipes, or any other stream, carrying NUL delimited
+    JSON messages as used by Chrome's --remote-debugging-pipe.
+
+    Compared to websockets there is no HTTP upgrade, framing or masking and
+    messages are received as bytes, which the codecs decode without first
+    converting them to str.
+    """
+
+    __slots__ = ["_reader", "_writer"]
+
+    @classmethod
+    async def from_fds(
+        cls, read_fd: int, write_fd: int, loop: Optional[AbstractEventLoop] = None
+    ) -> "PipeTransport":
+        """Creates a PipeTransport reading from and writing to the supplied
+        file descriptors, which are owned by the transport afterwards
+
+        :param read_fd: The fd the browser's messages are read from
+        :param write_fd: The fd messages to the browser are written to
+        :param loop: Optional event loop to use
+        :return: The transport
+        """
+        if loop is None:
+            loop = get_event_loop()
+        reader = StreamReader(limit=PIPE_READ_LIMIT, loop=loop)
+        await loop.connect_read_pipe(
+            lambda: StreamReaderProtocol(reader, loop=loop), os.fdopen(read_fd, "rb", 0)
+        )
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: StreamReaderProtocol(StreamReader(loop=loop), loop=loop),
+            os.fdopen(write_fd, "wb", 0),
+        )
+        writer = StreamWriter(transport, protocol, None, loop)
+        return cls(reader, writer)
+
+    @classmethod
+    async def from_socket(
+        cls, sock: Any, loop: Optional[AbstractEventLoop] = None
+    ) -> "PipeTransport":
+        """Creates a PipeTransport over the supplied connected socket,
+        for example one end of a socketpair
+
+        :param sock: The connected socket
+        :param loop: Optional event loop to use
+        :return: The transport
+        """
+        if loop is None:
+            loop = get_event_loop()
+        reader = StreamReader(limit=PIPE_READ_LIMIT, loop=loop)
+        protocol = StreamReaderProtocol(reader, loop=loop)
+        transport, _ = await loop.create_connection(lambda: protocol, sock=sock)
+        writer = StreamWriter(transport, protocol, reader, loop)
+        return cls(reader, writer)
+
+    def __init__(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """Create a new PipeTransport
+
+        :param reader: The stream the browser's messages are read from
+        :param writer: The stream messages to the browser are written to
+        """
+        self._reader: StreamReader = reader
+        self._writer: StreamWriter = writer
+
+    @property
+    def closed(self) -> bool:
+        return self._writer.transport.is_closing()
+
+    async def recv(self) -> bytes:
+        try:
+            data = await self._reader.readuntil(PIPE_DELIMITER)
+        except IncompleteReadError:
+            raise TransportClosedError("The pipe was closed")
+        return data[:-1]
+
+    async def send(self, data: Frame) -> None:
+        encoded = data.encode("utf-8") if isinstance(data, str) else data
+        writer = self._writer
+        if writer.transport.is_closing():
+            raise TransportClosedError("The pipe was closed")
+        writer.writelines((encoded, PIPE_DELIMITER))
+        await writer.drain()
+
+    async def close(self) -> None:
+        self._writer.close()
+
+    def abort(self) -> None:
+        self._writer.transport.abort()
+
+    async def wait_closed(self) -> None:
+        # resolves once the pipe is lost, not only once it was closed by us
+        if hasattr(self._writer, "wait_closed"):
+            try:
+                await self._writer.wait_closed()
+            except Exception:
+                pass
+        else:  # pragma: no cover
+            await super().wait_closed()
+
+
+class UnixSocketTransport(PipeTransport):
+    """Transport over a Unix domain socket carrying NUL delimited JSON messages,
+    the same framing as PipeTransport. Useful for talking to a browser through
+    a local relay, e.g. a CDPProxy listening on a Unix socket, without the cost
+    of websockets.
+    """
+
+    __slots__ = []
+
+    @classmethod
+    async def connect(
+        cls, path: str, loop: Optional[AbstractEventLoop] = None
+    ) -> "UnixSocketTransport":
+        """Connects to the Unix domain socket at the supplied path
+
+        :param path: The path of the socket
+        :param loop: Optional event loop to use
+        :return: The connected transport
+        """
+        reader, writer = await open_unix_connection(path, limit=PIPE_READ_LIMIT)
+        return cls(reader, writer)
+
+
+class InMemoryTransport(Transport):
+    """Transport passing messages, as is, to the other end of an in-memory pair
+    without any encoding, framing or I/O. Used to run a Connection against an
+    in-process peer such as a fake browser in tests and benchmarks.
+    """
+
+    __slots__ = ["_closed", "_closed_waiter", "_inbox", "_peer", "_waiter"]
+
+    @classmethod
+    def pair(cls) -> Tuple["InMemoryTransport", "InMemoryTransport"]:
+        """Creates two transports connected to each other
+
+        :return: The two ends of the pair
+        """
+        one = cls()
+        other = cls()
+        one._peer = other
+        other._peer = one
+        return one, other
+
+    def __init__(self) -> None:
+        self._closed: bool = False
+        self._closed_waiter: Optional[Future] = None
+        self._inbox: Deque[Frame] = deque()
+        self._peer: Optional[InMemoryTransport] = None
+        self._waiter: Optional[Future] = None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def recv(self) -> Frame:
+        inbox = self._inbox
+        while not inbox:
+            if self._closed:
+                raise TransportClosedError("The in-memory transport was closed")
+            self._waiter = get_event_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return inbox.popleft()
+
+    async def send(self, data: Frame) -> None:
+        if self._closed:
+            raise TransportClosedError("The in-memory transport was closed")
+        self._peer._deliver(data)
+
+    async def close(self) -> None:
+        self.abort()
+
+    def abort(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wake()
+        closed_waiter = self._closed_waiter
+        if closed_waiter is not None and not closed_waiter.done():
+            closed_waiter.set_result(None)
+        self._peer.abort()
+
+    async def wait_closed(self) -> None:
+        if self._closed:
+            return
+        if self._closed_waiter is None:
+            self._closed_waiter = get_event_loop().create_future()
+        await shield(self._closed_waiter)
+
+    def _deliver(self, data: Frame) -> None:
+        """Adds the message sent by the peer to the inbox
+
+        :param data: The message
+        """
+        self._inbox.append(data)
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wakes up a recv waiting for a message"""
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+
+async def launch_with_pipe(
+    executable: str,
+    args: Sequence[str] = (),
+    loop: Optional[AbstractEventLoop] = None,
+    **kwargs: Any,
+) -> Tuple[Process, PipeTransport]:
+    """Launches Chrome with --remote-debugging-pipe and returns the process and
+    a PipeTransport connected to it, to be supplied to Connection.connect.
+
+    Chrome reads commands from fd 3 and writes responses and events to fd 4, so
+    the pipes are moved onto those fds in the child before Chrome is executed.
+    Only supported on POSIX systems.
+
+    :param executable: The path to the Chrome executable
+    :param args: Additional command line arguments for Chrome
+    :param loop: Optional event loop to use
+    :param kwargs: Additional keyword arguments for asyncio.create_subprocess_exec
+    :return: The Chrome process and the transport connected to it
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        raise NotImplementedError("launch_with_pipe is only supported on POSIX systems")
+    import fcntl
+
+    # chrome_in: chrome reads from its read end, we write to its write end
+    # chrome_out: chrome writes to its write end, we read from its read end
+    chrome_in_read, chrome_in_write = os.pipe()
+    chrome_out_read, chrome_out_write = os.pipe()
+
+    def move_pipes_onto_chrome_fds() -> None:
+        # dup above the target fds first so that neither dup2 clobbers the other pipe
+        in_fd = fcntl.fcntl(chrome_in_read, fcntl.F_DUPFD, CHROME_PIPE_OUT_FD + 1)
+        out_fd = fcntl.fcntl(chrome_out_write, fcntl.F_DUPFD, CHROME_PIPE_OUT_FD + 1)
+        os.dup2(in_fd, CHROME_PIPE_IN_FD)
+        os.dup2(out_fd, CHROME_PIPE_OUT_FD)
+
+    kwargs.setdefault("stdin", DEVNULL)
+    try:
+        process = await create_subprocess_exec(
+            executable,
+            *args,
+            "--remote-debugging-pipe",
+            preexec_fn=move_pipes_onto_chrome_fds,
+            pass_fds=(CHROME_PIPE_IN_FD, CHROME_PIPE_OUT_FD),
+            **kwargs,
+        )
+    finally:
+        os.close(chrome_in_read)
+        os.close(chrome_out_write)
+    transport = await PipeTransport.from_fds(chrome_out_read, chrome_in_write, loop)
+    return process, transport
@@ -0,0 +1,126 @@
+from asyncio import Future
+from typing import Any, Callable, Optional
+
+from .errors import EventTimeoutError, NetworkError
+from .timers import Timer, Timers
+
+__all__ = ["EventPredicate", "EventWaiter"]
+
+EventPredicate = Callable[[Any], bool]
+
+
+class EventWaiter:
+    """Resolves a future with the first event, emitted by a connection or session,
+    accepted by the predicate.
+
+    The listener of the waiter is removed as soon as the future is done, whether it
+    resolved with an event, timed out or was cancelled by the caller, e.g. by
+    asyncio.wait_for, so abandoned waits do not leave listeners behind. If the
+    emitter disconnects first the future fails with NetworkError.
+    """
+
+    __slots__ = ["_emitter", "_event", "_future", "_predicate", "_timer"]
+
+    def __init__(
+        self,
+        emitter: Any,
+        event: str,
+        future: Future,
+        predicate: Optional[EventPredicate] = None,
+        timeout: Optional[float] = None,
+        timers: Optional[Timers] = None,
+    ) -> None:
+        """Create a new EventWaiter
+
+        :param emitter: The connection or session emitting the event
+        :param event: The name of the event
+        :param future: The future resolved with the event
+        :param predicate: Optional function called with each event that returns
+        T/F indicating if the event is the one waited for
+        :param timeout: Optional number of seconds to wait for the event before
+        failing the future with EventTimeoutError
+        :param timers: The timers used to schedule the timeout, which must not be
+        cleared while the emitter is connected as nothing else fails the future
+        """
+        self._emitter: Any = emitter
+        self._event: str = event
+        self._future: Future = future
+        self._predicate: Optional[EventPredicate] = predicate
+        self._timer: Optional[Timer] = None
+        emitter.on(event, self._on_event)
+        emitter.on(emitter.Events.Disconnected, self._on_disconnected)
+        future.add_done_callback(self._on_done)
+        if timeout is not None:
+            self._timer = timers.call_later(timeout, self._expire, timeout)
+
+    @property
+    def future(self) -> Future:
+        """Returns the future resolved with the event"""
+        return self._future
+
+    def _on_event(self, event: Any = None) -> None:
+        """Resolves the future with the event if the predicate accepts it
+
+        :param event: The event
+        """
+        future = self._future
+        if future.done():
+            return
+        predicate = self._predicate
+        if predicate is not None:
+            try:
+                if not predicate(event):
+                    return
+            except Exception as e:
+                future.set_exception(e)
+                self._cleanup()
+                return
+        future.set_result(event)
+        self._cleanup()
+
+    def _on_disconnected(self) -> None:
+        """Fails the future with NetworkError if it is still pending"""
+        if not self._future.done():
+            self._future.set_exception(
+                NetworkError(f"{self._event}: Disconnected while waiting for the event")
+            )
+        self._cleanup()
+
+    def _expire(self, timeout: float) -> None:
+        """Fails the future with EventTimeoutError if it is still pending
+
+        :param timeout: The timeout of the wait
+        """
+        self._timer = None
+        if not self._future.done():
+            self._future.set_exception(
+                EventTimeoutError(
+                    f"{self._event}: No event received within {timeout} seconds"
+                )
+            )
+            self._cleanup()
+
+    def _on_done(self, future: Future) -> None:
+        """Removes the listener once the future is done
+
+        :param future: The future
+        """
+        self._cleanup()
+
+    def _cleanup(self) -> None:
+        """Removes the listener and cancels the timeout, if they were not already"""
+        emitter = self._emitter
+        if emitter is None:
+            return
+        self._emitter = None
+        emitter.remove_listener(self._event, self._on_event)
+        emitter.remove_listener(emitter.Events.Disconnected, self._on_disconnected)
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(event={self._event}, done={self._future.done()})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,262 @@
+from asyncio import Future, get_event_loop
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .errors import ClientError
+
+__all__ = ["CommandWindow"]
+
+
+class CommandWindow:
+    """Bounds the number of commands that are in flight, written to the remote
+    browser but without a response, at once.
+
+    Commands submitted while the window is full are parked in the lane of their
+    priority, in the order they were submitted, and are written once a command in
+    flight is done. Parked control commands are written before parked bulk commands,
+    except that once max_streak control commands entered the window in a row a parked
+    bulk command enters, the same as the writer of the connection. The priority of a
+    command is handed to the write function along with the command.
+
+    Callers can await wait_for_room before sending to be pushed back on rather than
+    parking commands, and the number of parked commands can be bounded using max_parked.
+    Messages that do not enter the window, submitted using submit_nowait, are parked
+    behind the parked commands they would otherwise overtake.
+    """
+
+    __slots__ = [
+        "_abandoned",
+        "_in_flight",
+        "_lanes",
+        "_limit",
+        "_max_parked",
+        "_max_streak",
+        "_queued",
+        "_room_waiters",
+        "_streak",
+        "_uncounted",
+        "_write",
+    ]
+
+    def __init__(
+        self,
+        limit: int,
+        write: Callable[[Dict, int], Any],
+        max_parked: Optional[int] = None,
+        max_streak: int = 16,
+    ) -> None:
+        """Create a new CommandWindow
+
+        :param limit: The maximum number of commands in flight at once
+        :param write: The function used to write a command that entered the window
+        :param max_parked: Optional maximum number of parked commands, submitting a
+        command that would be parked once reached raises ClientError. Defaults to no limit
+        :param max_streak: The maximum number of parked control priority commands that
+        enter the window in a row while parked bulk priority commands are waiting
+        """
+        if limit < 1:
+            raise ClientError(f"The limit of a CommandWindow must be >= 1, got {limit}")
+        if max_parked is not None and max_parked < 0:
+            raise ClientError(
+                f"The max_parked of a CommandWindow must be >= 0, got {max_parked}"
+            )
+        self._limit: int = limit
+        self._write: Callable[[Dict, int], Any] = write
+        self._max_parked: Optional[int] = max_parked
+        self._max_streak: int = max_streak
+        self._in_flight: Set[int] = set()
+        # the parked commands of each priority, kept sorted by priority
+        self._lanes: Dict[int, Deque[Dict]] = {}
+        self._queued: int = 0
+        self._abandoned: Set[int] = set()
+        # the ids of the parked messages that do not enter the window
+        self._uncounted: Set[int] = set()
+        self._streak: int = 0
+        self._room_waiters: List[Future] = []
+
+    @property
+    def limit(self) -> int:
+        """Returns the maximum number of commands in flight at once"""
+        return self._limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        """Sets the maximum number of commands in flight at once, writing parked
+        commands if the limit was raised
+
+        :param value: The new limit
+        """
+        if value < 1:
+            raise ClientError(f"The limit of a CommandWindow must be >= 1, got {value}")
+        self._limit = value
+        self._pump()
+
+    @property
+    def max_parked(self) -> Optional[int]:
+        """Returns the maximum number of parked commands, None if unbounded"""
+        return self._max_parked
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of commands currently in flight"""
+        return len(self._in_flight)
+
+    @property
+    def parked(self) -> int:
+        """Returns the number of commands waiting for room in the window"""
+        return self._queued - len(self._abandoned)
+
+    @property
+    def full(self) -> bool:
+        """Returns T/F indicating if the window is full"""
+        return len(self._in_flight) >= self._limit
+
+    @property
+    def has_room(self) -> bool:
+        """Returns T/F indicating if a command submitted now is written right away"""
+        return not self._queued and len(self._in_flight) < self._limit
+
+    def submit(self, msg: Dict, priority: int) -> None:
+        """Writes the command if the window has room otherwise parks it
+
+        :param msg: The command, its id must already be set
+        :param priority: The priority of the command
+        :raises ClientError: If the command would be parked but max_parked
+        commands are already parked
+        """
+        if self._queued or len(self._in_flight) >= self._limit:
+            max_parked = self._max_parked
+            if (
+                max_parked is not None
+                and self.parked - len(self._uncounted) >= max_parked
+            ):
+                raise ClientError(
+                    f"{msg.get('method')}: The in flight window is full and "
+                    f"{max_parked} commands are already waiting for room"
+                )
+            self._park(msg, priority)
+            return
+        self._in_flight.add(msg["id"])
+        self._write(msg, priority)
+
+    def submit_nowait(self, msg: Dict, priority: int) -> None:
+        """Writes the message, which never enters the window e.g. a command sent
+        using send_nowait, unless parked commands it would overtake exist. Then it is
+        parked behind them, without counting towards max_parked, and is written once
+        they were, without waiting for room
+
+        :param msg: The message, its id must already be set
+        :param priority: The priority of the message
+        """
+        for lane_priority, lane in self._lanes.items():
+            if lane_priority <= priority and lane:
+                self._uncounted.add(msg["id"])
+                self._park(msg, priority)
+                return
+        self._write(msg, priority)
+
+    async def wait_for_room(self) -> None:
+        """Waits until a command submitted right after would be written right away
+        rather than parked. Returns immediately if there is room already
+        """
+        while not self.has_room:
+            waiter = get_event_loop().create_future()
+            self._room_waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if not waiter.done():
+                    self._room_waiters.remove(waiter)
+
+    def done(self, _id: int) -> None:
+        """Marks the command identified by the supplied id as done, either because its
+        response was received or it was abandoned (cancelled, timed out), and writes
+        parked commands if there is now room for them
+
+        :param _id: The id of the command
+        """
+        in_flight = self._in_flight
+        if _id in in_flight:
+            in_flight.remove(_id)
+            self._pump()
+        elif self._queued:
+            self._abandoned.add(_id)
+
+    def clear(self) -> None:
+        """Forgets every command in flight or parked, waking up the callers waiting
+        for room"""
+        self._in_flight.clear()
+        self._lanes.clear()
+        self._queued = 0
+        self._abandoned.clear()
+        self._uncounted.clear()
+        self._streak = 0
+        self._wake_room_waiters()
+
+    def _park(self, msg: Dict, priority: int) -> None:
+        """Adds the message to the lane of its priority
+
+        :param msg: The message
+        :param priority: The priority of the message
+        """
+        lane = self._lanes.get(priority)
+        if lane is None:
+            lane = self._lanes[priority] = deque()
+            self._lanes = dict(sorted(self._lanes.items()))
+        lane.append(msg)
+        self._queued += 1
+
+    def _next_lane(self) -> Tuple[int, Deque[Dict], bool]:
+        """Returns the priority and lane of the next parked command to enter the window
+
+        :return: The priority, the lane and T/F indicating if the lane was picked
+        over another lane with parked commands
+        """
+        lanes = [(priority, lane) for priority, lane in self._lanes.items() if lane]
+        if len(lanes) == 1:
+            return lanes[0][0], lanes[0][1], False
+        if self._streak >= self._max_streak:
+            return lanes[1][0], lanes[1][1], False
+        return lanes[0][0], lanes[0][1], True
+
+    def _pump(self) -> None:
+        """Writes parked commands while the window has room, and the parked
+        messages that do not enter the window once they are next in line"""
+        abandoned = self._abandoned
+        uncounted = self._uncounted
+        in_flight = self._in_flight
+        while self._queued:
+            priority, lane, overtook = self._next_lane()
+            _id = lane[0]["id"]
+            counted = _id not in uncounted
+            if counted and _id not in abandoned and len(in_flight) >= self._limit:
+                break
+            msg = lane.popleft()
+            self._queued -= 1
+            self._streak = self._streak + 1 if overtook else 0
+            if _id in abandoned:
+                abandoned.remove(_id)
+                continue
+            if counted:
+                in_flight.add(_id)
+            else:
+                uncounted.remove(_id)
+            self._write(msg, priority)
+        if not self._queued:
+            abandoned.clear()
+        if self._room_waiters and self.has_room:
+            self._wake_room_waiters()
+
+    def _wake_room_waiters(self) -> None:
+        """Wakes up the callers waiting for room, they check for room again"""
+        waiters = self._room_waiters
+        self._room_waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(limit={self._limit}, in_flight={self.in_flight}, parked={self.parked})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -29,6 +29,7 @@ setup(
     url="https://github.com/webrecorder/chrome-remote-interface-py",
     packages=find_packages(exclude=["tests", "tests.*"]),
     install_requires=get_requirements(),
+    extras_require={"orjson": ["orjson"]},
     package_data={"": ["templates/simple/*.j2", "templates/full/*.j2"]},
     include_package_data=True,
     zip_safe=False,
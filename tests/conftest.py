@@ -1,14 +1,25 @@
-from typing import Dict, List, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 import pytest
+import pytest_asyncio
 import uvloop
 from _pytest.fixtures import SubRequest
 
-from cripy import CDP, Client, connect
-from .helpers import Cleaner, launch_chrome
+from cripy import CDP, CDPSession, Client, connect
+from cripy.connection import Connection
+from .helpers import Cleaner, FakeBrowser, launch_chrome
 
 uvloop.install()
 
+FakeCDP = Tuple[FakeBrowser, Connection, Optional[CDPSession]]
+
+
+def pytest_configure(config: Any) -> None:
+    config.addinivalue_line(
+        "markers",
+        "fake_cdp(**kwargs): the arguments of fake_cdp_factory used by fake_cdp",
+    )
+
 
 @pytest.fixture(scope="class")
 def event_loop() -> uvloop.Loop:
@@ -51,3 +62,52 @@ async def protocol_def(request: SubRequest) -> Dict[str, Union[List[Dict], Dict]
     protocol = await CDP.Protocol()
     request.cls.protocol = protocol
     yield protocol
+
+
+@pytest_asyncio.fixture
+async def fake_cdp_factory() -> AsyncIterator[Callable[..., Any]]:
+    """Yields a coroutine function connecting a Connection to a new FakeBrowser,
+    every connection and browser it created is disposed of once the test is done.
+
+    The function accepts the handlers of the browser, registered before connecting,
+    whether to attach a session to page-1 (session, defaults to True) and the keyword
+    arguments of the Connection, flatten_sessions defaults to True. It returns
+    (browser, connection, session), session being None if no session was attached.
+    """
+    created: List[Tuple[FakeBrowser, Connection]] = []
+
+    async def factory(
+        handlers: Optional[Dict[str, Callable]] = None,
+        session: bool = True,
+        **kwargs: Any,
+    ) -> FakeCDP:
+        browser = FakeBrowser()
+        for method, handler in (handlers or {}).items():
+            browser.handle(method, handler)
+        kwargs.setdefault("flatten_sessions", True)
+        conn = Connection(**kwargs)
+        created.append((browser, conn))
+        await conn.connect(transport=browser.start())
+        return browser, conn, await conn.create_session("page-1") if session else None
+
+    try:
+        yield factory
+    finally:
+        for browser, conn in created:
+            try:
+                await conn.dispose()
+            finally:
+                await browser.stop()
+
+
+@pytest_asyncio.fixture
+async def fake_cdp(
+    request: SubRequest, fake_cdp_factory: Callable[..., Any]
+) -> FakeCDP:
+    """The (browser, connection, session) of a Connection, using flat sessions,
+    connected to a FakeBrowser with a session attached to page-1. The arguments of
+    fake_cdp_factory can be supplied using the fake_cdp marker
+    """
+    marker = request.node.get_closest_marker("fake_cdp")
+    kwargs = marker.kwargs if marker is not None else {}
+    return await fake_cdp_factory(**kwargs)
@@ -1,4 +1,5 @@
 from .chrome import launch_chrome
+from .fake_browser import FakeBrowser, FakeProtocolError
 from .utils import (
     Cleaner,
     evaluation_result,
@@ -8,6 +9,8 @@ from .utils import (
 
 __all__ = [
     "launch_chrome",
+    "FakeBrowser",
+    "FakeProtocolError",
     "Cleaner",
     "evaluation_result",
     "make_target_selector",
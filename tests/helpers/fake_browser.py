@@ -0,0 +1,122 @@
+"""An in-process stand-in for Chrome that speaks the CDP over an InMemoryTransport,
+so Connection and its sessions can be tested without a browser or a network"""
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+import ujson
+
+from cripy.errors import TransportClosedError
+from cripy.transports import InMemoryTransport
+
+__all__ = ["FakeBrowser", "FakeProtocolError"]
+
+Handler = Callable[[Dict], Optional[Dict]]
+
+
+class FakeProtocolError(Exception):
+    """Raised by a handler to answer the command with an error"""
+
+
+class FakeBrowser:
+    def __init__(self, targets: Optional[Dict[str, str]] = None) -> None:
+        """Create a new FakeBrowser
+
+        :param targets: Optional mapping of target id to target type of the targets
+        that can be attached to. Defaults to a single page with the id "page-1"
+        """
+        self.transport, self.client_transport = InMemoryTransport.pair()
+        self.targets: Dict[str, str] = targets or {"page-1": "page"}
+        self.received: List[Dict] = []
+        self.handlers: Dict[str, Handler] = {}
+        self.sessions: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> InMemoryTransport:
+        """Starts serving and returns the transport to be supplied to Connection.connect"""
+        self._task = asyncio.get_event_loop().create_task(self._serve())
+        return self.client_transport
+
+    async def stop(self) -> None:
+        self.transport.abort()
+        if self._task is not None:
+            await asyncio.wait([self._task], timeout=1)
+
+    def handle(self, method: str, handler: Handler) -> None:
+        """Answer the command with the result returned by the supplied handler"""
+        self.handlers[method] = handler
+
+    async def emit(
+        self, method: str, params: Dict, session_id: Optional[str] = None
+    ) -> None:
+        """Sends an event, if session_id is supplied the event is for that flat session"""
+        msg: Dict[str, Any] = {"method": method, "params": params}
+        if session_id is not None:
+            msg["sessionId"] = session_id
+        await self.transport.send(ujson.dumps(msg))
+
+    async def _serve(self) -> None:
+        while 1:
+            try:
+                frame = await self.transport.recv()
+            except TransportClosedError:
+                return
+            msg = ujson.loads(frame)
+            self.received.append(msg)
+            await self._answer(msg)
+
+    async def _answer(self, msg: Dict) -> None:
+        method = msg["method"]
+        params = msg.get("params", {})
+        session_id = msg.get("sessionId")
+        if method == "Target.sendMessageToTarget":
+            await self._answer_nested(params)
+            result: Optional[Dict] = {}
+        else:
+            try:
+                if method == "Target.attachToTarget":
+                    result = await self._attach(params)
+                else:
+                    handler = self.handlers.get(method)
+                    result = handler(params) if handler is not None else {}
+            except FakeProtocolError as e:
+                result = None
+                error = {"code": -32000, "message": str(e)}
+        response: Dict[str, Any] = {"id": msg["id"]}
+        if result is None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        if session_id is not None:
+            response["sessionId"] = session_id
+        await self.transport.send(ujson.dumps(response))
+
+    async def _attach(self, params: Dict) -> Dict:
+        target_id = params["targetId"]
+        target_type = self.targets.get(target_id)
+        if target_type is None:
+            raise FakeProtocolError(f"No target with given id found: {target_id}")
+        session_id = f"session-{len(self.sessions) + 1}"
+        self.sessions[session_id] = target_id
+        if params.get("flatten"):
+            await self.emit(
+                "Target.attachedToTarget",
+                {
+                    "sessionId": session_id,
+                    "targetInfo": {"targetId": target_id, "type": target_type},
+                    "waitingForDebugger": False,
+                },
+            )
+        return {"sessionId": session_id}
+
+    async def _answer_nested(self, params: Dict) -> None:
+        inner = ujson.loads(params["message"])
+        self.received.append(inner)
+        handler = self.handlers.get(inner["method"])
+        response = {
+            "id": inner["id"],
+            "result": handler(inner.get("params", {})) if handler else {},
+        }
+        await self.emit(
+            "Target.receivedMessageFromTarget",
+            {"sessionId": params["sessionId"], "message": ujson.dumps(response)},
+        )
@@ -0,0 +1,24 @@
+"""A stand-in for Chrome launched with --remote-debugging-pipe, it answers
+every command read from fd 3 on fd 4 with the command line it was started with"""
+import json
+import os
+import sys
+
+
+def main() -> None:
+    commands = os.fdopen(3, "rb", 0)
+    responses = os.fdopen(4, "wb", 0)
+    buffered = b""
+    while 1:
+        chunk = commands.read(65536)
+        if not chunk:
+            return
+        buffered += chunk
+        while b"\0" in buffered:
+            frame, buffered = buffered.split(b"\0", 1)
+            response = {"id": json.loads(frame)["id"], "result": {"argv": sys.argv[1:]}}
+            responses.write(json.dumps(response).encode("utf-8") + b"\0")
+
+
+if __name__ == "__main__":
+    main()
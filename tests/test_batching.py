@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from cripy.errors import ClientError
+from cripy.protocol import Network
+
+EVENT = "Network.dataReceived"
+
+
+class TestEventBatcher:
+    @pytest.mark.asyncio
+    async def test_a_burst_is_delivered_before_awaiting_code_resumes(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        batches = []
+        batcher = Network(session).dataReceived.batch(batches.append)
+        for i in range(3):
+            await browser.emit(EVENT, {"dataLength": i}, session.session_id)
+        await session.send("Runtime.evaluate")
+        assert sum(len(batch) for batch in batches) == 3
+        assert [event["dataLength"] for batch in batches for event in batch] == [
+            0,
+            1,
+            2,
+        ]
+        assert batcher.events == 3 and batcher.batches == len(batches)
+        batcher.close()
+        await browser.emit(EVENT, {"dataLength": 4}, session.session_id)
+        await asyncio.sleep(0.01)
+        assert batcher.events == 3
+
+    @pytest.mark.asyncio
+    async def test_window_and_max_size(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        batches = []
+        batcher = session.on_batch(EVENT, batches.append, window=0.05, max_size=4)
+        for i in range(6):
+            await browser.emit(EVENT, {"dataLength": i}, session.session_id)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        assert [len(batch) for batch in batches] == [4]
+        assert batcher.pending == 2
+        batcher.flush()
+        assert [len(batch) for batch in batches] == [4, 2]
+        await asyncio.sleep(0.06)
+        assert batcher.batches == 2
+
+    @pytest.mark.asyncio
+    async def test_wildcard_batches_hold_event_names(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        batches = []
+        session.on_batch("Network.*", batches.append)
+        await browser.emit(EVENT, {"dataLength": 1}, session.session_id)
+        await asyncio.sleep(0.01)
+        assert batches == [[(EVENT, {"dataLength": 1})]]
+        with pytest.raises(ClientError):
+            session.on_batch(EVENT, batches.append, max_size=0)
@@ -0,0 +1,75 @@
+import base64
+import io
+
+import pytest
+
+from cripy.binary import binary_result, decode_base64, decode_base64_to_sink
+from cripy.connection import Connection
+from cripy.protocol import IO, Network, Page
+from .helpers import FakeBrowser
+
+PAYLOAD = bytes(range(256)) * 64
+ENCODED = base64.b64encode(PAYLOAD).decode("ascii")
+
+
+async def resolved(value):
+    return value
+
+
+class TestBinaryHelpers:
+    def test_decode_base64_accepts_str_and_bytes(self):
+        assert decode_base64(ENCODED) == PAYLOAD
+        assert decode_base64(ENCODED.encode("ascii")) == PAYLOAD
+
+    @pytest.mark.parametrize("chunk_size", [4, 7, 1000, 1 << 20])
+    def test_decode_to_sink_in_chunks(self, chunk_size):
+        sink = io.BytesIO()
+        assert decode_base64_to_sink(ENCODED, sink, chunk_size) == len(PAYLOAD)
+        assert sink.getvalue() == PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_binary_result_honors_the_base64_flag(self):
+        result = await binary_result(
+            resolved({"body": "plain", "base64Encoded": False}),
+            "body",
+            flag="base64Encoded",
+        )
+        assert result == {"body": b"plain", "base64Encoded": False}
+        sink = io.BytesIO()
+        result = await binary_result(
+            resolved({"body": ENCODED, "base64Encoded": True}),
+            "body",
+            sink,
+            "base64Encoded",
+        )
+        assert result == {"body": len(PAYLOAD), "base64Encoded": True}
+        assert sink.getvalue() == PAYLOAD
+
+
+class TestGeneratedBinaryCommands:
+    @pytest.mark.asyncio
+    async def test_result_modes(self):
+        browser = FakeBrowser()
+        browser.handle("Page.captureScreenshot", lambda params: {"data": ENCODED})
+        browser.handle(
+            "Network.getResponseBody",
+            lambda params: {"body": ENCODED, "base64Encoded": True},
+        )
+        browser.handle(
+            "IO.read",
+            lambda params: {"data": ENCODED, "base64Encoded": True, "eof": True},
+        )
+        conn = Connection()
+        await conn.connect(transport=browser.start())
+
+        assert await Page(conn).captureScreenshot() == {"data": ENCODED}
+        assert await Page(conn).captureScreenshot(as_bytes=True) == {"data": PAYLOAD}
+        body = await Network(conn).getResponseBody("1", as_bytes=True)
+        assert body == {"body": PAYLOAD, "base64Encoded": True}
+        sink = io.BytesIO()
+        chunk = await IO(conn).read("stream", sink=sink)
+        assert chunk == {"data": len(PAYLOAD), "base64Encoded": True, "eof": True}
+        assert sink.getvalue() == PAYLOAD
+
+        await conn.dispose()
+        await browser.stop()
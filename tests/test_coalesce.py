@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from cripy.batching import sum_fields
+from cripy.connection import Connection
+from cripy.protocol import Network, Tracing
+
+EVENT = "Network.dataReceived"
+
+
+async def emit_data(browser, session, *chunks):
+    for request_id, length in chunks:
+        await browser.emit(
+            EVENT,
+            {"requestId": request_id, "dataLength": length, "timestamp": length},
+            session.session_id,
+        )
+
+
+class TestEventCoalescer:
+    @pytest.mark.asyncio
+    async def test_keeps_the_newest_event_per_key(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        delivered = []
+        coalescer = Network(session).dataReceived.coalesce(
+            delivered.append, key="requestId", window=0.05
+        )
+        await emit_data(browser, session, ("a", 1), ("b", 2), ("a", 3), ("a", 4))
+        await asyncio.sleep(0.01)
+        assert delivered == [] and coalescer.pending == 2
+        await asyncio.sleep(0.06)
+        assert [(e["requestId"], e["dataLength"]) for e in delivered] == [
+            ("a", 4),
+            ("b", 2),
+        ]
+        assert coalescer.coalesced == 2 and coalescer.delivered == 2
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_merging_sums_fields(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        delivered = []
+        coalescer = session.on_coalesced(
+            EVENT, delivered.append, "requestId", sum_fields("dataLength"), 0.05
+        )
+        await emit_data(browser, session, ("a", 1), ("a", 2), ("a", 3))
+        await asyncio.sleep(0.01)
+        coalescer.flush()
+        assert delivered == [{"requestId": "a", "dataLength": 6, "timestamp": 3}]
+
+    @pytest.mark.asyncio
+    async def test_unkeyed_events_keep_the_latest(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        delivered = []
+        Tracing(conn).bufferUsage.coalesce(delivered.append, window=0.05)
+        for value in range(5):
+            await browser.emit("Tracing.bufferUsage", {"percentFull": value})
+        await asyncio.sleep(0.08)
+        assert delivered == [{"percentFull": 4}]
+
+    @pytest.mark.asyncio
+    async def test_wildcards_coalesce_per_event_name(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        delivered = []
+        coalescer = session.on_coalesced(
+            "Network.*", delivered.append, "requestId", sum_fields("dataLength")
+        )
+        await emit_data(browser, session, ("a", 1), ("a", 2))
+        await browser.emit(
+            "Network.loadingFinished", {"requestId": "a"}, session.session_id
+        )
+        await asyncio.sleep(0.01)
+        assert delivered == [
+            (EVENT, {"requestId": "a", "dataLength": 3, "timestamp": 2}),
+            ("Network.loadingFinished", {"requestId": "a"}),
+        ]
+        assert coalescer.coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_events_without_params_share_a_key(self):
+        conn = Connection(flatten_sessions=True)
+        delivered = []
+        conn.on_coalesced("Page.frameResized", delivered.append, "frameId")
+        conn.emit("Page.frameResized")
+        conn.emit("Page.frameResized")
+        await asyncio.sleep(0)
+        assert delivered == [None]
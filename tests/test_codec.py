@@ -0,0 +1,41 @@
+import pytest
+
+from cripy.codec import CODECS, DEFAULT_CODEC, UJSONCodec, get_codec
+from cripy.errors import ClientError
+
+MSG = {"id": 1, "method": "Page.navigate", "params": {"url": "https://example.com/ü"}}
+
+
+def codec_instances():
+    codecs = []
+    for codec_clazz in CODECS.values():
+        try:
+            codecs.append(codec_clazz())
+        except ImportError:
+            pass
+    return codecs
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec", codec_instances(), ids=lambda c: c.name)
+    def test_codec_round_trips_str_and_bytes(self, codec):
+        encoded = codec.dumps(MSG)
+        assert codec.loads(encoded) == MSG
+        as_str = codec.dumps_str(MSG)
+        assert isinstance(as_str, str)
+        assert codec.loads(as_str) == MSG
+        assert codec.loads(as_str.encode("utf-8")) == MSG
+        assert codec.loads(memoryview(as_str.encode("utf-8"))) == MSG
+
+    def test_get_codec_defaults_to_ujson(self):
+        assert get_codec() is DEFAULT_CODEC
+        assert isinstance(get_codec(), UJSONCodec)
+
+    def test_get_codec_by_name_or_instance(self):
+        codec = get_codec("json")
+        assert codec.name == "json"
+        assert get_codec(codec) is codec
+
+    def test_get_codec_unknown_name_raises(self):
+        with pytest.raises(ClientError):
+            get_codec("nope")
@@ -7,8 +7,10 @@ from async_timeout import timeout
 from websockets import InvalidURI
 
 from cripy.cdp import CDP, connect
+from cripy.client import Client, ClientDynamic
 from cripy.connection import Connection
 from cripy.events import ConnectionEvents
+from cripy.reconnect import ReconnectPolicy
 from .helpers import Cleaner
 
 
@@ -42,6 +44,46 @@ class TestConnectFailsNoChrome:
             await conn.connect("ws://nope")
 
 
+WS_URL = "ws://localhost:9222/devtools/browser/options"
+# the options of Connection that connect, CDP and the clients pass through
+OPTIONS = {
+    "command_timeout": 5.0,
+    "max_in_flight": 8,
+    "reconnect_policy": ReconnectPolicy(),
+    "decode_threshold": 1 << 20,
+    "record_timing": True,
+}
+
+
+class TestConnectOptions:
+    @pytest.fixture
+    def no_connect(self, monkeypatch):
+        async def connected(self, *args, **kwargs):
+            pass
+
+        monkeypatch.setattr(Connection, "connect", connected)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("no_connect")
+    async def test_connect_and_cdp_pass_the_options_through(self):
+        for client in (
+            await connect(WS_URL, **OPTIONS),
+            await CDP.client(target=WS_URL, **OPTIONS),
+            await CDP.ws_connection(target=WS_URL, **OPTIONS),
+        ):
+            for name, value in OPTIONS.items():
+                assert getattr(client, name) == value
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "cls, kwargs", [(Client, {}), (ClientDynamic, {"proto_def": {}})]
+    )
+    async def test_the_clients_accept_the_options(self, cls, kwargs):
+        client = cls(WS_URL, **kwargs, **OPTIONS)
+        for name, value in OPTIONS.items():
+            assert getattr(client, name) == value
+
+
 @pytest.mark.usefixtures("chrome")
 class TestConnecting:
     @pytest.mark.parametrize(
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+
+import pytest
+
+from cripy.codec import UJSONCodec
+from cripy.connection import Connection
+from .helpers import FakeBrowser
+
+
+class RecordingCodec(UJSONCodec):
+    __slots__ = ["threads"]
+
+    def __init__(self):
+        self.threads = []
+
+    def loads(self, data):
+        self.threads.append(threading.current_thread())
+        return super().loads(data)
+
+
+class TestLargeFrameDecoding:
+    @pytest.mark.asyncio
+    async def test_large_frames_are_decoded_in_a_thread_in_order(self):
+        browser = FakeBrowser()
+        codec = RecordingCodec()
+        conn = Connection(codec=codec, decode_threshold=1024)
+        await conn.connect(transport=browser.start())
+        events = []
+        conn.on("Page.event", lambda params: events.append(params["n"]))
+
+        big = "x" * 2048
+        for n in range(6):
+            await browser.emit("Page.event", {"n": n, "pad": big if n % 2 else ""})
+        browser.handle("Browser.getVersion", lambda params: {"pad": big})
+        result = await conn.send("Browser.getVersion")
+
+        assert result == {"pad": big}
+        assert events == [0, 1, 2, 3, 4, 5]
+        assert conn.offloaded_decodes == 4
+        main = threading.current_thread()
+        assert sum(thread is not main for thread in codec.threads) == 4
+        assert conn.decode_time > 0
+        await conn.dispose()
+        await browser.stop()
+
+    @pytest.mark.asyncio
+    async def test_no_threshold_decodes_on_the_loop(self):
+        browser = FakeBrowser()
+        codec = RecordingCodec()
+        conn = Connection(codec=codec)
+        await conn.connect(transport=browser.start())
+        browser.handle("Browser.getVersion", lambda params: {"pad": "x" * 4096})
+        await conn.send("Browser.getVersion")
+        assert conn.offloaded_decodes == 0
+        assert all(thread is threading.current_thread() for thread in codec.threads)
+        await conn.dispose()
+        await browser.stop()
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from cripy.connection import Connection
+from cripy.dispatch import EventDispatcher
+from cripy.events import ConnectionEvents
+from .helpers import FakeBrowser
+
+
+@pytest.fixture
+def dispatcher(event_loop):
+    return EventDispatcher(loop=event_loop)
+
+
+class TestEventDispatcher:
+    def test_exact_and_wildcard_listeners(self, dispatcher):
+        calls = []
+        dispatcher.on(
+            "Network.dataReceived", lambda params: calls.append(("exact", params))
+        )
+        dispatcher.on(
+            "Network.*", lambda event, params: calls.append(("domain", event))
+        )
+        dispatcher.on("*", lambda event, params: calls.append(("all", event)))
+        assert dispatcher.emit("Network.dataReceived", 1)
+        assert dispatcher.emit("Page.loadEventFired", 2)
+        assert calls == [
+            ("exact", 1),
+            ("domain", "Network.dataReceived"),
+            ("all", "Network.dataReceived"),
+            ("all", "Page.loadEventFired"),
+        ]
+        assert dispatcher.has_listeners("DOM.documentUpdated")
+        assert not dispatcher.has_listeners(ConnectionEvents.Ready)
+        assert not dispatcher.emit(ConnectionEvents.Ready)
+
+    def test_table_follows_registrations(self, dispatcher):
+        calls = []
+
+        def listener(event, params):
+            calls.append(params)
+
+        assert not dispatcher.emit("Network.dataReceived", 0)
+        dispatcher.on("Network.*", listener)
+        dispatcher.emit("Network.dataReceived", 1)
+        dispatcher.remove_listener("Network.*", listener)
+        dispatcher.emit("Network.dataReceived", 2)
+        dispatcher.once("*", listener)
+        dispatcher.emit("Network.dataReceived", 3)
+        dispatcher.emit("Network.dataReceived", 4)
+        assert calls == [1, 3]
+        assert dispatcher.event_names() == []
+        assert not dispatcher.has_listeners("Network.dataReceived")
+
+    @pytest.mark.asyncio
+    async def test_errors_are_emitted(self):
+        dispatcher = EventDispatcher()
+        errors = []
+
+        def raises(params):
+            raise ValueError(params)
+
+        async def rejects(params):
+            raise KeyError(params)
+
+        dispatcher.on("Page.loadEventFired", raises)
+        dispatcher.on("Page.loadEventFired", rejects)
+        dispatcher.emit("Page.loadEventFired", 1)
+        dispatcher.on("error", errors.append)
+        dispatcher.emit("Page.loadEventFired", 2)
+        await asyncio.sleep(0.01)
+        assert [type(error) for error in errors] == [ValueError, KeyError]
+
+    @pytest.mark.asyncio
+    async def test_wildcard_listeners_receive_routed_events(self):
+        browser = FakeBrowser()
+        conn = Connection(flatten_sessions=True)
+        await conn.connect(transport=browser.start())
+        session = await conn.create_session("page-1")
+        events = []
+        session.on("Network.*", lambda event, params: events.append((event, params)))
+        await browser.emit(
+            "Network.dataReceived", {"dataLength": 1}, session.session_id
+        )
+        await browser.emit("Page.loadEventFired", {}, session.session_id)
+        await asyncio.sleep(0.01)
+        assert events == [("Network.dataReceived", {"dataLength": 1})]
+        assert conn.skipped_events == 1
+        await conn.dispose()
+        await browser.stop()
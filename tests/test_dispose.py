@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from cripy.connection import Connection, dispose_all
+from cripy.events import ConnectionEvents
+
+
+class HangingTransport:
+    """A transport whose closing handshake never completes"""
+
+    def __init__(self):
+        self.closed = False
+        self.aborted = False
+
+    async def close(self):
+        await asyncio.sleep(60)
+
+    def abort(self):
+        self.aborted = True
+
+
+def make_connection() -> Connection:
+    conn = Connection("ws://localhost:9222")
+    conn._transport = HangingTransport()
+    conn._connected = True
+    conn._recv_task = asyncio.ensure_future(asyncio.sleep(60))
+    return conn
+
+
+class TestDispose:
+    @pytest.mark.asyncio
+    async def test_close_timeout_aborts_the_transport(self):
+        conn = make_connection()
+        conn.close_timeout = 0.05
+        disconnected = []
+        conn.on(ConnectionEvents.Disconnected, lambda: disconnected.append(True))
+        await asyncio.wait_for(conn.dispose(), 1)
+        assert conn._transport.aborted
+        assert conn.closed and disconnected == [True]
+
+    @pytest.mark.asyncio
+    async def test_hard_close_does_not_wait(self):
+        conn = make_connection()
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        await conn.dispose(hard=True)
+        assert loop.time() - start < 0.05
+        assert conn._transport.aborted
+
+    @pytest.mark.asyncio
+    async def test_dispose_all_shares_one_deadline(self):
+        conns = [make_connection() for _ in range(50)]
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        await dispose_all(conns, timeout=0.1)
+        assert loop.time() - start < 0.5
+        assert all(conn.closed for conn in conns)
+        assert all(conn._transport.aborted for conn in conns)
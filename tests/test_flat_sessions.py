@@ -0,0 +1,120 @@
+import asyncio
+import logging
+
+import pytest
+import ujson
+
+from cripy.connection import Connection
+from .helpers import FakeBrowser, FakeProtocolError
+
+
+class TestFlatSessionDetection:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "product, flat",
+        [
+            ("HeadlessChrome/80.0.3987.0", True),
+            ("Chrome/71.0.3578.98", False),
+            (None, True),
+        ],
+    )
+    async def test_connect_probes_for_flat_sessions(
+        self, product, flat, fake_cdp_factory
+    ):
+        handlers = {}
+        if product is not None:
+            handlers["Browser.getVersion"] = lambda params: {"product": product}
+        browser, conn, _ = await fake_cdp_factory(
+            handlers, session=False, flatten_sessions=None
+        )
+        assert conn.flatten_sessions is flat
+        session = await conn.create_session("page-1")
+        assert session.flat_session is flat
+        attach = next(
+            msg for msg in browser.received if msg["method"] == "Target.attachToTarget"
+        )
+        assert attach["params"].get("flatten", False) is flat
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_falls_back_to_nested_sessions(
+        self, fake_cdp_factory, caplog
+    ):
+        def fail(params):
+            raise FakeProtocolError("'Browser.getVersion' wasn't found")
+
+        browser, conn, _ = await fake_cdp_factory(
+            {"Browser.getVersion": fail}, session=False, flatten_sessions=None
+        )
+        assert conn.flatten_sessions is False
+        assert any(
+            record.levelno == logging.WARNING and "flat session" in record.message
+            for record in caplog.records
+        )
+
+    @pytest.mark.asyncio
+    async def test_events_received_while_probing_see_the_mode(self):
+        browser = FakeBrowser()
+        conn = Connection()
+        seen = []
+        conn.on(
+            "Network.requestWillBeSent",
+            lambda params: seen.append(conn.flatten_sessions),
+        )
+        transport = browser.start()
+        # queued ahead of the response to the probe
+        await browser.emit("Network.requestWillBeSent", {"requestId": 1})
+        try:
+            await conn.connect(transport=transport)
+            await asyncio.sleep(0.01)
+            assert seen == [True]
+            assert not conn.reading_paused
+        finally:
+            await conn.dispose()
+            await browser.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.fake_cdp(session=False, flatten_sessions=False)
+    async def test_explicit_mode_is_not_probed(self, fake_cdp):
+        browser, conn, _ = fake_cdp
+        assert conn.flatten_sessions is False
+        assert browser.received == []
+
+    @pytest.mark.asyncio
+    async def test_flat_sessions_of_sessions_are_routed_by_the_connection(
+        self, fake_cdp
+    ):
+        browser, conn, session = fake_cdp
+        await browser.emit(
+            "Target.attachedToTarget",
+            {
+                "sessionId": "worker-1",
+                "targetInfo": {"targetId": "worker", "type": "worker"},
+            },
+            session.session_id,
+        )
+        await asyncio.sleep(0)
+        worker = conn.session("worker-1")
+        assert worker is not None and worker.target_id == "worker"
+        events = []
+        worker.on("Runtime.consoleAPICalled", events.append)
+        await browser.emit("Runtime.consoleAPICalled", {"type": "log"}, "worker-1")
+        await asyncio.sleep(0)
+        assert events == [{"type": "log"}]
+
+    @pytest.mark.asyncio
+    @pytest.mark.fake_cdp(flatten_sessions=False)
+    async def test_nested_sessions_emit_their_events(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        events = []
+        session.on("Page.loadEventFired", events.append)
+        await browser.emit(
+            "Target.receivedMessageFromTarget",
+            {
+                "sessionId": session.session_id,
+                "message": ujson.dumps(
+                    {"method": "Page.loadEventFired", "params": {"timestamp": 1}}
+                ),
+            },
+        )
+        await asyncio.sleep(0)
+        assert events == [{"timestamp": 1}]
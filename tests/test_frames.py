@@ -0,0 +1,98 @@
+import pytest
+import ujson
+
+from cripy.connection import Connection
+from cripy.events import ConnectionEvents
+from cripy.frames import mentions_session_id, peek_id, peek_method, peek_session_id
+
+EVENT = ujson.dumps(
+    {"method": "Network.dataReceived", "params": {"requestId": "1", "dataLength": 2}}
+)
+FLAT_EVENT = ujson.dumps(
+    {
+        "method": "Network.dataReceived",
+        "params": {"requestId": "1", "dataLength": 2},
+        "sessionId": "ABC",
+    }
+)
+NESTED_SESSION_ID = ujson.dumps(
+    {"method": "Some.event", "params": {"a": 1, "sessionId": "ABC"}}
+)
+# the sessionId is not the last key, where Chrome puts it
+EARLY_SESSION_ID = (
+    '{"method":"Network.dataReceived","sessionId":"%s",'
+    '"params":{"requestId":"1","dataLength":2}}'
+)
+RESPONSE = ujson.dumps({"id": 1, "result": {}})
+
+
+class TestPeeking:
+    @pytest.mark.parametrize("encode", [False, True], ids=["str", "bytes"])
+    def test_peek_method(self, encode: bool):
+        frame = EVENT.encode() if encode else EVENT
+        assert peek_method(frame) == "Network.dataReceived"
+        response = RESPONSE.encode() if encode else RESPONSE
+        assert peek_method(response) is None
+
+    @pytest.mark.parametrize("encode", [False, True], ids=["str", "bytes"])
+    def test_peek_session_id_only_top_level(self, encode: bool):
+        def frame(f):
+            return f.encode() if encode else f
+
+        assert peek_session_id(frame(FLAT_EVENT)) == "ABC"
+        assert peek_session_id(frame(EVENT)) is None
+        assert peek_session_id(frame(NESTED_SESSION_ID)) is None
+        assert peek_session_id(frame(EARLY_SESSION_ID % "ABC")) is None
+        assert mentions_session_id(frame(EARLY_SESSION_ID % "ABC"))
+        assert not mentions_session_id(frame(EVENT))
+
+
+class TestConnectionSkipsUnwantedEvents:
+    @pytest.mark.asyncio
+    async def test_event_without_listeners_is_not_decoded(self):
+        conn = Connection("ws://localhost:9222")
+        received = []
+        conn.on("Network.loadingFinished", received.append)
+        conn._on_message(EVENT)
+        assert conn.skipped_events == 1
+        conn.on("Network.dataReceived", received.append)
+        conn._on_message(EVENT)
+        assert conn.skipped_events == 1
+        assert received == [{"requestId": "1", "dataLength": 2}]
+
+    @pytest.mark.asyncio
+    async def test_events_whose_session_id_is_not_found_are_decoded(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        received = []
+        session.on("Network.dataReceived", received.append)
+        conn._on_message(EARLY_SESSION_ID % session.session_id)
+        assert conn.skipped_events == 0
+        assert received == [{"requestId": "1", "dataLength": 2}]
+
+    @pytest.mark.asyncio
+    async def test_all_messages_listeners_receive_everything(self):
+        conn = Connection("ws://localhost:9222")
+        received = []
+        conn.on(ConnectionEvents.AllMessages, received.append)
+        conn._on_message(EVENT)
+        assert conn.skipped_events == 0
+        assert len(received) == 1
+
+
+class TestLateResponses:
+    @pytest.mark.asyncio
+    async def test_cancelled_command_is_removed_and_late_response_discarded(self):
+        conn = Connection("ws://localhost:9222")
+        future = conn.send("Page.navigate", {"url": "about:blank"})
+        assert len(conn._callbacks) == 1
+        future.cancel()
+        assert len(conn._callbacks) == 0
+        conn._on_message(RESPONSE)
+        assert conn.discarded_responses == 1
+
+    @pytest.mark.parametrize("encode", [False, True], ids=["str", "bytes"])
+    def test_peek_id(self, encode: bool):
+        frame = RESPONSE.encode() if encode else RESPONSE
+        assert peek_id(frame) == 1
+        event = EVENT.encode() if encode else EVENT
+        assert peek_id(event) is None
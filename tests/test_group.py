@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from cripy.errors import ClientError
+from cripy.group import ConnectionGroup
+from .helpers import FakeBrowser
+
+TARGETS = {f"page-{i}": "page" for i in range(1, 7)}
+
+
+def make_group(size=3):
+    browsers = []
+    # one browser behind every connection, so session ids are unique across them
+    sessions = {}
+
+    async def transport_factory():
+        browser = FakeBrowser(TARGETS)
+        browser.sessions = sessions
+        browsers.append(browser)
+        return browser.start()
+
+    group = ConnectionGroup(
+        size=size, flatten_sessions=True, transport_factory=transport_factory
+    )
+    return group, browsers
+
+
+class TestConnectionGroup:
+    def test_size_must_be_positive(self):
+        with pytest.raises(ClientError):
+            ConnectionGroup(size=0)
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_spread_across_the_connections(self):
+        group, browsers = make_group()
+        await group.connect()
+        assert len(group.connections) == 3
+
+        sessions = [await group.create_session(f"page-{i}") for i in range(1, 4)]
+        owners = {id(session._connection) for session in sessions}
+        assert len(owners) == 3
+        assert group.session(sessions[1].session_id) is sessions[1]
+
+        # the busy connection is skipped while its command awaits its response
+        busy = sessions[0].send("Runtime.evaluate", {"expression": "1"})
+        fourth = await group.create_session("page-4")
+        assert fourth._connection is not sessions[0]._connection
+        await busy
+
+        await group.dispose()
+        for browser in browsers:
+            await browser.stop()
+
+    @pytest.mark.asyncio
+    async def test_commands_and_events_use_the_primary_connection(self):
+        group, browsers = make_group(2)
+        await group.connect()
+        browsers[0].handle("Browser.getVersion", lambda params: {"product": "one"})
+        assert await group.send("Browser.getVersion") == {"product": "one"}
+
+        events = []
+        group.on("Target.targetCreated", events.append)
+        await browsers[0].emit("Target.targetCreated", {"targetInfo": {}})
+        await browsers[1].emit("Target.targetCreated", {"targetInfo": {}})
+        await asyncio.sleep(0)
+        assert events == [{"targetInfo": {}}]
+        await group.dispose()
+        for browser in browsers:
+            await browser.stop()
@@ -0,0 +1,45 @@
+import pytest
+
+from cripy.connection import Connection
+from cripy.errors import ProtocolError
+from cripy.events import ConnectionEvents
+from cripy.frames import peek_error
+from cripy.protocol.runtime import Runtime
+
+SUCCESS = '{"id":1,"result":{}}'
+ERROR = '{"id":1,"error":{"code":-32000,"message":"Could not find object"}}'
+
+
+class TestSendNowait:
+    def test_peek_error(self):
+        assert not peek_error(SUCCESS)
+        assert peek_error(ERROR)
+        assert not peek_error(SUCCESS.encode())
+        assert peek_error(ERROR.encode())
+
+    @pytest.mark.asyncio
+    async def test_success_is_discarded_without_a_future(self):
+        conn = Connection("ws://localhost:9222")
+        assert conn.send_nowait("Runtime.releaseObject", {"objectId": "1"}) is None
+        assert len(conn._callbacks) == 0
+        conn._on_message(SUCCESS)
+        assert len(conn._notifications) == 0
+        assert conn.notification_errors == 0
+        assert conn.discarded_responses == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted_and_emitted(self):
+        conn = Connection("ws://localhost:9222")
+        errors = []
+        conn.on(ConnectionEvents.NotificationError, errors.append)
+        conn.send_nowait("Runtime.releaseObject", {"objectId": "1"})
+        conn._on_message(ERROR)
+        assert conn.notification_errors == 1
+        assert isinstance(errors[0], ProtocolError)
+        assert "Runtime.releaseObject" in str(errors[0])
+
+    @pytest.mark.asyncio
+    async def test_generated_commands_without_returns_accept_nowait(self):
+        conn = Connection("ws://localhost:9222")
+        assert Runtime(conn).releaseObject("1", nowait=True) is None
+        assert conn._notifications == {1: "Runtime.releaseObject"}
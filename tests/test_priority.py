@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+import ujson
+
+from cripy.connection import Connection
+from cripy.priority import Priority
+
+
+class RecordingWS:
+    text_only = True
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg):
+        self.sent.append(ujson.loads(msg)["method"])
+        await asyncio.sleep(0)
+
+
+def start_writer(conn: Connection) -> RecordingWS:
+    ws = RecordingWS()
+    conn._transport = ws
+    conn._send_ready = asyncio.Event()
+    conn._send_ready.set()
+    conn._writer_task = asyncio.get_event_loop().create_task(conn._write_loop())
+    return ws
+
+
+class TestPriorityLanes:
+    @pytest.mark.asyncio
+    async def test_control_is_written_before_bulk(self):
+        conn = Connection("ws://localhost:9222")
+        conn._connected = True
+        conn.send_nowait("Network.getResponseBody", {"requestId": "1"})
+        conn.send_nowait("Fetch.continueRequest", {"requestId": "2"})
+        conn.send_nowait("Runtime.evaluate", priority=Priority.BULK)
+        conn.send_nowait("Page.captureScreenshot", priority=Priority.CONTROL)
+        ws = start_writer(conn)
+        await asyncio.sleep(0.01)
+        conn._writer_task.cancel()
+        assert ws.sent == [
+            "Fetch.continueRequest",
+            "Page.captureScreenshot",
+            "Network.getResponseBody",
+            "Runtime.evaluate",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bulk_is_not_starved(self):
+        conn = Connection("ws://localhost:9222", max_control_streak=2)
+        conn._connected = True
+        conn.send_nowait("IO.read", {"handle": "1"})
+        for _ in range(5):
+            conn.send_nowait("Input.dispatchMouseEvent")
+        ws = start_writer(conn)
+        await asyncio.sleep(0.01)
+        conn._writer_task.cancel()
+        assert ws.sent.index("IO.read") == 2
@@ -0,0 +1,161 @@
+import asyncio
+import sys
+
+import pytest
+import ujson
+
+from cripy.connection import Connection
+from cripy.errors import ProtocolError
+from cripy.proxy import (
+    CDPProxy,
+    INVALID_REQUEST_CODE,
+    PARSE_ERROR_CODE,
+    PROXY_ERROR_CODE,
+    SESSION_NOT_FOUND,
+)
+from cripy.transports import InMemoryTransport, UnixSocketTransport
+from .helpers import FakeBrowser, FakeProtocolError
+
+
+async def start_proxy():
+    browser = FakeBrowser({"page-1": "page", "page-2": "page"})
+    upstream = Connection(flatten_sessions=True)
+    await upstream.connect(transport=browser.start())
+    return browser, upstream, CDPProxy(upstream)
+
+
+async def connect_client(proxy):
+    ours, theirs = InMemoryTransport.pair()
+    asyncio.get_event_loop().create_task(proxy.handle_client(theirs))
+    client = Connection(flatten_sessions=True)
+    await client.connect(transport=ours)
+    return client
+
+
+class TestCDPProxy:
+    @pytest.mark.asyncio
+    async def test_clients_share_the_browser(self):
+        browser, upstream, proxy = await start_proxy()
+        browser.handle("Runtime.evaluate", lambda params: {"value": params["v"]})
+        one = await connect_client(proxy)
+        two = await connect_client(proxy)
+
+        # both clients use the same ids, the proxy rewrites them
+        session_one = await one.create_session("page-1")
+        session_two = await two.create_session("page-2")
+        assert session_one.session_id != session_two.session_id
+        results = await asyncio.gather(
+            session_one.send("Runtime.evaluate", {"v": 1}),
+            session_two.send("Runtime.evaluate", {"v": 2}),
+        )
+        assert results == [{"value": 1}, {"value": 2}]
+        assert two.session(session_one.session_id) is None
+
+        events_one, events_two, upstream_events = [], [], []
+        session_one.on("Page.loadEventFired", events_one.append)
+        session_two.on("Page.loadEventFired", events_two.append)
+        upstream.session(session_one.session_id).on(
+            "Page.loadEventFired", upstream_events.append
+        )
+        await browser.emit("Page.loadEventFired", {"t": 1}, session_one.session_id)
+        await asyncio.sleep(0.01)
+        assert events_one == [{"t": 1}]
+        assert events_two == []
+        # the events of the sessions of the clients are not emitted upstream too
+        assert upstream_events == []
+
+        await one.dispose()
+        await two.dispose()
+        await upstream.dispose()
+        await browser.stop()
+
+    @pytest.mark.asyncio
+    async def test_browser_events_reach_subscribers_only(self):
+        browser, upstream, proxy = await start_proxy()
+        one = await connect_client(proxy)
+        two = await connect_client(proxy)
+        await one.send("Target.setDiscoverTargets", {"discover": True})
+
+        created_one, created_two = [], []
+        one.on("Target.targetCreated", created_one.append)
+        two.on("Target.targetCreated", created_two.append)
+        await browser.emit("Target.targetCreated", {"targetInfo": {"targetId": "x"}})
+        await asyncio.sleep(0.01)
+        assert created_one == [{"targetInfo": {"targetId": "x"}}]
+        assert created_two == []
+
+        await one.dispose()
+        await two.dispose()
+        await upstream.dispose()
+        await browser.stop()
+
+    @pytest.mark.asyncio
+    async def test_errors_and_disconnects(self):
+        browser, upstream, proxy = await start_proxy()
+
+        def fail(params):
+            raise FakeProtocolError("nope")
+
+        browser.handle("Page.navigate", fail)
+        client = await connect_client(proxy)
+        session = await client.create_session("page-1")
+        with pytest.raises(ProtocolError, match="nope"):
+            await session.send("Page.navigate", {"url": "about:blank"})
+        assert proxy.clients == 1
+
+        await client.dispose()
+        await asyncio.sleep(0.01)
+        assert proxy.clients == 0
+        assert browser.received[-1]["method"] == "Target.detachFromTarget"
+        await upstream.dispose()
+        await browser.stop()
+
+    @pytest.mark.asyncio
+    async def test_invalid_and_foreign_commands_are_answered_with_errors(self):
+        browser, upstream, proxy = await start_proxy()
+        owner = await connect_client(proxy)
+        session = await owner.create_session("page-1")
+        ours, theirs = InMemoryTransport.pair()
+        asyncio.get_event_loop().create_task(proxy.handle_client(theirs))
+
+        async def exchange(frame):
+            await ours.send(frame)
+            return ujson.loads(await asyncio.wait_for(ours.recv(), 1))
+
+        assert (await exchange(b"{nope"))["error"]["code"] == PARSE_ERROR_CODE
+        response = await exchange(b'{"id": 1}')
+        assert response["id"] == 1
+        assert response["error"]["code"] == INVALID_REQUEST_CODE
+        response = await exchange(b'{"method": "Browser.getVersion"}')
+        assert "id" not in response
+        assert response["error"]["code"] == INVALID_REQUEST_CODE
+        # the session of another client can not be used
+        foreign = {"id": 2, "method": "Page.reload", "sessionId": session.session_id}
+        response = await exchange(ujson.dumps(foreign).encode())
+        assert response == {
+            "id": 2,
+            "error": {"code": PROXY_ERROR_CODE, "message": SESSION_NOT_FOUND},
+            "sessionId": session.session_id,
+        }
+        assert not any(msg["method"] == "Page.reload" for msg in browser.received)
+        assert proxy.clients == 2
+
+        await ours.close()
+        await owner.dispose()
+        await upstream.dispose()
+        await browser.stop()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX")
+    @pytest.mark.asyncio
+    async def test_clients_over_a_unix_socket(self, tmp_path):
+        browser, upstream, proxy = await start_proxy()
+        browser.handle("Browser.getVersion", lambda params: {"product": "fake"})
+        path = str(tmp_path / "proxy.sock")
+        server = await proxy.serve_unix(path)
+        client = Connection(flatten_sessions=True)
+        await client.connect(transport=await UnixSocketTransport.connect(path))
+        assert await client.send("Browser.getVersion") == {"product": "fake"}
+        await client.dispose()
+        server.close()
+        await upstream.dispose()
+        await browser.stop()
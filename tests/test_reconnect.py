@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+import ujson
+
+from cripy.connection import Connection
+from cripy.errors import ConnectionLostError
+from cripy.events import ConnectionEvents
+from cripy.reconnect import ReconnectPolicy, record_state
+
+
+class FakeBrowserWS:
+    text_only = True
+
+    def __init__(self, conn: Connection, live_targets):
+        self.conn = conn
+        self.live_targets = live_targets
+        self.sent = []
+
+    async def send(self, msg):
+        msg = ujson.loads(msg)
+        self.sent.append(msg)
+        if msg["method"] == "Target.attachToTarget":
+            if msg["params"]["targetId"] in self.live_targets:
+                reply = {"id": msg["id"], "result": {"sessionId": "NEW"}}
+            else:
+                reply = {"id": msg["id"], "error": {"message": "No target"}}
+        else:
+            reply = {"id": msg["id"], "result": {}}
+            if "sessionId" in msg:
+                reply["sessionId"] = msg["sessionId"]
+        asyncio.get_event_loop().call_soon(self.conn._on_message, ujson.dumps(reply))
+
+
+class ReconnectingConnection(Connection):
+    __slots__ = ["failures", "live_targets", "fake_ws"]
+
+    async def _open(self, transport=None):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("refused")
+        self.fake_ws = FakeBrowserWS(self, self.live_targets)
+        self._transport = self.fake_ws
+        self._send_ready = asyncio.Event()
+        self._writer_task = self._loop.create_task(self._write_loop())
+        self._connected = True
+
+
+def make_connection(failures: int = 0, max_attempts: int = 3):
+    conn = ReconnectingConnection(
+        "ws://localhost:9222",
+        flatten_sessions=True,
+        reconnect_policy=ReconnectPolicy(
+            max_attempts=max_attempts, initial_delay=0, jitter=0
+        ),
+    )
+    conn.failures = failures
+    conn.live_targets = {"T1"}
+    conn._connected = True
+    return conn
+
+
+class TestReconnect:
+    def test_record_state(self):
+        state = {}
+        record_state(state, "Network.enable", {"maxTotalBufferSize": 1})
+        record_state(state, "Target.setAutoAttach", {"autoAttach": True})
+        record_state(state, "Page.navigate", {"url": "about:blank"})
+        record_state(state, "Page.enable", {})
+        record_state(state, "Page.disable", {})
+        assert state == {
+            "Network.enable": {"maxTotalBufferSize": 1},
+            "Target.setAutoAttach": {"autoAttach": True},
+        }
+
+    def test_delays_back_off_exponentially(self):
+        policy = ReconnectPolicy(
+            max_attempts=5, initial_delay=1, max_delay=5, multiplier=2, jitter=0
+        )
+        assert list(policy.delays()) == [1, 2, 4, 5, 5]
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_reattached_and_state_replayed(self):
+        conn = make_connection(failures=1)
+        page = conn._new_session("page", "OLD", "T1")
+        gone = conn._new_session("page", "GONE", "T2")
+        conn._sessions.update(OLD=page, GONE=gone)
+        conn.send_nowait("Target.setDiscoverTargets", {"discover": True})
+        page.send_nowait("Network.enable")
+        pending = page.send("Page.navigate", {"url": "about:blank"})
+        events = []
+        conn.on(ConnectionEvents.Reconnected, lambda: events.append("reconnected"))
+
+        reconnect = asyncio.ensure_future(conn._reconnect())
+        await asyncio.sleep(0)
+        with pytest.raises(ConnectionLostError):
+            await pending
+        with pytest.raises(ConnectionLostError):
+            page.send("Page.reload")
+        await reconnect
+        await asyncio.sleep(0.01)
+
+        assert events == ["reconnected"]
+        assert page.session_id == "NEW"
+        assert conn.session("NEW") is page
+        assert gone.session_id == "GONE" and conn.session("GONE") is None
+        replayed = [(msg["method"], msg.get("sessionId")) for msg in conn.fake_ws.sent]
+        assert ("Network.enable", "NEW") in replayed
+        assert ("Target.setDiscoverTargets", None) in replayed
+        assert await page.send("Page.reload") == {}
+        conn._writer_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_enabling_reconnecting_later_records_state_from_then_on(self):
+        conn = make_connection()
+        conn.reconnect_policy = None
+        page = conn._new_session("page", "OLD", "T1")
+        conn._sessions.update(OLD=page)
+        page.send_nowait("Page.enable")
+        conn.reconnect_policy = ReconnectPolicy(max_attempts=1, initial_delay=0)
+        page.send_nowait("Network.enable")
+        await conn._reconnect()
+        await asyncio.sleep(0.01)
+        replayed = [msg["method"] for msg in conn.fake_ws.sent]
+        assert replayed == ["Target.attachToTarget", "Network.enable"]
+        conn._writer_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_closes_once_attempts_are_exhausted(self):
+        conn = make_connection(failures=5, max_attempts=2)
+        closed = []
+        conn.on(ConnectionEvents.Disconnected, lambda: closed.append(True))
+        await conn._reconnect()
+        assert conn.closed
+        assert closed == [True]
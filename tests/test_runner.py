@@ -0,0 +1,48 @@
+import pytest
+
+from cripy.connection import Connection
+from cripy.errors import ClientError
+from cripy.runner import CrawlRunner
+from .helpers import FakeBrowser
+
+
+async def fake_client():
+    browser = FakeBrowser()
+    browser.handle("Runtime.evaluate", lambda params: {"value": params["v"] * 2})
+    client = Connection(flatten_sessions=True)
+    await client.connect(transport=browser.start())
+    return client
+
+
+async def broken_client():
+    raise RuntimeError("no browser")
+
+
+async def evaluate(client, job):
+    if job == 3:
+        raise ValueError("bad job")
+    result = await client.send("Runtime.evaluate", {"v": job})
+    return result["value"]
+
+
+class TestCrawlRunner:
+    def test_jobs_are_run_across_workers(self):
+        runner = CrawlRunner(
+            evaluate, workers=2, concurrency=2, client_factory=fake_client
+        )
+        results = runner.run(range(10))
+        assert [result.index for result in results] == list(range(10))
+        assert [result.value for result in results if result.ok] == [
+            job * 2 for job in range(10) if job != 3
+        ]
+        assert "bad job" in results[3].error
+        assert sum(stats.jobs for stats in runner.stats) == 10
+        assert sum(stats.failures for stats in runner.stats) == 1
+        assert all(
+            stats.pid is not None and stats.error is None for stats in runner.stats
+        )
+
+    def test_every_worker_failing_raises(self):
+        runner = CrawlRunner(evaluate, workers=2, client_factory=broken_client)
+        with pytest.raises(ClientError, match="no browser"):
+            runner.run(range(3))
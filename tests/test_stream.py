@@ -0,0 +1,154 @@
+import asyncio
+
+import pytest
+
+from cripy.connection import Connection
+from cripy.errors import ClientError, NetworkError
+from cripy.events import ConnectionEvents
+from cripy.protocol import Network
+from cripy.stream import EventStream, Overflow
+
+EVENT = "Network.requestWillBeSent"
+
+
+async def emit_all(browser, session, count):
+    for i in range(count):
+        await browser.emit(EVENT, {"requestId": i}, session.session_id)
+    await asyncio.sleep(0.01)
+
+
+async def take(stream, count):
+    return [(await stream.__anext__())["requestId"] for _ in range(count)]
+
+
+class TestEventStream:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overflow, expected",
+        [(Overflow.DROP_OLDEST, [2, 3, 4]), (Overflow.COALESCE, [0, 1, 4])],
+    )
+    async def test_overflow_drops(self, overflow, expected, fake_cdp):
+        browser, conn, session = fake_cdp
+        stream = Network(session).requestWillBeSent.stream(3, overflow)
+        await emit_all(browser, session, 5)
+        assert stream.received == 5
+        assert stream.dropped == 2
+        assert await take(stream, 3) == expected
+
+    @pytest.mark.asyncio
+    async def test_block_pauses_reading_until_consumed(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        stream = Network(session).requestWillBeSent.stream(2, Overflow.BLOCK)
+        await emit_all(browser, session, 5)
+        assert stream.buffered == 2
+        assert conn.reading_paused
+        assert await take(stream, 5) == [0, 1, 2, 3, 4]
+        assert stream.dropped == 0
+        await asyncio.sleep(0.01)
+        assert not conn.reading_paused
+
+    @pytest.mark.asyncio
+    async def test_closing_removes_the_listener(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        async with Network(session).requestWillBeSent.stream(2, "block") as stream:
+            await emit_all(browser, session, 2)
+            assert conn.reading_paused
+        assert stream.closed and not conn.reading_paused
+        await emit_all(browser, session, 1)
+        assert stream.received == 2
+        assert [event["requestId"] async for event in stream] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_commands_are_answered_while_blocked(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        stream = Network(session).requestWillBeSent.stream(1, Overflow.BLOCK)
+        await emit_all(browser, session, 4)
+        assert conn.reading_paused
+        received = []
+
+        async def consume():
+            async for event in stream:
+                # the response arrives behind the held events
+                assert await session.send("Runtime.evaluate") == {}
+                received.append(event["requestId"])
+                if len(received) == 4:
+                    break
+
+        await asyncio.wait_for(consume(), 1)
+        assert received == [0, 1, 2, 3]
+        assert stream.dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_the_browser_while_blocked(self, fake_cdp, monkeypatch):
+        monkeypatch.setattr("cripy.connection.MAX_HELD_EVENTS", 1)
+        browser, conn, session = fake_cdp
+        stream = Network(session).requestWillBeSent.stream(2, Overflow.BLOCK)
+        await emit_all(browser, session, 3)
+        assert conn.reading_paused
+        # the response is never read once the held events reached the limit
+        pending = conn.send("Browser.getVersion")
+        disconnected = conn.wait_for(ConnectionEvents.Disconnected)
+        await browser.stop()
+        await asyncio.wait_for(disconnected, 1)
+        assert conn.closed and not conn.reading_paused
+        with pytest.raises(NetworkError):
+            await pending
+        assert stream.closed
+        assert await take(stream, 2) == [0, 1]
+        assert stream.received == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.fake_cdp(command_timeout=1)
+    async def test_leaving_a_loop_early_closes_the_stream(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        stream = Network(session).requestWillBeSent.stream(2, Overflow.BLOCK)
+        await emit_all(browser, session, 3)
+        assert conn.reading_paused
+        async for event in stream:
+            break
+        await asyncio.sleep(0.01)
+        assert stream.closed and not conn.reading_paused
+        assert session.listener_count(EVENT) == 0
+        assert await session.send("Runtime.evaluate") == {}
+
+    @pytest.mark.asyncio
+    async def test_aclose(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        stream = Network(session).requestWillBeSent.stream(1, Overflow.BLOCK)
+        await emit_all(browser, session, 1)
+        await stream.aclose()
+        assert stream.closed and not conn.reading_paused
+
+    @pytest.mark.asyncio
+    async def test_disconnecting_ends_the_stream(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        stream = EventStream(conn, "Target.targetCreated")
+        consumer = asyncio.ensure_future(take(stream, 1))
+        await asyncio.sleep(0)
+        await conn.dispose()
+        with pytest.raises(StopAsyncIteration):
+            await consumer
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self):
+        conn = Connection(flatten_sessions=True)
+        with pytest.raises(ClientError):
+            EventStream(conn, EVENT, 0)
+        with pytest.raises(ClientError):
+            EventStream(conn, EVENT, 1, "drop_newest")
+
+    @pytest.mark.asyncio
+    async def test_accessors_still_listen_and_wait(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        network = Network(session)
+        received = []
+        remove = network.requestWillBeSent(received.append)
+        future = network.requestWillBeSent()
+        await emit_all(browser, session, 1)
+        remove()
+        await emit_all(browser, session, 1)
+        assert received == [{"requestId": 0}]
+        assert await future == {"requestId": 0}
+        assert network.requestWillBeSent.event == EVENT
+        assert "about to send HTTP request" in Network.requestWillBeSent.__doc__
@@ -0,0 +1,64 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+from cripy.errors import ClientError, ProtocolError
+from cripy.threaded import ThreadedClient
+from .helpers import FakeBrowser, FakeProtocolError
+
+
+def fail(params):
+    raise FakeProtocolError("nope")
+
+
+def make_client():
+    browsers = []
+
+    async def transport_factory():
+        browser = FakeBrowser()
+        browser.handle("Runtime.evaluate", lambda params: {"value": params["v"]})
+        browser.handle("Page.navigate", fail)
+        browsers.append(browser)
+        return browser.start()
+
+    return ThreadedClient(flatten_sessions=True, transport_factory=transport_factory)
+
+
+class TestThreadedClient:
+    def test_blocking_calls_from_worker_threads(self):
+        with make_client() as client:
+            session_id = client.create_session("page-1")
+            with ThreadPoolExecutor(4) as pool:
+                values = list(
+                    pool.map(
+                        lambda v: client.send("Runtime.evaluate", {"v": v}, session_id),
+                        range(20),
+                    )
+                )
+            assert values == [{"value": v} for v in range(20)]
+
+    def test_submissions_are_batched(self):
+        with make_client() as client:
+            gate = threading.Event()
+            # hold the loop thread so the submissions pile up
+            client.loop.call_soon_threadsafe(gate.wait)
+            before = client.batches
+            futures = [client.submit("Runtime.evaluate", {"v": v}) for v in range(50)]
+            assert all(isinstance(future, Future) for future in futures)
+            gate.set()
+            assert [future.result(5) for future in futures] == [
+                {"value": v} for v in range(50)
+            ]
+            assert client.batches == before + 1
+
+    def test_errors_are_raised_in_the_calling_thread(self):
+        with make_client() as client:
+            with pytest.raises(ProtocolError, match="nope"):
+                client.send("Page.navigate", {"url": "about:blank"})
+            with pytest.raises(ClientError):
+                client.send("Runtime.evaluate", {"v": 1}, "missing")
+
+    def test_not_started(self):
+        with pytest.raises(ClientError):
+            ThreadedClient().submit("Browser.getVersion")
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from cripy.connection import Connection
+from cripy.errors import CommandTimeoutError, NetworkError
+from cripy.timers import Timers
+from .helpers import FakeBrowser
+
+
+class TestTimers:
+    @pytest.mark.asyncio
+    async def test_timers_fire_in_deadline_order(self):
+        timers = Timers(asyncio.get_event_loop())
+        fired = []
+        timers.call_later(0.03, fired.append, 3)
+        timers.call_later(0.01, fired.append, 1)
+        timers.call_later(0.02, fired.append, 2)
+        await asyncio.sleep(0.06)
+        assert fired == [1, 2, 3]
+        assert len(timers) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_timers_do_not_fire(self):
+        timers = Timers(asyncio.get_event_loop())
+        fired = []
+        timer = timers.call_later(0.01, fired.append, 1)
+        timers.call_later(0.02, fired.append, 2)
+        timer.cancel()
+        await asyncio.sleep(0.04)
+        assert fired == [2]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_timers_are_removed_from_the_heap(self):
+        timers = Timers(asyncio.get_event_loop())
+        pending = [timers.call_later(30, print, i) for i in range(100)]
+        for timer in pending[:60]:
+            timer.cancel()
+        assert len(timers) == 40
+        assert len(timers._heap) < 100
+        for timer in pending[60:]:
+            timer.cancel()
+        assert len(timers) == 0
+        assert timers._heap == [] and timers._handle is None
+
+    @pytest.mark.asyncio
+    async def test_clear_cancels_everything(self):
+        timers = Timers(asyncio.get_event_loop())
+        fired = []
+        timers.call_later(0.01, fired.append, 1)
+        timers.clear()
+        await asyncio.sleep(0.02)
+        assert fired == []
+
+
+class TestCommandTimeouts:
+    @pytest.mark.asyncio
+    async def test_command_times_out_and_is_removed(self):
+        conn = Connection("ws://localhost:9222")
+        future = conn.send("Page.navigate", {"url": "about:blank"}, timeout=0.01)
+        with pytest.raises(CommandTimeoutError):
+            await future
+        assert len(conn._callbacks) == 0
+
+    @pytest.mark.asyncio
+    async def test_connection_default_timeout(self):
+        conn = Connection("ws://localhost:9222", command_timeout=0.01)
+        with pytest.raises(asyncio.TimeoutError):
+            await conn.send("Browser.getVersion")
+        assert issubclass(CommandTimeoutError, NetworkError)
+
+    @pytest.mark.asyncio
+    async def test_answered_and_cancelled_commands_cancel_their_timers(self):
+        browser = FakeBrowser()
+        conn = Connection(flatten_sessions=True, command_timeout=30)
+        await conn.connect(transport=browser.start())
+        try:
+            session = await conn.create_session("page-1")
+            await asyncio.gather(
+                *[conn.send("Runtime.evaluate") for _ in range(500)],
+                *[session.send("Runtime.evaluate") for _ in range(500)],
+            )
+            assert len(conn._timers) == 0
+            assert conn._timers._heap == []
+            future = session.send("Runtime.evaluate")
+            future.cancel()
+            assert len(conn._timers) == 0
+        finally:
+            await conn.dispose()
+            await browser.stop()
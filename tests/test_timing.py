@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+import ujson
+
+from cripy.timing import TimedEvent, wire_size
+
+
+EVALUATE = {"Runtime.evaluate": lambda params: {"value": "é"}}
+
+
+class TestTiming:
+    def test_wire_size_counts_utf8_bytes(self):
+        assert wire_size('{"a":"é"}') == 10
+        assert wire_size('{"a":"e"}') == 9
+        assert wire_size(b'{"a":1}') == 7
+
+    @pytest.mark.asyncio
+    @pytest.mark.fake_cdp(handlers=EVALUATE, session=False, record_timing=True)
+    async def test_commands_and_events_are_timed(self, fake_cdp):
+        browser, conn, _ = fake_cdp
+        before = time.monotonic()
+        future = conn.send("Runtime.evaluate")
+        await future
+        expected = wire_size(
+            ujson.dumps({"id": future.callback_id, "result": {"value": "é"}})
+        )
+        assert before <= future.sent_at <= future.received_at <= time.monotonic()
+        assert future.latency >= 0
+        assert future.size == expected
+
+        session = await conn.create_session("page-1")
+        future = session.send("Runtime.evaluate")
+        await future
+        assert future.received_at is not None and future.size > 0
+
+        events = []
+        session.on("Page.loadEventFired", events.append)
+        await browser.emit("Page.loadEventFired", {"timestamp": 1}, session.session_id)
+        await asyncio.sleep(0)
+        event = events[0]
+        assert isinstance(event, TimedEvent)
+        assert event == {"timestamp": 1}
+        assert event.received_at >= future.received_at
+        assert event.size == len(
+            ujson.dumps(
+                {
+                    "method": "Page.loadEventFired",
+                    "params": {"timestamp": 1},
+                    "sessionId": session.session_id,
+                }
+            )
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.fake_cdp(handlers=EVALUATE, session=False)
+    async def test_nothing_is_recorded_by_default(self, fake_cdp):
+        browser, conn, _ = fake_cdp
+        future = conn.send("Runtime.evaluate")
+        await future
+        assert future.sent_at is None and future.latency is None
+        events = []
+        conn.on("Page.loadEventFired", events.append)
+        await browser.emit("Page.loadEventFired", {"timestamp": 1})
+        await asyncio.sleep(0)
+        assert type(events[0]) is dict
+
+    @pytest.mark.asyncio
+    @pytest.mark.fake_cdp(handlers=EVALUATE)
+    async def test_recording_can_be_enabled_later(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        conn.record_timing = True
+        assert session.record_timing
+        future = session.send("Runtime.evaluate")
+        await future
+        assert future.latency >= 0 and future.size > 0
+        events = []
+        session.on("Page.loadEventFired", events.append)
+        await browser.emit("Page.loadEventFired", {"timestamp": 1}, session.session_id)
+        await asyncio.sleep(0)
+        assert isinstance(events[0], TimedEvent)
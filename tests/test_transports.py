@@ -0,0 +1,154 @@
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+import pytest
+import ujson
+
+from cripy.connection import Connection
+from cripy.errors import ProtocolError, TransportClosedError
+from cripy.events import ConnectionEvents
+from cripy.transports import (
+    InMemoryTransport,
+    PipeTransport,
+    UnixSocketTransport,
+    launch_with_pipe,
+)
+from .helpers import FakeBrowser
+
+PIPE_PEER = str(Path(__file__).parent / "helpers" / "pipe_peer.py")
+
+
+async def pipe_pair():
+    ours, theirs = socket.socketpair()
+    transport = await PipeTransport.from_socket(ours)
+    reader, writer = await asyncio.open_connection(sock=theirs)
+    return transport, reader, writer
+
+
+class TestPipeTransport:
+    @pytest.mark.asyncio
+    async def test_connection_over_a_pipe(self):
+        transport, reader, writer = await pipe_pair()
+        conn = Connection(flatten_sessions=False)
+        await conn.connect(transport=transport)
+        events = []
+        conn.on("Page.loadEventFired", events.append)
+
+        result = conn.send("Browser.getVersion")
+        frame = await reader.readuntil(b"\0")
+        command = ujson.loads(frame[:-1])
+        assert command["method"] == "Browser.getVersion"
+        writer.write(b'{"method":"Page.loadEventFired","params":{"timestamp":1}}\0')
+        writer.write(b'{"id":%d,"result":{"product":"Chrome"}}\0' % command["id"])
+        assert await result == {"product": "Chrome"}
+        assert events == [{"timestamp": 1}]
+
+        disconnected = asyncio.Event()
+        conn.on(ConnectionEvents.Disconnected, disconnected.set)
+        writer.close()
+        await asyncio.wait_for(disconnected.wait(), 1)
+        assert conn.closed
+
+    @pytest.mark.asyncio
+    async def test_messages_split_across_reads(self):
+        transport, reader, writer = await pipe_pair()
+        writer.write(b'{"id":1,"res')
+        await writer.drain()
+        writer.write(b'ult":{}}\0{"id":2,"result":{}}\0')
+        assert await transport.recv() == b'{"id":1,"result":{}}'
+        assert await transport.recv() == b'{"id":2,"result":{}}'
+        transport.abort()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX")
+    @pytest.mark.asyncio
+    async def test_launch_with_pipe(self):
+        process, transport = await launch_with_pipe(sys.executable, [PIPE_PEER])
+        conn = Connection()
+        await conn.connect(transport=transport)
+        result = await asyncio.wait_for(conn.send("Browser.getVersion"), 5)
+        assert result == {"argv": ["--remote-debugging-pipe"]}
+        # its responses are not laid out the way Chrome does but still answer the probe
+        assert conn.flatten_sessions is True
+        await conn.dispose()
+        assert await asyncio.wait_for(process.wait(), 5) == 0
+
+
+class TestInMemoryTransport:
+    @pytest.mark.asyncio
+    async def test_pair_passes_messages_as_is(self):
+        one, other = InMemoryTransport.pair()
+        frame = b'{"id":1,"result":{}}'
+        await one.send(frame)
+        assert await other.recv() is frame
+        await other.send("str frame")
+        assert await one.recv() == "str frame"
+
+    @pytest.mark.asyncio
+    async def test_close_wakes_the_peer_after_delivering_what_was_sent(self):
+        one, other = InMemoryTransport.pair()
+        await one.send("last")
+        await one.close()
+        assert other.closed
+        assert await other.recv() == "last"
+        with pytest.raises(TransportClosedError):
+            await other.recv()
+
+
+class TestUnixSocketTransport:
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires POSIX")
+    @pytest.mark.asyncio
+    async def test_connection_over_a_unix_socket(self, tmp_path):
+        async def answer(reader, writer):
+            frame = await reader.readuntil(b"\0")
+            command = ujson.loads(frame[:-1])
+            writer.write(b'{"id":%d,"result":{"unix":true}}\0' % command["id"])
+
+        path = str(tmp_path / "cdp.sock")
+        server = await asyncio.start_unix_server(answer, path)
+        conn = Connection(flatten_sessions=False)
+        await conn.connect(transport=await UnixSocketTransport.connect(path))
+        assert await conn.send("Browser.getVersion") == {"unix": True}
+        await conn.dispose(hard=True)
+        server.close()
+
+
+class TestFakeBrowser:
+    @pytest.mark.asyncio
+    async def test_flat_sessions_against_the_fake_browser(self):
+        browser = FakeBrowser()
+        browser.handle("Runtime.evaluate", lambda params: {"result": {"value": 2}})
+        conn = Connection(flatten_sessions=True)
+        await conn.connect(transport=browser.start())
+
+        session = await conn.create_session("page-1")
+        assert session.target_id == "page-1"
+        assert await session.send("Runtime.evaluate", {"expression": "1+1"}) == {
+            "result": {"value": 2}
+        }
+        assert browser.received[-1]["sessionId"] == session.session_id
+
+        events = []
+        session.on("Page.loadEventFired", events.append)
+        await browser.emit("Page.loadEventFired", {"timestamp": 1}, session.session_id)
+        await asyncio.sleep(0)
+        assert events == [{"timestamp": 1}]
+
+        with pytest.raises(ProtocolError):
+            await conn.create_session("missing")
+        await conn.dispose()
+        await browser.stop()
+
+    @pytest.mark.asyncio
+    async def test_nested_sessions_against_the_fake_browser(self):
+        browser = FakeBrowser()
+        browser.handle("Runtime.evaluate", lambda params: {"result": {"value": 3}})
+        conn = Connection(flatten_sessions=False)
+        await conn.connect(transport=browser.start())
+        session = await conn.create_session("page-1")
+        assert await session.send("Runtime.evaluate", {"expression": "1+2"}) == {
+            "result": {"value": 3}
+        }
+        await conn.dispose()
+        await browser.stop()
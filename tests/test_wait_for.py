@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from cripy.connection import Connection
+from cripy.errors import EventTimeoutError, NetworkError
+from cripy.events import ConnectionEvents
+from cripy.reconnect import ReconnectPolicy
+from cripy.protocol import Page
+from .helpers import FakeBrowser
+
+EVENT = "Page.loadEventFired"
+
+
+class TestWaitFor:
+    @pytest.mark.asyncio
+    async def test_resolves_with_the_first_accepted_event(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        future = session.wait_for(EVENT, lambda event: event["timestamp"] > 1)
+        for timestamp in range(4):
+            await browser.emit(EVENT, {"timestamp": timestamp}, session.session_id)
+        assert await future == {"timestamp": 2}
+        assert session.listener_count(EVENT) == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_cancel_remove_the_listener(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        loop = asyncio.get_event_loop()
+        errors = []
+        handler = loop.get_exception_handler()
+        loop.set_exception_handler(lambda loop, context: errors.append(context))
+        try:
+            timed_out = session.wait_for(EVENT, timeout=0.01)
+            with pytest.raises(EventTimeoutError):
+                await timed_out
+            cancelled = conn.wait_for("Target.targetCreated")
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(cancelled, 0.01)
+            await asyncio.sleep(0)
+            assert session.listener_count(EVENT) == 0
+            assert conn.listener_count("Target.targetCreated") == 0
+            # a late event must not resolve the abandoned futures
+            await browser.emit(EVENT, {"timestamp": 1}, session.session_id)
+            await browser.emit("Target.targetCreated", {})
+            await asyncio.sleep(0.01)
+            assert isinstance(timed_out.exception(), EventTimeoutError)
+            assert cancelled.cancelled()
+            assert errors == []
+        finally:
+            loop.set_exception_handler(handler)
+
+    @pytest.mark.asyncio
+    async def test_predicate_errors_fail_the_wait(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        future = session.wait_for(EVENT, lambda event: event["missing"])
+        await browser.emit(EVENT, {"timestamp": 1}, session.session_id)
+        with pytest.raises(KeyError):
+            await future
+        assert session.listener_count(EVENT) == 0
+
+    @pytest.mark.asyncio
+    async def test_generated_accessors_wait_for(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        page = Page(session)
+        with pytest.raises(EventTimeoutError):
+            await page.loadEventFired(timeout=0.01)
+        future = page.loadEventFired(predicate=lambda event: event["timestamp"] == 3)
+        for timestamp in range(4):
+            await browser.emit(EVENT, {"timestamp": timestamp}, session.session_id)
+        assert await future == {"timestamp": 3}
+        assert session.listener_count(EVENT) == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_fails_the_waits(self, fake_cdp):
+        browser, conn, session = fake_cdp
+        waits = [
+            conn.wait_for("Target.targetCreated", timeout=30),
+            session.wait_for(EVENT),
+        ]
+        await conn.dispose()
+        for wait in waits:
+            with pytest.raises(NetworkError):
+                await wait
+        assert conn.listener_count("Target.targetCreated") == 0
+        assert len(conn._wait_timers) == 0
+        with pytest.raises(NetworkError):
+            await asyncio.wait_for(conn.wait_for(EVENT, timeout=0.2), 1)
+        with pytest.raises(NetworkError):
+            await session.wait_for(EVENT)
+
+    @pytest.mark.asyncio
+    async def test_waits_survive_reconnecting(self):
+        browsers = [FakeBrowser(), FakeBrowser()]
+        browsers[1].sessions = browsers[0].sessions
+
+        async def transport_factory():
+            return browsers.pop(0).start() if browsers else None
+
+        first = browsers[0]
+        conn = Connection(
+            flatten_sessions=True,
+            transport_factory=transport_factory,
+            reconnect_policy=ReconnectPolicy(max_attempts=1, initial_delay=0, jitter=0),
+        )
+        await conn.connect()
+        second = browsers[0]
+        try:
+            times_out = conn.wait_for("Target.targetCreated", timeout=0.1)
+            resolves = conn.wait_for("Target.targetDestroyed")
+            reconnected = conn.wait_for(ConnectionEvents.Reconnected)
+            await first.stop()
+            await asyncio.wait_for(reconnected, 1)
+            with pytest.raises(EventTimeoutError):
+                await asyncio.wait_for(times_out, 1)
+            await second.emit("Target.targetDestroyed", {"targetId": "page-1"})
+            assert await asyncio.wait_for(resolves, 1) == {"targetId": "page-1"}
+        finally:
+            await conn.dispose()
+            await second.stop()
@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from cripy.connection import Connection
+from cripy.errors import ClientError
+from cripy.priority import Priority
+from cripy.window import CommandWindow
+
+
+class TestCommandWindow:
+    def test_parks_commands_once_full(self):
+        written = []
+        window = CommandWindow(2, lambda msg, priority: written.append(msg))
+        for _id in range(1, 5):
+            window.submit({"id": _id}, 0)
+        assert [msg["id"] for msg in written] == [1, 2]
+        assert window.full
+        assert window.parked == 2
+        window.done(1)
+        assert [msg["id"] for msg in written] == [1, 2, 3]
+        assert window.in_flight == 2
+
+    def test_abandoned_parked_commands_are_not_written(self):
+        written = []
+        window = CommandWindow(1, lambda msg, priority: written.append(msg))
+        for _id in range(1, 4):
+            window.submit({"id": _id}, 0)
+        window.done(2)
+        assert window.parked == 1
+        window.done(1)
+        assert [msg["id"] for msg in written] == [1, 3]
+        assert window.parked == 0
+
+    def test_raising_the_limit_writes_parked_commands(self):
+        written = []
+        window = CommandWindow(1, lambda msg, priority: written.append(msg))
+        window.submit({"id": 1}, 0)
+        window.submit({"id": 2}, 0)
+        window.limit = 2
+        assert [msg["id"] for msg in written] == [1, 2]
+
+    def test_limit_must_be_positive(self):
+        with pytest.raises(ClientError):
+            CommandWindow(0, print)
+
+    def test_parked_commands_enter_by_priority(self):
+        written = []
+        window = CommandWindow(
+            1, lambda msg, priority: written.append((msg["id"], priority)), max_streak=2
+        )
+        window.submit({"id": 1}, Priority.BULK)
+        for _id in range(2, 6):
+            window.submit({"id": _id}, Priority.BULK if _id == 2 else Priority.CONTROL)
+        while window.parked:
+            window.done(written[-1][0])
+        # control commands overtake the parked bulk command until the streak is reached
+        assert written == [(1, 1), (3, 0), (4, 0), (2, 1), (5, 0)]
+
+    def test_max_parked_bounds_the_parked_commands(self):
+        window = CommandWindow(1, lambda msg, priority: None, max_parked=1)
+        window.submit({"id": 1, "method": "A.a"}, 0)
+        window.submit({"id": 2, "method": "A.a"}, 0)
+        with pytest.raises(ClientError):
+            window.submit({"id": 3, "method": "A.a"}, 0)
+        assert window.parked == 1
+
+    def test_nowait_messages_do_not_overtake_parked_commands(self):
+        written = []
+        window = CommandWindow(1, lambda msg, priority: written.append(msg["id"]))
+        window.submit_nowait({"id": 1}, Priority.CONTROL)
+        window.submit({"id": 2}, Priority.CONTROL)
+        window.submit({"id": 3}, Priority.CONTROL)
+        window.submit_nowait({"id": 4}, Priority.CONTROL)
+        window.submit({"id": 5}, Priority.BULK)
+        window.submit_nowait({"id": 6}, Priority.CONTROL)
+        assert written == [1, 2]
+        window.done(2)
+        # the nowait messages are written right behind the commands they were
+        # parked behind, control priority ones still overtake bulk commands
+        assert written == [1, 2, 3, 4, 6]
+        assert window.in_flight == 1
+        window.done(3)
+        assert written == [1, 2, 3, 4, 6, 5]
+        assert window.parked == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_for_room(self):
+        window = CommandWindow(1, lambda msg, priority: None)
+        await window.wait_for_room()
+        window.submit({"id": 1}, 0)
+        window.submit({"id": 2}, 0)
+        waiters = [asyncio.ensure_future(window.wait_for_room()) for _ in range(2)]
+        await asyncio.sleep(0)
+        window.done(1)
+        await asyncio.sleep(0)
+        assert not any(waiter.done() for waiter in waiters)
+        window.done(2)
+        await asyncio.sleep(0)
+        assert all(waiter.done() for waiter in waiters)
+
+
+class TestConnectionWindow:
+    @pytest.mark.asyncio
+    async def test_second_command_waits_for_first_response(self):
+        conn = Connection("ws://localhost:9222", max_in_flight=1)
+        conn._connected = True
+        first = conn.send("Browser.getVersion")
+        second = conn.send("Browser.getVersion")
+        assert conn.in_flight == 1
+        assert conn.queued_commands == 1
+        assert len(conn._send_queue) == 1
+        conn._on_message('{"id":1,"result":{}}')
+        assert await first == {}
+        assert len(conn._send_queue) == 2
+        assert conn.queued_commands == 0
+        second.cancel()
+        assert conn.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_send_nowait_queues_behind_parked_commands(self):
+        conn = Connection("ws://localhost:9222", max_in_flight=1)
+        conn._connected = True
+        first = conn.send("Browser.getVersion")
+        second = conn.send("Page.enable")
+        conn.send_nowait("Network.enable")
+        assert [_id for _, _id in conn._send_queue] == [1]
+        assert conn.queued_commands == 2
+        conn._on_message('{"id":1,"result":{}}')
+        await first
+        assert [_id for _, _id in conn._send_queue] == [1, 2, 3]
+        assert conn.in_flight == 1
+        second.cancel()
+
+    @pytest.mark.asyncio
+    async def test_max_parked_and_wait_for_room(self):
+        conn = Connection("ws://localhost:9222", max_in_flight=1, max_parked=0)
+        conn._connected = True
+        assert conn.max_parked == 0
+        await conn.wait_for_room()
+        first = conn.send("Browser.getVersion")
+        with pytest.raises(ClientError):
+            conn.send("Browser.getVersion")
+        room = asyncio.ensure_future(conn.wait_for_room())
+        await asyncio.sleep(0)
+        assert not room.done()
+        conn._on_message('{"id":1,"result":{}}')
+        await first
+        await asyncio.wait_for(room, 1)
+        conn.send("Browser.getVersion").cancel()